@@ -28,7 +28,6 @@ from textual.message import Message
 from textual.screen import Screen
 from textual.worker import get_current_worker
 
-from textual_code.cancellable_worker import run_cancellable
 from textual_code.command_registry import bindings_for_context as _bindings_for_context
 from textual_code.commands import (
     _read_workspace_directories,
@@ -51,6 +50,12 @@ from textual_code.config import (
     save_project_editor_settings,
     save_user_editor_settings,
 )
+from textual_code.file_operations import (
+    FileOperation,
+    FileOperationCancelled,
+    FileOpProgress,
+)
+from textual_code.file_watcher import FileChanges, InotifyWatcher, create_file_watcher
 from textual_code.modals import (
     ChangeEncodingModalResult,
     ChangeEncodingModalScreen,
@@ -76,7 +81,7 @@ from textual_code.modals import (
     UnsavedChangeQuitModalResult,
     UnsavedChangeQuitModalScreen,
 )
-from textual_code.subprocess_tasks import calc_dir_size
+from textual_code.subprocess_tasks import calc_dir_size, get_dir_size_cache
 from textual_code.widgets.code_editor import CodeEditor
 from textual_code.widgets.explorer import Explorer
 from textual_code.widgets.main_view import MainView
@@ -136,6 +141,21 @@ def _validate_sidebar_width_setting(value: int | float | str) -> int | str | Non
 _MAX_COPY_SUFFIX = 1000
 
 
+def _file_op_status(label: str, progress: FileOpProgress) -> str:
+    """Return the progress toast text for a running file operation."""
+    from textual_code.modals.file_ops import _format_file_size
+
+    files_done, files_total, bytes_done, bytes_total = progress.snapshot()
+    if not files_total:
+        return label
+    status = f"{label} — {files_done:,}/{files_total:,} files"
+    if bytes_total:
+        status += (
+            f", {_format_file_size(bytes_done)} of {_format_file_size(bytes_total)}"
+        )
+    return status
+
+
 def _resolve_paste_name(target_dir: Path, name: str) -> Path:
     """Return a non-conflicting path in *target_dir* for *name*.
 
@@ -401,6 +421,15 @@ class TextualCode(App):
         source_path: Path
         destination_dir: Path
 
+    @dataclass
+    class FilesChanged(Message):
+        """
+        Message posted by the file watcher thread with a debounced batch of
+        filesystem events.
+        """
+
+        changes: FileChanges
+
     CSS_PATH = "style.tcss"
 
     BINDINGS = _bindings_for_context("app")
@@ -491,6 +520,8 @@ class TextualCode(App):
 
         # Label of the currently running file operation (for cancel notification)
         self._current_file_op_label: str = ""
+        # Runs file operations one at a time, in the order they were started
+        self._file_op_lock = asyncio.Lock()
 
         # load and apply custom keybindings and display preferences
         kb_path = get_keybindings_path(user_config_path) if user_config_path else None
@@ -509,6 +540,12 @@ class TextualCode(App):
         # Double Ctrl+Q force-quit: timestamp of last Ctrl+Q press
         self._last_ctrl_q_time: float = 0.0
 
+        # inotify file watcher (None → widgets fall back to mtime polling)
+        self.file_watcher: InotifyWatcher | None = None
+        # Directories each widget wants watched, kept even before the watcher
+        # starts so late and early registrations are both honoured.
+        self._watched_dirs: dict[str, frozenset[Path]] = {}
+
     _FORCE_QUIT_INTERVAL = 1.0  # seconds
 
     async def on_event(self, event: events.Event) -> None:
@@ -535,6 +572,29 @@ class TextualCode(App):
         loop = asyncio.get_running_loop()
         loop.set_default_executor(_DaemonThreadPoolExecutor())
 
+    def on_mount(self) -> None:
+        # Like the polling timers, the watcher is skipped in headless mode so
+        # tests stay deterministic — they post FilesChanged directly.
+        if not self.is_headless:
+            self.file_watcher = create_file_watcher(
+                lambda changes: self.post_message(self.FilesChanged(changes))
+            )
+            if self.file_watcher is not None:
+                for owner, dirs in self._watched_dirs.items():
+                    self.file_watcher.set_watches(owner, dirs)
+
+    def on_unmount(self) -> None:
+        if self.file_watcher is not None:
+            self.file_watcher.stop()
+            self.file_watcher = None
+
+    def set_watched_dirs(self, owner: str, dirs: Iterable[Path]) -> None:
+        """Register the directories *owner* wants the file watcher to observe."""
+        frozen = frozenset(dirs)
+        self._watched_dirs[owner] = frozen
+        if self.file_watcher is not None:
+            self.file_watcher.set_watches(owner, frozen)
+
     def compose(self) -> ComposeResult:
         if not self._skip_sidebar:
             yield Sidebar(
@@ -1741,8 +1801,6 @@ class TextualCode(App):
     @on(MoveDestinationSelected)
     def on_move_destination_selected(self, event: MoveDestinationSelected) -> None:
         """Handle destination directory selection and perform the move."""
-        import shutil
-
         path = event.source_path
         dest_dir = event.destination_dir
         is_directory = path.is_dir()
@@ -1808,21 +1866,18 @@ class TextualCode(App):
             def _do_move() -> None:
                 self._do_file_op(
                     f"Moving '{path.name}'",
-                    shutil.move,
-                    (str(path), str(new_path)),
+                    FileOperation("move", path, new_path),
                     on_success=_move_success,
                 )
 
             self._check_dir_size_and_proceed(path, "Move", _do_move)
         else:
-            # Single file move — typically fast
-            try:
-                shutil.move(str(path), str(new_path))
-            except Exception as e:
-                self.log.warning("Move failed: %s → %s: %s", path, new_path, e)
-                self.notify(f"Error moving: {e}", severity="error")
-                return
-            _move_success()
+            # Single file: no size check, but still off the event loop
+            self._do_file_op(
+                f"Moving '{path.name}'",
+                FileOperation("move", path, new_path),
+                on_success=_move_success,
+            )
 
     # ── Directory size check ─────────────────────────────────────────
 
@@ -1843,10 +1898,13 @@ class TextualCode(App):
     ) -> None:
         """Check directory size and show a warning modal if over threshold.
 
-        Runs the size calculation in a subprocess via ``run_cancellable``.
-        If the directory exceeds the threshold, a confirmation modal is
-        shown.  The *proceed* callback is invoked only when the user
-        approves or the size is below the threshold.
+        Measures the directory on a thread pool (:func:`calc_dir_size`),
+        stopping as soon as the threshold is exceeded.  Per-directory
+        results are cached by mtime, so copying and then moving the same
+        folder walks it only once.  A progress toast shows the running
+        total for slow scans.  If the directory exceeds the threshold, a
+        confirmation modal is shown.  The *proceed* callback is invoked
+        only when the user approves or the size is below the threshold.
 
         Args:
             path: Directory path to check.
@@ -1856,6 +1914,7 @@ class TextualCode(App):
         """
         from textual_code.modals.file_ops import (
             LargeDirWarningModalScreen,
+            _format_file_size,
         )
 
         threshold = self.default_large_dir_threshold
@@ -1869,7 +1928,41 @@ class TextualCode(App):
 
         @work(exit_on_error=False, exclusive=True, group="dir_size_check")
         async def _calc_and_check(self_: "TextualCode") -> None:
-            total, count = await run_cancellable(calc_dir_size, path, threshold)
+            label = f"Measuring '{path.name}'"
+            toast = self_.show_progress_toast(
+                label, get_current_worker(), group="dir_size_check"
+            )
+            latest = (0, 0)
+
+            def _report(total: int, count: int) -> None:
+                nonlocal latest
+                latest = (total, count)
+
+            cancel = threading.Event()
+            measure = asyncio.ensure_future(
+                asyncio.to_thread(
+                    calc_dir_size,
+                    path,
+                    threshold,
+                    cache=get_dir_size_cache(),
+                    progress=_report,
+                    cancel=cancel,
+                )
+            )
+            try:
+                while not measure.done():
+                    await asyncio.wait({measure}, timeout=0.25)
+                    total, count = latest
+                    if count:
+                        toast.set_label(
+                            f"{label} — {count:,} files, {_format_file_size(total)}"
+                        )
+                total, count = measure.result()
+            except asyncio.CancelledError:
+                cancel.set()
+                raise
+            finally:
+                toast.close()
 
             self_.log.info(
                 "dir size check: %s = %d bytes, %d files (threshold: %d)",
@@ -1895,46 +1988,80 @@ class TextualCode(App):
         """Show a persistent progress toast connected to *worker*."""
         return self.query_one(ProgressToastRack).show(label, worker, **kwargs)
 
-    @work(exclusive=True, group="file_ops", exit_on_error=False)
+    @work(group="file_ops", exit_on_error=False)
     async def _do_file_op(
         self,
         label: str,
-        op: Callable[..., object],
-        args: tuple[object, ...],
+        operation: FileOperation,
         on_success: Callable[[], None] | None = None,
         on_error: Callable[[], None] | None = None,
     ) -> None:
-        """Run a file operation in a subprocess via :func:`run_cancellable`.
+        """Run a :class:`FileOperation` on a thread with a progress toast.
+
+        Operations queue behind each other rather than cancelling the one
+        already running.  The toast label shows files and bytes done.
+        Cancelling the worker sets the operation's cancel event and waits
+        for it to stop, so a cancelled copy or move has been rolled back
+        before *on_error* runs.  An operation that finished before it saw
+        the cancel is reported as a success before the worker ends
+        cancelled.
 
         Args:
             label: Human-readable label like "Deleting 'mydir'".
-            op: A **module-level** callable (must be picklable).
-            args: Positional arguments for *op* (must be picklable).
+            operation: The copy, move or delete to perform.
             on_success: Callback to run after success.
             on_error: Callback to run after failure or cancel.
         """
-        self._current_file_op_label = label
-        self.log.info("file_op started: %s", label)
-        self.show_progress_toast(label, get_current_worker(), group="file_ops")
-
+        toast = self.show_progress_toast(label, get_current_worker(), group="file_ops")
         try:
-            await run_cancellable(op, *args)
-        except (TimeoutError, asyncio.CancelledError):
+            async with self._file_op_lock:
+                cancelled = await self._run_file_op(label, operation, toast)
+        except (FileOperationCancelled, asyncio.CancelledError):
             self.log.warning("file_op cancelled: %s", label)
             if on_error is not None:
                 on_error()
             return
         except Exception as e:
             self.log.error("file_op failed: %s: %s", label, e)
+            self.notify(f"{label} failed: {e}", severity="error")
             if on_error is not None:
                 on_error()
             return
-        finally:
-            self._current_file_op_label = ""
 
         self.log.info("file_op completed: %s", label)
         if on_success is not None:
             on_success()
+        if cancelled:
+            raise asyncio.CancelledError
+
+    async def _run_file_op(
+        self, label: str, operation: FileOperation, toast: Any
+    ) -> bool:
+        """Run *operation* on a thread, updating *toast* until it ends.
+
+        Returns:
+            True if the worker was cancelled after the operation had
+            already completed.
+        """
+        self._current_file_op_label = label
+        self.log.info("file_op started: %s", label)
+        cancel = threading.Event()
+        task = asyncio.ensure_future(asyncio.to_thread(operation.run, cancel))
+        try:
+            while not task.done():
+                await asyncio.wait({task}, timeout=0.25)
+                toast.set_label(_file_op_status(label, operation.progress))
+            task.result()
+        except asyncio.CancelledError:
+            cancel.set()
+            # Let the engine stop and roll back before reporting.
+            await asyncio.wait({task})
+            if task.exception() is not None:
+                raise
+            return True
+        finally:
+            self._current_file_op_label = ""
+        return False
 
     def action_cancel_file_operation(self) -> None:
         """Cancel any in-progress file operation."""
@@ -1943,8 +2070,6 @@ class TextualCode(App):
 
     def _execute_delete(self, path: Path) -> None:
         """Shared delete logic for explorer and command palette handlers."""
-        import shutil
-
         is_dir = path.is_dir()
 
         def _post_delete() -> None:
@@ -1956,24 +2081,18 @@ class TextualCode(App):
             self.action_refresh_explorer()
             self.notify(f"Deleted: {path.name}", severity="information")
 
-        if not is_dir:
-            # Single file delete — instant, keep synchronous
-            try:
-                path.unlink()
-            except Exception as e:
-                self.notify(f"Error deleting: {e}", severity="error")
-                return
-            _post_delete()
-            return
-
         def _do_delete() -> None:
             self._do_file_op(
                 f"Deleting '{path.name}'",
-                shutil.rmtree,
-                (path,),
+                FileOperation("delete", path),
                 on_success=_post_delete,
             )
 
+        if not is_dir:
+            # Single file delete — no size check, but still off the event loop
+            _do_delete()
+            return
+
         # Directory delete — check size, then async worker
         self._check_dir_size_and_proceed(path, "Delete", _do_delete)
 
@@ -2113,8 +2232,6 @@ class TextualCode(App):
     def on_explorer_file_paste_requested(
         self, event: Explorer.FilePasteRequested
     ) -> None:
-        import shutil
-
         if self._file_clipboard is None:
             self.notify("Nothing to paste.", severity="warning")
             return
@@ -2174,23 +2291,17 @@ class TextualCode(App):
                 def _do_copy() -> None:
                     self._do_file_op(
                         f"Copying '{source_path.name}'",
-                        shutil.copytree,
-                        (str(source_path), str(dest_path)),
+                        FileOperation("copy", source_path, dest_path),
                         on_success=_copy_success,
                     )
 
                 self._check_dir_size_and_proceed(source_path, "Copy", _do_copy)
             else:
-                # Single file copy — instant
-                try:
-                    shutil.copy2(str(source_path), str(dest_path))
-                except Exception as e:
-                    self.log.warning(
-                        "Paste failed: %s → %s: %s", source_path, dest_path, e
-                    )
-                    self.notify(f"Error pasting: {e}", severity="error")
-                    return
-                _copy_success()
+                self._do_file_op(
+                    f"Copying '{source_path.name}'",
+                    FileOperation("copy", source_path, dest_path),
+                    on_success=_copy_success,
+                )
 
         else:  # cut
 
@@ -2200,39 +2311,25 @@ class TextualCode(App):
                 )
                 self.action_refresh_explorer()
 
-            if is_directory:
-
-                def _do_cut() -> None:
-                    # Clipboard clear deferred until after size warning confirmation
-                    saved_clipboard = self._file_clipboard
-                    self._file_clipboard = None
+            def _do_cut() -> None:
+                # Clipboard clear deferred until after size warning confirmation
+                saved_clipboard = self._file_clipboard
+                self._file_clipboard = None
 
-                    def _cut_fail_restore() -> None:
-                        self._file_clipboard = saved_clipboard
+                def _cut_fail_restore() -> None:
+                    self._file_clipboard = saved_clipboard
 
-                    self._do_file_op(
-                        f"Moving '{source_path.name}'",
-                        shutil.move,
-                        (str(source_path), str(dest_path)),
-                        on_success=_cut_success,
-                        on_error=_cut_fail_restore,
-                    )
+                self._do_file_op(
+                    f"Moving '{source_path.name}'",
+                    FileOperation("move", source_path, dest_path),
+                    on_success=_cut_success,
+                    on_error=_cut_fail_restore,
+                )
 
+            if is_directory:
                 self._check_dir_size_and_proceed(source_path, "Move", _do_cut)
             else:
-                # Single file cut — instant
-                saved_clipboard = self._file_clipboard
-                self._file_clipboard = None
-                try:
-                    shutil.move(str(source_path), str(dest_path))
-                except Exception as e:
-                    self._file_clipboard = saved_clipboard
-                    self.log.warning(
-                        "Paste failed: %s → %s: %s", source_path, dest_path, e
-                    )
-                    self.notify(f"Error pasting: {e}", severity="error")
-                    return
-                _cut_success()
+                _do_cut()
 
     @on(MainView.ActiveFileChanged)
     def on_active_file_changed(self, event: MainView.ActiveFileChanged) -> None:
@@ -2264,6 +2361,18 @@ class TextualCode(App):
 
         PathSearchModal.invalidate_cache(self.workspace_path)
 
+    @on(FilesChanged)
+    def on_files_changed(self, event: FilesChanged) -> None:
+        """Fan a watcher batch out to the explorer, editors and path caches."""
+        from textual_code.modals import PathSearchModal
+
+        changes = event.changes
+        if changes.overflow or changes.dirs:
+            PathSearchModal.invalidate_cache(self.workspace_path)
+        if self.sidebar is not None:
+            self.sidebar.explorer.directory_tree.apply_file_changes(changes)
+        self.main_view.apply_file_changes(changes)
+
     @on(OpenFileRequested)
     async def on_open_file_requested(self, event: OpenFileRequested):
         # open the file in the code editor when requested
@@ -0,0 +1,40 @@
+"""Build a syntax-aware document off the UI thread.
+
+``SyntaxAwareDocument`` parses its text in its constructor and feeds it to
+tree-sitter line by line through a Python callback, so building one for a
+large file on the event loop blocks the UI, and building it on a thread
+still competes with the loop for the GIL on every line.
+:func:`parse_document` is meant to run on a worker thread: it encodes the
+text once and parses the bytes, during which tree-sitter releases the GIL,
+then wraps the finished tree in a document that behaves exactly like a
+``SyntaxAwareDocument`` (later edits re-parse it incrementally as usual).
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from textual.document._document import Document
+from textual.document._syntax_aware_document import SyntaxAwareDocument
+
+if TYPE_CHECKING:
+    from tree_sitter import Language, Tree
+
+
+class _PreparsedDocument(SyntaxAwareDocument):
+    """A SyntaxAwareDocument adopting a tree parsed from its encoded text."""
+
+    def __init__(self, text: str, language: Language) -> None:
+        from tree_sitter import Parser
+
+        Document.__init__(self, text)
+        self.language = language
+        self._parser = Parser(language)
+        # The document's own text, with its normalised line separators.
+        tree: Tree = self._parser.parse(self.text.encode("utf-8"))
+        self._syntax_tree = tree
+
+
+def parse_document(text: str, language: Language) -> SyntaxAwareDocument:
+    """Parse *text* as *language* into a document for the TextArea."""
+    return _PreparsedDocument(text, language)
@@ -0,0 +1,539 @@
+"""Long-lived, shared directory scanner for the explorer.
+
+Forking a subprocess per directory listing (``run_cancellable``) costs far
+more than the ``os.scandir`` call it wraps.  :class:`DirectoryScanner`
+instead keeps a small pool of daemon threads alive for the lifetime of the
+process and feeds them scan requests through a queue:
+
+- **Batching** — :meth:`DirectoryScanner.scan_many` enqueues a whole set of
+  directories at once and awaits them together.
+- **De-duplication** — while a scan for ``(path, show_hidden_files,
+  compact_folders)`` is in flight, further requests for the same key share
+  its future instead of scanning the directory again.
+- **Compact folders** — single-child directory chains are resolved on the
+  worker thread as part of the scan, so the explorer can build collapsed
+  ``src/main/java`` nodes without touching the filesystem.
+- **Gitignore** — when a workspace root is given, every entry of the
+  listing is checked against the directory's merged gitignore matcher in
+  one batch, and the ignored set travels back with the listing.
+- **Listing cache** — every scan is kept in a bounded LRU keyed by the
+  scan options and validated by the ``mtime_ns`` of the directory and of
+  everything else the listing was derived from (subdirectories and chain
+  directories for compact folders, ``.gitignore`` files from the
+  workspace root down for ignore flags).  Explorer
+  expansions (``use_cache=True``) and idle-time :meth:`~DirectoryScanner.prefetch`
+  requests read it first, so a folder prefetched while the user was
+  looking at its parent opens without listing it again.  Refreshes always
+  scan fresh.
+- **Abandonment** — Python threads cannot be killed, so a scan that hangs
+  (e.g. on a dead network mount) is *abandoned* when it times out or when
+  its last waiter is cancelled: the worker's slot is handed to a fresh
+  thread and the stuck thread exits on its own once the syscall returns.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import itertools
+import logging
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from pathlib import Path
+from typing import NamedTuple
+
+from textual_code.gitignore import get_gitignore_cache, gitignore_mtime
+from textual_code.subprocess_tasks import resolve_compact_chains, scan_directory_sync
+
+log = logging.getLogger(__name__)
+
+type _ScanKey = tuple[Path, bool, bool, Path | None]
+type _Dependencies = tuple[tuple[Path, int | None], ...]
+
+# Queue priorities: explorer-visible scans overtake idle-time prefetches.
+_FOREGROUND = 0
+_PREFETCH = 1
+# Listings of directories modified this recently are not cached: an entry
+# added within the filesystem's timestamp granularity would leave the
+# mtime unchanged (git's "racy clean" problem).
+_RACY_WINDOW_NS = 2_000_000_000
+_GITIGNORE = ".gitignore"
+
+
+class DirectoryListing(NamedTuple):
+    """Result of scanning one directory for the explorer."""
+
+    # Filtered, sorted entries (directories first, then by name).
+    paths: list[Path]
+    # is_dir for every scanned entry, keyed by path.
+    is_dir: dict[Path, bool]
+    # Collapsed single-child chains: dir -> (joined_label, deepest_dir).
+    compact_chains: dict[Path, tuple[str, Path]]
+    # Gitignored entries (and gitignored compact-chain targets).
+    ignored: frozenset[Path] = frozenset()
+    # mtime_ns of the directory's own .gitignore (None if absent or unchecked).
+    gitignore_mtime: int | None = None
+
+
+def scan_directory_listing(
+    path: Path,
+    show_hidden_files: bool,
+    compact_folders: bool,
+    gitignore_root: Path | None = None,
+) -> DirectoryListing:
+    """Scan *path* and, if requested, resolve compact chains of its subdirectories.
+
+    When *gitignore_root* (the workspace) is given, the listing's entries
+    are also matched against the directory's gitignore rules.
+    """
+    paths, is_dir = scan_directory_sync(path, show_hidden_files)
+    chains: dict[Path, tuple[str, Path]] = {}
+    if compact_folders:
+        chains = resolve_compact_chains(
+            (p for p in paths if is_dir.get(p, False)), show_hidden_files
+        )
+    if gitignore_root is None:
+        return DirectoryListing(paths, is_dir, chains)
+    cache = get_gitignore_cache()
+    root = gitignore_root.resolve()
+    directory = path.resolve()
+    ignored = set(cache.matcher(directory, root).ignored(paths, is_dir))
+    for top, (label, deepest) in chains.items():
+        # *deepest* is resolved at each step of the chain, so a symlink in it
+        # leads elsewhere; match the path as shown, from the resolved listing.
+        shown = directory.joinpath(*label.split("/"))
+        if top in ignored or cache.is_ignored(shown, root, is_dir=True):
+            ignored.add(deepest)
+    return DirectoryListing(
+        paths, is_dir, chains, frozenset(ignored), gitignore_mtime(directory)
+    )
+
+
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def listing_dependencies(key: _ScanKey, listing: DirectoryListing) -> list[Path]:
+    """Return the paths besides the directory that *listing* was derived from.
+
+    A cached listing is stale once any of their mtimes changes, even if
+    the directory's own mtime did not.
+    """
+    path, _show_hidden_files, compact_folders, gitignore_root = key
+    deps: list[Path] = []
+    if compact_folders:
+        # A subdirectory's listing decides whether a chain starts there;
+        # each directory along a chain decides where it ends.
+        deps.extend(p for p in listing.paths if listing.is_dir.get(p, False))
+        for top, (label, _deepest) in listing.compact_chains.items():
+            current = top
+            for name in label.split("/")[1:]:
+                current = current / name
+                deps.append(current)
+    if gitignore_root is not None:
+        root = gitignore_root.resolve()
+        directory = path.resolve()
+        if directory.is_relative_to(root):
+            current = root
+            deps.append(current / _GITIGNORE)
+            for name in directory.relative_to(root).parts:
+                current = current / name
+                deps.append(current / _GITIGNORE)
+        # Chain targets are matched against the ignore files along the chain.
+        for label, _deepest in listing.compact_chains.values():
+            current = directory
+            for name in label.split("/")[:-1]:
+                current = current / name
+                deps.append(current / _GITIGNORE)
+    return deps
+
+
+class ListingCache:
+    """Thread-safe, bounded LRU of listings validated by mtimes.
+
+    Args:
+        max_size: Number of listings kept; the least recently used one is
+            evicted first.
+    """
+
+    def __init__(self, max_size: int = 256) -> None:
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[
+            _ScanKey, tuple[int, _Dependencies, DirectoryListing]
+        ] = OrderedDict()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: _ScanKey, mtime_ns: int) -> DirectoryListing | None:
+        """Return the listing cached for *key* if it is still valid.
+
+        The listing must have been taken at *mtime_ns*, and the paths it
+        depends on (see :func:`listing_dependencies`) must be unchanged;
+        they are stat'ed here.
+        """
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                return None
+            if cached[0] != mtime_ns:
+                del self._entries[key]
+                return None
+        if any(_mtime_ns(dep) != mtime for dep, mtime in cached[1]):
+            with self._lock:
+                if self._entries.get(key) is cached:
+                    del self._entries[key]
+            return None
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+        return cached[2]
+
+    def put(
+        self,
+        key: _ScanKey,
+        mtime_ns: int,
+        listing: DirectoryListing,
+        dependencies: _Dependencies = (),
+    ) -> None:
+        """Store *listing* for *key*, evicting the oldest entry when full.
+
+        *dependencies* are ``(path, mtime_ns)`` pairs the listing is
+        revalidated against.
+        """
+        with self._lock:
+            self._entries[key] = (mtime_ns, dependencies, listing)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached listing."""
+        with self._lock:
+            self._entries.clear()
+
+
+class _ScanRequest:
+    """A queued scan plus the bookkeeping needed to share and abandon it."""
+
+    __slots__ = ("future", "key", "started", "use_cache", "waiters", "worker")
+
+    def __init__(self, key: _ScanKey, use_cache: bool) -> None:
+        self.key = key
+        self.use_cache = use_cache
+        self.future: concurrent.futures.Future[DirectoryListing] = (
+            concurrent.futures.Future()
+        )
+        self.waiters = 0
+        self.worker: threading.Thread | None = None
+        self.started = 0.0
+
+
+class DirectoryScanner:
+    """Pool of daemon threads that scans directories on request.
+
+    Args:
+        max_workers: Number of scans that may run concurrently.
+        cache_size: Number of listings kept in :attr:`cache`.
+    """
+
+    def __init__(self, max_workers: int = 4, cache_size: int = 256) -> None:
+        self._max_workers = max_workers
+        self.cache = ListingCache(cache_size)
+        # (priority, sequence, request); the sequence keeps FIFO order
+        # within a priority and never lets two requests be compared.
+        self._queue: queue.PriorityQueue[tuple[int, int, _ScanRequest]] = (
+            queue.PriorityQueue()
+        )
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._in_flight: dict[_ScanKey, _ScanRequest] = {}
+        self._prefetched: list[_ScanRequest] = []
+        self._workers: set[threading.Thread] = set()
+        self._abandoned: set[threading.Thread] = set()
+        self._spawned = 0
+
+    # ── Submission ──────────────────────────────────────────────────────
+
+    def _submit_locked(
+        self,
+        path: Path,
+        show_hidden_files: bool,
+        compact_folders: bool,
+        gitignore_root: Path | None,
+        *,
+        use_cache: bool = False,
+        priority: int = _FOREGROUND,
+    ) -> _ScanRequest:
+        key = (path, show_hidden_files, compact_folders, gitignore_root)
+        request = self._in_flight.get(key)
+        if (
+            request is not None
+            and request.worker is not None
+            and request.use_cache
+            and not use_cache
+        ):
+            # Already running: a cache hit cannot satisfy a fresh request.
+            request = None
+        if request is None:
+            request = _ScanRequest(key, use_cache)
+            self._in_flight[key] = request
+            self._enqueue_locked(request, priority)
+        else:
+            if not use_cache:
+                request.use_cache = False
+            if priority == _FOREGROUND and request.worker is None:
+                # A prefetch someone now waits for moves to the front.
+                self._enqueue_locked(request, priority)
+        if priority == _FOREGROUND:
+            request.waiters += 1
+        return request
+
+    def _enqueue_locked(self, request: _ScanRequest, priority: int) -> None:
+        self._queue.put((priority, next(self._sequence), request))
+        self._ensure_workers_locked()
+
+    def _ensure_workers_locked(self) -> None:
+        while len(self._workers) < self._max_workers:
+            self._spawned += 1
+            thread = threading.Thread(
+                target=self._run_worker,
+                name=f"DirectoryScanner_{self._spawned}",
+                daemon=True,
+            )
+            self._workers.add(thread)
+            thread.start()
+
+    # ── Worker loop ─────────────────────────────────────────────────────
+
+    def _run_worker(self) -> None:
+        me = threading.current_thread()
+        while True:
+            _priority, _seq, request = self._queue.get()
+            with self._lock:
+                if request.future.running() or request.future.done():
+                    continue  # queued twice (re-prioritised) or cancelled
+                if not request.future.set_running_or_notify_cancel():
+                    continue
+                request.worker = me
+                request.started = time.monotonic()
+            try:
+                result = self._scan(request)
+            except BaseException as exc:
+                with self._lock:
+                    self._finish_locked(request)
+                request.future.set_exception(exc)
+            else:
+                with self._lock:
+                    self._finish_locked(request)
+                request.future.set_result(result)
+            with self._lock:
+                if me in self._abandoned:
+                    # A replacement thread already took over this slot.
+                    self._abandoned.discard(me)
+                    log.debug("abandoned scanner thread %s exiting", me.name)
+                    return
+
+    def _scan(self, request: _ScanRequest) -> DirectoryListing:
+        """Return the cached listing for *request* if still valid, else scan."""
+        key = request.key
+        path, show_hidden_files, compact_folders, gitignore_root = key
+        started = time.time_ns()
+        mtime_ns = _mtime_ns(path)
+        if mtime_ns is not None and request.use_cache:
+            cached = self.cache.get(key, mtime_ns)
+            if cached is not None:
+                return cached
+        listing = scan_directory_listing(
+            path, show_hidden_files, compact_folders, gitignore_root
+        )
+        if mtime_ns is not None and started - mtime_ns > _RACY_WINDOW_NS:
+            dependencies = tuple(
+                (dep, _mtime_ns(dep)) for dep in listing_dependencies(key, listing)
+            )
+            # A dependency changed during (or just before) the scan may
+            # not show in its mtime either.
+            if all(
+                mtime is None or started - mtime > _RACY_WINDOW_NS
+                for _dep, mtime in dependencies
+            ):
+                self.cache.put(key, mtime_ns, listing, dependencies)
+        return listing
+
+    def _finish_locked(self, request: _ScanRequest) -> None:
+        if self._in_flight.get(request.key) is request:
+            del self._in_flight[request.key]
+        request.worker = None
+
+    # ── Release / abandonment ───────────────────────────────────────────
+
+    def _release(self, request: _ScanRequest, *, abandon: bool) -> None:
+        """Drop one waiter; abandon the scan if nobody is left (or *abandon*)."""
+        with self._lock:
+            request.waiters -= 1
+            if request.future.done():
+                return
+            if request.waiters > 0 and not abandon:
+                return
+            self._abandon_locked(request)
+
+    def _abandon_locked(self, request: _ScanRequest) -> None:
+        stuck = request.worker
+        self._finish_locked(request)
+        if request.future.cancel():
+            return  # still queued; the worker will skip it
+        # Already running: give the stuck worker's slot to a fresh thread.
+        if stuck is None or stuck not in self._workers:
+            return
+        log.debug("abandoning stuck scan of %s on %s", request.key[0], stuck.name)
+        self._workers.discard(stuck)
+        self._abandoned.add(stuck)
+        self._ensure_workers_locked()
+
+    # ── Async API ───────────────────────────────────────────────────────
+
+    async def scan(
+        self,
+        path: Path,
+        show_hidden_files: bool,
+        *,
+        compact_folders: bool = False,
+        gitignore_root: Path | None = None,
+        timeout: float | None = None,
+        use_cache: bool = False,
+    ) -> DirectoryListing:
+        """Scan *path* on the shared pool and return its :class:`DirectoryListing`.
+
+        With *use_cache*, a cached listing that is still valid (see
+        :meth:`ListingCache.get`) is returned without scanning again.
+
+        Raises:
+            TimeoutError: If the scan does not finish within *timeout* seconds.
+                The scan is abandoned for every waiter.
+        """
+        with self._lock:
+            request = self._submit_locked(
+                path,
+                show_hidden_files,
+                compact_folders,
+                gitignore_root,
+                use_cache=use_cache,
+            )
+        return await self._wait(request, timeout)
+
+    async def scan_many(
+        self,
+        paths: Iterable[Path],
+        show_hidden_files: bool,
+        *,
+        compact_folders: bool = False,
+        gitignore_root: Path | None = None,
+        timeout: float | None = None,
+    ) -> dict[Path, DirectoryListing]:
+        """Scan several directories as one batch.
+
+        Every path is queued before the first one is awaited, so the pool
+        works on them concurrently.  Directories that fail to scan are
+        omitted from the result.
+
+        Raises:
+            TimeoutError: If the batch does not finish within *timeout*
+                seconds.  Unfinished scans are abandoned.
+        """
+        with self._lock:
+            requests = [
+                self._submit_locked(
+                    p, show_hidden_files, compact_folders, gitignore_root
+                )
+                for p in dict.fromkeys(paths)
+            ]
+        results = await asyncio.gather(
+            *(self._wait(r, timeout) for r in requests), return_exceptions=True
+        )
+        out: dict[Path, DirectoryListing] = {}
+        for request, result in zip(requests, results, strict=True):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, TimeoutError):
+                raise result
+            if isinstance(result, BaseException):
+                log.debug("scan of %s failed: %s", request.key[0], result)
+                continue
+            out[request.key[0]] = result
+        return out
+
+    def prefetch(
+        self,
+        paths: Iterable[Path],
+        show_hidden_files: bool,
+        *,
+        compact_folders: bool = False,
+        gitignore_root: Path | None = None,
+        stuck_after: float = 30.0,
+    ) -> None:
+        """Fill :attr:`cache` with listings of *paths* without waiting for them.
+
+        Prefetches queue behind every explorer-visible scan.  A new batch
+        supersedes the previous one: its scans that have not started yet
+        (and that nobody awaits) are dropped, and those running for more
+        than *stuck_after* seconds are abandoned.
+        """
+        now = time.monotonic()
+        with self._lock:
+            for stale in self._prefetched:
+                if stale.waiters or stale.future.done():
+                    continue
+                if stale.worker is None or now - stale.started > stuck_after:
+                    self._abandon_locked(stale)
+            self._prefetched = [
+                self._submit_locked(
+                    p,
+                    show_hidden_files,
+                    compact_folders,
+                    gitignore_root,
+                    use_cache=True,
+                    priority=_PREFETCH,
+                )
+                for p in dict.fromkeys(paths)
+            ]
+
+    async def _wait(
+        self, request: _ScanRequest, timeout: float | None
+    ) -> DirectoryListing:
+        # shield() keeps one waiter's cancellation from cancelling the shared
+        # future that other waiters may still be awaiting.
+        shared = asyncio.shield(asyncio.wrap_future(request.future))
+        try:
+            result = await asyncio.wait_for(shared, timeout=timeout)
+        except TimeoutError:
+            self._release(request, abandon=True)
+            raise TimeoutError(
+                f"scan of {request.key[0]} timed out after {timeout}s"
+            ) from None
+        except BaseException:
+            self._release(request, abandon=False)
+            raise
+        self._release(request, abandon=False)
+        return result
+
+
+_shared_scanner: DirectoryScanner | None = None
+_shared_lock = threading.Lock()
+
+
+def get_directory_scanner() -> DirectoryScanner:
+    """Return the process-wide :class:`DirectoryScanner`, creating it lazily."""
+    global _shared_scanner
+    with _shared_lock:
+        if _shared_scanner is None:
+            _shared_scanner = DirectoryScanner()
+        return _shared_scanner
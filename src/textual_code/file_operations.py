@@ -0,0 +1,371 @@
+"""Cancellable copy, move and delete with byte-level progress.
+
+Explorer file operations used to hand ``shutil.copytree`` / ``shutil.move``
+/ ``shutil.rmtree`` to a subprocess as one opaque call: the progress toast
+could only spin, and cancelling killed the child halfway through a tree,
+leaving a partial copy behind.  :class:`FileOperation` instead runs on a
+thread and works in explicit phases:
+
+1. **Enumerate** — the source is walked once with ``os.scandir`` (symlinks
+   are not followed), so the total number of files and bytes is known
+   before anything is written.
+2. **Copy** — directories and symlinks are recreated, then regular files
+   are copied by a small thread pool.  Each file is copied in chunks with
+   ``os.copy_file_range`` (in-kernel, reflink-capable), falling back to
+   ``os.sendfile`` and finally to plain ``read``/``write`` where the kernel
+   or filesystem refuses.  Every chunk updates :class:`FileOpProgress` and
+   checks the cancel event.
+3. **Rollback** — if the copy is cancelled or fails, every file, symlink
+   and directory it created is removed again (newest first), so a
+   cancelled paste leaves nothing behind.
+
+A move is a ``rename`` when source and destination share a filesystem;
+otherwise it is a copy (with rollback) followed by removing the source,
+which is no longer cancellable once the copy is complete.  A delete removes
+files one by one with progress; a cancelled delete stops, and what was
+already removed stays removed.
+
+Symlinks are copied as symlinks (like ``shutil.move`` across devices), so a
+link cycle cannot make a copy recurse forever.  Named pipes, sockets and
+devices cannot be copied (opening a pipe would block the copy forever): a
+copy of a tree containing one fails with ``shutil.SpecialFileError``, like
+``shutil.copytree``, before anything is written.  A delete removes them.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import errno
+import logging
+import os
+import shutil
+import stat
+import threading
+from collections.abc import Callable
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Literal, NamedTuple
+
+log = logging.getLogger(__name__)
+
+type FileOpKind = Literal["copy", "move", "delete"]
+
+_CHUNK_SIZE = 8 * 1024 * 1024
+# copy_file_range/sendfile errors that mean "not supported here, fall back".
+_FALLBACK_ERRNOS = frozenset(
+    {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM}
+)
+
+
+class FileOperationCancelled(Exception):
+    """Raised by :meth:`FileOperation.run` when its cancel event was set."""
+
+
+class FileOpProgress:
+    """Counters written by the engine's threads and read by the UI."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.bytes_done = 0
+        self.bytes_total = 0
+        self.files_done = 0
+        self.files_total = 0
+
+    def set_totals(self, files: int, size: int) -> None:
+        with self._lock:
+            self.files_total = files
+            self.bytes_total = size
+
+    def add_bytes(self, count: int) -> None:
+        with self._lock:
+            self.bytes_done += count
+
+    def add_file(self) -> None:
+        with self._lock:
+            self.files_done += 1
+
+    def snapshot(self) -> tuple[int, int, int, int]:
+        """Return ``(files_done, files_total, bytes_done, bytes_total)``."""
+        with self._lock:
+            return (
+                self.files_done,
+                self.files_total,
+                self.bytes_done,
+                self.bytes_total,
+            )
+
+
+class _Plan(NamedTuple):
+    """Everything below a source path, relative to it."""
+
+    # Directories, parents before children ("." is the source itself).
+    dirs: list[Path]
+    # Regular files and their sizes.
+    files: list[tuple[Path, int]]
+    symlinks: list[Path]
+    # Named pipes, sockets and devices.
+    special: list[Path]
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(size for _rel, size in self.files)
+
+
+def _enumerate(source: Path) -> _Plan:
+    """Walk *source* without following symlinks."""
+    st = os.lstat(source)
+    if stat.S_ISLNK(st.st_mode):
+        return _Plan([], [], [Path(".")], [])
+    if stat.S_ISREG(st.st_mode):
+        return _Plan([], [(Path("."), st.st_size)], [], [])
+    if not stat.S_ISDIR(st.st_mode):
+        return _Plan([], [], [], [Path(".")])
+    dirs: list[Path] = [Path(".")]
+    files: list[tuple[Path, int]] = []
+    symlinks: list[Path] = []
+    special: list[Path] = []
+    stack = [Path(".")]
+    while stack:
+        rel_dir = stack.pop()
+        with os.scandir(source / rel_dir) as it:
+            for entry in it:
+                rel = rel_dir / entry.name
+                if entry.is_symlink():
+                    symlinks.append(rel)
+                elif entry.is_dir(follow_symlinks=False):
+                    dirs.append(rel)
+                    stack.append(rel)
+                elif entry.is_file(follow_symlinks=False):
+                    files.append((rel, entry.stat(follow_symlinks=False).st_size))
+                else:
+                    special.append(rel)
+    return _Plan(dirs, files, symlinks, special)
+
+
+def _remove(path: Path) -> None:
+    """Remove *path* (file, symlink or tree) if it exists."""
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        with contextlib.suppress(FileNotFoundError):
+            path.unlink()
+
+
+def _rollback(created: list[Path]) -> None:
+    """Remove *created* paths, newest first (files before their directories)."""
+    for path in reversed(created):
+        try:
+            if path.is_dir() and not path.is_symlink():
+                os.rmdir(path)
+            else:
+                os.unlink(path)
+        except OSError as exc:
+            log.warning("file_op: cannot roll back %s: %s", path, exc)
+
+
+class FileOperation:
+    """One copy, move or delete, planned up front and run on a thread.
+
+    Args:
+        kind: The operation.
+        source: The file or directory to copy, move or delete.
+        dest: The path to create (``copy``/``move`` only); must not exist.
+        max_workers: Files copied concurrently.
+        chunk_size: Bytes copied per system call (and between cancel checks).
+    """
+
+    def __init__(
+        self,
+        kind: FileOpKind,
+        source: Path,
+        dest: Path | None = None,
+        *,
+        max_workers: int = 4,
+        chunk_size: int = _CHUNK_SIZE,
+    ) -> None:
+        if kind != "delete" and dest is None:
+            raise ValueError(f"{kind} needs a destination")
+        self.kind = kind
+        self.source = source
+        self.dest = dest
+        self.progress = FileOpProgress()
+        self._max_workers = max_workers
+        self._chunk_size = chunk_size
+
+    def run(self, cancel: threading.Event | None = None) -> None:
+        """Perform the operation, blocking until done.
+
+        Raises:
+            FileOperationCancelled: If *cancel* was set.  A copy (or the copy
+                phase of a move) has been rolled back by then.
+            FileExistsError: If the destination already exists.
+            shutil.SpecialFileError: If a copy (or a move across devices)
+                meets a named pipe, socket or device; nothing is written.
+            OSError: If the filesystem refuses; a failed copy is rolled back.
+        """
+        cancel = cancel if cancel is not None else threading.Event()
+        if self.kind == "delete":
+            self._delete(cancel)
+            return
+        assert self.dest is not None
+        if os.path.lexists(self.dest):
+            raise FileExistsError(errno.EEXIST, "Destination exists", str(self.dest))
+        if self.kind == "move" and self._rename():
+            return
+        self._copy(cancel)
+        if self.kind == "move":
+            # The copy is complete: finish the move even if cancelled now.
+            _remove(self.source)
+
+    # ── Move ────────────────────────────────────────────────────────────
+
+    def _rename(self) -> bool:
+        """Try a same-filesystem rename; return False if it crosses devices."""
+        assert self.dest is not None
+        try:
+            os.rename(self.source, self.dest)
+        except OSError as exc:
+            if exc.errno == errno.EXDEV:
+                return False
+            raise
+        self.progress.set_totals(1, 0)
+        self.progress.add_file()
+        return True
+
+    # ── Copy ────────────────────────────────────────────────────────────
+
+    def _copy(self, cancel: threading.Event) -> None:
+        assert self.dest is not None
+        plan = _enumerate(self.source)
+        if plan.special:
+            path = self.source / plan.special[0]
+            raise shutil.SpecialFileError(f"`{path}` is not a regular file")
+        self.progress.set_totals(len(plan.files) + len(plan.symlinks), plan.total_bytes)
+        if cancel.is_set():
+            raise FileOperationCancelled
+        failed = threading.Event()
+        # Every path this copy created, in creation order, for rollback.
+        created: list[Path] = []
+
+        def stopped() -> bool:
+            return cancel.is_set() or failed.is_set()
+
+        try:
+            for rel in plan.dirs:
+                os.mkdir(self.dest / rel)
+                created.append(self.dest / rel)
+            for rel in plan.symlinks:
+                os.symlink(os.readlink(self.source / rel), self.dest / rel)
+                created.append(self.dest / rel)
+                self.progress.add_file()
+            with ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="FileOperation"
+            ) as pool:
+                futures = [
+                    pool.submit(
+                        self._copy_file,
+                        self.source / rel,
+                        self.dest / rel,
+                        stopped,
+                        created,
+                    )
+                    for rel, _size in plan.files
+                ]
+                done, _pending = wait(futures, return_when=FIRST_EXCEPTION)
+                if any(f.exception() is not None for f in done):
+                    failed.set()  # let the other copies stop early
+                    wait(futures)
+                    # The copies stopped by ``failed`` raise
+                    # FileOperationCancelled: report the error that stopped
+                    # them instead of whichever was submitted first.
+                    for future in (*done, *futures):
+                        error = future.exception()
+                        if error is not None and not isinstance(
+                            error, FileOperationCancelled
+                        ):
+                            raise error
+                for future in futures:
+                    future.result()
+            # Like copytree: directory times/modes are applied last.
+            for rel in reversed(plan.dirs):
+                shutil.copystat(self.source / rel, self.dest / rel)
+        except BaseException:
+            log.info("file_op: rolling back %d path(s) of %s", len(created), self.dest)
+            _rollback(created)
+            if cancel.is_set():
+                raise FileOperationCancelled from None
+            raise
+
+    def _copy_file(
+        self,
+        src: Path,
+        dst: Path,
+        stopped: Callable[[], bool],
+        created: list[Path],
+    ) -> None:
+        with open(src, "rb") as fin, open(dst, "xb") as fout:
+            created.append(dst)
+            copy_chunk = self._chunk_copier(fin.fileno(), fout.fileno())
+            while True:
+                if stopped():
+                    raise FileOperationCancelled
+                copied = copy_chunk()
+                if copied == 0:
+                    break
+                self.progress.add_bytes(copied)
+        shutil.copystat(src, dst)
+        self.progress.add_file()
+
+    def _chunk_copier(self, fd_in: int, fd_out: int) -> Callable[[], int]:
+        """Return a function copying the next chunk, best method first.
+
+        Every method advances both file positions, so falling back midway
+        continues where the previous one stopped.
+        """
+        size = self._chunk_size
+        methods: list[Callable[[], int]] = []
+        if hasattr(os, "copy_file_range"):
+            methods.append(lambda: os.copy_file_range(fd_in, fd_out, size))
+        if hasattr(os, "sendfile"):
+            methods.append(lambda: os.sendfile(fd_out, fd_in, None, size))
+
+        def read_write() -> int:
+            data = os.read(fd_in, size)
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd_out, view) :]
+            return len(data)
+
+        methods.append(read_write)
+
+        def copy_chunk() -> int:
+            while True:
+                try:
+                    return methods[0]()
+                except OSError as exc:
+                    if len(methods) == 1 or exc.errno not in _FALLBACK_ERRNOS:
+                        raise
+                    methods.pop(0)
+
+        return copy_chunk
+
+    # ── Delete ──────────────────────────────────────────────────────────
+
+    def _delete(self, cancel: threading.Event) -> None:
+        plan = _enumerate(self.source)
+        self.progress.set_totals(
+            len(plan.files) + len(plan.symlinks) + len(plan.special), plan.total_bytes
+        )
+        for rel, size in plan.files:
+            if cancel.is_set():
+                raise FileOperationCancelled
+            os.unlink(self.source / rel)
+            self.progress.add_bytes(size)
+            self.progress.add_file()
+        for rel in plan.symlinks + plan.special:
+            if cancel.is_set():
+                raise FileOperationCancelled
+            os.unlink(self.source / rel)
+            self.progress.add_file()
+        for rel in reversed(plan.dirs):
+            os.rmdir(self.source / rel)
@@ -0,0 +1,230 @@
+"""Speculative, memory-bounded cache of files loaded for the editor.
+
+Opening a file reads it, detects its encoding and line ending, and resolves
+its EditorConfig chain (:func:`load_file_for_editor`).  When the user walks
+down the explorer or through workspace-search results, the next file they
+open is usually predictable, so :class:`FilePreloader` does that work ahead
+of time on a background thread:
+
+- **Cache** — an LRU of :class:`FileLoadResult` keyed by resolved path (so a
+  file prefetched from the explorer is found when it is opened through a
+  symlink or a relative path) and validated by ``(st_mtime_ns, st_size)``
+  plus the EditorConfig mtimes the result was built from.  It is bounded
+  by the total size of the cached text, and files larger than
+  ``max_file_size`` (or binary, or unreadable) are never cached.  Files
+  modified within the last two seconds are not cached either: a write
+  inside the filesystem's timestamp granularity would leave the
+  fingerprint unchanged.
+- **Prefetch** — :meth:`FilePreloader.prefetch` queues paths for one daemon
+  thread.  The most recent request is served first, and the queue is
+  bounded, so holding down an arrow key only preloads around where the
+  cursor stops.
+
+``MainView.action_open_code_editor`` calls :meth:`FilePreloader.lookup` on a
+file-service thread before loading a file itself; a hit skips the load.
+Cached results are shared, so callers must not mutate them (``CodeEditor``
+copies the lists it keeps).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import stat
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Iterable
+from pathlib import Path
+from typing import NamedTuple
+
+from textual_code.utils import is_binary_file
+from textual_code.widgets.code_editor_helpers import (
+    FileLoadResult,
+    _snapshot_editorconfig_mtimes,
+    load_file_for_editor,
+)
+
+log = logging.getLogger(__name__)
+
+_RACY_WINDOW_NS = 2_000_000_000
+# Rough per-entry overhead (result object, dicts, key) added to the text size.
+_ENTRY_OVERHEAD = 1024
+
+
+class _Fingerprint(NamedTuple):
+    mtime_ns: int
+    size: int
+
+
+class _Entry(NamedTuple):
+    fingerprint: _Fingerprint
+    result: FileLoadResult
+    cost: int
+
+
+def _key(path: Path) -> Path:
+    """Return the cache key of *path*: its resolved absolute path."""
+    try:
+        return path.expanduser().resolve()
+    except (OSError, RuntimeError):
+        return path
+
+
+def _fingerprint(path: Path) -> tuple[_Fingerprint, int] | None:
+    """Return ``(fingerprint, st_mode)`` of *path*, or None if unstat-able."""
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    return _Fingerprint(st.st_mtime_ns, st.st_size), st.st_mode
+
+
+class FilePreloader:
+    """Preloads files into a bounded LRU of editor load results.
+
+    Args:
+        max_bytes: Total characters of cached text before LRU eviction.
+        max_file_size: Larger files are never preloaded.
+        max_pending: Queued prefetch requests; the oldest are dropped.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 32 * 1024 * 1024,
+        max_file_size: int = 2 * 1024 * 1024,
+        max_pending: int = 32,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.max_file_size = max_file_size
+        self._entries: OrderedDict[Path, _Entry] = OrderedDict()
+        self._total = 0
+        self._lock = threading.Lock()
+        self._pending: deque[Path] = deque(maxlen=max_pending)
+        self._wakeup = threading.Condition(self._lock)
+        self._thread: threading.Thread | None = None
+
+    # ── Cache ───────────────────────────────────────────────────────────
+
+    def lookup(self, path: Path) -> FileLoadResult | None:
+        """Return the cached result for *path* if it is still current.
+
+        Blocks on a ``stat`` (and the EditorConfig chain's), so call it off
+        the event loop.  A stale entry is dropped.
+        """
+        return self._lookup(_key(path))
+
+    def _lookup(self, path: Path) -> FileLoadResult | None:
+        with self._lock:
+            entry = self._entries.get(path)
+        if entry is None:
+            return None
+        current = _fingerprint(path)
+        if (
+            current is not None
+            and current[0] == entry.fingerprint
+            and _snapshot_editorconfig_mtimes(entry.result.ec_search_dirs)
+            == entry.result.ec_mtimes
+        ):
+            with self._lock:
+                if self._entries.get(path) is entry:
+                    self._entries.move_to_end(path)
+            log.debug("file_preloader: hit %s", path)
+            return entry.result
+        self._invalidate(path)
+        return None
+
+    def load(self, path: Path) -> FileLoadResult | None:
+        """Load *path* into the cache unless it is cached already (blocking).
+
+        Returns the cached result, or None if the file is not cacheable.
+        """
+        path = _key(path)
+        cached = self._lookup(path)
+        if cached is not None:
+            return cached
+        before = _fingerprint(path)
+        if before is None:
+            return None
+        fingerprint, mode = before
+        if not stat.S_ISREG(mode) or fingerprint.size > self.max_file_size:
+            return None
+        if time.time_ns() - fingerprint.mtime_ns < _RACY_WINDOW_NS:
+            return None
+        if is_binary_file(path):
+            return None
+        result = load_file_for_editor(path)
+        after = _fingerprint(path)
+        if result.error is not None or after is None or after[0] != fingerprint:
+            return None  # unreadable, or changed while we read it
+        self._store(
+            path, _Entry(fingerprint, result, len(result.text) + _ENTRY_OVERHEAD)
+        )
+        return result
+
+    def invalidate(self, path: Path) -> None:
+        self._invalidate(_key(path))
+
+    def _invalidate(self, path: Path) -> None:
+        with self._lock:
+            entry = self._entries.pop(path, None)
+            if entry is not None:
+                self._total -= entry.cost
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total = 0
+
+    def _store(self, path: Path, entry: _Entry) -> None:
+        if entry.cost > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(path, None)
+            if old is not None:
+                self._total -= old.cost
+            self._entries[path] = entry
+            self._total += entry.cost
+            while self._total > self.max_bytes:
+                _path, evicted = self._entries.popitem(last=False)
+                self._total -= evicted.cost
+
+    # ── Prefetch ────────────────────────────────────────────────────────
+
+    def prefetch(self, paths: Iterable[Path]) -> None:
+        """Queue *paths* (most important first) for background loading."""
+        with self._wakeup:
+            for path in reversed(list(dict.fromkeys(paths))):
+                if path in self._pending:
+                    self._pending.remove(path)
+                self._pending.append(path)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="FilePreloader", daemon=True
+                )
+                self._thread.start()
+            self._wakeup.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._wakeup:
+                while not self._pending:
+                    self._wakeup.wait()
+                path = self._pending.pop()
+            try:
+                self.load(path)
+            except Exception:
+                log.debug("file_preloader: cannot preload %s", path, exc_info=True)
+
+
+_shared_preloader: FilePreloader | None = None
+_shared_lock = threading.Lock()
+
+
+def get_file_preloader() -> FilePreloader:
+    """Return the process-wide :class:`FilePreloader`, creating it lazily."""
+    global _shared_preloader
+    with _shared_lock:
+        if _shared_preloader is None:
+            _shared_preloader = FilePreloader()
+        return _shared_preloader
@@ -0,0 +1,131 @@
+"""Filesystem calls for the event loop, run on a bounded thread pool.
+
+Opening, saving, reloading and polling used to ``stat``, read and write
+files directly on Textual's event loop.  On a local disk that is
+microseconds; on NFS/SSHFS a single call can take hundreds of milliseconds
+(or hang until the mount times out), freezing the whole UI.
+
+:class:`FileService` moves those calls onto a small, bounded thread pool and
+exposes them as coroutines, each with a timeout:
+
+- The pool is bounded, so a hung mount ties up at most ``max_workers``
+  threads instead of one new thread per poll tick.
+- A call that exceeds its timeout raises :class:`TimeoutError` to the
+  awaiting coroutine.  Python cannot interrupt a blocked system call, so the
+  thread itself finishes (or stays stuck) in the background, but the UI
+  moves on.  A call still queued behind stuck ones is dropped.
+
+Long, cancellable work (tree copies, directory measurement) keeps its own
+threads; this service is for the short calls that sit on interactive paths.
+
+The module has no Textual dependency; widgets call :func:`get_file_service`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import EllipsisType
+from typing import Any
+
+from textual_code.utils import is_binary_file
+
+log = logging.getLogger(__name__)
+
+_DEFAULT_TIMEOUT = 10.0
+_MAX_WORKERS = 4
+
+
+class FileService:
+    """Run blocking filesystem calls off the event loop.
+
+    Args:
+        max_workers: Threads in the pool (calls beyond this are queued).
+        timeout: Default seconds to wait for a call; ``None`` waits forever.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = _MAX_WORKERS,
+        timeout: float | None = _DEFAULT_TIMEOUT,
+    ) -> None:
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="FileService"
+        )
+
+    async def run[T](
+        self,
+        fn: Callable[..., T],
+        *args: Any,
+        timeout: float | None | EllipsisType = ...,
+    ) -> T:
+        """Run *fn(*args)* on the pool and return its result.
+
+        *timeout* defaults to the service's timeout; ``None`` waits forever.
+
+        Raises:
+            TimeoutError: If the call does not finish in time.
+            Exception: Anything *fn* raises.
+        """
+        if timeout is ...:
+            timeout = self.timeout
+        future = asyncio.wrap_future(self._executor.submit(fn, *args))
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except TimeoutError:
+            name = getattr(fn, "__name__", repr(fn))
+            log.warning("file_service: %s%r timed out after %ss", name, args, timeout)
+            raise TimeoutError(f"{name} timed out after {timeout}s") from None
+
+    # ── Convenience wrappers ────────────────────────────────────────────
+
+    async def stat(self, path: Path) -> os.stat_result | None:
+        """Return ``os.stat(path)``, or None if it cannot be stat'ed."""
+        return await self.run(_stat_or_none, path)
+
+    async def mtime(self, path: Path) -> float | None:
+        """Return the ``st_mtime`` of *path*, or None if it cannot be stat'ed."""
+        st = await self.stat(path)
+        return st.st_mtime if st is not None else None
+
+    async def exists(self, path: Path) -> bool:
+        return await self.run(os.path.lexists, path)
+
+    async def is_binary(self, path: Path) -> bool:
+        """See :func:`textual_code.utils.is_binary_file`."""
+        return await self.run(is_binary_file, path)
+
+    async def read_bytes(self, path: Path) -> bytes:
+        return await self.run(path.read_bytes)
+
+    async def write_bytes(self, path: Path, data: bytes) -> None:
+        await self.run(path.write_bytes, data)
+
+    async def unlink(self, path: Path) -> None:
+        await self.run(path.unlink)
+
+
+def _stat_or_none(path: Path) -> os.stat_result | None:
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
+
+
+_shared_service: FileService | None = None
+_shared_lock = threading.Lock()
+
+
+def get_file_service() -> FileService:
+    """Return the process-wide :class:`FileService`, creating it lazily."""
+    global _shared_service
+    with _shared_lock:
+        if _shared_service is None:
+            _shared_service = FileService()
+        return _shared_service
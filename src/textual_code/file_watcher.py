@@ -0,0 +1,326 @@
+"""Event-driven file watching via Linux inotify (stdlib ``ctypes`` only).
+
+The explorer and the editors historically detected external changes by
+polling mtimes every two seconds.  On Linux this module replaces that with
+kernel notifications: :class:`InotifyWatcher` owns one inotify descriptor,
+reads it on a dedicated daemon thread, coalesces bursts of events (a
+``git checkout`` or a build can fire thousands) and hands each debounced
+batch to a callback as a :class:`FileChanges`.
+
+inotify watches are per directory and non-recursive, so consumers register
+the directories they care about — expanded explorer folders, parents of
+open files, EditorConfig search directories — under an *owner* key with
+:meth:`InotifyWatcher.set_watches`.  The watcher keeps the union.
+
+No third-party dependency is needed.  On other platforms (or when the
+kernel refuses, e.g. ``max_user_instances`` exhausted)
+:func:`create_file_watcher` returns ``None`` and callers fall back to
+polling.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import NamedTuple
+
+log = logging.getLogger(__name__)
+
+# ── inotify constants (from <sys/inotify.h>) ────────────────────────────────
+
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_EXCL_UNLINK = 0x04000000
+
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = 0o2000000
+
+# Events that change a directory's listing.
+_STRUCTURE_MASK = _IN_CREATE | _IN_DELETE | _IN_MOVED_FROM | _IN_MOVED_TO
+_SELF_MASK = _IN_DELETE_SELF | _IN_MOVE_SELF
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _STRUCTURE_MASK
+    | _SELF_MASK
+    | _IN_ONLYDIR
+    | _IN_EXCL_UNLINK
+)
+
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+_READ_SIZE = 64 * 1024
+
+
+class FileChanges(NamedTuple):
+    """One debounced batch of filesystem events."""
+
+    # Every path reported by an event (files and directories).
+    paths: frozenset[Path]
+    # Watched directories whose listing changed (entries created, deleted,
+    # renamed) or that were themselves removed/renamed.
+    dirs: frozenset[Path]
+    # The kernel queue overflowed: events were lost, rescan everything.
+    overflow: bool = False
+
+
+_libc: ctypes.CDLL | None = None
+
+
+def _load_libc() -> ctypes.CDLL | None:
+    global _libc
+    if _libc is not None:
+        return _libc
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_init1.restype = ctypes.c_int
+        libc.inotify_add_watch.argtypes = [
+            ctypes.c_int,
+            ctypes.c_char_p,
+            ctypes.c_uint32,
+        ]
+        libc.inotify_add_watch.restype = ctypes.c_int
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        libc.inotify_rm_watch.restype = ctypes.c_int
+    except (OSError, AttributeError) as exc:
+        log.debug("inotify unavailable: %s", exc)
+        return None
+    _libc = libc
+    return libc
+
+
+def inotify_supported() -> bool:
+    """Return True if this platform exposes inotify through libc."""
+    return _load_libc() is not None
+
+
+class InotifyWatcher:
+    """Watch a dynamic set of directories and report debounced changes.
+
+    Args:
+        callback: Called on the watcher thread with each :class:`FileChanges`
+            batch.  Must be thread-safe (e.g. ``App.post_message``).
+        debounce: Seconds of quiet before a batch is delivered.
+        max_delay: Upper bound on how long a continuous stream of events can
+            postpone delivery.
+
+    Raises:
+        OSError: If inotify is unavailable or the descriptor cannot be created.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[FileChanges], object],
+        *,
+        debounce: float = 0.1,
+        max_delay: float = 1.0,
+    ) -> None:
+        libc = _load_libc()
+        if libc is None:
+            raise OSError("inotify is not supported on this platform")
+        self._libc = libc
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_init1 failed: {os.strerror(err)}")
+        self._fd = fd
+        self._wake_r, self._wake_w = os.pipe()
+        self._callback = callback
+        self._debounce = debounce
+        self._max_delay = max_delay
+        self._lock = threading.Lock()
+        self._owners: dict[str, frozenset[Path]] = {}
+        # One wd can stand for several paths: the kernel hands out the same
+        # descriptor when two spellings (e.g. via a symlink) name one inode.
+        self._wd_to_dirs: dict[int, set[Path]] = {}
+        self._dir_to_wd: dict[Path, int] = {}
+        self._thread: threading.Thread | None = None
+        self._stopped = False
+
+    # ── Watch management ────────────────────────────────────────────────
+
+    @property
+    def watched_dirs(self) -> frozenset[Path]:
+        """Directories that currently hold an inotify watch."""
+        with self._lock:
+            return frozenset(self._dir_to_wd)
+
+    def set_watches(self, owner: str, dirs: Iterable[Path]) -> None:
+        """Replace the directories watched on behalf of *owner*.
+
+        Watches are reference-counted across owners: a directory is
+        unwatched only once no owner lists it any more.
+        """
+        with self._lock:
+            if self._stopped:
+                return
+            self._owners[owner] = frozenset(dirs)
+            wanted: set[Path] = set().union(*self._owners.values())
+            for stale in set(self._dir_to_wd) - wanted:
+                wd = self._dir_to_wd.pop(stale)
+                aliases = self._wd_to_dirs.get(wd, set())
+                aliases.discard(stale)
+                if not aliases:
+                    self._wd_to_dirs.pop(wd, None)
+                    self._libc.inotify_rm_watch(self._fd, wd)
+            for new in wanted - set(self._dir_to_wd):
+                self._add_watch_locked(new)
+
+    def _add_watch_locked(self, path: Path) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), _WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            # ENOENT/ENOTDIR are routine (directory vanished); ENOSPC means
+            # fs.inotify.max_user_watches is exhausted.
+            log.debug("inotify_add_watch(%s) failed: %s", path, os.strerror(err))
+            return
+        self._wd_to_dirs.setdefault(wd, set()).add(path)
+        self._dir_to_wd[path] = wd
+
+    # ── Lifecycle ───────────────────────────────────────────────────────
+
+    def start(self) -> None:
+        """Start the reader thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="InotifyWatcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the reader thread and release the inotify descriptor."""
+        with self._lock:
+            if self._stopped:
+                return
+            self._stopped = True
+        with contextlib.suppress(OSError):
+            os.write(self._wake_w, b"\0")
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+        for fd in (self._fd, self._wake_r, self._wake_w):
+            with contextlib.suppress(OSError):
+                os.close(fd)
+
+    # ── Reader thread ───────────────────────────────────────────────────
+
+    def _run(self) -> None:
+        paths: set[Path] = set()
+        dirs: set[Path] = set()
+        overflow = False
+        first_at = last_at = 0.0
+        poller = select.poll()
+        poller.register(self._fd, select.POLLIN)
+        poller.register(self._wake_r, select.POLLIN)
+        while True:
+            timeout_ms: float | None = None
+            if paths or dirs or overflow:
+                now = time.monotonic()
+                deadline = min(last_at + self._debounce, first_at + self._max_delay)
+                timeout_ms = max(0.0, deadline - now) * 1000
+            try:
+                readable = {fd for fd, _event in poller.poll(timeout_ms)}
+            except OSError:
+                return  # descriptors closed by stop()
+            if self._wake_r in readable:
+                return
+            if self._fd in readable:
+                try:
+                    data = os.read(self._fd, _READ_SIZE)
+                except BlockingIOError:
+                    data = b""
+                except OSError:
+                    return
+                if data:
+                    now = time.monotonic()
+                    if not (paths or dirs or overflow):
+                        first_at = now
+                    last_at = now
+                    overflow |= self._parse(data, paths, dirs)
+                # A steady stream keeps the descriptor readable, so poll()
+                # never times out: deliver once the batch is overdue anyway.
+                if not (paths or dirs or overflow) or (
+                    time.monotonic() < first_at + self._max_delay
+                ):
+                    continue
+            # The batch is quiet (poll() timed out) or overdue — deliver it.
+            batch = FileChanges(frozenset(paths), frozenset(dirs), overflow)
+            paths.clear()
+            dirs.clear()
+            overflow = False
+            try:
+                self._callback(batch)
+            except Exception:
+                log.exception("file watcher callback failed")
+
+    def _parse(self, data: bytes, paths: set[Path], dirs: set[Path]) -> bool:
+        """Decode raw inotify events into *paths*/*dirs*; return overflow flag."""
+        overflow = False
+        offset = 0
+        size = _EVENT_HEADER.size
+        with self._lock:
+            while offset + size <= len(data):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                raw_name = data[offset + size : offset + size + length]
+                offset += size + length
+                if mask & _IN_Q_OVERFLOW:
+                    overflow = True
+                    continue
+                directories = self._wd_to_dirs.get(wd)
+                if not directories:
+                    continue
+                if mask & _IN_IGNORED:
+                    # Kernel dropped the watch (directory deleted/unmounted).
+                    for directory in self._wd_to_dirs.pop(wd):
+                        if self._dir_to_wd.get(directory) == wd:
+                            del self._dir_to_wd[directory]
+                    continue
+                name = os.fsdecode(raw_name.rstrip(b"\0"))
+                for directory in directories:
+                    if mask & _SELF_MASK:
+                        paths.add(directory)
+                        dirs.add(directory)
+                        dirs.add(directory.parent)
+                        continue
+                    paths.add(directory / name if name else directory)
+                    if mask & _STRUCTURE_MASK:
+                        dirs.add(directory)
+        return overflow
+
+
+def create_file_watcher(
+    callback: Callable[[FileChanges], object], **kwargs: float
+) -> InotifyWatcher | None:
+    """Create and start an :class:`InotifyWatcher`, or return None if unsupported."""
+    if not inotify_supported():
+        return None
+    try:
+        watcher = InotifyWatcher(callback, **kwargs)
+    except OSError as exc:
+        log.info("file watcher unavailable, falling back to polling: %s", exc)
+        return None
+    watcher.start()
+    return watcher
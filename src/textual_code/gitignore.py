@@ -0,0 +1,226 @@
+"""Compiled, per-directory gitignore matching for the explorer.
+
+The explorer dims entries matched by ``.gitignore`` files.  Checking every
+loaded ``PathSpec`` for every rendered row (with ``relative_to`` calls and a
+regex scan per spec) is slow in monorepos with many nested ignore files, so
+this module builds **one merged matcher per directory** instead:
+
+- Every ``.gitignore`` is parsed once and cached by ``(path, mtime_ns)``.
+- The rules that apply to a directory — the ignore files of the workspace
+  root and of each ancestor down to the directory itself — are rewritten to
+  match workspace-relative paths and joined into a single compiled regex.
+  Alternatives are ordered last rule first, so the first alternative that
+  matches is the rule git would apply ("last match wins"), negations
+  included.
+- Matchers are cached per directory and revalidated by the mtimes of the
+  ignore files on their chain, so an edited ``.gitignore`` is picked up by
+  the next lookup without any explicit invalidation.
+
+Like the rest of the explorer, ``.gitignore`` files inside hidden
+directories (``.git/``, ``.venv/`` …) are not read.
+
+The module has no Textual dependency: :class:`DirectoryScanner` threads call
+:func:`get_gitignore_cache` to flag a whole listing in one batch.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+
+import pathspec.util
+from pathspec.pattern import RegexPattern
+
+log = logging.getLogger(__name__)
+
+_GITIGNORE = ".gitignore"
+# pathspec names a capture group in some patterns; names must be unique
+# once the patterns are joined into one regex.
+_NAMED_GROUP = re.compile(r"\(\?P<[^>]+>")
+
+type _Rule = tuple[str, bool]  # (regex source anchored with "^", include)
+type _Signature = tuple[tuple[Path, int], ...]
+
+
+def gitignore_mtime(directory: Path) -> int | None:
+    """Return the ``mtime_ns`` of *directory*/.gitignore, or None if absent."""
+    try:
+        return (directory / _GITIGNORE).stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+class GitignoreMatcher:
+    """Decide which entries of one directory are ignored.
+
+    Args:
+        rel_dir: The directory relative to the workspace root, as a POSIX
+            prefix ending in ``/`` (empty for the root itself).
+        rules: ``(workspace_relative_regex, include)`` pairs in git order
+            (root file first, each file top to bottom).
+    """
+
+    __slots__ = ("_fallback", "_includes", "_regex", "_rel_dir", "rule_count")
+
+    def __init__(self, rel_dir: str, rules: list[_Rule]) -> None:
+        self._rel_dir = rel_dir
+        self.rule_count = len(rules)
+        ordered = rules[::-1]  # last rule first: first match decides
+        self._includes = [include for _src, include in ordered]
+        self._regex: re.Pattern[str] | None = None
+        self._fallback: list[tuple[re.Pattern[str], bool]] = []
+        if not ordered:
+            return
+        alternatives = "|".join(
+            f"(?P<r{i}>{_NAMED_GROUP.sub('(?:', src[1:])})"
+            for i, (src, _include) in enumerate(ordered)
+        )
+        try:
+            self._regex = re.compile(f"^(?:{alternatives})")
+        except re.error as exc:
+            log.debug("gitignore: cannot merge rules (%s), matching one by one", exc)
+            self._fallback = [(re.compile(src), include) for src, include in ordered]
+
+    def is_ignored(self, name: str, is_dir: bool) -> bool:
+        """Return True if the entry *name* of this directory is ignored."""
+        if self._regex is None and not self._fallback:
+            return False
+        rel = self._rel_dir + name + ("/" if is_dir else "")
+        if self._regex is not None:
+            m = self._regex.match(rel)
+            if m is None or m.lastgroup is None:
+                return False
+            return self._includes[int(m.lastgroup[1:])]
+        for regex, include in self._fallback:
+            if regex.match(rel):
+                return include
+        return False
+
+    def ignored(
+        self, paths: Iterable[Path], is_dir: dict[Path, bool]
+    ) -> frozenset[Path]:
+        """Return the subset of *paths* (entries of this directory) that is ignored.
+
+        Dotfiles are never reported: the explorer does not dim them.
+        """
+        if self._regex is None and not self._fallback:
+            return frozenset()
+        return frozenset(
+            p
+            for p in paths
+            if not p.name.startswith(".")
+            and self.is_ignored(p.name, is_dir.get(p, False))
+        )
+
+
+_EMPTY = GitignoreMatcher("", [])
+
+
+class GitignoreCache:
+    """Thread-safe cache of parsed ignore files and per-directory matchers."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._files: dict[Path, tuple[int, list[_Rule]]] = {}
+        self._matchers: dict[
+            tuple[Path, Path], tuple[_Signature, GitignoreMatcher]
+        ] = {}
+
+    def _rules_for_file(self, path: Path, mtime_ns: int) -> list[_Rule]:
+        with self._lock:
+            cached = self._files.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        rules: list[_Rule] = []
+        try:
+            content = path.read_text(encoding="utf-8", errors="replace")
+        except (OSError, ValueError):
+            content = ""
+        factory = pathspec.util.lookup_pattern("gitignore")
+        for line in content.splitlines():
+            try:
+                pattern = factory(line)
+            except Exception as e:
+                log.warning("Failed to parse %s: %s", path, e)
+                continue
+            if (
+                not isinstance(pattern, RegexPattern)
+                or pattern.include is None
+                or pattern.regex is None
+            ):
+                continue
+            rules.append((pattern.regex.pattern, pattern.include))
+        with self._lock:
+            self._files[path] = (mtime_ns, rules)
+        return rules
+
+    def matcher(self, directory: Path, root: Path) -> GitignoreMatcher:
+        """Return the merged matcher for the entries of *directory*.
+
+        Directories outside *root* get a matcher that ignores nothing.
+        """
+        try:
+            rel = directory.relative_to(root)
+        except ValueError:
+            return _EMPTY
+        # Ignore files on the chain root → directory, skipping hidden dirs.
+        chain = [root]
+        current = root
+        for part in rel.parts:
+            current = current / part
+            chain.append(current)
+        signature: list[tuple[Path, int]] = []
+        for d in chain:
+            if any(p.startswith(".") for p in d.relative_to(root).parts):
+                continue
+            mtime = gitignore_mtime(d)
+            if mtime is not None:
+                signature.append((d, mtime))
+        key = (directory, root)
+        sig = tuple(signature)
+        with self._lock:
+            cached = self._matchers.get(key)
+        if cached is not None and cached[0] == sig:
+            return cached[1]
+
+        rules: list[_Rule] = []
+        for d, mtime in sig:
+            rel_d = d.relative_to(root).as_posix()
+            prefix = re.escape(rel_d + "/") if rel_d != "." else ""
+            rules.extend(
+                ("^" + prefix + src[1:], include)
+                for src, include in self._rules_for_file(d / _GITIGNORE, mtime)
+            )
+        rel_dir = rel.as_posix() + "/" if rel.parts else ""
+        matcher = GitignoreMatcher(rel_dir, rules) if rules else _EMPTY
+        with self._lock:
+            self._matchers[key] = (sig, matcher)
+        return matcher
+
+    def is_ignored(self, path: Path, root: Path, is_dir: bool) -> bool:
+        """Check a single path (convenience wrapper around :meth:`matcher`)."""
+        if path.name.startswith("."):
+            return False
+        return self.matcher(path.parent, root).is_ignored(path.name, is_dir)
+
+    def clear(self) -> None:
+        """Drop every cached ignore file and matcher."""
+        with self._lock:
+            self._files.clear()
+            self._matchers.clear()
+
+
+_shared_cache: GitignoreCache | None = None
+_shared_lock = threading.Lock()
+
+
+def get_gitignore_cache() -> GitignoreCache:
+    """Return the process-wide :class:`GitignoreCache`, creating it lazily."""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = GitignoreCache()
+        return _shared_cache
@@ -0,0 +1,160 @@
+"""Line-start index of an editor document for offset ↔ location conversion.
+
+Find, select-occurrence and the multi-cursor code work with character offsets
+into the document text (``"\\n"``-joined lines), but the editor stores the
+document as a list of lines.  Converting between the two used to mean building
+a table of line starts from the full text for every lookup.
+
+:class:`LineIndex` keeps the lengths of the lines in a Fenwick (binary indexed)
+tree, so both directions cost O(log n):
+
+- :meth:`LineIndex.offset_of` sums the lengths of the lines above a row.
+- :meth:`LineIndex.location_of` descends the tree to the row containing an
+  offset.
+
+An edit that changes line lengths without adding or removing lines (typing,
+deleting within a line, multi-cursor edits on separate lines) updates the
+edited rows in place.  An edit that changes the number of lines marks the index
+stale instead; it is rebuilt in O(n) from the live line list the next time it is
+queried, so a burst of Enter presses costs one rebuild, not one per key.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+
+class FenwickTree:
+    """Prefix sums over a list of non-negative weights, with point updates.
+
+    Shared by :class:`LineIndex` (line lengths) and the find match index
+    (matches per line).
+    """
+
+    def __init__(self, weights: list[int]) -> None:
+        self.weights = weights
+        tree = [0, *weights]
+        size = len(weights)
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def __len__(self) -> int:
+        return len(self.weights)
+
+    def add(self, index: int, delta: int) -> None:
+        """Add *delta* to the weight at *index*."""
+        self.weights[index] += delta
+        tree = self._tree
+        size = len(self.weights)
+        i = index + 1
+        while i <= size:
+            tree[i] += delta
+            i += i & -i
+
+    def prefix(self, index: int) -> int:
+        """Sum of the weights before *index*."""
+        tree = self._tree
+        total = 0
+        i = index
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def search(self, value: int) -> tuple[int, int]:
+        """Return ``(index, remainder)`` of the weight containing *value*.
+
+        *index* is the largest index whose prefix sum is ``<= value`` and
+        *remainder* is *value* minus that sum.  A value at or past the total
+        returns ``len(self)``.
+        """
+        tree = self._tree
+        size = len(self.weights)
+        index = 0
+        remaining = value
+        step = 1 << size.bit_length() if size else 0
+        while step:
+            nxt = index + step
+            if nxt <= size and tree[nxt] <= remaining:
+                index = nxt
+                remaining -= tree[nxt]
+            step >>= 1
+        return index, remaining
+
+
+class LineIndex:
+    """Fenwick tree over the lengths (plus newline) of a list of lines.
+
+    Args:
+        lines: The document's live line list.  It is read, never modified;
+            callers report edits with :meth:`update_rows` or
+            :meth:`invalidate`.
+    """
+
+    def __init__(self, lines: Sequence[str]) -> None:
+        self._lines = lines
+        self._tree = FenwickTree([])
+        self._stale = True
+
+    # ── Updates ─────────────────────────────────────────────────────────
+
+    def invalidate(self) -> None:
+        """Rebuild from the line list on the next query."""
+        self._stale = True
+
+    def update_rows(self, first: int, last: int) -> None:
+        """Re-read the lengths of rows *first*..*last* (inclusive).
+
+        Only valid when the edit did not change the number of lines;
+        otherwise call :meth:`invalidate`.
+        """
+        if self._stale:
+            return
+        tree = self._tree
+        lengths = tree.weights
+        if len(self._lines) != len(lengths):
+            self._stale = True
+            return
+        lines = self._lines
+        for row in range(max(first, 0), min(last, len(lengths) - 1) + 1):
+            delta = len(lines[row]) + 1 - lengths[row]
+            if delta:
+                tree.add(row, delta)
+
+    def _ensure(self) -> None:
+        if not self._stale:
+            return
+        self._tree = FenwickTree([len(line) + 1 for line in self._lines])
+        self._stale = False
+
+    # ── Queries ─────────────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        self._ensure()
+        return len(self._tree)
+
+    def line_start(self, row: int) -> int:
+        """Offset of the first character of *row* (clamped to the last line)."""
+        self._ensure()
+        return self._tree.prefix(min(max(row, 0), max(len(self._tree) - 1, 0)))
+
+    def offset_of(self, location: tuple[int, int]) -> int:
+        """Character offset of a ``(row, col)`` location."""
+        row, col = location
+        return self.line_start(row) + col
+
+    def location_of(self, offset: int) -> tuple[int, int]:
+        """``(row, col)`` of a character offset.
+
+        An offset past the end of the document lands on the last line.
+        """
+        self._ensure()
+        size = len(self._tree)
+        row, remaining = self._tree.search(max(offset, 0))
+        if row >= size and size:
+            row = size - 1
+            remaining = offset - self.line_start(row)
+        return (row, remaining)
@@ -0,0 +1,294 @@
+"""Index of the matches of one find query in an editor document.
+
+The find bar used to search the full text on every Find Next, and Find
+Previous walked every match from the start of the file to the cursor.
+A :class:`MatchIndex` is built once per find session instead:
+
+- **Scan** — :func:`scan_matches` runs the compiled pattern over the whole
+  document once (on a worker thread) and groups the matches by the row they
+  start on.
+- **Incremental updates** — edits are reported as row splices
+  (:meth:`MatchIndex.splice`).  For patterns that cannot match across a line
+  break (:func:`is_line_local`), only the rows the edit wrote are searched
+  again, lazily, on the next query.  Other patterns, and very large edits,
+  mark the index not ready so the owner schedules a new scan.
+- **Queries** — a :class:`~textual_code.line_index.FenwickTree` over the
+  number of matches per row turns "next match after the cursor", "previous
+  match", "match *k* of *n*" and "matches on this row" into O(log n) lookups,
+  which is what the match counter and the viewport highlighting need.
+
+Locations are ``(row, col)`` tuples, as in the TextArea.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Sequence
+from itertools import accumulate
+
+from textual_code.line_index import FenwickTree
+
+Location = tuple[int, int]
+
+# A match as stored per row: (start_col, rows_spanned, end_col).
+_Match = tuple[int, int, int]
+_NO_MATCHES: tuple[_Match, ...] = ()
+
+# Edits that rewrite more rows than this trigger a full rescan instead of
+# searching the rows again on the event loop.
+_MAX_INLINE_ROWS = 2000
+
+# Regex constructs that can match a line break or see past the current line.
+_MULTILINE_TOKENS = (
+    "\n",
+    "\\n",
+    "\\r",
+    "\\s",
+    "\\W",
+    "\\D",
+    "\\x",
+    "\\0",
+    "\\u",
+    "\\U",
+    "\\N",
+    "\\A",
+    "\\Z",
+)
+_DOTALL_FLAG = re.compile(r"\(\?[a-zA-Z]*s")
+# A character class, or an escape (so that ``\[`` does not open one).
+_CHAR_CLASS = re.compile(r"\\.|(\[\^?\]?(?:[^\]\\]|\\.)*\])", re.DOTALL)
+
+
+def _class_matches_newline(query: str) -> bool:
+    """Whether a character class in *query* can match ``"\\n"``.
+
+    Each class is compiled on its own, which covers negated classes,
+    ranges such as ``[\\t- ]`` and octal escapes such as ``[\\12]``.
+    """
+    for match in _CHAR_CLASS.finditer(query):
+        char_class = match.group(1)
+        if char_class is None:
+            continue
+        try:
+            if re.match(char_class, "\n"):
+                return True
+        except re.error:
+            return True
+    return False
+
+
+def is_line_local(query: str, use_regex: bool) -> bool:
+    """Whether every match of *query* lies within a single line.
+
+    Conservative: a regex that merely mentions a construct able to match a
+    line break is treated as multiline.
+    """
+    if not use_regex:
+        return "\n" not in query
+    return not (
+        any(token in query for token in _MULTILINE_TOKENS)
+        or _DOTALL_FLAG.search(query)
+        or _class_matches_newline(query)
+    )
+
+
+def scan_matches(
+    pattern: re.Pattern[str],
+    lines: Sequence[str],
+    cancelled: Callable[[], bool] | None = None,
+) -> list[tuple[_Match, ...] | None] | None:
+    """Search the ``"\\n"``-joined *lines* and group the matches by row.
+
+    Returns None if *cancelled* reports True part way through.
+    """
+    count = len(lines)
+    rows: list[tuple[_Match, ...] | None] = [_NO_MATCHES]
+    rows *= count
+    # Offset just past the newline of each row.
+    row_ends = list(accumulate(len(line) + 1 for line in lines))
+    row = 0
+    row_start = 0
+    pending: list[_Match] = []
+    for n, match in enumerate(pattern.finditer("\n".join(lines))):
+        if cancelled is not None and not n % 1024 and cancelled():
+            return None
+        start, end = match.span()
+        if row_ends[row] <= start:
+            if pending:
+                rows[row] = tuple(pending)
+                pending = []
+            row = bisect_right(row_ends, start, row)
+            row_start = row_ends[row - 1] if row else 0
+        end_row = bisect_right(row_ends, end, row) if end >= row_ends[row] else row
+        end_start = row_ends[end_row - 1] if end_row else 0
+        pending.append((start - row_start, end_row - row, end - end_start))
+    if pending:
+        rows[row] = tuple(pending)
+    return rows
+
+
+class MatchIndex:
+    """The matches of *pattern* in a document, kept current across edits.
+
+    Args:
+        lines: The document's live line list (read, never modified).
+        pattern: The compiled find pattern.
+        line_local: Whether matches never span rows (see
+            :func:`is_line_local`); enables per-row updates.
+    """
+
+    def __init__(
+        self, lines: Sequence[str], pattern: re.Pattern[str], line_local: bool
+    ) -> None:
+        self.lines = lines
+        self.pattern = pattern
+        self.line_local = line_local
+        # Bumped by every splice, so a scan of an older snapshot is rejected.
+        self.generation = 0
+        self._ready = False
+        self._rows: list[tuple[_Match, ...] | None] = []
+        self._dirty: list[int] = []
+        self._counts: FenwickTree | None = None
+        self._total = 0
+
+    # ── Updates ─────────────────────────────────────────────────────────
+
+    @property
+    def ready(self) -> bool:
+        """Whether the index reflects the document (no scan is needed)."""
+        return self._ready
+
+    def install(self, rows: list[tuple[_Match, ...] | None], generation: int) -> bool:
+        """Adopt the result of :func:`scan_matches`.
+
+        Returns False (and keeps the index not ready) if the document was
+        edited after the scanned snapshot was taken.
+        """
+        if generation != self.generation or len(rows) != len(self.lines):
+            return False
+        self._rows = rows
+        self._dirty = []
+        self._counts = None
+        self._total = sum(len(found) for found in rows if found)
+        self._ready = True
+        return True
+
+    def splice(self, top: int, old_bottom: int, new_bottom: int) -> None:
+        """Rows *top*..*old_bottom* were replaced by rows *top*..*new_bottom*."""
+        self.generation += 1
+        if not self._ready:
+            return
+        if not self.line_local or new_bottom - top >= _MAX_INLINE_ROWS:
+            self._ready = False
+            return
+        rows = self._rows
+        self._total -= sum(len(found) for found in rows[top : old_bottom + 1] if found)
+        rows[top : old_bottom + 1] = [None] * (new_bottom - top + 1)
+        shift = new_bottom - old_bottom
+        self._dirty = [
+            row + shift if row > old_bottom else row
+            for row in self._dirty
+            if not top <= row <= old_bottom
+        ]
+        self._dirty.extend(range(top, new_bottom + 1))
+        counts = self._counts
+        if shift:
+            self._counts = None
+        elif counts is not None:
+            for row in range(top, new_bottom + 1):
+                if counts.weights[row]:
+                    counts.add(row, -counts.weights[row])
+
+    def _refresh(self) -> bool:
+        """Search the dirty rows again; return whether the index is usable."""
+        if not self._ready:
+            return False
+        rows = self._rows
+        lines = self.lines
+        if len(rows) != len(lines):
+            self._ready = False
+            return False
+        if self._dirty:
+            finditer = self.pattern.finditer
+            counts = self._counts
+            for row in self._dirty:
+                found = tuple(
+                    (match.start(), 0, match.end()) for match in finditer(lines[row])
+                )
+                rows[row] = found or _NO_MATCHES
+                if found:
+                    self._total += len(found)
+                    if counts is not None:
+                        counts.add(row, len(found))
+            self._dirty = []
+        if self._counts is None:
+            self._counts = FenwickTree([len(found) if found else 0 for found in rows])
+        return True
+
+    # ── Queries ─────────────────────────────────────────────────────────
+
+    @property
+    def count(self) -> int | None:
+        """Number of matches, or None while the index is not ready."""
+        return self._total if self._refresh() else None
+
+    def _before(self, location: Location) -> int:
+        """Number of matches starting before *location*."""
+        assert self._counts is not None
+        row, col = location
+        if row >= len(self._rows):
+            return self._total
+        # (col, 0, 0) sorts before every match starting at col.
+        before = bisect_left(self._rows[row] or _NO_MATCHES, (col, 0, 0))
+        return self._counts.prefix(row) + before
+
+    def _nth(self, ordinal: int) -> tuple[Location, Location]:
+        assert self._counts is not None
+        row, i = self._counts.search(ordinal)
+        start_col, spanned, end_col = self._rows[row][i]  # type: ignore[index]
+        return (row, start_col), (row + spanned, end_col)
+
+    def next_match(self, location: Location) -> tuple[Location, Location] | None:
+        """First match starting at or after *location*, wrapping around."""
+        if not self._refresh() or not self._total:
+            return None
+        ordinal = self._before(location)
+        return self._nth(ordinal if ordinal < self._total else 0)
+
+    def previous_match(self, location: Location) -> tuple[Location, Location] | None:
+        """Last match ending before *location*, wrapping around."""
+        if not self._refresh() or not self._total:
+            return None
+        ordinal = self._before(location) - 1
+        if ordinal >= 0 and self._nth(ordinal)[1] >= location:
+            # Matches do not overlap, so the one before this ends in time.
+            ordinal -= 1
+        return self._nth(ordinal if ordinal >= 0 else self._total - 1)
+
+    def ordinal_of(self, start: Location, end: Location) -> int | None:
+        """1-based number of the match spanning *start*..*end*, if any."""
+        if not self._refresh():
+            return None
+        ordinal = self._before(start)
+        if ordinal < self._total and self._nth(ordinal) == (start, end):
+            return ordinal + 1
+        return None
+
+    def spans_on_row(self, row: int) -> list[tuple[int, int | None]]:
+        """Column ranges of the matches covering *row* (None: to line end)."""
+        if not self._refresh() or not self._total or row >= len(self._rows):
+            return []
+        assert self._counts is not None
+        spans: list[tuple[int, int | None]] = []
+        before = self._counts.prefix(row)
+        if before and not self.line_local:
+            # Only the last match starting above the row can reach into it.
+            (_, _), (end_row, end_col) = self._nth(before - 1)
+            if end_row > row:
+                spans.append((0, None))
+            elif end_row == row:
+                spans.append((0, end_col))
+        for start_col, spanned, end_col in self._rows[row] or ():
+            spans.append((start_col, None if spanned else end_col))
+        return spans
@@ -0,0 +1,216 @@
+"""Streaming, atomic save of editor text.
+
+Saving used to join the document, run the EditorConfig save transforms over
+the whole string, convert line endings, encode, and ``write_bytes`` the
+result over the original file — several full-size copies of a large file,
+and a window in which a crash leaves the original truncated.
+
+:func:`save_text` runs on a worker thread instead and streams:
+
+1. The text is cut into chunks of roughly ``chunk_size`` characters on line
+   boundaries.  Each chunk is trimmed (``trim_trailing_whitespace``),
+   converted to the target line ending and encoded with an *incremental*
+   encoder (so a BOM is written once), then written.  Without trimming the
+   chunks are plain slices and no per-line work is done.
+2. ``insert_final_newline`` / its removal only look at the end of the text,
+   so they never need the whole transformed document in memory.
+3. The bytes go to a temp file next to the target, which is flushed,
+   ``fsync``-ed and renamed over the target with ``os.replace``.  A failure
+   at any point (including an encoding error) removes the temp file and
+   leaves the original untouched.
+
+The target's permission bits are copied to the temp file, and a symlink is
+saved through to its target rather than replaced.  If the directory does not
+allow creating the temp file, the file is overwritten in place as before.
+"""
+
+from __future__ import annotations
+
+import codecs
+import contextlib
+import logging
+import os
+import stat
+import sys
+import uuid
+from pathlib import Path
+from typing import BinaryIO, NamedTuple
+
+log = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 1024 * 1024
+_NEWLINES = {"lf": "\n", "crlf": "\r\n", "cr": "\r"}
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+
+class SaveResult(NamedTuple):
+    """What :func:`save_text` wrote."""
+
+    # New mtime of the saved file (None if it could not be stat'ed).
+    mtime: float | None
+    # The LF text now on disk, or None when the transforms changed nothing.
+    saved_text: str | None
+
+
+def save_text(
+    path: Path,
+    text: str,
+    *,
+    encoding: str = "utf-8",
+    line_ending: str = "lf",
+    trim_trailing_whitespace: bool | None = None,
+    insert_final_newline: bool | None = None,
+    chunk_size: int = _CHUNK_SIZE,
+) -> SaveResult:
+    """Write LF-normalised *text* to *path* atomically; blocks until done.
+
+    *trim_trailing_whitespace* and *insert_final_newline* follow the
+    EditorConfig semantics of the editor (``None`` leaves the text as is,
+    ``False`` for *insert_final_newline* strips trailing newlines).
+
+    Raises:
+        OSError: If the file cannot be written.
+        UnicodeEncodeError: If *text* cannot be encoded with *encoding*.
+    """
+    target = Path(os.path.realpath(path)) if os.path.islink(path) else path
+    writer = _ChunkWriter(text, encoding, line_ending, chunk_size)
+    try:
+        tmp, fd = _create_temp(target)
+    except OSError as exc:
+        log.info("save: cannot create temp file next to %s (%s)", target, exc)
+        with open(target, "wb") as out:
+            saved_text = writer.write(
+                out, trim_trailing_whitespace, insert_final_newline
+            )
+    else:
+        try:
+            with os.fdopen(fd, "wb") as out:
+                saved_text = writer.write(
+                    out, trim_trailing_whitespace, insert_final_newline
+                )
+                out.flush()
+                os.fsync(out.fileno())
+            _copy_mode(target, tmp)
+            os.replace(tmp, target)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+            raise
+        _fsync_dir(target.parent)
+    try:
+        mtime: float | None = os.stat(target).st_mtime
+    except OSError:
+        mtime = None
+    return SaveResult(mtime, saved_text)
+
+
+class _ChunkWriter:
+    """Encodes one document chunk by chunk into a binary file."""
+
+    def __init__(
+        self, text: str, encoding: str, line_ending: str, chunk_size: int
+    ) -> None:
+        self._text = text
+        self._newline = _NEWLINES.get(line_ending, "\n")
+        self._encoder = codecs.getincrementalencoder(encoding)()
+        self._chunk_size = max(1, chunk_size)
+
+    def write(
+        self,
+        out: BinaryIO,
+        trim: bool | None,
+        final_newline: bool | None,
+    ) -> str | None:
+        """Write the document; return the saved LF text if it differs."""
+        text = self._text
+        end = len(text)
+        if final_newline is False:
+            end = _content_end(text, " \t\n" if trim else "\n")
+        if trim:
+            parts, changed = self._write_trimmed(out, end)
+            # A trimmed-empty last chunk means the text is empty or ends in "\n".
+            add_newline = (
+                bool(parts) and not parts[-1].endswith("\n") and parts[-1] != ""
+            )
+        else:
+            parts, changed = [], end != len(text)
+            for start in range(0, end, self._chunk_size):
+                self._emit(out, text[start : min(start + self._chunk_size, end)])
+            add_newline = end > 0 and text[end - 1] != "\n"
+        add_newline = add_newline and final_newline is True
+        if add_newline:
+            self._emit(out, "\n")
+        out.write(self._encoder.encode("", final=True))
+        if not (changed or add_newline):
+            return None
+        saved = "".join(parts) if trim else text[:end]
+        return saved + "\n" if add_newline else saved
+
+    def _write_trimmed(self, out: BinaryIO, end: int) -> tuple[list[str], bool]:
+        """Trim trailing blanks line by line; return the LF chunks written."""
+        text = self._text
+        parts: list[str] = []
+        changed = end != len(text)
+        start = 0
+        while start < end:
+            stop = text.find("\n", min(start + self._chunk_size, end) - 1, end)
+            stop = end if stop < 0 else stop + 1
+            chunk = text[start:stop]
+            lines = chunk.split("\n")
+            trimmed = [line.rstrip(" \t") for line in lines]
+            if not changed and any(
+                len(a) != len(b) for a, b in zip(lines, trimmed, strict=True)
+            ):
+                changed = True
+            chunk = "\n".join(trimmed)
+            parts.append(chunk)
+            self._emit(out, chunk)
+            start = stop
+        return parts, changed
+
+    def _emit(self, out: BinaryIO, chunk: str) -> None:
+        if self._newline != "\n":
+            chunk = chunk.replace("\n", self._newline)
+        out.write(self._encoder.encode(chunk))
+
+
+def _content_end(text: str, strip: str) -> int:
+    """Index after the last character of *text* not in *strip*."""
+    end = len(text)
+    while end and text[end - 1] in strip:
+        end -= 1
+    return end
+
+
+def _create_temp(target: Path) -> tuple[Path, int]:
+    """Create an empty temp file beside *target*; return its path and fd."""
+    tmp = target.with_name(f".{target.name}.{uuid.uuid4().hex[:8]}.tmp")
+    # 0o666 lets the umask decide, as for any newly created file.
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL | _O_BINARY, 0o666)
+    return tmp, fd
+
+
+def _copy_mode(source: Path, dest: Path) -> None:
+    """Give *dest* the permission bits of *source*, if it exists."""
+    try:
+        st = os.stat(source)
+    except OSError:
+        return
+    with contextlib.suppress(OSError):
+        os.chmod(dest, stat.S_IMODE(st.st_mode))
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Persist a rename in *directory* (best effort, POSIX only)."""
+    if sys.platform == "win32":
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
@@ -0,0 +1,74 @@
+"""Document model shared by every view of the same file.
+
+When a file is open in several split panes, each pane used to keep its own
+TextArea document: every keystroke was copied into the other panes as a
+whole-document replace (and a full re-parse), and every copy held the full
+text.  A :class:`SharedDocument` holds the parts of an editor that belong to
+the file rather than to a view:
+
+- the TextArea document (for a syntax-aware document, its tree-sitter tree),
+- the undo/redo history,
+- the language and the prepared highlight query.
+
+Each view (:class:`~textual_code.widgets.multi_cursor_text_area.MultiCursorTextArea`)
+keeps its own cursors, selection, scroll position, wrapping and highlight map.
+An edit is applied to the document once, by the view it was made in, which
+then reports the edited rows to the other attached views so they can update
+their wrapping, cursors and highlights.
+"""
+
+from __future__ import annotations
+
+import weakref
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from textual.widgets.text_area import DocumentBase, EditHistory
+
+    from textual_code.widgets.multi_cursor_text_area import MultiCursorTextArea
+
+
+class SharedDocument:
+    """A document, undo history and syntax tree shared between views.
+
+    Args:
+        document: The TextArea document.
+        history: The undo/redo history of *document*.
+        language: The language *document* was parsed as (None: plain text).
+        highlight_query: The highlight query prepared for *document*.
+    """
+
+    def __init__(
+        self,
+        document: DocumentBase,
+        history: EditHistory,
+        language: str | None,
+        highlight_query: object | None,
+    ) -> None:
+        self.document = document
+        self.history = history
+        self.language = language
+        self.highlight_query = highlight_query
+        self._views: weakref.WeakSet[MultiCursorTextArea] = weakref.WeakSet()
+        self._text: str | None = None
+
+    @property
+    def text(self) -> str:
+        """The document's text, joined once per edit for all views."""
+        if self._text is None:
+            self._text = self.document.text
+        return self._text
+
+    def invalidate_text(self) -> None:
+        """Forget the joined text after the document was edited."""
+        self._text = None
+
+    def attach(self, view: MultiCursorTextArea) -> None:
+        self._views.add(view)
+
+    def detach(self, view: MultiCursorTextArea) -> None:
+        self._views.discard(view)
+
+    def views(self) -> list[MultiCursorTextArea]:
+        """The views currently showing this document."""
+        return [view for view in self._views if view.document is self.document]
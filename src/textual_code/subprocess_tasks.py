@@ -13,8 +13,13 @@ from __future__ import annotations
 
 import logging
 import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 if TYPE_CHECKING:
     from rich.console import RenderableType
@@ -25,29 +30,196 @@ log = logging.getLogger(__name__)
 # ── Directory size calculation ───────────────────────────────────────────────
 
 
-def calc_dir_size(path: Path, threshold: int = 0) -> tuple[int, int]:
+class _DirSize(NamedTuple):
+    """Sizes of the files directly inside one directory."""
+
+    mtime_ns: int
+    total: int
+    count: int
+    subdirs: tuple[str, ...]
+
+
+class DirSizeCache:
+    """Thread-safe, bounded cache of per-directory file sizes.
+
+    Each entry holds the bytes and file count directly inside one
+    directory plus its subdirectories, and is valid while the directory's
+    ``mtime_ns`` is unchanged.  Re-measuring an unchanged tree therefore
+    costs one ``stat`` per directory instead of one per file.  Files
+    rewritten in place (same name, new size) do not bump the directory
+    mtime; that staleness is acceptable for a size *warning*.
+
+    Args:
+        max_entries: Directories kept; the least recently used is evicted.
+    """
+
+    def __init__(self, max_entries: int = 100_000) -> None:
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _DirSize] = OrderedDict()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, path: str, mtime_ns: int) -> _DirSize | None:
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or entry.mtime_ns != mtime_ns:
+                return None
+            self._entries.move_to_end(path)
+            return entry
+
+    def put(self, path: str, entry: _DirSize) -> None:
+        with self._lock:
+            self._entries[path] = entry
+            self._entries.move_to_end(path)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_size_cache: DirSizeCache | None = None
+_size_cache_lock = threading.Lock()
+
+
+def get_dir_size_cache() -> DirSizeCache:
+    """Return the process-wide :class:`DirSizeCache`, creating it lazily."""
+    global _size_cache
+    with _size_cache_lock:
+        if _size_cache is None:
+            _size_cache = DirSizeCache()
+        return _size_cache
+
+
+def _measure_dir(path: str) -> _DirSize:
+    """Sum the files directly inside *path* with one ``scandir`` pass.
+
+    Mirrors ``os.walk(followlinks=False)`` + ``getsize``: symlinks to files
+    count with their target's size, symlinked directories are not entered,
+    and unreadable entries are skipped.
+
+    Raises:
+        OSError: If *path* itself cannot be listed.
+    """
+    mtime_ns = os.stat(path).st_mtime_ns
+    total = 0
+    count = 0
+    subdirs: list[str] = []
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                    continue
+                total += entry.stat().st_size
+            except OSError:
+                continue
+            count += 1
+    return _DirSize(mtime_ns, total, count, tuple(subdirs))
+
+
+def calc_dir_size(
+    path: Path,
+    threshold: int = 0,
+    *,
+    cache: DirSizeCache | None = None,
+    progress: Callable[[int, int], object] | None = None,
+    cancel: threading.Event | None = None,
+    max_workers: int = 4,
+    progress_interval: float = 0.25,
+) -> tuple[int, int]:
     """Calculate total size and file count for a directory.
 
+    Directories are listed with ``os.scandir`` by *max_workers* threads
+    working off a shared queue, so deep trees on slow disks are measured
+    concurrently.
+
     Args:
         path: Directory to scan.
         threshold: When > 0, stop scanning once total exceeds this value.
+        cache: Per-directory results to reuse and fill (see
+            :class:`DirSizeCache`).  Only fully listed directories are
+            stored, so an early stop still leaves useful entries behind.
+        progress: Called as ``progress(total, count)`` from a worker thread
+            at most every *progress_interval* seconds while scanning.
+        cancel: When set, the scan stops as soon as possible and returns
+            the partial result.
+        max_workers: Number of scanning threads.
 
     Returns:
         (total_bytes, file_count) tuple.
     """
+    stop = cancel if cancel is not None else threading.Event()
+    pending: queue.SimpleQueue[str | None] = queue.SimpleQueue()
+    lock = threading.Lock()
     total = 0
     count = 0
-    for dirpath, _dirnames, filenames in os.walk(
-        path, followlinks=False, onerror=lambda _e: None
-    ):
-        for fname in filenames:
-            try:
-                total += os.path.getsize(os.path.join(dirpath, fname))
-            except OSError:
-                continue
-            count += 1
-            if threshold > 0 and total > threshold:
-                return total, count
+    outstanding = 1  # directories queued but not finished
+    reported_at = time.monotonic()
+    pending.put(os.fspath(path))
+
+    def work() -> None:
+        nonlocal total, count, outstanding, reported_at
+        while True:
+            directory = pending.get()
+            if directory is None:
+                return
+            subdirs: tuple[str, ...] = ()
+            if not stop.is_set():
+                entry = None
+                if cache is not None:
+                    try:
+                        entry = cache.get(directory, os.stat(directory).st_mtime_ns)
+                    except OSError:
+                        entry = None
+                if entry is None:
+                    try:
+                        entry = _measure_dir(directory)
+                    except OSError:
+                        entry = None
+                    else:
+                        if cache is not None:
+                            cache.put(directory, entry)
+                if entry is not None:
+                    subdirs = entry.subdirs
+                    with lock:
+                        total += entry.total
+                        count += entry.count
+                        if threshold > 0 and total > threshold:
+                            stop.set()
+                        now = time.monotonic()
+                        report = progress is not None and (
+                            now - reported_at >= progress_interval
+                        )
+                        if report:
+                            reported_at = now
+                            snapshot = (total, count)
+                    if report and progress is not None:
+                        progress(*snapshot)
+            with lock:
+                if not stop.is_set():
+                    outstanding += len(subdirs)
+                    for sub in subdirs:
+                        pending.put(sub)
+                outstanding -= 1
+                finished = outstanding == 0 or stop.is_set()
+            if finished:
+                for _ in range(max_workers):
+                    pending.put(None)
+
+    threads = [
+        threading.Thread(target=work, name=f"calc_dir_size_{i}", daemon=True)
+        for i in range(max_workers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
     return total, count
 
 
@@ -87,6 +259,57 @@ def scan_directory_sync(
     return entries, is_dir_cache
 
 
+def resolve_compact_chains(
+    dirs: Iterable[Path], show_hidden_files: bool
+) -> dict[Path, tuple[str, Path]]:
+    """Resolve single-child directory chains for compact folder display.
+
+    Starting from each directory in *dirs*, follows directories that have
+    exactly one visible child which is itself a directory.  All chains are
+    advanced together one level at a time, so a listing with many
+    subdirectories costs one ``scandir`` per directory per level.
+
+    Args:
+        dirs: Directories (as returned by :func:`scan_directory_sync`).
+        show_hidden_files: If False, dotfiles do not count as children.
+
+    Returns:
+        Mapping of each directory whose chain collapses to a
+        ``(joined_label, deepest_directory)`` tuple, e.g.
+        ``("src/main/java", Path(".../src/main/java"))``.  Directories
+        that do not collapse are omitted.
+    """
+    segments: dict[Path, list[str]] = {d: [d.name] for d in dirs}
+    deepest: dict[Path, Path] = {d: d for d in segments}
+    # Guard against symlink cycles (per chain, keyed by resolved path)
+    seen: dict[Path, set[Path]] = {d: set() for d in segments}
+    frontier = list(segments)
+    while frontier:
+        next_frontier: list[Path] = []
+        for origin in frontier:
+            children, is_dir_cache = scan_directory_sync(
+                deepest[origin], show_hidden_files
+            )
+            if len(children) != 1:
+                continue
+            child = children[0]
+            if not is_dir_cache.get(child, False):
+                continue
+            resolved = child.resolve()
+            if resolved in seen[origin]:
+                continue
+            seen[origin].add(resolved)
+            segments[origin].append(child.name)
+            deepest[origin] = child
+            next_frontier.append(origin)
+        frontier = next_frontier
+    return {
+        origin: ("/".join(parts), deepest[origin])
+        for origin, parts in segments.items()
+        if len(parts) > 1
+    }
+
+
 # ── Image rendering ─────────────────────────────────────────────────────────
 
 
@@ -0,0 +1,139 @@
+"""Syntax highlights of a large document, built for the viewport only.
+
+The TextArea keeps a highlight map of the whole document and rebuilds it by
+running the highlight query over the entire syntax tree after every edit —
+the main cost of typing in a large file.  :class:`ViewportHighlights` is a
+drop-in highlight map for large documents instead:
+
+- **On demand** — a row missing from the map is filled by querying the rows
+  in view plus a margin (a tree-sitter point range), so rows that are never
+  drawn are never highlighted.
+- **Per-line cache** — filled rows stay until an edit touches them.  Edits are
+  reported as row splices (:meth:`ViewportHighlights.splice`): the edited rows
+  are dropped and the rows below shift.  Rows whose syntax changed without
+  being edited (e.g. below a newly opened string or comment) are dropped with
+  :meth:`ViewportHighlights.discard_changed`, from ``Tree.changed_ranges``
+  between the syntax trees before and after the edit.
+
+Highlights are ``(start_byte, end_byte | None, name)`` per row, as in the
+TextArea's own map.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from textual.widgets.text_area import DocumentBase
+    from tree_sitter import Query, Tree
+
+Highlight = tuple[int, int | None, str]
+
+# Rows highlighted above and below the viewport by each query.
+_MARGIN = 50
+
+# Filled rows kept before the cache starts over (e.g. after a long scroll).
+_MAX_ROWS = 10_000
+
+
+class ViewportHighlights(dict[int, list[Highlight]]):
+    """Highlight map of *document* filled lazily, a viewport at a time.
+
+    Args:
+        document: The syntax-aware document to highlight.
+        query: The prepared highlight query.
+        window: Returns the ``(first, stop)`` rows currently in view.
+    """
+
+    def __init__(
+        self,
+        document: DocumentBase,
+        query: Query,
+        window: Callable[[], tuple[int, int]],
+    ) -> None:
+        super().__init__()
+        self.document = document
+        self.query = query
+        self.window = window
+
+    def __bool__(self) -> bool:
+        # The TextArea skips highlighting when its map is empty.
+        return True
+
+    def __missing__(self, row: int) -> list[Highlight]:
+        line_count = self.document.line_count
+        if not 0 <= row < line_count:
+            return []
+        if len(self) > _MAX_ROWS:
+            self.clear()
+        first, stop = self.window()
+        self._fill(
+            max(min(row, first) - _MARGIN, 0),
+            min(max(row + 1, stop) + _MARGIN, line_count) - 1,
+        )
+        return self[row]
+
+    def _fill(self, first: int, last: int) -> None:
+        """Highlight the rows *first*..*last* not already in the map."""
+        rows: dict[int, list[Highlight]] = {
+            row: [] for row in range(first, last + 1) if row not in self
+        }
+        if not rows:
+            return
+        captures = self.document.query_syntax_tree(
+            self.query, (first, 0), (last + 1, 0)
+        )
+        # Same row layout as TextArea._build_highlight_map, clipped to the rows.
+        for name, nodes in captures.items():
+            for node in nodes:
+                start_row, start_col = node.start_point
+                end_row, end_col = node.end_point
+                if start_row == end_row:
+                    line = rows.get(start_row)
+                    if line is not None:
+                        line.append((start_col, end_col, name))
+                    continue
+                line = rows.get(start_row)
+                if line is not None:
+                    line.append((start_col, None, name))
+                for middle in range(max(start_row + 1, first), min(end_row, last + 1)):
+                    line = rows.get(middle)
+                    if line is not None:
+                        line.append((0, None, name))
+                line = rows.get(end_row)
+                if line is not None:
+                    line.append((0, end_col, name))
+        self.update(rows)
+
+    # ── Updates ─────────────────────────────────────────────────────────
+
+    def splice(self, top: int, old_bottom: int, new_bottom: int) -> None:
+        """Rows *top*..*old_bottom* were replaced by rows *top*..*new_bottom*."""
+        shift = new_bottom - old_bottom
+        if not shift:
+            for row in range(top, new_bottom + 1):
+                self.pop(row, None)
+            return
+        moved = {
+            row + shift if row > old_bottom else row: highlights
+            for row, highlights in self.items()
+            if not top <= row <= old_bottom
+        }
+        self.clear()
+        self.update(moved)
+
+    def discard_changed(self, old_tree: Tree, new_tree: Tree) -> None:
+        """Drop the rows whose syntax differs between two trees of one edit.
+
+        *old_tree* must be the tree before the edit, already edited with it
+        (as the document does before re-parsing).
+        """
+        for changed in old_tree.changed_ranges(new_tree):
+            first = changed.start_point[0]
+            last = changed.end_point[0]
+            if last - first > _MAX_ROWS:
+                self.clear()
+                return
+            for row in range(first, last + 1):
+                self.pop(row, None)
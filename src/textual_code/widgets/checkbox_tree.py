@@ -357,6 +357,13 @@ class CheckboxTree(VerticalScroll, can_focus=True, can_focus_children=False):
     class SelectionChanged(Message):
         """Posted when any checkbox state changes."""
 
+    @dataclass
+    class CursorMoved(Message):
+        """Posted when the cursor moves to another row."""
+
+        file_path: Path
+        line_number: int
+
     def __init__(
         self,
         *,
@@ -530,11 +537,17 @@ class CheckboxTree(VerticalScroll, can_focus=True, can_focus_children=False):
 
     def _set_cursor(self, row: _FileRow | _MatchRow) -> None:
         """Move the virtual cursor to a row."""
-        if self._last_focused_row is not None and self._last_focused_row is not row:
+        moved = self._last_focused_row is not row
+        if self._last_focused_row is not None and moved:
             self._last_focused_row.remove_class("-cursor")
         self._last_focused_row = row
         row.add_class("-cursor")
         row.scroll_visible()
+        if moved:
+            file_path, line_number = row.data
+            self.post_message(
+                self.CursorMoved(file_path=file_path, line_number=line_number)
+            )
 
     def action_focus_next_row(self) -> None:
         visible = self._visible_rows()
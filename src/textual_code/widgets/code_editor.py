@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import logging
 import re
+import threading
 from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
@@ -18,6 +20,8 @@ from textual.reactive import reactive
 from textual.widgets import Button, Label, Static, TextArea
 from textual.worker import get_current_worker
 
+from textual_code.file_service import get_file_service
+from textual_code.match_index import MatchIndex, is_line_local, scan_matches
 from textual_code.modals import (
     ChangeEncodingModalResult,
     ChangeEncodingModalScreen,
@@ -40,6 +44,8 @@ from textual_code.modals import (
     UnsavedChangeModalResult,
     UnsavedChangeModalScreen,
 )
+from textual_code.save_pipeline import SaveResult, save_text
+from textual_code.shared_document import SharedDocument
 from textual_code.widgets.code_editor_git import (
     _MAX_DIFF_LINES as _MAX_DIFF_LINES,
 )
@@ -87,6 +93,9 @@ from textual_code.widgets.code_editor_helpers import (
 from textual_code.widgets.code_editor_helpers import (
     _build_line_offsets as _build_line_offsets,
 )
+from textual_code.widgets.code_editor_helpers import (
+    _compile_find_pattern as _compile_find_pattern,
+)
 from textual_code.widgets.code_editor_helpers import (
     _convert_indentation as _convert_indentation,
 )
@@ -132,6 +141,12 @@ from textual_code.widgets.code_editor_helpers import (
 from textual_code.widgets.code_editor_helpers import (
     _remove_final_newline as _remove_final_newline,
 )
+from textual_code.widgets.code_editor_helpers import (
+    _replace_all_matches as _replace_all_matches,
+)
+from textual_code.widgets.code_editor_helpers import (
+    _ReplaceAllResult as _ReplaceAllResult,
+)
 from textual_code.widgets.code_editor_helpers import (
     _snapshot_editorconfig_mtimes as _snapshot_editorconfig_mtimes,
 )
@@ -144,11 +159,17 @@ from textual_code.widgets.code_editor_helpers import (
 from textual_code.widgets.code_editor_helpers import (
     _word_boundary_pattern as _word_boundary_pattern,
 )
+from textual_code.widgets.code_editor_helpers import (
+    reload_file_for_editor as reload_file_for_editor,
+)
 from textual_code.widgets.find_replace_bar import FindReplaceBar
 from textual_code.widgets.multi_cursor_text_area import MultiCursorTextArea
 
 log = logging.getLogger(__name__)
 
+# Replace All on documents at least this long runs on a worker thread.
+_BACKGROUND_REPLACE_CHARS = 1 << 20
+
 
 @dataclass
 class EditorState:
@@ -177,6 +198,56 @@ class EditorState:
     show_indentation_guides: bool = True
     render_whitespace: str = "none"
     force_no_highlighting: bool = False
+    # Document, undo history and syntax tree shared with other views of the
+    # same file (None: rebuilt from text on remount).
+    document: SharedDocument | None = None
+
+    def drop_stale_document(self) -> None:
+        """Forget :attr:`document` once it no longer holds this state's text.
+
+        The views sharing it may have left it since the state was captured
+        (e.g. one was saved as another file), while edits to the file went on
+        updating :attr:`text`.
+        """
+        if self.document is not None and self.document.text != self.text:
+            self.document = None
+
+    def mark_saved(self, text: str, result: SaveResult) -> None:
+        """Record that the snapshot *text* was saved as *result* describes.
+
+        Like :meth:`CodeEditor._mark_saved`: text edited in (through a split
+        view) while the write was in flight stays unsaved.
+        """
+        saved_text = text if result.saved_text is None else result.saved_text
+        if self.text == text:
+            self.text = saved_text
+        self.initial_text = saved_text
+        if result.mtime is not None:
+            self.file_mtime = result.mtime
+
+
+@dataclass
+class EditorCaches:
+    """Derived data of a lazily unmounted editor, reused when it remounts.
+
+    Kept by MainView in a size-bounded LRU keyed by pane id, separately from
+    EditorState, so only recently hidden tabs hold on to a syntax tree.
+    """
+
+    text: str
+    document: SharedDocument
+    highlights: dict[int, list[tuple[int, int | None, str]]]
+    git_head_lines: list[str] | None
+    line_changes: dict[int, LineChangeType]
+
+    def fits(self, state: EditorState) -> bool:
+        """Whether the caches still describe *state*'s text and language."""
+        document = self.document
+        return (
+            state.document in (None, document)
+            and document.language == state.language
+            and self.text == state.text == document.text
+        )
 
 
 class _PathLabel(Label):
@@ -617,6 +688,7 @@ class CodeEditor(Static):
         default_render_whitespace: str = "none",
         default_warn_line_ending: bool = True,
         _from_state: EditorState | None = None,
+        _from_caches: EditorCaches | None = None,
         _from_loaded: FileLoadResult | None = None,
         _force_no_highlighting: bool = False,
         **kwargs,
@@ -626,12 +698,17 @@ class CodeEditor(Static):
         self.set_reactive(CodeEditor.path, path)
         self._file_mtime: float | None = None
         self._external_change_notification: Notification | None = None
+        # Serializes writes: saves run on the file service, off the loop.
+        self._save_lock = asyncio.Lock()
         self._force_no_highlighting = _force_no_highlighting
         self._syntax_theme: str = default_syntax_theme
         self._warn_line_ending: bool = default_warn_line_ending
         self._notified_copy_line_ending: bool = False
         # tracks the end offset of the last successful find for sequential search
         self._find_offset: int | None = None
+        # Match index of the open find bar's query (see _start_find_session)
+        self._find_session: MatchIndex | None = None
+        self._find_session_key: tuple[str, bool, bool] | None = None
         # Ctrl+D word-boundary mode: non-empty when initiated from collapsed cursor
         self._ctrl_d_query: str = ""
         # EditorConfig save-time transformations (None = not set)
@@ -646,6 +723,12 @@ class CodeEditor(Static):
         self._is_restoring: bool = False
         # Git diff gutter: cached HEAD lines for diff computation
         self._git_head_lines: list[str] | None = None
+        # Text the gutter indicators were last computed from
+        self._git_diff_text: str | None = None
+        # Document adopted by the text area on mount (see share_document)
+        self._shared_document: SharedDocument | None = None
+        # Highlights and git gutter adopted on mount (lazy remount)
+        self._restore_caches: EditorCaches | None = None
 
         if _from_state is not None:
             # Restore from captured state — skip file I/O
@@ -678,6 +761,12 @@ class CodeEditor(Static):
             self._force_no_highlighting = _from_state.force_no_highlighting
             self._restore_cursor = _from_state.cursor_end
             self._restore_scroll = _from_state.scroll_offset
+            self._shared_document = _from_state.document
+            if _from_caches is not None and _from_caches.fits(_from_state):
+                self._shared_document = _from_caches.document
+                self._restore_caches = _from_caches
+                self._git_head_lines = _from_caches.git_head_lines
+                self._git_diff_text = _from_caches.text
             self._is_restoring = True
             return
 
@@ -829,10 +918,18 @@ class CodeEditor(Static):
     def compose(self) -> ComposeResult:
         yield FindReplaceBar()
         # Custom languages require register_language() before use;
-        # pass None and let watch_language() handle registration.
-        lang = None if self.language in _CUSTOM_LANGUAGES else self.language
+        # pass None and let watch_language() handle registration.  Large
+        # documents also get their language after mount, so they are parsed
+        # on a worker thread instead of while composing.
+        lang = (
+            None
+            if self.language in _CUSTOM_LANGUAGES
+            or len(self.text) >= MultiCursorTextArea.BACKGROUND_PARSE_CHARS
+            else self.language
+        )
         yield MultiCursorTextArea.code_editor(
-            text=self.text,
+            # A shared document is adopted on mount instead of parsing a copy.
+            text="" if self._shared_document is not None else self.text,
             language=lang,
             tab_behavior="focus",
         )
@@ -863,6 +960,16 @@ class CodeEditor(Static):
         if self._is_restoring:
             # Language was set via set_reactive; apply it to the editor widget
             self.watch_language(self.language)
+            caches = self._restore_caches
+            if self._shared_document is not None:
+                self.editor.share_document(
+                    self._shared_document,
+                    highlights=caches.highlights if caches is not None else None,
+                )
+                self._shared_document = None
+            if caches is not None:
+                self.editor.set_line_changes(caches.line_changes)
+                self._restore_caches = None
             if self._restore_cursor is not None:
                 self.editor.cursor_location = self._restore_cursor
                 self._restore_cursor = None
@@ -911,6 +1018,13 @@ class CodeEditor(Static):
         """Apply git diff results on the main thread."""
         if not self.is_mounted:
             return
+        if (
+            head_lines is not None
+            and head_lines == self._git_head_lines
+            and self._git_diff_text == self.editor.text
+        ):
+            # Neither HEAD nor the text changed (e.g. gutter restored on remount).
+            return
         self._git_head_lines = head_lines
         self._recompute_git_diff()
 
@@ -927,7 +1041,9 @@ class CodeEditor(Static):
             if ta._line_changes:
                 ta.set_line_changes({})
             return
-        current_lines = ta.text.splitlines()
+        text = ta.text
+        self._git_diff_text = text
+        current_lines = text.splitlines()
         changes = _compute_line_changes(self._git_head_lines, current_lines)
         log.debug("git diff: %d changes for %s", len(changes), self.path)
         ta.set_line_changes(changes)
@@ -999,8 +1115,10 @@ class CodeEditor(Static):
     def watch_initial_text(self, initial_text: str) -> None:
         # update the title, as the initial text has changed
         self.update_title()
-        # replace the text in the editor with the new initial text
-        self.replace_editor_text(initial_text)
+        # replace the text in the editor with the new initial text (a view
+        # sharing the document of the saved editor already shows it)
+        if self.editor.text != initial_text:
+            self.replace_editor_text(initial_text)
 
     def watch_path(self, path: Path | None) -> None:
         # update the title, as the path has changed
@@ -1095,12 +1213,31 @@ class CodeEditor(Static):
             self._notified_copy_line_ending = True
 
     def _poll_file_change(self) -> None:
-        """Check if file was modified externally; auto-reload if no unsaved changes."""
+        """Check if file was modified externally; auto-reload if no unsaved changes.
+
+        The stat runs on the file service; :meth:`_handle_file_mtime` reacts
+        once it returns.
+        """
         if self.path is None or self._file_mtime is None:
             return
+        self._check_file_mtime(self.path)
+
+    @work(exclusive=True, group="file_poll", exit_on_error=False)
+    async def _check_file_mtime(self, path: Path) -> None:
         try:
-            current_mtime = self.path.stat().st_mtime
-        except OSError:
+            current_mtime = await get_file_service().mtime(path)
+        except TimeoutError:
+            return
+        if self.path == path:
+            self._handle_file_mtime(current_mtime)
+
+    def _handle_file_mtime(self, current_mtime: float | None) -> None:
+        """React to a freshly observed on-disk mtime (stat done by the caller).
+
+        Split from :meth:`_poll_file_change` so the stat can run off the
+        event loop (fallback polling worker) while the reaction stays here.
+        """
+        if current_mtime is None or self._file_mtime is None:
             return
         if current_mtime == self._file_mtime:
             return
@@ -1120,7 +1257,12 @@ class CodeEditor(Static):
         """Check if any .editorconfig in the chain has changed; re-apply if so."""
         if self.path is None or not self._ec_search_dirs:
             return
-        current = _snapshot_editorconfig_mtimes(self._ec_search_dirs)
+        self._handle_editorconfig_mtimes(
+            _snapshot_editorconfig_mtimes(self._ec_search_dirs)
+        )
+
+    def _handle_editorconfig_mtimes(self, current: dict[Path, float | None]) -> None:
+        """Re-apply EditorConfig if the observed mtimes differ from the snapshot."""
         if current != self._ec_mtimes:
             self._apply_editorconfig_changes()
 
@@ -1140,30 +1282,32 @@ class CodeEditor(Static):
             self._external_change_notification = None
 
     def _reload_file(self) -> None:
-        """Reload file content from disk, resetting unsaved state."""
+        """Reload file content from disk, resetting unsaved state.
+
+        The file is read and decoded on the file service.
+        """
         self._dismiss_external_change_notification()
         if self.path is None:
             return
+        self._reload_from_disk(self.path)
+
+    @work(exclusive=True, group="file_reload", exit_on_error=False)
+    async def _reload_from_disk(self, path: Path) -> None:
         try:
-            raw_bytes = self.path.read_bytes()
-        except OSError as e:
+            text, encoding, line_ending, mtime = await get_file_service().run(
+                reload_file_for_editor, path
+            )
+        except (OSError, TimeoutError) as e:
             self.notify(f"Error reloading file: {e}", severity="error")
             return
-        detected_encoding = _detect_encoding(raw_bytes)
-        try:
-            raw_text = raw_bytes.decode(detected_encoding)
-        except Exception:
-            raw_text = raw_bytes.decode("latin-1", errors="replace")
-        detected = _detect_line_ending(raw_text)
-        text = raw_text.replace("\r\n", "\n").replace("\r", "\n")
-        if text.startswith("\ufeff"):
-            text = text[1:]
-        self.encoding = detected_encoding
-        self.line_ending = detected
+        if self.path != path:
+            return
+        self.encoding = encoding
+        self.line_ending = line_ending
         self.initial_text = text  # triggers watch_initial_text → replace_editor_text
         self.text = text  # sync reactive so text == initial_text immediately
-        with contextlib.suppress(OSError):
-            self._file_mtime = self.path.stat().st_mtime
+        if mtime is not None:
+            self._file_mtime = mtime
         self.notify("File reloaded.", severity="information")
 
     def action_revert_file(self) -> None:
@@ -1182,51 +1326,83 @@ class CodeEditor(Static):
             return
         self._reload_file()
 
-    def _apply_save_transformations(self, text: str) -> str:
-        """Apply EditorConfig save-time transformations to text.
+    def _save_text(self, path: Path, text: str) -> SaveResult:
+        """Write *text* to *path* through the save pipeline (blocking)."""
+        return save_text(
+            path,
+            text,
+            encoding=self.encoding,
+            line_ending=self.line_ending,
+            trim_trailing_whitespace=self._trim_trailing_whitespace,
+            insert_final_newline=self._insert_final_newline,
+        )
 
-        Order: trim_trailing_whitespace first, then insert_final_newline.
-        Operates on LF-normalized text (before line ending conversion).
+    def _mark_saved(self, text: str, saved_text: str | None) -> None:
+        """Record that *saved_text* (from the snapshot *text*) is on disk.
+
+        *saved_text* is None when the save transforms left *text* unchanged.
         """
-        if self._trim_trailing_whitespace is True:
-            text = _trim_trailing_whitespace(text)
-        if self._insert_final_newline is True:
-            text = _insert_final_newline(text)
-        elif self._insert_final_newline is False:
-            text = _remove_final_newline(text)
-        return text
+        if saved_text is None:
+            saved_text = text
+        if self.text != text:
+            # Edited while the write was in flight: keep the new text unsaved.
+            self.set_reactive(CodeEditor.initial_text, saved_text)
+            self.update_title()
+            return
+        if saved_text != text:
+            self.text = saved_text
+            self.replace_editor_text(saved_text)
+        self.initial_text = self.text
 
     def _write_to_disk(self) -> None:
         """Write current text to disk and update mtime. Requires self.path is set."""
         assert self.path is not None
-        self._dismiss_external_change_notification()
-        try:
-            saved_text = self._apply_save_transformations(self.text)
-            content = _convert_line_ending(saved_text, self.line_ending)
-            self.path.write_bytes(content.encode(self.encoding))
-            if saved_text != self.text:
-                self.text = saved_text
-                self.replace_editor_text(saved_text)
-            self.initial_text = self.text
-            with contextlib.suppress(OSError):
-                self._file_mtime = self.path.stat().st_mtime
-            self.notify("File saved", severity="information")
-            self.post_message(self.Saved(code_editor=self))
-        except Exception as e:
-            self.notify(f"Error saving file: {e}", severity="error")
+        self._write_in_background()
 
-    def action_save(self) -> None:
+    @work(group="save", exit_on_error=False)
+    async def _write_in_background(self) -> None:
+        await self._write_file()
+
+    async def _write_file(self) -> bool:
+        """Write the current text to ``self.path`` on the file service.
+
+        Returns True once the file is written.  Text typed while the write
+        is in flight stays unsaved.
         """
-        Save the current text to the file.
+        path = self.path
+        assert path is not None
+        self._dismiss_external_change_notification()
+        async with self._save_lock:
+            text = self.text
+            try:
+                # No timeout: abandoning a half-written save would be worse.
+                result = await get_file_service().run(
+                    self._save_text, path, text, timeout=None
+                )
+            except Exception as e:
+                self.notify(f"Error saving file: {e}", severity="error")
+                return False
+            self._mark_saved(text, result.saved_text)
+            if result.mtime is not None:
+                self._file_mtime = result.mtime
+        self.notify("File saved", severity="information")
+        self.post_message(self.Saved(code_editor=self))
+        return True
+
+    async def _save(self) -> bool:
+        """Save to ``self.path`` unless the file changed on disk meanwhile.
+
+        An external change asks for confirmation instead and returns False;
+        the modal's answer decides whether the file is written.
         """
-        if self.path is None:
-            self.action_save_as()
-            return
+        path = self.path
+        assert path is not None
         # Check for external changes before saving
         try:
-            current_mtime = self.path.stat().st_mtime
-        except OSError:
-            current_mtime = None
+            current_mtime = await get_file_service().mtime(path)
+        except TimeoutError as e:
+            self.notify(f"Error saving file: {e}", severity="error")
+            return False
         if (
             current_mtime is not None
             and self._file_mtime is not None
@@ -1239,8 +1415,21 @@ class CodeEditor(Static):
                 self._write_to_disk()
 
             self.app.push_screen(OverwriteConfirmModalScreen(), do_overwrite)
+            return False
+        return await self._write_file()
+
+    def action_save(self) -> None:
+        """
+        Save the current text to the file.
+        """
+        if self.path is None:
+            self.action_save_as()
             return
-        self._write_to_disk()
+        self._save_in_background()
+
+    @work(group="save", exit_on_error=False)
+    async def _save_in_background(self) -> None:
+        await self._save()
 
     def action_save_as(self, *, on_complete: Callable | None = None) -> None:
         """
@@ -1259,42 +1448,49 @@ class CodeEditor(Static):
                     on_complete()
                 return
 
-            new_path = Path(result.file_path).resolve()
-            if new_path.exists():
-                self.notify("File already exists", severity="error")
-                if on_complete:
-                    on_complete()
-                return
-
-            try:
-                saved_text = self._apply_save_transformations(self.text)
-                content = _convert_line_ending(saved_text, self.line_ending)
-                new_path.write_bytes(content.encode(self.encoding))
-                if saved_text != self.text:
-                    self.text = saved_text
-                    self.replace_editor_text(saved_text)
-                self.initial_text = self.text
-                self.path = new_path
-                with contextlib.suppress(OSError):
-                    self._file_mtime = new_path.stat().st_mtime
-                self.post_message(
-                    self.SavedAs(
-                        code_editor=self,
-                    )
-                )
-                self.notify(f"File saved: {self.path}", severity="information")
-            except Exception as e:
-                self.notify(f"Error saving file: {e}", severity="error")
-                if on_complete:
-                    on_complete()
-                return
-
-            if on_complete:
-                on_complete()
+            self._save_as_in_background(Path(result.file_path).resolve(), on_complete)
 
         self.app.push_screen(SaveAsModalScreen(), do_save_as)
         return
 
+    @work(group="save", exit_on_error=False)
+    async def _save_as_in_background(
+        self, new_path: Path, on_complete: Callable | None
+    ) -> None:
+        service = get_file_service()
+        try:
+            exists = await service.exists(new_path)
+        except TimeoutError as e:
+            self.notify(f"Error saving file: {e}", severity="error")
+            exists = None
+        if exists:
+            self.notify("File already exists", severity="error")
+        if exists is False:
+            async with self._save_lock:
+                text = self.text
+                try:
+                    result = await service.run(
+                        self._save_text, new_path, text, timeout=None
+                    )
+                except Exception as e:
+                    self.notify(f"Error saving file: {e}", severity="error")
+                else:
+                    self._mark_saved(text, result.saved_text)
+                    if self.path is not None:
+                        # Views of the old file keep its document and history.
+                        self.editor.leave_shared_document()
+                    self.path = new_path
+                    if result.mtime is not None:
+                        self._file_mtime = result.mtime
+                    self.post_message(
+                        self.SavedAs(
+                            code_editor=self,
+                        )
+                    )
+                    self.notify(f"File saved: {self.path}", severity="information")
+        if on_complete:
+            on_complete()
+
     def action_close(
         self, *, on_complete: Callable[[bool], None] | None = None
     ) -> None:
@@ -1323,16 +1519,8 @@ class CodeEditor(Static):
                     if on_complete:
                         on_complete(False)
                     return
-                self.action_save()
-                if self.text == self.initial_text:
-                    self.post_message(self.Closed(code_editor=self))
-                    if on_complete:
-                        on_complete(True)
-                    return
-                else:
-                    if on_complete:
-                        on_complete(False)
-                    return
+                self._save_and_close(on_complete)
+                return
             else:
                 self.post_message(self.Closed(code_editor=self))
                 if on_complete:
@@ -1347,6 +1535,16 @@ class CodeEditor(Static):
         if on_complete:
             on_complete(True)
 
+    @work(group="save", exit_on_error=False)
+    async def _save_and_close(self, on_complete: Callable[[bool], None] | None) -> None:
+        """Save, then close if nothing is left unsaved."""
+        if await self._save() and self.text == self.initial_text:
+            self.post_message(self.Closed(code_editor=self))
+            if on_complete:
+                on_complete(True)
+        elif on_complete:
+            on_complete(False)
+
     def action_delete(self) -> None:
         """
         Delete the file.
@@ -1366,20 +1564,25 @@ class CodeEditor(Static):
                 )
                 return
             if result.should_delete:
-                try:
-                    self.path.unlink()
-                    self.notify(f"File deleted: {self.path}", severity="information")
-                    self.post_message(
-                        self.Deleted(
-                            code_editor=self,
-                        )
-                    )
-                except Exception as e:
-                    self.notify(f"Error deleting file: {e}", severity="error")
+                self._delete_in_background(self.path)
 
         assert self.path is not None
         self.app.push_screen(DeleteFileModalScreen(self.path), do_delete)
 
+    @work(group="delete", exit_on_error=False)
+    async def _delete_in_background(self, path: Path) -> None:
+        try:
+            await get_file_service().unlink(path)
+        except Exception as e:
+            self.notify(f"Error deleting file: {e}", severity="error")
+            return
+        self.notify(f"File deleted: {path}", severity="information")
+        self.post_message(
+            self.Deleted(
+                code_editor=self,
+            )
+        )
+
     def action_goto_line(self) -> None:
         """
         Open the Goto Line modal and move the cursor to the specified location.
@@ -1427,21 +1630,30 @@ class CodeEditor(Static):
         from textual.widgets.text_area import Selection
 
         query = event.query
-        text = self.text
 
         # Use tracked offset for sequential finds; fall back to cursor position
         if self._find_offset is not None:
             cursor_offset = self._find_offset
         else:
-            cursor_row, cursor_col = self.editor.cursor_location
-            lines = text.split("\n")
-            cursor_offset = (
-                sum(len(lines[i]) + 1 for i in range(cursor_row)) + cursor_col
+            cursor_offset = self.editor.line_index.offset_of(
+                self.editor.cursor_location
             )
 
+        index = self._ready_find_session(query, event.use_regex, event.case_sensitive)
+        if index is not None:
+            line_index = self.editor.line_index
+            found = index.next_match(line_index.location_of(cursor_offset))
+            if found is None:
+                self._find_offset = None
+                self.notify(f"'{query}' not found", severity="warning")
+                return
+            self._find_offset = line_index.offset_of(found[1])
+            self.editor.selection = Selection(*found)
+            return
+
         try:
             start_idx, end_idx = _find_next(
-                text, query, cursor_offset, event.use_regex, event.case_sensitive
+                self.text, query, cursor_offset, event.use_regex, event.case_sensitive
             )
         except re.error as e:
             self.notify(f"Invalid regex: {e}", severity="error")
@@ -1453,9 +1665,10 @@ class CodeEditor(Static):
             return
 
         self._find_offset = end_idx
+        line_index = self.editor.line_index
         self.editor.selection = Selection(
-            start=_text_offset_to_location(text, start_idx),
-            end=_text_offset_to_location(text, end_idx),
+            start=line_index.location_of(start_idx),
+            end=line_index.location_of(end_idx),
         )
 
     def on_find_replace_bar_find_previous(
@@ -1467,21 +1680,30 @@ class CodeEditor(Static):
         from textual.widgets.text_area import Selection
 
         query = event.query
-        text = self.text
 
         # Use tracked offset for sequential finds; fall back to cursor position
         if self._find_offset is not None:
             cursor_offset = self._find_offset
         else:
-            cursor_row, cursor_col = self.editor.cursor_location
-            lines = text.split("\n")
-            cursor_offset = (
-                sum(len(lines[i]) + 1 for i in range(cursor_row)) + cursor_col
+            cursor_offset = self.editor.line_index.offset_of(
+                self.editor.cursor_location
             )
 
+        index = self._ready_find_session(query, event.use_regex, event.case_sensitive)
+        if index is not None:
+            line_index = self.editor.line_index
+            found = index.previous_match(line_index.location_of(cursor_offset))
+            if found is None:
+                self._find_offset = None
+                self.notify(f"'{query}' not found", severity="warning")
+                return
+            self._find_offset = line_index.offset_of(found[0])
+            self.editor.selection = Selection(*found)
+            return
+
         try:
             start_idx, end_idx = _find_previous(
-                text, query, cursor_offset, event.use_regex, event.case_sensitive
+                self.text, query, cursor_offset, event.use_regex, event.case_sensitive
             )
         except re.error as e:
             self.notify(f"Invalid regex: {e}", severity="error")
@@ -1493,37 +1715,103 @@ class CodeEditor(Static):
             return
 
         self._find_offset = start_idx
+        line_index = self.editor.line_index
         self.editor.selection = Selection(
-            start=_text_offset_to_location(text, start_idx),
-            end=_text_offset_to_location(text, end_idx),
+            start=line_index.location_of(start_idx),
+            end=line_index.location_of(end_idx),
         )
 
     def on_find_replace_bar_replace_all(self, event: FindReplaceBar.ReplaceAll) -> None:
         if not event.query:
             return
 
-        find_query = event.query
-        replacement = event.replacement
-        use_regex = event.use_regex
-        case_sensitive = event.case_sensitive
-        flags = 0 if case_sensitive else re.IGNORECASE
-        if use_regex:
-            flags |= re.MULTILINE
         try:
-            pattern = re.compile(
-                find_query if use_regex else re.escape(find_query), flags
+            pattern = _compile_find_pattern(
+                event.query, event.use_regex, event.case_sensitive
             )
-            count = len(pattern.findall(self.text))
-            if count == 0:
-                self.notify(f"'{find_query}' not found", severity="warning")
-                return
-            # Replacement uses Python re.sub() syntax (\1, \2), not VSCode $1.
-            new_text = pattern.sub(replacement, self.text)
         except re.error as e:
             self.notify(f"Invalid regex: {e}", severity="error")
             return
-        self.replace_editor_text(new_text)
-        self.notify(f"Replaced {count} occurrence(s)", severity="information")
+        text = self.editor.text
+        if len(text) >= _BACKGROUND_REPLACE_CHARS:
+            self._replace_all_in_background(
+                pattern, event.replacement, event.query, text
+            )
+            return
+        try:
+            result = _replace_all_matches(pattern, event.replacement, text)
+        except re.error as e:
+            self.notify(f"Invalid regex: {e}", severity="error")
+            return
+        assert result is not None
+        self._apply_replace_all(result, event.query)
+
+    @work(exclusive=True, group="replace_all", exit_on_error=False)
+    async def _replace_all_in_background(
+        self, pattern: re.Pattern[str], replacement: str, query: str, text: str
+    ) -> None:
+        """Run a large Replace All on a thread with a cancellable progress toast.
+
+        The result is applied only if the document was not edited meanwhile.
+        """
+        document = self.editor.document
+        generation = self.editor.edit_generation
+        label = f"Replacing '{query}'"
+        toast = self.app.show_progress_toast(  # type: ignore[attr-defined]
+            label, get_current_worker(), group="replace_all"
+        )
+        done = 0.0
+
+        def _report(fraction: float) -> None:
+            nonlocal done
+            done = fraction
+
+        cancel = threading.Event()
+        task = asyncio.ensure_future(
+            asyncio.to_thread(
+                _replace_all_matches, pattern, replacement, text, cancel, _report
+            )
+        )
+        try:
+            while not task.done():
+                await asyncio.wait({task}, timeout=0.25)
+                toast.set_label(f"{label} ({done:.0%})")
+            result = task.result()
+        except asyncio.CancelledError:
+            cancel.set()
+            await asyncio.wait({task})
+            self.notify("Replace All cancelled", severity="warning")
+            raise
+        except re.error as e:
+            self.notify(f"Invalid regex: {e}", severity="error")
+            return
+        if result is None:
+            return
+        if (
+            self.editor.document is not document
+            or self.editor.edit_generation != generation
+        ):
+            self.notify(
+                "Replace All skipped: the file changed while it ran",
+                severity="warning",
+            )
+            return
+        self._apply_replace_all(result, query)
+
+    def _apply_replace_all(self, result: _ReplaceAllResult, query: str) -> None:
+        """Apply a computed Replace All as one undo step."""
+        if result.count == 0:
+            self.notify(f"'{query}' not found", severity="warning")
+            return
+        if result.new_text is not None:
+            self.replace_editor_text(result.new_text)
+        else:
+            line_index = self.editor.line_index
+            self.editor.apply_edits(
+                (line_index.location_of(start), line_index.location_of(end), rep)
+                for start, end, rep in result.edits
+            )
+        self.notify(f"Replaced {result.count} occurrence(s)", severity="information")
 
     def on_find_replace_bar_replace_current(
         self, event: FindReplaceBar.ReplaceCurrent
@@ -1543,11 +1831,9 @@ class CodeEditor(Static):
 
         sel = self.editor.selection
         text = self.text
-        lines = text.split("\n")
-        start_offset = (
-            sum(len(lines[i]) + 1 for i in range(sel.start[0])) + sel.start[1]
-        )
-        end_offset = sum(len(lines[i]) + 1 for i in range(sel.end[0])) + sel.end[1]
+        line_index = self.editor.line_index
+        start_offset = line_index.offset_of(sel.start)
+        end_offset = line_index.offset_of(sel.end)
 
         try:
             # Match against full text so lookaheads/lookbehinds can see context
@@ -1578,16 +1864,14 @@ class CodeEditor(Static):
                 end_idx = -1
             self.replace_editor_text(new_text)
             if start_idx != -1:
+                # The editor now holds new_text, so its index maps the offsets.
+                line_index = self.editor.line_index
                 self.editor.selection = Selection(
-                    start=_text_offset_to_location(new_text, start_idx),
-                    end=_text_offset_to_location(new_text, end_idx),
+                    start=line_index.location_of(start_idx),
+                    end=line_index.location_of(end_idx),
                 )
         else:
-            cursor_row, cursor_col = self.editor.cursor_location
-            lines = text.split("\n")
-            cursor_offset = (
-                sum(len(lines[i]) + 1 for i in range(cursor_row)) + cursor_col
-            )
+            cursor_offset = line_index.offset_of(self.editor.cursor_location)
             try:
                 start_idx, end_idx = _find_next(
                     text, find_query, cursor_offset, use_regex, case_sensitive
@@ -1599,12 +1883,13 @@ class CodeEditor(Static):
                 self.notify(f"'{find_query}' not found", severity="warning")
                 return
             self.editor.selection = Selection(
-                start=_text_offset_to_location(text, start_idx),
-                end=_text_offset_to_location(text, end_idx),
+                start=line_index.location_of(start_idx),
+                end=line_index.location_of(end_idx),
             )
 
     def on_find_replace_bar_closed(self, event: FindReplaceBar.Closed) -> None:
         self._find_offset = None
+        self._end_find_session()
         self.editor.focus()
 
     def on_find_replace_bar_select_all(self, event: FindReplaceBar.SelectAll) -> None:
@@ -1624,7 +1909,7 @@ class CodeEditor(Static):
             return
 
         matches = list(pattern.finditer(text))
-        count = self._apply_matches_as_cursors(matches, text)
+        count = self._apply_matches_as_cursors(matches)
 
         self._find_offset = None
         self.editor.focus()
@@ -1634,6 +1919,129 @@ class CodeEditor(Static):
         elif count >= 2:
             self.notify(f"{count} occurrences selected")
 
+    # ── find session ─────────────────────────────────────────────────────────
+
+    def on_find_replace_bar_query_changed(
+        self, event: FindReplaceBar.QueryChanged
+    ) -> None:
+        self._start_find_session(event.query, event.use_regex, event.case_sensitive)
+
+    def _start_find_session(
+        self, query: str, use_regex: bool, case_sensitive: bool
+    ) -> None:
+        """Index the matches of *query* for the counter, highlights and find.
+
+        The document is scanned once on a worker thread; afterwards the
+        editor keeps the index current as it is edited.
+        """
+        key = (query, use_regex, case_sensitive)
+        session = self._find_session
+        if (
+            session is not None
+            and key == self._find_session_key
+            and session.lines is self.editor.document.lines
+        ):
+            return
+        self._end_find_session()
+        if not query:
+            return
+        try:
+            pattern = _compile_find_pattern(query, use_regex, case_sensitive)
+        except re.error:
+            return  # reported when the user searches
+        session = MatchIndex(
+            self.editor.document.lines, pattern, is_line_local(query, use_regex)
+        )
+        self._find_session = session
+        self._find_session_key = key
+        self.editor.set_match_index(session)
+        self._scan_find_session()
+
+    def _end_find_session(self) -> None:
+        self.query_one(FindReplaceBar).set_match_count(None, None)
+        if self._find_session is None:
+            return
+        self._find_session = None
+        self._find_session_key = None
+        self.workers.cancel_group(self, "find_index")
+        self.editor.set_match_index(None)
+
+    def _ready_find_session(
+        self, query: str, use_regex: bool, case_sensitive: bool
+    ) -> MatchIndex | None:
+        """The find session's index if it is current for this query."""
+        session = self._find_session
+        if (
+            session is None
+            or self._find_session_key != (query, use_regex, case_sensitive)
+            or session.lines is not self.editor.document.lines
+            or session.count is None
+        ):
+            return None
+        return session
+
+    def _scan_find_session(self) -> None:
+        session = self._find_session
+        if session is not None:
+            self._scan_matches(session, list(session.lines), session.generation)
+
+    @work(thread=True, exclusive=True, group="find_index")
+    def _scan_matches(
+        self, session: MatchIndex, lines: list[str], generation: int
+    ) -> None:
+        """Search a snapshot of the document in a background thread."""
+        worker = get_current_worker()
+        rows = scan_matches(session.pattern, lines, lambda: worker.is_cancelled)
+        if rows is None or worker.is_cancelled:
+            return
+        try:
+            self.app.call_from_thread(
+                self._install_find_matches, session, rows, generation
+            )
+        except RuntimeError as exc:
+            if "loop" not in str(exc).lower() and "closed" not in str(exc).lower():
+                raise
+            log.debug("call_from_thread suppressed (app exiting): %s", exc)
+
+    def _install_find_matches(
+        self, session: MatchIndex, rows: list, generation: int
+    ) -> None:
+        if session is not self._find_session:
+            return
+        if not session.install(rows, generation):
+            # Edited while scanning: scan the current text again.
+            self._scan_find_session()
+            return
+        self.editor.refresh_matches()
+        self._update_match_count()
+
+    def _sync_find_session(self) -> None:
+        """Follow an edit or a replaced document with the find session."""
+        session = self._find_session
+        if session is None:
+            return
+        if session.lines is not self.editor.document.lines:
+            key = self._find_session_key
+            self._end_find_session()
+            if key is not None:
+                self._start_find_session(*key)
+            return
+        if not session.ready:
+            self._scan_find_session()
+        self._update_match_count()
+
+    def _update_match_count(self) -> None:
+        session = self._find_session
+        if session is None:
+            return
+        total = session.count
+        current = None
+        if total:
+            selection = self.editor.selection
+            start, end = sorted((selection.start, selection.end))
+            current = session.ordinal_of(start, end)
+        self.query_one(FindReplaceBar).set_match_count(current, total)
+
     def action_change_language(self) -> None:
         """
         Open the Change Language modal and update the syntax highlighting language.
@@ -1733,11 +2141,13 @@ class CodeEditor(Static):
         self.text = event.control.text
         # Recompute git diff using cached HEAD (no subprocess)
         self._recompute_git_diff()
+        self._sync_find_session()
 
     @on(TextArea.SelectionChanged)
     def on_selection_changed(self, event: TextArea.SelectionChanged):
         event.stop()
         self._notify_footer()
+        self._update_match_count()
 
     @on(MultiCursorTextArea.CursorsChanged)
     def on_cursors_changed(self, event: MultiCursorTextArea.CursorsChanged):
@@ -1770,13 +2180,13 @@ class CodeEditor(Static):
         if sel.start != sel.end:
             return self.editor.selected_text
         row, col = self.editor.cursor_location
-        return _get_word_at_location(self.text, row, col)
+        return _get_word_at_location(self.editor.document.get_line(row), 0, col)
 
-    def _apply_matches_as_cursors(self, matches: list[re.Match], text: str) -> int:
+    def _apply_matches_as_cursors(self, matches: list[re.Match]) -> int:
         """Set primary selection to first match, add extra cursors for the rest.
 
-        Zero-length matches are silently skipped.
-        Returns the number of matches applied.
+        *matches* must come from the editor's current text.  Zero-length
+        matches are silently skipped.  Returns the number of matches applied.
         """
         from textual.widgets.text_area import Selection
 
@@ -1786,19 +2196,17 @@ class CodeEditor(Static):
         if not matches:
             return 0
 
-        line_starts = _build_line_offsets(text)
+        location_of = self.editor.line_index.location_of
 
         first = matches[0]
         self.editor.selection = Selection(
-            start=_text_offset_to_location(text, first.start(), line_starts),
-            end=_text_offset_to_location(text, first.end(), line_starts),
+            start=location_of(first.start()),
+            end=location_of(first.end()),
         )
 
-        for m in matches[1:]:
-            self.editor.add_cursor(
-                _text_offset_to_location(text, m.end(), line_starts),
-                anchor=_text_offset_to_location(text, m.start(), line_starts),
-            )
+        self.editor.add_cursors(
+            (location_of(m.end()), location_of(m.start())) for m in matches[1:]
+        )
 
         return len(matches)
 
@@ -1822,7 +2230,7 @@ class CodeEditor(Static):
         else:
             pattern = re.compile(re.escape(query), re.IGNORECASE)
         matches = list(pattern.finditer(text))
-        count = self._apply_matches_as_cursors(matches, text)
+        count = self._apply_matches_as_cursors(matches)
         self._find_offset = None
 
         if count == 0:
@@ -1841,7 +2249,6 @@ class CodeEditor(Static):
         """
         from textual.widgets.text_area import Selection
 
-        text = self.text
         query = self._get_query_text()
         if not query:
             return
@@ -1852,12 +2259,12 @@ class CodeEditor(Static):
         if sel.start == sel.end:
             self._ctrl_d_query = query
             row, col = self.editor.cursor_location
-            line_offset = _location_to_text_offset(text, (row, 0))
-            for m in re.finditer(_word_boundary_pattern(query), text):
-                if m.start() <= line_offset + col < m.end():
+            # The query is a word from this line; \b also holds at line ends.
+            line = self.editor.document.get_line(row)
+            for m in re.finditer(_word_boundary_pattern(query), line):
+                if m.start() <= col < m.end():
                     self.editor.selection = Selection(
-                        start=_text_offset_to_location(text, m.start()),
-                        end=_text_offset_to_location(text, m.end()),
+                        start=(row, m.start()), end=(row, m.end())
                     )
                     return
             return
@@ -1867,12 +2274,14 @@ class CodeEditor(Static):
         if self._ctrl_d_query and self.editor.selected_text != self._ctrl_d_query:
             self._ctrl_d_query = ""
 
+        text = self.text
+        line_index = self.editor.line_index
         if self.editor.extra_cursors:
             last_cursor = self.editor.extra_cursors[-1]
             last_anchor = self.editor.extra_anchors[-1]
-            search_from = _location_to_text_offset(text, max(last_cursor, last_anchor))
+            search_from = line_index.offset_of(max(last_cursor, last_anchor))
         else:
-            search_from = _location_to_text_offset(text, max(sel.start, sel.end))
+            search_from = line_index.offset_of(max(sel.start, sel.end))
 
         if self._ctrl_d_query:
             start, end = _find_next(
@@ -1888,8 +2297,8 @@ class CodeEditor(Static):
         if start == -1:
             return
 
-        match_start = _text_offset_to_location(text, start)
-        match_end = _text_offset_to_location(text, end)
+        match_start = line_index.location_of(start)
+        match_end = line_index.location_of(end)
 
         # Check if match is already selected (primary or any extra cursor)
         primary_start = min(sel.start, sel.end)
@@ -1950,12 +2359,15 @@ class CodeEditor(Static):
 
     def capture_state(self) -> EditorState:
         """Serialize current editor state for lazy unmounting."""
+        document: SharedDocument | None
         try:
             scroll = (int(self.editor.scroll_x), int(self.editor.scroll_y))
             cursor = self.editor.selection.end
+            document = self.editor.shared_document
         except Exception:
             scroll = (0, 0)
             cursor = (0, 0)
+            document = None
         state = EditorState(
             pane_id=self.pane_id,
             path=self.path,
@@ -1980,44 +2392,64 @@ class CodeEditor(Static):
             warn_line_ending=self._warn_line_ending,
             notified_copy_line_ending=self._notified_copy_line_ending,
             force_no_highlighting=self._force_no_highlighting,
+            document=document,
         )
         log.debug("capture_state: pane=%s path=%s", state.pane_id, state.path)
         return state
 
+    def capture_caches(self) -> EditorCaches | None:
+        """Capture the syntax tree, highlights and git gutter for a remount."""
+        try:
+            ta = self.editor
+        except Exception:
+            return None
+        if ta.parse_pending:
+            return None
+        document = ta.shared_document
+        return EditorCaches(
+            text=document.text,
+            document=document,
+            highlights=ta._highlights,
+            git_head_lines=self._git_head_lines,
+            line_changes=ta._line_changes,
+        )
+
     @classmethod
-    def from_state(cls, state: EditorState) -> CodeEditor:
-        """Create a CodeEditor from a captured EditorState (no file I/O)."""
+    def from_state(
+        cls, state: EditorState, caches: EditorCaches | None = None
+    ) -> CodeEditor:
+        """Create a CodeEditor from a captured EditorState (no file I/O).
+
+        *caches* from :meth:`capture_caches` are adopted when they still match
+        the state's text, so the remount skips parsing and highlighting.
+        """
         log.debug("from_state: pane=%s path=%s", state.pane_id, state.path)
         return cls(
             pane_id=state.pane_id,
             path=state.path,
             _from_state=state,
+            _from_caches=caches,
         )
 
     @staticmethod
-    def save_from_state(state: EditorState) -> None:
-        """Save an unmounted editor's state to disk.
+    def save_from_state(state: EditorState, text: str) -> SaveResult:
+        """Write *text*, a snapshot of an unmounted editor's text, to disk.
 
-        Applies save-time transformations and updates state.initial_text
-        and state.file_mtime in place.
+        Blocking, so it runs on the file service; *state* is only read, for
+        its path and save settings.  Pass the result to
+        :meth:`EditorState.mark_saved` back on the event loop.
+
+        Raises:
+            Exception: Whatever :func:`save_text` raises (e.g. ``OSError``).
         """
-        if state.path is None:
-            return
-        try:
-            text = state.text
-            if state.trim_trailing_whitespace is True:
-                text = _trim_trailing_whitespace(text)
-            if state.insert_final_newline is True:
-                text = _insert_final_newline(text)
-            elif state.insert_final_newline is False:
-                text = _remove_final_newline(text)
-            content = _convert_line_ending(text, state.line_ending)
-            state.path.write_bytes(content.encode(state.encoding))
-            if text != state.text:
-                state.text = text
-            state.initial_text = state.text
-            with contextlib.suppress(OSError):
-                state.file_mtime = state.path.stat().st_mtime
-            log.debug("save_from_state: saved %s", state.path)
-        except Exception as e:
-            log.error("save_from_state: error saving %s: %s", state.path, e)
+        assert state.path is not None
+        result = save_text(
+            state.path,
+            text,
+            encoding=state.encoding,
+            line_ending=state.line_ending,
+            trim_trailing_whitespace=state.trim_trailing_whitespace,
+            insert_final_newline=state.insert_final_newline,
+        )
+        log.debug("save_from_state: saved %s", state.path)
+        return result
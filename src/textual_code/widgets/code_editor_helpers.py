@@ -3,11 +3,19 @@
 from __future__ import annotations
 
 import contextlib
+import functools
 import logging
+import os
 import re
+import stat
+import threading
+import time
 from bisect import bisect_right
+from collections import OrderedDict
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import NamedTuple
 
 from charset_normalizer import detect as _cn_detect
 
@@ -15,12 +23,17 @@ log = logging.getLogger(__name__)
 
 # ── EditorConfig support ────────────────────────────────────────────────────
 
+# Files modified this recently are not cached (see EditorConfigCache).
+_RACY_WINDOW_NS = 2_000_000_000
 
+
+@functools.lru_cache(maxsize=1024)
 def _editorconfig_glob_to_pattern(glob: str) -> re.Pattern:
     """Convert an EditorConfig glob pattern to a compiled re.Pattern.
 
     If the glob contains no slash, it is prefixed with '**/' so that it
     matches the filename at any directory depth (per EditorConfig spec).
+    Compiled patterns are memoized: the same globs recur in every project.
     """
     if "/" not in glob:
         glob = "**/" + glob
@@ -97,29 +110,26 @@ def _glob_to_regex(glob: str) -> str:
     return "".join(result)
 
 
-def _parse_editorconfig_file(
-    ec_file: Path, target_file: Path
-) -> tuple[bool, dict[str, str]]:
-    """Parse one .editorconfig file and return (is_root, matched_properties).
+class _EditorConfigFile(NamedTuple):
+    """One parsed .editorconfig file, independent of the file it applies to."""
+
+    is_root: bool
+    # (compiled section glob or None if invalid, properties) in file order.
+    sections: tuple[tuple[re.Pattern | None, dict[str, str]], ...]
+
+
+_EMPTY_EDITORCONFIG = _EditorConfigFile(False, ())
+
+
+def _parse_editorconfig_text(content: str) -> _EditorConfigFile:
+    """Parse the text of an .editorconfig file into its preamble and sections.
 
     is_root is True only when 'root = true' appears in the preamble
-    (before any section header). Properties from sections whose glob matches
-    *target_file* are collected; later sections override earlier ones.
-    All keys and values are lowercased.
+    (before any section header). All keys and values are lowercased.
     """
     is_root = False
-    result: dict[str, str] = {}
-    try:
-        rel_str = str(target_file.relative_to(ec_file.parent)).replace("\\", "/")
-    except ValueError:
-        return False, {}
-
-    try:
-        content = ec_file.read_text(encoding="utf-8", errors="replace")
-    except OSError:
-        return False, {}
-    in_preamble = True
-    current_section_matches = False
+    sections: list[tuple[re.Pattern | None, dict[str, str]]] = []
+    props: dict[str, str] | None = None  # None while in the preamble
 
     for line in content.splitlines():
         stripped = line.strip()
@@ -128,25 +138,197 @@ def _parse_editorconfig_file(
         if stripped.startswith("#") or stripped.startswith(";"):
             continue
         if stripped.startswith("[") and stripped.endswith("]"):
-            in_preamble = False
-            glob = stripped[1:-1]
             try:
-                pattern = _editorconfig_glob_to_pattern(glob)
-                current_section_matches = bool(pattern.fullmatch(rel_str))
+                pattern: re.Pattern | None = _editorconfig_glob_to_pattern(
+                    stripped[1:-1]
+                )
             except re.error:
-                current_section_matches = False
+                pattern = None
+            props = {}
+            sections.append((pattern, props))
             continue
         if "=" in stripped:
             key, _, value = stripped.partition("=")
             key = key.strip().lower()
             value = value.strip().lower()
-            if in_preamble:
+            if props is None:
                 if key == "root" and value == "true":
                     is_root = True
-            elif current_section_matches:
-                result[key] = value
+            else:
+                props[key] = value
+
+    return _EditorConfigFile(is_root, tuple(sections))
+
+
+def _match_editorconfig_sections(
+    parsed: _EditorConfigFile, rel_str: str
+) -> dict[str, str]:
+    """Collect properties of the sections matching *rel_str* (later ones win)."""
+    result: dict[str, str] = {}
+    for pattern, props in parsed.sections:
+        if pattern is not None and pattern.fullmatch(rel_str):
+            result.update(props)
+    return result
+
+
+def _parse_editorconfig_file(
+    ec_file: Path, target_file: Path
+) -> tuple[bool, dict[str, str]]:
+    """Parse one .editorconfig file and return (is_root, matched_properties).
 
-    return is_root, result
+    Properties from sections whose glob matches *target_file* are collected;
+    later sections override earlier ones.  This reads the file every time;
+    editors go through :class:`EditorConfigCache` instead.
+    """
+    try:
+        rel_str = str(target_file.relative_to(ec_file.parent)).replace("\\", "/")
+    except ValueError:
+        return False, {}
+
+    try:
+        content = ec_file.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return False, {}
+    parsed = _parse_editorconfig_text(content)
+    return parsed.is_root, _match_editorconfig_sections(parsed, rel_str)
+
+
+class _EditorConfigChain(NamedTuple):
+    """The resolved .editorconfig chain of one directory."""
+
+    # (.editorconfig mtime_ns or None) per searched directory.
+    signature: tuple[int | None, ...]
+    # Directories checked for .editorconfig files, closest first, up to the
+    # first root=true file (or the filesystem root).
+    search_dirs: tuple[Path, ...]
+    # (directory, parsed file) for every .editorconfig found, closest first.
+    files: tuple[tuple[Path, _EditorConfigFile], ...]
+
+
+def _editorconfig_mtime_ns(directory: Path) -> int | None:
+    """Return the ``mtime_ns`` of *directory*/.editorconfig if it is a file."""
+    try:
+        st = os.stat(directory / ".editorconfig")
+    except (OSError, ValueError):
+        return None
+    return st.st_mtime_ns if stat.S_ISREG(st.st_mode) else None
+
+
+class EditorConfigCache:
+    """Thread-safe cache of parsed .editorconfig files and directory chains.
+
+    Opening a file used to stat every ancestor, then read, parse and compile
+    every .editorconfig on the way up.  Here each file is parsed once per
+    ``(path, mtime_ns)`` and the chain of a directory — which files apply,
+    closest first, and where root=true stops the search — is resolved once
+    and shared by every editor below it.  A chain is revalidated by stat'ing
+    its directories, so new, edited and deleted files are still seen by the
+    next lookup.  Files modified within the last couple of seconds are not
+    cached, because a second write in the same timestamp tick would be
+    invisible (Git's "racy clean" problem).
+    """
+
+    def __init__(self, max_files: int = 256, max_chains: int = 1024) -> None:
+        self._lock = threading.Lock()
+        self._max_files = max_files
+        self._max_chains = max_chains
+        self._files: OrderedDict[Path, tuple[int, _EditorConfigFile]] = OrderedDict()
+        self._chains: OrderedDict[Path, _EditorConfigChain] = OrderedDict()
+
+    def resolve(self, path: Path) -> tuple[dict[str, str], list[Path]]:
+        """Return the EditorConfig properties for *path* and the searched dirs.
+
+        Same contract as :func:`_read_editorconfig`.
+        """
+        chain = self._chain(path.parent)
+        result: dict[str, str] = {}
+        for directory, parsed in chain.files:
+            try:
+                rel_str = str(path.relative_to(directory)).replace("\\", "/")
+            except ValueError:
+                continue
+            # Closer files take precedence: keep keys already set.
+            for key, value in _match_editorconfig_sections(parsed, rel_str).items():
+                result.setdefault(key, value)
+        return result, list(chain.search_dirs)
+
+    def _chain(self, directory: Path) -> _EditorConfigChain:
+        with self._lock:
+            cached = self._chains.get(directory)
+            if cached is not None:
+                self._chains.move_to_end(directory)
+        if cached is not None and cached.signature == tuple(
+            _editorconfig_mtime_ns(d) for d in cached.search_dirs
+        ):
+            return cached
+
+        now = time.time_ns()
+        cacheable = True
+        signature: list[int | None] = []
+        search_dirs: list[Path] = []
+        files: list[tuple[Path, _EditorConfigFile]] = []
+        current = directory
+        while True:
+            search_dirs.append(current)
+            mtime_ns = _editorconfig_mtime_ns(current)
+            signature.append(mtime_ns)
+            if mtime_ns is not None:
+                cacheable = cacheable and now - mtime_ns > _RACY_WINDOW_NS
+                parsed = self._file(current / ".editorconfig", mtime_ns, now)
+                files.append((current, parsed))
+                if parsed.is_root:
+                    break
+            parent = current.parent
+            if parent == current:
+                break
+            current = parent
+
+        chain = _EditorConfigChain(tuple(signature), tuple(search_dirs), tuple(files))
+        if cacheable:
+            with self._lock:
+                self._chains[directory] = chain
+                self._chains.move_to_end(directory)
+                while len(self._chains) > self._max_chains:
+                    self._chains.popitem(last=False)
+        return chain
+
+    def _file(self, ec_file: Path, mtime_ns: int, now: int) -> _EditorConfigFile:
+        with self._lock:
+            cached = self._files.get(ec_file)
+            if cached is not None and cached[0] == mtime_ns:
+                self._files.move_to_end(ec_file)
+                return cached[1]
+        try:
+            content = ec_file.read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            return _EMPTY_EDITORCONFIG
+        parsed = _parse_editorconfig_text(content)
+        if now - mtime_ns > _RACY_WINDOW_NS:
+            with self._lock:
+                self._files[ec_file] = (mtime_ns, parsed)
+                self._files.move_to_end(ec_file)
+                while len(self._files) > self._max_files:
+                    self._files.popitem(last=False)
+        return parsed
+
+    def clear(self) -> None:
+        """Drop every cached file and chain."""
+        with self._lock:
+            self._files.clear()
+            self._chains.clear()
+
+
+_shared_editorconfig_cache: EditorConfigCache | None = None
+_shared_editorconfig_lock = threading.Lock()
+
+
+def get_editorconfig_cache() -> EditorConfigCache:
+    """Return the process-wide :class:`EditorConfigCache`, creating it lazily."""
+    global _shared_editorconfig_cache
+    with _shared_editorconfig_lock:
+        if _shared_editorconfig_cache is None:
+            _shared_editorconfig_cache = EditorConfigCache()
+        return _shared_editorconfig_cache
 
 
 def _read_editorconfig(path: Path) -> tuple[dict[str, str], list[Path]]:
@@ -158,47 +340,10 @@ def _read_editorconfig(path: Path) -> tuple[dict[str, str], list[Path]]:
     All keys and values are lowercased.
 
     Returns (properties, searched_dirs) where searched_dirs is the list of
-    directories checked for .editorconfig files (closest first).
+    directories checked for .editorconfig files (closest first).  Parsed
+    files and chains come from the shared :class:`EditorConfigCache`.
     """
-    result: dict[str, str] = {}
-    searched_dirs: list[Path] = []
-
-    # Collect .editorconfig files from closest to farthest
-    config_files: list[Path] = []
-    directory = path.parent
-    while True:
-        searched_dirs.append(directory)
-        ec_file = directory / ".editorconfig"
-        try:
-            if ec_file.is_file():
-                config_files.append(ec_file)
-        except OSError:
-            pass
-        parent = directory.parent
-        if parent == directory:
-            break
-        directory = parent
-
-    # Process closest first; closer keys win (not overwritten by farther)
-    root_dir: Path | None = None
-    for ec_file in config_files:
-        is_root, props = _parse_editorconfig_file(ec_file, path)
-        for key, value in props.items():
-            if key not in result:
-                result[key] = value
-        if is_root:
-            root_dir = ec_file.parent
-            break
-
-    # Trim searched_dirs to stop at root=true boundary
-    if root_dir is not None:
-        try:
-            idx = searched_dirs.index(root_dir)
-            searched_dirs = searched_dirs[: idx + 1]
-        except ValueError:
-            pass
-
-    return result, searched_dirs
+    return get_editorconfig_cache().resolve(path)
 
 
 def _snapshot_editorconfig_mtimes(dirs: list[Path]) -> dict[Path, float | None]:
@@ -389,6 +534,43 @@ class FileLoadResult:
     error: str | None = None
 
 
+def _decode_for_editor(raw_bytes: bytes) -> tuple[str, str, str]:
+    """Decode file bytes for the editor: ``(text, encoding, line_ending)``.
+
+    The text is normalized to ``\\n`` line endings without a BOM.
+    """
+    detected_encoding = _detect_encoding(raw_bytes)
+    try:
+        raw_text = raw_bytes.decode(detected_encoding)
+    except UnicodeDecodeError as e:
+        log.debug(
+            "decode error (%s), falling back to latin-1: %s", detected_encoding, e
+        )
+        raw_text = raw_bytes.decode("latin-1", errors="replace")
+    detected_le = _detect_line_ending(raw_text)
+    text = raw_text.replace("\r\n", "\n").replace("\r", "\n")
+    if text.startswith("\ufeff"):
+        text = text[1:]
+    return text, detected_encoding, detected_le
+
+
+def reload_file_for_editor(path: Path) -> tuple[str, str, str, float | None]:
+    """Re-read *path*: ``(text, encoding, line_ending, mtime)``.
+
+    Like :func:`load_file_for_editor` without the EditorConfig lookup; runs
+    on a :class:`~textual_code.file_service.FileService` thread.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    raw_bytes = path.read_bytes()
+    text, encoding, line_ending = _decode_for_editor(raw_bytes)
+    file_mtime: float | None = None
+    with contextlib.suppress(OSError):
+        file_mtime = path.stat().st_mtime
+    return text, encoding, line_ending, file_mtime
+
+
 def load_file_for_editor(path: Path) -> FileLoadResult:
     """Read a file and return all data needed to construct a CodeEditor.
 
@@ -403,25 +585,8 @@ def load_file_for_editor(path: Path) -> FileLoadResult:
         error = str(e)
         log.debug("load_file_for_editor: read error: %s", error)
 
-    log.debug("load_file_for_editor: detecting encoding (%d bytes)", len(raw_bytes))
-    detected_encoding = _detect_encoding(raw_bytes)
-
-    try:
-        raw_text = raw_bytes.decode(detected_encoding)
-    except UnicodeDecodeError as e:
-        log.debug(
-            "load_file_for_editor: decode error (%s), falling back to latin-1: %s",
-            detected_encoding,
-            e,
-        )
-        raw_text = raw_bytes.decode("latin-1", errors="replace")
-
-    log.debug("load_file_for_editor: detecting line endings")
-    detected_le = _detect_line_ending(raw_text)
-
-    text = raw_text.replace("\r\n", "\n").replace("\r", "\n")
-    if text.startswith("\ufeff"):
-        text = text[1:]
+    log.debug("load_file_for_editor: decoding %d bytes", len(raw_bytes))
+    text, detected_encoding, detected_le = _decode_for_editor(raw_bytes)
 
     file_mtime: float | None = None
     with contextlib.suppress(OSError):
@@ -459,9 +624,11 @@ def _build_line_offsets(text: str) -> list[int]:
     of line *i*.
     """
     offsets = [0]
-    for i, ch in enumerate(text):
-        if ch == "\n":
-            offsets.append(i + 1)
+    find = text.find
+    pos = find("\n")
+    while pos != -1:
+        offsets.append(pos + 1)
+        pos = find("\n", pos + 1)
     return offsets
 
 
@@ -504,6 +671,20 @@ def _word_boundary_pattern(query: str) -> str:
     return r"\b" + re.escape(query) + r"\b"
 
 
+@functools.lru_cache(maxsize=64)
+def _compile_find_pattern(
+    query: str, use_regex: bool = False, case_sensitive: bool = True
+) -> re.Pattern[str]:
+    """Compile a find-bar query (cached, so repeated presses reuse it).
+
+    Raises re.error for invalid regex when use_regex=True.
+    """
+    flags = 0 if case_sensitive else re.IGNORECASE
+    if use_regex:
+        flags |= re.MULTILINE
+    return re.compile(query if use_regex else re.escape(query), flags)
+
+
 def _find_next(
     text: str,
     query: str,
@@ -516,10 +697,7 @@ def _find_next(
     Returns (-1, -1) if not found.
     Raises re.error for invalid regex when use_regex=True.
     """
-    flags = 0 if case_sensitive else re.IGNORECASE
-    if use_regex:
-        flags |= re.MULTILINE
-    pattern = re.compile(query if use_regex else re.escape(query), flags)
+    pattern = _compile_find_pattern(query, use_regex, case_sensitive)
     match = pattern.search(text, cursor_offset)
     if match is None:
         match = pattern.search(text, 0)
@@ -541,10 +719,7 @@ def _find_previous(
     Returns (-1, -1) if not found.
     Raises re.error for invalid regex when use_regex=True.
     """
-    flags = 0 if case_sensitive else re.IGNORECASE
-    if use_regex:
-        flags |= re.MULTILINE
-    pattern = re.compile(query if use_regex else re.escape(query), flags)
+    pattern = _compile_find_pattern(query, use_regex, case_sensitive)
     # Single pass: track the last match before cursor and the last match overall
     last_before = None
     last_overall = None
@@ -558,6 +733,61 @@ def _find_previous(
     return -1, -1
 
 
+# Replace All results with more replacements than this are applied as one
+# whole-document swap instead of as ranged edits.
+_REPLACE_ALL_MAX_EDITS = 1000
+
+
+class _ReplaceAllResult(NamedTuple):
+    count: int
+    # (start, end, replacement) text offsets; empty when new_text is set.
+    edits: list[tuple[int, int, str]]
+    new_text: str | None
+
+
+def _replace_all_matches(
+    pattern: re.Pattern[str],
+    replacement: str,
+    text: str,
+    cancel: threading.Event | None = None,
+    report: Callable[[float], None] | None = None,
+    max_edits: int | None = None,
+) -> _ReplaceAllResult | None:
+    """Compute a Replace All in one pass over *text*.
+
+    Replacement uses Python re.sub() syntax (\\1, \\2).  Every 4096 matches
+    the job checks *cancel* (returning None once it is set) and reports the
+    fraction of *text* searched.  Up to *max_edits* (default
+    ``_REPLACE_ALL_MAX_EDITS``) replacements come back as ranged edits;
+    beyond that the new text is built here, off the event loop.
+
+    Raises re.error for an invalid replacement template.
+    """
+    if max_edits is None:
+        max_edits = _REPLACE_ALL_MAX_EDITS
+    literal = "\\" not in replacement
+    edits: list[tuple[int, int, str]] = []
+    size = max(len(text), 1)
+    for n, match in enumerate(pattern.finditer(text)):
+        if n and not n % 4096:
+            if cancel is not None and cancel.is_set():
+                return None
+            if report is not None:
+                report(match.start() / size)
+        rep = replacement if literal else match.expand(replacement)
+        edits.append((match.start(), match.end(), rep))
+    if len(edits) <= max_edits:
+        return _ReplaceAllResult(len(edits), edits, None)
+    pieces: list[str] = []
+    last = 0
+    for start, end, rep in edits:
+        pieces.append(text[last:start])
+        pieces.append(rep)
+        last = end
+    pieces.append(text[last:])
+    return _ReplaceAllResult(len(edits), [], "".join(pieces))
+
+
 def _get_word_at_location(text: str, row: int, col: int) -> str:
     """Return the word under (row, col) using \\w+ boundaries.
 
@@ -566,9 +796,11 @@ def _get_word_at_location(text: str, row: int, col: int) -> str:
     """
     from textual_code.widgets.multi_cursor_text_area import MultiCursorTextArea
 
-    bounds = MultiCursorTextArea._word_bounds_at(text, row, col)
-    if bounds is None:
-        return ""
     lines = text.split("\n")
+    if row >= len(lines):
+        return ""
     line = lines[row]
+    bounds = MultiCursorTextArea._word_bounds_at(line, 0, col)
+    if bounds is None:
+        return ""
     return line[bounds[0] : bounds[1]]
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 
-from textual import on
+from textual import on, work
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.message import Message
@@ -143,9 +143,6 @@ class Explorer(Static):
         def control(self) -> Explorer:
             return self.explorer
 
-    _MAX_SELECT_RETRIES = 10
-    _SELECT_RETRY_DELAY = 0.05
-
     def __init__(
         self,
         workspace_path: Path,
@@ -167,125 +164,32 @@ class Explorer(Static):
         self._show_git_status = show_git_status
         self._compact_folders = compact_folders
         self._pending_path: Path | None = None
-        self._pending_retries: int = 0
-        self._pending_depth: int = -1
 
     def on_mount(self) -> None:
         if self._pending_path is not None:
-            self.set_timer(self._SELECT_RETRY_DELAY, self._retry_pending)
-
-    def _retry_pending(self) -> None:
-        if self._pending_path is None:
-            return
-        self._pending_retries -= 1
-        if self._pending_retries <= 0:
-            self.log.warning(
-                "select_file: gave up after %s retries for %s",
-                self._MAX_SELECT_RETRIES,
-                self._pending_path,
-            )
-            self._pending_path = None
-            self._pending_depth = -1
-            return
-        pending = self._pending_path
-        self._pending_path = None
-        self.log.debug("select_file: retrying for %s", pending)
-        self.select_file(pending)
+            pending, self._pending_path = self._pending_path, None
+            self.select_file(pending)
 
     def select_file(self, path: Path) -> None:
-        """Move the explorer cursor to path if it is loaded and within workspace."""
+        """Reveal path in the tree: load and expand its folders, move the cursor.
+
+        Paths outside the workspace are ignored.  A newer call supersedes a
+        reveal that is still waiting for directories to load.
+        """
         try:
             path.relative_to(self.workspace_path)
         except ValueError:
             return  # outside workspace
-
-        def find_node(node):
-            if node.data is not None and node.data.path == path:
-                return node
-            for child in node.children:
-                result = find_node(child)
-                if result is not None:
-                    return result
-            return None
-
-        def is_visible(node) -> bool:
-            """Return True if every ancestor up to root is expanded."""
-            current = node.parent
-            while current is not None:
-                if not current.is_expanded:
-                    return False
-                current = current.parent
-            return True
-
-        root = self.directory_tree.root
-        node = find_node(root)
-        if node is not None and is_visible(node):
-            self.directory_tree.move_cursor(node)
-            self._pending_path = None
-            self._pending_depth = -1
+        if not self.is_mounted:
+            self._pending_path = path
             return
+        self._reveal(path)
 
-        # File not found in loaded nodes, or is inside a collapsed folder.
-        # Reset depth tracker when switching to a different target path, so
-        # that a shallower new path doesn't inherit stale depth from the old.
-        if self._pending_path != path:
-            self._pending_depth = -1
-        self._pending_path = path
-        if self._pending_retries == 0:
-            self._pending_retries = self._MAX_SELECT_RETRIES
-
-        # Walk tree using is_relative_to matching — handles compact folder nodes
-        # where intermediate directories don't have individual tree nodes.
-        max_depth = len(path.relative_to(self.workspace_path).parts)
-        depth_reached = 0
-        current = root
-        for _ in range(max_depth):
-            # Find a directory child that contains the target path
-            dir_child = next(
-                (
-                    c
-                    for c in current.children
-                    if c.data is not None
-                    and c.allow_expand
-                    and path.is_relative_to(c.data.path)
-                ),
-                None,
-            )
-            if dir_child is None:
-                # Directory not in tree yet — retry after loading
-                break
-            if not dir_child.is_expanded:
-                assert dir_child.data is not None
-                self.log.debug("select_file: expanding %s", dir_child.data.path)
-                dir_child.expand()
-                depth_reached += 1
-                break
-            current = dir_child
-            depth_reached += 1
-            # Check if the file node is now a direct child
-            file_match = next(
-                (
-                    c
-                    for c in current.children
-                    if c.data is not None and c.data.path == path
-                ),
-                None,
-            )
-            if file_match is not None:
-                # File node exists but find_node didn't reach it — still loading
-                break
-
-        # Reset retry counter when deeper progress is made in the tree walk.
-        # This makes the mechanism depth-independent: each new level of
-        # expansion grants a fresh set of retries for async loading to finish.
-        if depth_reached > self._pending_depth:
-            self._pending_depth = depth_reached
-            self._pending_retries = self._MAX_SELECT_RETRIES
-
-        # Use set_timer instead of call_after_refresh to give async directory
-        # loading (NodeExpanded handler → _add_to_load_queue → _loader) enough
-        # time to complete between retries.
-        self.set_timer(self._SELECT_RETRY_DELAY, self._retry_pending)
+    @work(exclusive=True, group="explorer_reveal", exit_on_error=False)
+    async def _reveal(self, path: Path) -> None:
+        node = await self.directory_tree.reveal_path(path)
+        if node is None:
+            self.log.debug("select_file: %s is not in the tree", path)
 
     def compose(self) -> ComposeResult:
         directory_tree = FilteredDirectoryTree(
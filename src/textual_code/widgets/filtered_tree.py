@@ -6,26 +6,35 @@ import contextlib
 import logging
 import os
 import shutil
+import stat
 import subprocess
 from collections.abc import Iterable
 from pathlib import Path
 from typing import TYPE_CHECKING, NamedTuple
 
-import pathspec
 from rich.style import Style
 from rich.text import Text
 from textual import work
 from textual.await_complete import AwaitComplete
 from textual.message import Message
-from textual.widgets import DirectoryTree
+from textual.widgets import DirectoryTree, Tree
 from textual.widgets._directory_tree import DirEntry
 from textual.worker import get_current_worker
 
-from textual_code.cancellable_worker import run_cancellable
-from textual_code.subprocess_tasks import scan_directory_sync
+from textual_code.directory_scanner import (
+    DirectoryListing,
+    get_directory_scanner,
+    scan_directory_listing,
+)
+from textual_code.file_preloader import get_file_preloader
+from textual_code.file_service import get_file_service
+from textual_code.gitignore import get_gitignore_cache
 
 if TYPE_CHECKING:
-    from textual.widgets._tree import TreeNode
+    from textual.timer import Timer
+    from textual.widgets._tree import NodeID, TreeNode
+
+    from textual_code.file_watcher import FileChanges
 
 
 _NO_ITALIC = Style(italic=False)
@@ -38,89 +47,170 @@ GIT_STATUS_UNTRACKED = "untracked"
 # Priority values for git statuses (higher = takes precedence)
 _GIT_STATUS_PRIORITY = {GIT_STATUS_UNTRACKED: 0, GIT_STATUS_MODIFIED: 1}
 
+# Beyond this many changed directories a full git status is cheaper than a
+# long pathspec list.
+_GIT_SCOPE_LIMIT = 64
+
+# A listed entry that has no node yet: (path, is_dir, compact chain).
+type _Entry = tuple[Path, bool, tuple[str, Path] | None]
+
+
+class _NodeSpec(NamedTuple):
+    """How to show a listed entry: its label, node path and expandability."""
+
+    label: str
+    target: Path
+    allow_expand: bool
+
+
+class _MoreEntries(NamedTuple):
+    """The unshown tail of a paged directory and its "load more" node."""
+
+    node: TreeNode[DirEntry]
+    entries: list[_Entry]
+
 
 class GitStatusResult(NamedTuple):
     """Result from parsing git status output."""
 
-    status_map: dict[Path, str]
+    # Absolute path string → status, for every reported entry and each of
+    # its parent directories.  Keyed by ``str`` so parsing a huge status
+    # never builds a ``Path`` per entry; lookups use the cached
+    # ``str(path)`` of the node's path.
+    status_map: dict[str, str]
     untracked_dirs: set[Path]
     # Pre-computed string prefixes for fast child-of-untracked checks.
     # Each entry ends with os.sep so "foo/" won't false-match "foobar/".
     untracked_dir_prefixes: tuple[str, ...]
+    # Entries exactly as git reported them (workspace-relative POSIX paths,
+    # untracked directories with a trailing "/"), kept so a scoped refresh
+    # can replace one subtree and re-derive the parents.
+    entries: dict[str, str] = {}
 
+    def status_of(self, path: Path) -> str | None:
+        """Return the status of *path*, or None if clean/unknown.
 
-def _parse_git_status_output(stdout: str, workspace: Path) -> GitStatusResult:
-    """Parse ``git status --porcelain -z -unormal`` output.
+        Paths inside an untracked directory report ``untracked``; the
+        verdict is cached so the next lookup is a plain dict hit.
+        """
+        path_str = str(path)
+        status = self.status_map.get(path_str)
+        if status is not None:
+            return status
+        if self.untracked_dir_prefixes and path_str.startswith(
+            self.untracked_dir_prefixes
+        ):
+            self.status_map[path_str] = GIT_STATUS_UNTRACKED
+            return GIT_STATUS_UNTRACKED
+        return None
 
-    Returns a GitStatusResult with:
-    - status_map: mapping of absolute paths to status strings
-    - untracked_dirs: set of untracked directory paths (from -unormal)
 
-    Parent directories are propagated up to the workspace root so that
-    folders containing changed files inherit the highest-priority status.
-    """
-    status_map: dict[Path, str] = {}
-    untracked_dirs: set[Path] = set()
+# Field counts before the path in porcelain v2 records ("1", "2", "u").
+_V2_PATH_FIELD = {"1": 8, "2": 9, "u": 10}
 
-    if not stdout:
-        return GitStatusResult(status_map, untracked_dirs, ())
 
-    entries = stdout.split("\0")
+def _parse_git_status_entries(stdout: str) -> dict[str, str]:
+    """Parse ``git status --porcelain=v2 -z`` output into raw entries.
+
+    Returns workspace-relative POSIX paths mapped to a status string.
+    Untracked directories (from ``-unormal``) keep their trailing ``/``.
+    Ignored (``!``) and header (``#``) records are skipped.
+    """
+    entries: dict[str, str] = {}
+    records = stdout.split("\0")
     i = 0
-    while i < len(entries):
-        entry = entries[i]
-        if len(entry) < 4:
-            i += 1
+    while i < len(records):
+        record = records[i]
+        i += 1
+        kind = record[:1]
+        if kind == "?":
+            if len(record) > 2:
+                entries[record[2:]] = GIT_STATUS_UNTRACKED
             continue
-
-        xy = entry[:2]
-        filepath_str = entry[3:]
-
-        # Classify status
-        status = GIT_STATUS_UNTRACKED if xy == "??" else GIT_STATUS_MODIFIED
-
-        # Handle renames/copies: with -z, the next entry is the destination
-        if xy[0] in ("R", "C"):
-            i += 1
-            if i < len(entries) and entries[i]:
-                filepath_str = entries[i]
-
-        # Detect untracked directories (-unormal shows them with trailing /)
-        if status == GIT_STATUS_UNTRACKED and filepath_str.endswith("/"):
-            dir_path = workspace / filepath_str.rstrip("/")
-            untracked_dirs.add(dir_path)
-            # Also add to status_map for the directory itself
-            _set_status(status_map, dir_path, status, workspace)
-            i += 1
+        fields = _V2_PATH_FIELD.get(kind)
+        if fields is None:
+            continue
+        if kind == "2":
+            i += 1  # the original path of a rename/copy follows
+        parts = record.split(" ", fields)
+        if len(parts) <= fields or not parts[fields]:
             continue
+        entries[parts[fields]] = GIT_STATUS_MODIFIED
+    return entries
 
-        filepath = workspace / filepath_str
-        _set_status(status_map, filepath, status, workspace)
 
-        i += 1
+def _build_git_status(entries: dict[str, str], workspace: Path) -> GitStatusResult:
+    """Derive the per-path status map (with parent propagation) from *entries*.
 
-    # Pre-compute string prefixes with trailing separator for fast child checks.
+    Parents are found by cutting the relative path at each ``/`` —
+    no ``Path`` objects or ``is_relative_to`` walks per entry.
+    """
+    status_map: dict[str, str] = {}
+    untracked_dirs: set[Path] = set()
+    for rel, status in entries.items():
+        if rel.endswith("/"):
+            rel = rel.rstrip("/")
+            untracked_dirs.add(workspace / rel)
+        _set_status(status_map, rel, status)
+    base = str(workspace) + os.sep
+    if os.sep == "/":
+        absolute = {base + rel: status for rel, status in status_map.items()}
+    else:
+        absolute = {
+            base + rel.replace("/", os.sep): status
+            for rel, status in status_map.items()
+        }
     prefixes = tuple(str(d) + os.sep for d in untracked_dirs)
-    return GitStatusResult(status_map, untracked_dirs, prefixes)
+    return GitStatusResult(absolute, untracked_dirs, prefixes, entries)
+
+
+def _parse_git_status_output(stdout: str, workspace: Path) -> GitStatusResult:
+    """Parse ``git status --porcelain=v2 -z -unormal`` output.
+
+    Returns a GitStatusResult with:
+    - status_map: mapping of absolute path strings to status strings
+    - untracked_dirs: set of untracked directory paths (from -unormal)
+
+    Parent directories are propagated up to the workspace root so that
+    folders containing changed files inherit the highest-priority status.
+    """
+    return _build_git_status(_parse_git_status_entries(stdout), workspace)
 
 
-def _set_status(
-    status_map: dict[Path, str],
-    filepath: Path,
-    status: str,
+def _merge_git_status(
+    previous: GitStatusResult,
+    scopes: Iterable[str],
+    entries: dict[str, str],
     workspace: Path,
-) -> None:
-    """Set status for a path and propagate to parent directories."""
+) -> GitStatusResult:
+    """Replace the entries under *scopes* with a scoped status run's *entries*.
+
+    *scopes* are workspace-relative POSIX directory prefixes ending in
+    ``/``; everything git reported outside them is kept.
+    """
+    prefixes = tuple(scopes)
+    kept = {
+        rel: status
+        for rel, status in previous.entries.items()
+        if not rel.startswith(prefixes)
+    }
+    kept.update(entries)
+    return _build_git_status(kept, workspace)
+
+
+def _set_status(status_map: dict[str, str], rel: str, status: str) -> None:
+    """Set status for a relative path and propagate to parent directories."""
     priority = _GIT_STATUS_PRIORITY.get(status, 0)
 
     # Set file status (only upgrade, never downgrade)
-    existing = status_map.get(filepath)
+    existing = status_map.get(rel)
     if existing is None or _GIT_STATUS_PRIORITY.get(existing, 0) < priority:
-        status_map[filepath] = status
+        status_map[rel] = status
 
-    # Propagate to parent directories up to workspace root
-    parent = filepath.parent
-    while parent != workspace and parent.is_relative_to(workspace):
+    # Propagate to parent directories up to (not including) the root
+    parent = rel
+    while (cut := parent.rfind("/")) > 0:
+        parent = parent[:cut]
         existing_parent = status_map.get(parent)
         if (
             existing_parent is not None
@@ -128,7 +218,6 @@ def _set_status(
         ):
             break  # All ancestors already have equal or higher priority
         status_map[parent] = status
-        parent = parent.parent
 
 
 class FilteredDirectoryTree(DirectoryTree):
@@ -142,12 +231,23 @@ class FilteredDirectoryTree(DirectoryTree):
         "directory-tree--hidden",
         "directory-tree--git-modified",
         "directory-tree--git-untracked",
+        "directory-tree--load-more",
     }
 
+    # Seconds before a directory scan is abandoned (e.g. unreachable NFS).
+    _SCAN_TIMEOUT = 30.0
+    # Entries given a node per page; larger listings end in a "load more" row.
+    _PAGE_SIZE = 500
+    # Seconds of quiet (no expansion or cursor move) before prefetching.
+    _PREFETCH_DELAY = 0.3
+    # Directories prefetched per idle period.
+    _PREFETCH_LIMIT = 32
+
     DEFAULT_CSS = """
     FilteredDirectoryTree {
         & > .directory-tree--gitignored,
-        & > .directory-tree--hidden {
+        & > .directory-tree--hidden,
+        & > .directory-tree--load-more {
             text-style: dim;
         }
         & > .directory-tree--git-modified {
@@ -157,7 +257,8 @@ class FilteredDirectoryTree(DirectoryTree):
             color: $text-success;
         }
         &:ansi > .directory-tree--gitignored,
-        &:ansi > .directory-tree--hidden {
+        &:ansi > .directory-tree--hidden,
+        &:ansi > .directory-tree--load-more {
             color: ansi_default;
             text-style: dim;
         }
@@ -187,10 +288,12 @@ class FilteredDirectoryTree(DirectoryTree):
         self.dim_hidden_files = dim_hidden_files
         self.show_git_status = show_git_status
         self.compact_folders = compact_folders
-        self._gitignore_specs: list[tuple[Path, pathspec.PathSpec]] | None = None
+        # Path → ignored verdict, filled from directory listings.
         self._gitignore_cache: dict[Path, bool] = {}
         self._git_result: GitStatusResult | None = None
         self._git_bin: str | None = shutil.which("git")
+        # Directories still waiting for a git status refresh ({root} = all).
+        self._git_pending: frozenset[Path] = frozenset()
         # Workspace polling state for auto-refresh
         self._dir_mtimes: dict[Path, float | None] = {}
         self._git_ref_mtimes: tuple[float | None, float | None] = (
@@ -200,8 +303,22 @@ class FilteredDirectoryTree(DirectoryTree):
         self._ws_polling_paused: bool = False
         # Performance: scandir is_dir cache (populated by _load_directory_sync)
         self._is_dir_cache: dict[Path, bool] = {}
-        # Performance: lazy gitignore loading (no workspace-wide traversal)
-        self._gitignore_checked_dirs: set[Path] = set()
+        # Performance: compact-folder chains resolved during the scan
+        self._compact_chains: dict[Path, tuple[str, Path]] = {}
+        # .gitignore mtime_ns per listed dir (None = no file), so a subtree
+        # refresh can tell whose rules changed.
+        self._gitignore_mtimes: dict[Path, int | None] = {}
+        # Loaded directories collapsed since their last listing; re-listed
+        # when expanded again because nobody watches collapsed folders.
+        self._stale_dirs: set[Path] = set()
+        # Path → node for every populated entry (compact nodes under their
+        # deepest directory), kept in sync by _populate_node/_merge_listing.
+        self._node_index: dict[Path, TreeNode[DirEntry]] = {}
+        # Paged directories (by node id) → entries not shown yet.
+        self._more: dict[NodeID, _MoreEntries] = {}
+        # Nodes whose child listings are prefetched once the tree is idle.
+        self._prefetch_nodes: list[TreeNode[DirEntry]] = []
+        self._prefetch_timer: Timer | None = None
         # Performance: background git status loading flag
         self._bg_loading_started: bool = False
 
@@ -210,35 +327,66 @@ class FilteredDirectoryTree(DirectoryTree):
         self._start_bg_loading()
         self.call_after_refresh(self._init_ws_polling)
 
+    def _start_bg_loading(self, scope: Iterable[Path] | None = None) -> None:
+        """Schedule a background git status refresh.
+
+        With *scope*, only those directories are re-queried
+        (``git status -- <dirs>``) and merged into the current result;
+        without it the whole workspace is.  Requests made while a refresh
+        is running are folded into one pending scope, so a superseded
+        worker never loses the directories it was asked to cover.
+        """
+        self._queue_git_scope(scope)
+        self._load_git_status_in_background(self._git_pending)
+
+    def _queue_git_scope(self, scope: Iterable[Path] | None) -> None:
+        """Fold *scope* (None = whole workspace) into the pending git scope."""
+        root = Path(self.path)
+        wanted = {root} if scope is None or self._git_result is None else set(scope)
+        pending = self._git_pending | wanted
+        if root in pending or len(pending) > _GIT_SCOPE_LIMIT:
+            pending = {root}
+        self._git_pending = frozenset(pending)
+
     @work(thread=True, exclusive=True, group="bg_loading")
-    def _start_bg_loading(self) -> None:
+    def _load_git_status_in_background(self, scope: frozenset[Path]) -> None:
         """Load git status in a background thread.
 
         Git status is inherently workspace-wide and cannot be lazy-loaded
-        per-directory, so it runs in a background worker to avoid blocking
-        the first render.
+        per-directory, so the first load runs in a background worker to
+        avoid blocking the first render.  Later refreshes are scoped to
+        the directories that changed when possible.
         """
-        _log.debug("starting background git status loading")
-        git_result = self._load_git_status()
+        _log.debug("starting background git status loading (%d scope)", len(scope))
+        git_result = self._load_git_status(scope)
         worker = get_current_worker()
         if worker.is_cancelled:
             _log.debug("bg_loading worker cancelled, skipping callback")
             return
-        self._git_result = git_result
-        _log.debug("background git status loading completed")
         try:
-            self.app.call_from_thread(self.refresh)
+            self.app.call_from_thread(self._apply_git_status, scope, git_result)
         except RuntimeError as exc:
             if "loop" not in str(exc).lower() and "closed" not in str(exc).lower():
                 raise
             _log.debug("call_from_thread suppressed (app exiting): %s", exc)
 
-    def _init_ws_polling(self) -> None:
+    def _apply_git_status(
+        self, scope: frozenset[Path], git_result: GitStatusResult
+    ) -> None:
+        """Install a finished git status result and repaint the labels."""
+        self._git_result = git_result
+        if self._git_pending is scope:
+            self._git_pending = frozenset()
+        _log.debug("background git status loading completed")
+        self._clear_line_cache()  # labels are cached per line
+        self.refresh()
+
+    async def _init_ws_polling(self) -> None:
         """Initialize workspace polling snapshot and start timer."""
-        self._dir_mtimes = self._collect_expanded_dir_mtimes()
-        self._git_ref_mtimes = self._get_git_ref_mtimes()
+        await self._resnapshot_ws_mtimes()
+        self._sync_file_watches()
         if not self.app.is_headless:
-            self.set_interval(2.0, self._poll_workspace_change)
+            self.set_interval(2.0, self._on_ws_poll_tick)
 
     def filter_paths(self, paths: Iterable[Path]) -> Iterable[Path]:
         if self.show_hidden_files:
@@ -247,67 +395,51 @@ class FilteredDirectoryTree(DirectoryTree):
 
     # ── Gitignore support ────────────────────────────────────────────────
 
-    def _load_gitignore_for_dir(self, dir_path: Path) -> None:
-        """Load .gitignore from a specific directory if not already checked.
-
-        Skips directories inside hidden paths (e.g. .git/, .venv/).
-        Each directory is checked at most once per tree lifetime (or until
-        reload clears _gitignore_checked_dirs).
-        """
-        if dir_path in self._gitignore_checked_dirs:
-            return
-        self._gitignore_checked_dirs.add(dir_path)
+    def _gitignore_root(self) -> Path | None:
+        """Workspace root handed to the scanner, or None when not dimming."""
+        return Path(self.path) if self.dim_gitignored else None
 
-        # Skip hidden directories
-        workspace = Path(self.path)
-        try:
-            rel = dir_path.relative_to(workspace)
-        except ValueError:
-            return
-        if any(part.startswith(".") for part in rel.parts):
-            return
+    def _record_gitignore(self, directory: Path, listing: DirectoryListing) -> None:
+        """Store the ignored flags the scanner computed for *listing*.
 
-        gitignore_path = dir_path / ".gitignore"
-        try:
-            content = gitignore_path.read_text(encoding="utf-8", errors="replace")
-        except (OSError, ValueError):
+        Entries and compact-chain targets get a definite verdict, so
+        render_label never matches patterns itself.  The directory's own
+        ``.gitignore`` mtime is kept so a subtree refresh can tell whether
+        the rules below it changed.
+        """
+        if not self.dim_gitignored:
             return
-        try:
-            spec = pathspec.PathSpec.from_lines("gitignore", content.splitlines())
-            if self._gitignore_specs is None:
-                self._gitignore_specs = []
-            self._gitignore_specs.append((dir_path, spec))
-        except Exception as e:
-            _log.warning("Failed to parse %s: %s", gitignore_path, e)
-
-    def _ensure_ancestor_gitignores(self, file_path: Path) -> None:
-        """Ensure .gitignore files are loaded for all ancestor directories.
-
-        Walks from the file's parent up to the workspace root, loading
-        any .gitignore files found along the way.
+        ignored = listing.ignored
+        for path in listing.paths:
+            self._gitignore_cache[path] = path in ignored
+        for _label, deepest in listing.compact_chains.values():
+            self._gitignore_cache[deepest] = deepest in ignored
+        self._gitignore_mtimes[directory] = listing.gitignore_mtime
+
+    def _invalidate_gitignore_dirs(self, dirs: set[Path]) -> None:
+        """Forget the cached verdicts below *dirs*.
+
+        Verdicts outside *dirs* are kept; the dropped ones come back with
+        the next listing (or from the shared matcher on a cache miss).
         """
-        workspace = Path(self.path)
-        current = file_path.parent
-        while current.is_relative_to(workspace):
-            self._load_gitignore_for_dir(current)
-            if current == workspace:
-                break
-            current = current.parent
-
-    def _get_gitignore_specs(self) -> list[tuple[Path, pathspec.PathSpec]]:
-        """Return current gitignore specs."""
-        if self._gitignore_specs is None:
-            self._gitignore_specs = []
-        return self._gitignore_specs
+        if not dirs:
+            return
+        _log.debug("invalidating gitignore for %d dir(s)", len(dirs))
+        prefixes = tuple(str(d) + os.sep for d in dirs)
+        self._gitignore_cache = {
+            path: ignored
+            for path, ignored in self._gitignore_cache.items()
+            if not str(path).startswith(prefixes)
+        }
 
     def _is_gitignored(self, file_path: Path, *, is_dir: bool | None = None) -> bool:
-        """Check if a path is matched by any gitignore spec.
+        """Check if a path is matched by the workspace's gitignore rules.
 
         Returns False when dim_gitignored is disabled or when the path
         is a dotfile (hidden files are exempt from dimming).
-        Lazily loads .gitignore files for ancestor directories on first
-        access. Iterates specs deepest-first so a subdirectory .gitignore
-        can override a parent's patterns (matching real git behavior).
+        Verdicts normally arrive with the directory listing (computed on the
+        scanner thread, see :mod:`textual_code.gitignore`); paths that were
+        not listed yet fall back to the shared per-directory matcher.
 
         Args:
             file_path: The path to check.
@@ -321,24 +453,12 @@ class FilteredDirectoryTree(DirectoryTree):
         # Hidden files are exempt from dimming
         if file_path.name.startswith("."):
             return False
-        # Check result cache
-        if file_path in self._gitignore_cache:
-            return self._gitignore_cache[file_path]
-        # Lazily load ancestor gitignore files
-        self._ensure_ancestor_gitignores(file_path)
-        result = False
+        cached = self._gitignore_cache.get(file_path)
+        if cached is not None:
+            return cached
         if is_dir is None:
             is_dir = file_path.is_dir()
-        # Iterate deepest-first so nested .gitignore overrides parent
-        for gitignore_dir, spec in reversed(self._get_gitignore_specs()):
-            if not file_path.is_relative_to(gitignore_dir):
-                continue
-            rel_to_dir = file_path.relative_to(gitignore_dir)
-            # Append "/" for directories so patterns like "build/" match
-            rel_str = str(rel_to_dir) + "/" if is_dir else str(rel_to_dir)
-            if spec.match_file(rel_str):
-                result = True
-                break
+        result = get_gitignore_cache().is_ignored(file_path, Path(self.path), is_dir)
         self._gitignore_cache[file_path] = result
         return result
 
@@ -348,14 +468,19 @@ class FilteredDirectoryTree(DirectoryTree):
         """Check if .git directory exists at workspace root."""
         return (Path(self.path) / ".git").is_dir()
 
-    def _load_git_status(self) -> GitStatusResult:
+    def _load_git_status(self, scope: Iterable[Path] | None = None) -> GitStatusResult:
         """Run git status and parse the output.
 
+        When *scope* names directories below the workspace root (and a
+        previous result exists), only those are queried and the previous
+        result is updated in place of a full run.
+
         Returns empty result when:
         - show_git_status is disabled
         - No .git directory at workspace root
         - git binary not found
         - git command fails or times out
+        A failed scoped run keeps the previous result.
         """
         empty = GitStatusResult({}, set(), ())
         if not self.show_git_status:
@@ -368,9 +493,31 @@ class FilteredDirectoryTree(DirectoryTree):
             return empty
 
         workspace = Path(self.path)
+        previous = self._git_result
+        scopes: list[str] = []
+        if scope is not None and previous is not None:
+            for directory in scope:
+                try:
+                    rel = directory.relative_to(workspace).as_posix()
+                except ValueError:
+                    continue
+                if rel == ".":
+                    scopes = []
+                    break
+                scopes.append(rel + "/")
+        cmd = [
+            self._git_bin,
+            "--literal-pathspecs",
+            "status",
+            "--porcelain=v2",
+            "-z",
+            "-unormal",
+        ]
+        if scopes:
+            cmd += ["--", *scopes]
         try:
             result = subprocess.run(
-                [self._git_bin, "status", "--porcelain", "-z", "-unormal"],
+                cmd,
                 capture_output=True,
                 text=True,
                 encoding="utf-8",
@@ -380,10 +527,10 @@ class FilteredDirectoryTree(DirectoryTree):
             )
         except subprocess.TimeoutExpired:
             _log.warning("git status: timed out for %s", workspace)
-            return empty
+            return previous if scopes and previous is not None else empty
         except OSError as e:
             _log.debug("git status: OS error: %s", e)
-            return empty
+            return previous if scopes and previous is not None else empty
 
         if result.returncode != 0:
             _log.debug(
@@ -391,8 +538,12 @@ class FilteredDirectoryTree(DirectoryTree):
                 result.returncode,
                 workspace,
             )
-            return empty
+            return previous if scopes and previous is not None else empty
 
+        if scopes and previous is not None:
+            return _merge_git_status(
+                previous, scopes, _parse_git_status_entries(result.stdout), workspace
+            )
         return _parse_git_status_output(result.stdout, workspace)
 
     def _ensure_git_status_loaded(self) -> GitStatusResult:
@@ -412,34 +563,19 @@ class FilteredDirectoryTree(DirectoryTree):
         """Return the git status for a path, or None if clean/unknown.
 
         Also checks if the path is inside an untracked directory
-        (from -unormal output where entire directories are listed).
+        (from -unormal output where entire directories are listed),
+        using pre-computed string prefixes.
         """
         if not self.show_git_status:
             return None
-        result = self._ensure_git_status_loaded()
-
-        status = result.status_map.get(file_path)
-        if status is not None:
-            return status
-
-        # Check if the file is inside an untracked directory using
-        # pre-computed string prefixes (305x faster than is_relative_to).
-        if result.untracked_dir_prefixes:
-            path_str = str(file_path)
-            for prefix in result.untracked_dir_prefixes:
-                if path_str.startswith(prefix):
-                    # Cache the result so subsequent renders get O(1) dict hit.
-                    result.status_map[file_path] = GIT_STATUS_UNTRACKED
-                    return GIT_STATUS_UNTRACKED
-
-        return None
+        return self._ensure_git_status_loaded().status_of(file_path)
 
     def reload(self) -> AwaitComplete:
         """Reload the tree, invalidate caches, and re-snapshot for polling."""
         self._ws_polling_paused = True
-        self._gitignore_specs = None
-        self._gitignore_checked_dirs.clear()
+        self._gitignore_mtimes.clear()
         self._gitignore_cache.clear()
+        self._stale_dirs.clear()
         # Keep stale git data visible during the tree rebuild only when the
         # background worker is active (mounted tree) — it will atomically replace
         # _git_result once the fresh status is ready, avoiding a blank flash.
@@ -448,47 +584,350 @@ class FilteredDirectoryTree(DirectoryTree):
         if not self._bg_loading_started:
             self._git_result = None
         self._is_dir_cache.clear()
+        self._compact_chains.clear()
+        self._node_index.clear()
+        self._more.clear()
+        # A reload is an explicit request for fresh listings.
+        get_directory_scanner().cache.clear()
         parent_awaitable = super().reload()
 
         async def _reload_then_resume():
             try:
                 await parent_awaitable
             finally:
-                self._dir_mtimes = self._collect_expanded_dir_mtimes()
-                self._git_ref_mtimes = self._get_git_ref_mtimes()
+                await self._resnapshot_ws_mtimes()
                 self._ws_polling_paused = False
                 if self._bg_loading_started:
                     self._start_bg_loading()
+                    self._sync_file_watches()
 
         return AwaitComplete(_reload_then_resume())
 
-    # ── Workspace auto-refresh polling ──────────────────────────────────
+    # ── Subtree refresh ─────────────────────────────────────────────────
 
-    def _collect_expanded_dir_mtimes(self) -> dict[Path, float | None]:
-        """Stat workspace root and all expanded directories in the tree."""
-        result: dict[Path, float | None] = {}
-        workspace = Path(self.path)
+    def refresh_dirs(self, dirs: Iterable[Path]) -> AwaitComplete:
+        """Re-list *dirs* and merge the result into the existing nodes.
+
+        Unlike :meth:`reload`, untouched directories keep their nodes, so
+        expansion, cursor and scroll position survive.  Directories that
+        are not loaded in the tree are ignored.  Only the specs of
+        ``.gitignore`` files that changed in *dirs* are invalidated, and
+        git status is refreshed in the background as usual.
+        """
+        self._ws_polling_paused = True
+        targets = set(dirs)
+
+        async def _refresh_then_resume():
+            try:
+                await self._refresh_dirs(targets)
+            finally:
+                await self._resnapshot_ws_mtimes()
+                self._ws_polling_paused = False
+                if self._bg_loading_started:
+                    self._start_bg_loading(targets)
+                    self._sync_file_watches()
+
+        return AwaitComplete(_refresh_then_resume())
+
+    def _loaded_dir_nodes(self) -> dict[Path, TreeNode[DirEntry]]:
+        """Map the root and every loaded directory node by path (no I/O)."""
+        result: dict[Path, TreeNode[DirEntry]] = {Path(self.path): self.root}
+
+        def walk(node: TreeNode[DirEntry]) -> None:
+            for child in node.children:
+                if child.data is not None and child.allow_expand and child.data.loaded:
+                    result[child.data.path] = child
+                    walk(child)
+
+        walk(self.root)
+        return result
+
+    async def _refresh_dirs(self, dirs: set[Path]) -> None:
+        async with self.lock:
+            targets = {
+                path: node
+                for path, node in self._loaded_dir_nodes().items()
+                if path in dirs
+            }
+            if not targets:
+                return
+            listings = await self._scan_for_refresh(targets)
+            if listings is None:
+                return
+            # A changed .gitignore affects every loaded directory below it,
+            # so those are re-listed (and re-flagged) in a second batch.
+            stale = {
+                path
+                for path, listing in listings.items()
+                if path in self._gitignore_mtimes
+                and listing.gitignore_mtime != self._gitignore_mtimes[path]
+            }
+            if stale:
+                self._invalidate_gitignore_dirs(stale)
+                prefixes = tuple(str(d) + os.sep for d in stale)
+                below = {
+                    path: node
+                    for path, node in self._loaded_dir_nodes().items()
+                    if path not in targets and str(path).startswith(prefixes)
+                }
+                more = await self._scan_for_refresh(below)
+                if more is not None:
+                    targets.update(below)
+                    listings.update(more)
+
+            # Anchor the view on the cursor (or the top visible node) so the
+            # rows the user is looking at do not jump when entries appear
+            # or disappear above them.
+            scroll_y = round(self.scroll_y)
+            cursor = self.cursor_node
+            anchor = cursor
+            if anchor is None or not (
+                scroll_y <= anchor.line < scroll_y + self.size.height
+            ):
+                anchor = self.get_node_at_line(scroll_y)
+            anchor_offset = anchor.line - scroll_y if anchor is not None else 0
+            cursor_chain: set[NodeID] = set()
+            node = cursor
+            while node is not None:
+                cursor_chain.add(node.id)
+                node = node.parent
+
+            fallback: tuple[TreeNode[DirEntry], int] | None = None
+            for path, node in targets.items():
+                listing = listings.get(path)
+                if listing is None:
+                    continue
+                removed = self._merge_listing(node, listing)
+                self._record_gitignore(path, listing)
+                hit = cursor_chain.intersection(removed)
+                if hit:
+                    fallback = (node, removed[hit.pop()])
+
+            if stale:
+                self._clear_line_cache()  # kept rows may change their dimming
+            _ = self._tree_lines  # rebuild lines so node.line is current
+            if fallback is not None:
+                parent, index = fallback
+                if parent.children:
+                    target = parent.children[min(index, len(parent.children) - 1)]
+                else:
+                    target = None if parent is self.root else parent
+                self.move_cursor(target, animate=False)
+                anchor = target if anchor is not None else None
+            if anchor is not None and anchor.line >= 0:
+                self.scroll_to(y=anchor.line - anchor_offset, animate=False)
+
+    async def _scan_for_refresh(
+        self, targets: dict[Path, TreeNode[DirEntry]]
+    ) -> dict[Path, DirectoryListing] | None:
+        """Scan *targets* as one batch, keyed by tree path; None on timeout."""
+        if not targets:
+            return {}
+        by_scan_path = {path.expanduser(): path for path in targets}
         try:
-            result[workspace] = workspace.stat().st_mtime
-        except OSError:
-            result[workspace] = None
+            listings = await get_directory_scanner().scan_many(
+                by_scan_path,
+                self.show_hidden_files,
+                compact_folders=self.compact_folders,
+                gitignore_root=self._gitignore_root(),
+                timeout=self._SCAN_TIMEOUT,
+            )
+        except TimeoutError as exc:
+            _log.warning("subtree refresh abandoned: %s", exc)
+            return None
+        return {by_scan_path[p]: listing for p, listing in listings.items()}
+
+    def _merge_listing(
+        self, node: TreeNode[DirEntry], listing: DirectoryListing
+    ) -> dict[NodeID, int]:
+        """Bring *node*'s children in line with *listing*.
+
+        Children whose path, kind and compact-chain target are unchanged are
+        kept as-is (with their own children and expansion); new entries are
+        inserted at their sorted position and vanished ones removed.  A
+        paged directory keeps showing as many entries as before (at least
+        one page); the rest of the listing goes behind "load more".
+
+        Returns:
+            The ids of removed children mapped to their former index.
+        """
+        children = list(node.children)
+        positions = {child.id: i for i, child in enumerate(children)}
+        # Compact nodes point at the deepest directory of their chain, so
+        # key children by the first path segment below the listed directory.
+        base = listing.paths[0].parent if listing.paths else None
+        existing: dict[Path, TreeNode[DirEntry]] = {}
+        for child in children:
+            if child.data is None:
+                continue
+            key = child.data.path
+            if base is not None and key.is_relative_to(base) and key != base:
+                key = base / key.relative_to(base).parts[0]
+            existing[key] = child
+
+        shown = max(self._PAGE_SIZE, len(existing))
+        plan: list[TreeNode[DirEntry] | _NodeSpec] = []
+        kept: list[TreeNode[DirEntry]] = []
+        for path in listing.paths[:shown]:
+            spec = self._entry_spec(
+                path,
+                listing.is_dir.get(path, False),
+                listing.compact_chains.get(path),
+            )
+            label, target, allow_expand = spec
+            old = existing.get(path)
+            if (
+                old is not None
+                and old.data is not None
+                and old.data.path == target
+                and old.allow_expand == allow_expand
+            ):
+                del existing[path]
+                if str(old.label) != label:
+                    old.set_label(label)
+                plan.append(old)
+                kept.append(old)
+            else:
+                plan.append(spec)
+
+        # Survivors must already be in listing order; a tie in the
+        # case-insensitive sort can swap two of them, so rebuild those.
+        kept_ids = {child.id for child in kept}
+        if [c for c in node.children if c.id in kept_ids] != kept:
+            for i, item in enumerate(plan):
+                if not isinstance(item, _NodeSpec):
+                    assert item.data is not None
+                    existing[item.data.path] = item
+                    plan[i] = _NodeSpec(
+                        str(item.label), item.data.path, item.allow_expand
+                    )
+
+        removed: dict[NodeID, int] = {}
+        for child in existing.values():
+            removed[child.id] = positions[child.id]
+            self._unindex_subtree(child)
+            child.remove()
+        for index, item in enumerate(plan):
+            if isinstance(item, _NodeSpec):
+                label, target, allow_expand = item
+                self._node_index[target] = node.add(
+                    label,
+                    data=DirEntry(target),
+                    allow_expand=allow_expand,
+                    before=index,
+                )
+        self._set_more(
+            node,
+            [
+                (
+                    path,
+                    listing.is_dir.get(path, False),
+                    listing.compact_chains.get(path),
+                )
+                for path in listing.paths[shown:]
+            ],
+        )
+        return removed
+
+    # ── Path index and reveal ───────────────────────────────────────────
+
+    def _unindex_subtree(self, node: TreeNode[DirEntry]) -> None:
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            data = current.data
+            if data is not None and self._node_index.get(data.path) is current:
+                del self._node_index[data.path]
+            self._more.pop(current.id, None)
+            stack.extend(current.children)
+
+    def find_node(self, path: Path) -> TreeNode[DirEntry] | None:
+        """Return the loaded node for *path* in O(1), or None."""
+        if path == Path(self.path):
+            return self.root
+        return self._node_index.get(path)
+
+    def _deepest_loaded_ancestor(self, path: Path) -> TreeNode[DirEntry]:
+        for parent in path.parents:
+            node = self.find_node(parent)
+            if node is not None:
+                return node
+        return self.root
+
+    async def reveal_path(self, path: Path) -> TreeNode[DirEntry] | None:
+        """Load and expand the folders leading to *path*, then move the cursor.
+
+        Each directory on the way is loaded through the normal load queue
+        and awaited before descending, so the whole path is revealed in one
+        pass.  Compact nodes are crossed in a single step because they are
+        indexed under their deepest directory, and paged directories show
+        pages until the entry on the path has a node.
+
+        Returns:
+            The node for *path*, or None when it is outside the workspace
+            or does not exist.
+        """
+        if path == Path(self.path) or not path.is_relative_to(Path(self.path)):
+            return None
+        current = self.root
+        while (node := self.find_node(path)) is None:
+            await self._add_to_load_queue(current)
+            self._show_more_for(current, path)
+            if (node := self.find_node(path)) is not None:
+                break
+            deeper = self._deepest_loaded_ancestor(path)
+            if deeper is current or not deeper.allow_expand:
+                return None  # the next path segment is not on disk
+            current = deeper
+        ancestor = node.parent
+        while ancestor is not None and ancestor is not self.root:
+            ancestor.expand()
+            ancestor = ancestor.parent
+        _ = self._tree_lines  # rebuild lines so node.line is current
+        self.move_cursor(node)
+        return node
+
+    # ── Workspace auto-refresh polling ──────────────────────────────────
+
+    def _expanded_dir_paths(self) -> list[Path]:
+        """Return the workspace root and every expanded directory node's path.
+
+        Reads only the in-memory tree (no I/O), so it is safe to call on the
+        event loop before handing the stat work to a thread.
+        """
+        result = [Path(self.path)]
 
         def walk(node):
             for child in node.children:
-                if (
-                    child.data is not None
-                    and child.is_expanded
-                    and child.data.path.is_dir()
-                ):
-                    try:
-                        result[child.data.path] = child.data.path.stat().st_mtime
-                    except OSError:
-                        result[child.data.path] = None
+                if child.data is not None and child.allow_expand and child.is_expanded:
+                    result.append(child.data.path)
                     walk(child)
 
         walk(self.root)
         return result
 
+    @staticmethod
+    def _stat_dir_mtimes(dirs: list[Path]) -> dict[Path, float | None]:
+        """Stat *dirs* (root first); vanished or non-directory entries are skipped.
+
+        The root always gets an entry (``None`` when it cannot be stat'ed).
+        """
+        result: dict[Path, float | None] = {}
+        for i, path in enumerate(dirs):
+            try:
+                st = path.stat()
+            except OSError:
+                if i == 0:
+                    result[path] = None
+                continue
+            if i == 0 or stat.S_ISDIR(st.st_mode):
+                result[path] = st.st_mtime
+        return result
+
+    def _collect_expanded_dir_mtimes(self) -> dict[Path, float | None]:
+        """Stat workspace root and all expanded directories in the tree."""
+        return self._stat_dir_mtimes(self._expanded_dir_paths())
+
     def _get_git_ref_mtimes(self) -> tuple[float | None, float | None]:
         """Stat .git/index and .git/HEAD for git change detection."""
         git_dir = Path(self.path) / ".git"
@@ -502,21 +941,69 @@ class FilteredDirectoryTree(DirectoryTree):
             head_mtime = (git_dir / "HEAD").stat().st_mtime
         return (index_mtime, head_mtime)
 
+    def _stat_ws_mtimes(
+        self, dirs: list[Path]
+    ) -> tuple[dict[Path, float | None], tuple[float | None, float | None]]:
+        """Stat *dirs* and the git refs (blocking; run on the file service)."""
+        return self._stat_dir_mtimes(dirs), self._get_git_ref_mtimes()
+
+    async def _resnapshot_ws_mtimes(self) -> None:
+        """Take a fresh polling baseline without stat'ing on the event loop."""
+        try:
+            self._dir_mtimes, self._git_ref_mtimes = await get_file_service().run(
+                self._stat_ws_mtimes, self._expanded_dir_paths()
+            )
+        except TimeoutError:
+            _log.debug("workspace polling baseline timed out")
+
     def _poll_workspace_change(self) -> None:
-        """Check for workspace dir changes and git ref changes."""
+        """Check for workspace dir changes and git ref changes (blocking)."""
         if self._ws_polling_paused:
             return
+        self._apply_workspace_poll(
+            self._collect_expanded_dir_mtimes(), self._get_git_ref_mtimes()
+        )
 
-        new_dir_mtimes = self._collect_expanded_dir_mtimes()
-        dir_changed = new_dir_mtimes != self._dir_mtimes
+    def _on_ws_poll_tick(self) -> None:
+        """Timer callback: poll off the event loop unless the watcher is active."""
+        if self._ws_polling_paused or self._file_watcher_active():
+            return
+        self._poll_workspace_in_background(self._expanded_dir_paths())
 
-        new_git_mtimes = self._get_git_ref_mtimes()
+    @work(exclusive=True, group="ws_poll", exit_on_error=False)
+    async def _poll_workspace_in_background(self, dirs: list[Path]) -> None:
+        """Fallback polling: stat *dirs* and git refs on the file service."""
+        try:
+            new_dir_mtimes, new_git_mtimes = await get_file_service().run(
+                self._stat_ws_mtimes, dirs
+            )
+        except TimeoutError:
+            return
+        self._apply_workspace_poll(new_dir_mtimes, new_git_mtimes)
+
+    def _apply_workspace_poll(
+        self,
+        new_dir_mtimes: dict[Path, float | None],
+        new_git_mtimes: tuple[float | None, float | None],
+    ) -> None:
+        """Compare a fresh mtime snapshot with the last one and react."""
+        if self._ws_polling_paused:
+            return
+        dir_changed = new_dir_mtimes != self._dir_mtimes
         git_changed = new_git_mtimes != self._git_ref_mtimes
 
         if dir_changed:
-            _log.debug("workspace dir change detected, reloading explorer")
+            changed = {
+                path
+                for path in new_dir_mtimes.keys() | self._dir_mtimes.keys()
+                if new_dir_mtimes.get(path) != self._dir_mtimes.get(path)
+            }
+            _log.debug("workspace dir change detected in %d dir(s)", len(changed))
             self._git_ref_mtimes = new_git_mtimes
-            self.reload()
+            if git_changed:
+                # The refresh below only re-queries *changed*; widen it.
+                self._queue_git_scope(None)
+            self.refresh_dirs(changed)
             self.post_message(self.WorkspaceChanged())
         elif git_changed:
             _log.debug(
@@ -529,6 +1016,86 @@ class FilteredDirectoryTree(DirectoryTree):
             if self._bg_loading_started:
                 self._start_bg_loading()
 
+    # ── File watcher integration ────────────────────────────────────────
+
+    def _file_watcher_active(self) -> bool:
+        return getattr(self.app, "file_watcher", None) is not None
+
+    def _sync_file_watches(self) -> None:
+        """Ask the app's file watcher to observe expanded dirs and ``.git``."""
+        set_watched_dirs = getattr(self.app, "set_watched_dirs", None)
+        if set_watched_dirs is None:
+            return
+        dirs = self._expanded_dir_paths()
+        # .git itself is watched (non-recursively) for index/HEAD updates.
+        dirs.append(Path(self.path) / ".git")
+        set_watched_dirs("explorer", dirs)
+
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
+        data = event.node.data
+        if data is not None and data.path in self._stale_dirs:
+            # Its listing went unwatched while collapsed.
+            self._stale_dirs.discard(data.path)
+            self.refresh_dirs([data.path])
+        self.call_after_refresh(self._sync_file_watches)
+
+    def on_tree_node_collapsed(self, event: Tree.NodeCollapsed) -> None:
+        data = event.node.data
+        if data is not None and data.loaded:
+            self._stale_dirs.add(data.path)
+        self.call_after_refresh(self._sync_file_watches)
+
+    def apply_file_changes(self, changes: FileChanges) -> None:
+        """React to a file watcher batch (event-driven twin of the poll).
+
+        - A listing change in an expanded directory re-lists just those
+          directories (:meth:`refresh_dirs`) and posts ``WorkspaceChanged``;
+          a queue overflow means events were lost, so the tree reloads.
+        - An edited ``.gitignore`` re-lists its directory, which re-flags
+          the loaded subtree below it.
+        - An ``index``/``HEAD`` update in ``.git`` refreshes git status for
+          the whole workspace; a file edit elsewhere re-queries only the
+          directories of the edited files.  Stale colours stay visible
+          until the new result lands.
+        """
+        if self._ws_polling_paused:
+            # A reload is in flight; re-check once it has settled.
+            self.set_timer(0.2, lambda: self.apply_file_changes(changes))
+            return
+        git_dir = Path(self.path) / ".git"
+        if changes.overflow:
+            _log.debug("watcher: event queue overflow, reloading explorer")
+            self.reload()
+            self.post_message(self.WorkspaceChanged())
+            return
+        changed_dirs = changes.dirs & set(self._expanded_dir_paths())
+        gitignore_dirs = {p.parent for p in changes.paths if p.name == ".gitignore"}
+        git_changed = any(
+            p.parent == git_dir and p.name in ("index", "HEAD") for p in changes.paths
+        )
+        # Directories whose files changed: git status is re-queried for
+        # these only, unless the index or HEAD moved.
+        file_dirs = {
+            p.parent
+            for p in changes.paths
+            if p != git_dir and not p.is_relative_to(git_dir)
+        }
+        git_scope = None if git_changed else file_dirs
+        stale_gitignores = gitignore_dirs & self._gitignore_mtimes.keys()
+        refresh = changed_dirs | stale_gitignores
+        if refresh:
+            if changed_dirs:
+                _log.debug("watcher: listing change in %d dir(s)", len(changed_dirs))
+            # refresh_dirs re-queries git for its own dirs once it is done.
+            if git_changed or file_dirs - refresh:
+                self._queue_git_scope(git_scope)
+            self.refresh_dirs(refresh)
+            if changed_dirs:
+                self.post_message(self.WorkspaceChanged())
+        elif (git_changed or file_dirs) and self._bg_loading_started:
+            _log.debug("watcher: scheduling background git status reload")
+            self._start_bg_loading(git_scope)
+
     def render_label(self, node: TreeNode, base_style: Style, style: Style) -> Text:
         """Override to strip italic and apply gitignored/hidden/git-status styles.
 
@@ -541,6 +1108,18 @@ class FilteredDirectoryTree(DirectoryTree):
         as hidden files for consistent appearance across terminal modes.
         Git-modified files are colored with $text-warning, untracked with $text-success.
         """
+        if node.data is None:
+            # The "load more" row of a paged directory.
+            label = node.label
+            text = label.copy() if isinstance(label, Text) else Text(label)
+            text.stylize(style)
+            if self.is_mounted:
+                text.stylize_before(
+                    self.get_component_rich_style(
+                        "directory-tree--load-more", partial=True
+                    )
+                )
+            return text
         text = super().render_label(node, base_style, style)
         if node.data is not None:
             is_dotfile = node.data.path.name.startswith(".")
@@ -582,12 +1161,149 @@ class FilteredDirectoryTree(DirectoryTree):
                 )
         return text
 
+    # ── Paged directories ───────────────────────────────────────────────
+
+    def _set_more(self, node: TreeNode[DirEntry], entries: list[_Entry]) -> None:
+        """Replace *node*'s unshown tail (and its "load more" row) with *entries*.
+
+        If the cursor was on the old row it moves to the entry that took
+        its place, i.e. the first one of the page just shown.
+        """
+        more = self._more.pop(node.id, None)
+        cursor_index: int | None = None
+        if more is not None:
+            if self.cursor_node is more.node:
+                cursor_index = node.children.index(more.node)
+            more.node.remove()
+        if entries:
+            label = f"Load more… ({len(entries):,} more entries)"
+            self._more[node.id] = _MoreEntries(node.add_leaf(label), entries)
+        if cursor_index is not None and node.children:
+            _ = self._tree_lines  # rebuild lines so node.line is current
+            target = node.children[min(cursor_index, len(node.children) - 1)]
+            self.move_cursor(target, animate=False)
+
+    def show_more(self, node: TreeNode[DirEntry], count: int | None = None) -> None:
+        """Give the next *count* (default: one page) unshown entries a node."""
+        more = self._more.get(node.id)
+        if more is None:
+            return
+        count = self._PAGE_SIZE if count is None else count
+        self._add_entries(node, more.entries[:count])
+        self._set_more(node, more.entries[count:])
+
+    def _show_more_for(self, node: TreeNode[DirEntry], path: Path) -> None:
+        """Show pages of *node* until the entry leading to *path* has a node."""
+        more = self._more.get(node.id)
+        if more is None:
+            return
+        for index, (entry, _is_dir, _chain) in enumerate(more.entries):
+            if path.is_relative_to(entry):
+                pages = index // self._PAGE_SIZE + 1
+                self.show_more(node, pages * self._PAGE_SIZE)
+                return
+
+    def _more_parent(self, node: TreeNode[DirEntry]) -> TreeNode[DirEntry] | None:
+        """Return the paged directory if *node* is its "load more" row."""
+        parent = node.parent
+        if node.data is not None or parent is None:
+            return None
+        more = self._more.get(parent.id)
+        return parent if more is not None and more.node is node else None
+
+    def on_tree_node_highlighted(self, event: Tree.NodeHighlighted) -> None:
+        # Moving onto the "load more" row pages in, so scrolling down with
+        # the keyboard walks through a huge directory without extra keys.
+        parent = self._more_parent(event.node)
+        if parent is not None:
+            self.show_more(parent)
+        else:
+            self._schedule_prefetch(event.node)
+
+    def on_tree_node_selected(self, event: Tree.NodeSelected) -> None:
+        parent = self._more_parent(event.node)
+        if parent is not None:
+            self.show_more(parent)
+
+    # ── Listing prefetch ────────────────────────────────────────────────
+
+    def _schedule_prefetch(self, node: TreeNode[DirEntry]) -> None:
+        """Prefetch the listings below *node* once the tree has been idle.
+
+        Every call restarts the idle timer, so holding down an arrow key
+        prefetches only around where the cursor comes to rest.
+        """
+        if not self.is_mounted:
+            return
+        if node not in self._prefetch_nodes:
+            self._prefetch_nodes.append(node)
+        if self._prefetch_timer is not None:
+            self._prefetch_timer.stop()
+        self._prefetch_timer = self.set_timer(
+            self._PREFETCH_DELAY, self._prefetch_listings
+        )
+
+    def _prefetch_targets(self, node: TreeNode[DirEntry]) -> list[Path]:
+        """Return the directories the user can open next from *node*.
+
+        For a loaded folder these are its unloaded subdirectories; for a
+        folder that was never listed, the folder itself.  Files and
+        "load more" rows have none.
+        """
+        data = node.data
+        if data is None or not node.allow_expand:
+            return []
+        if not data.loaded:
+            return [data.path]
+        return [
+            child.data.path
+            for child in node.children
+            if child.data is not None and child.allow_expand and not child.data.loaded
+        ]
+
+    def _prefetch_listings(self) -> None:
+        """Queue idle-time scans that fill the shared listing cache.
+
+        A file under the cursor is preloaded for the editor instead.
+        """
+        self._prefetch_timer = None
+        nodes, self._prefetch_nodes = self._prefetch_nodes, []
+        targets: list[Path] = []
+        files: list[Path] = []
+        for node in nodes:
+            if self._tree_nodes.get(node.id) is not node:  # no longer in the tree
+                continue
+            if node.data is not None and not node.allow_expand:
+                files.append(node.data.path.expanduser())
+            targets.extend(self._prefetch_targets(node))
+        if files:
+            # The node the cursor rests on was highlighted last.
+            get_file_preloader().prefetch(reversed(files))
+        if not targets:
+            return
+        get_directory_scanner().prefetch(
+            [p.expanduser() for p in targets[: self._PREFETCH_LIMIT]],
+            self.show_hidden_files,
+            compact_folders=self.compact_folders,
+            gitignore_root=self._gitignore_root(),
+            stuck_after=self._SCAN_TIMEOUT,
+        )
+
     # ── os.scandir directory loading optimization ────────────────────────
 
+    def _store_listing(self, directory: Path, listing: DirectoryListing) -> list[Path]:
+        """Cache the is_dir, compact-chain and gitignore results of a scan."""
+        self._record_gitignore(directory, listing)
+        self._is_dir_cache.update(listing.is_dir)
+        self._compact_chains.update(listing.compact_chains)
+        return listing.paths
+
     def _load_directory_sync(self, path: Path) -> list[Path]:
         """Load directory contents using os.scandir and populate _is_dir_cache.
 
-        Delegates to :func:`scan_directory_sync` (module-level, picklable).
+        Delegates to :func:`scan_directory_listing`, which also resolves
+        compact-folder chains when ``compact_folders`` is enabled and flags
+        gitignored entries when ``dim_gitignored`` is.
 
         Args:
             path: The directory to scan. Will be resolved to an absolute path.
@@ -595,60 +1311,44 @@ class FilteredDirectoryTree(DirectoryTree):
         Returns:
             Sorted list of filtered paths (directories first, then by name).
         """
-        paths, cache = scan_directory_sync(path, self.show_hidden_files)
-        self._is_dir_cache.update(cache)
-        return paths
+        return self._store_listing(
+            path,
+            scan_directory_listing(
+                path,
+                self.show_hidden_files,
+                self.compact_folders,
+                self._gitignore_root(),
+            ),
+        )
 
     @work(exit_on_error=False)
     async def _load_directory(self, node: TreeNode[DirEntry]) -> list[Path]:
-        """Load directory contents in a subprocess via :func:`run_cancellable`.
+        """Load directory contents on the shared :class:`DirectoryScanner`.
 
         Overrides the base DirectoryTree._load_directory to eliminate
-        duplicate stat calls per entry and enable true cancellation.
+        duplicate stat calls per entry.  Scans run on a long-lived thread
+        pool instead of a per-directory subprocess; concurrent requests for
+        the same directory share one scan, and a scan stuck on a dead mount
+        is abandoned after ``_SCAN_TIMEOUT`` seconds (or when this worker is
+        cancelled) so it cannot wedge the loader queue.  Compact-folder
+        chains and gitignore flags are resolved as part of the same
+        background scan.  A listing prefetched while the tree was idle
+        (see :meth:`_schedule_prefetch`) is used as long as the directory's
+        mtime is unchanged.
         """
         assert node.data is not None
-        paths, cache = await run_cancellable(
-            scan_directory_sync,
+        listing = await get_directory_scanner().scan(
             node.data.path.expanduser(),
             self.show_hidden_files,
+            compact_folders=self.compact_folders,
+            gitignore_root=self._gitignore_root(),
+            timeout=self._SCAN_TIMEOUT,
+            use_cache=True,
         )
-        self._is_dir_cache.update(cache)
-        return paths
-
-    def _resolve_compact_chain(self, path: Path) -> tuple[str, Path]:
-        """Walk a single-child directory chain and return joined label + deepest path.
-
-        Starting from *path*, repeatedly loads subdirectory contents.  If a
-        directory has exactly one visible child that is also a directory, the
-        chain continues.  Otherwise the chain ends.
-
-        Returns:
-            A tuple of (joined_label, deepest_directory_path).
-        """
-        segments = [path.name]
-        current = path
-        seen: set[Path] = set()
-        while True:
-            children = self._load_directory_sync(current)
-            if len(children) != 1:
-                break
-            child = children[0]
-            is_dir = self._is_dir_cache.get(child, self._safe_is_dir(child))
-            if not is_dir:
-                break
-            # Guard against symlink cycles
-            resolved = child.resolve()
-            if resolved in seen:
-                break
-            seen.add(resolved)
-            segments.append(child.name)
-            current = child
-        if len(segments) > 1:
-            _log.debug("compact chain: %s → %s", path.name, "/".join(segments))
-        return "/".join(segments), current
+        return self._store_listing(node.data.path, listing)
 
     def _populate_node(self, node: TreeNode[DirEntry], content: Iterable[Path]) -> None:
-        """Populate tree node using cached is_dir results.
+        """Populate tree node using cached scan results.
 
         Overrides the base DirectoryTree._populate_node to read from
         _is_dir_cache (populated by _load_directory_sync) instead of
@@ -656,23 +1356,41 @@ class FilteredDirectoryTree(DirectoryTree):
 
         When compact_folders is enabled, single-child directory chains are
         merged into a single node with a joined label (e.g. "src/main/java").
+        The chains were resolved during the scan (_compact_chains), so this
+        method never walks the filesystem itself.
+
+        Only the first ``_PAGE_SIZE`` entries get a node; the rest are kept
+        as plain tuples behind a "load more" row (see :meth:`show_more`).
         """
+        for child in node.children:
+            self._unindex_subtree(child)
+        self._more.pop(node.id, None)
         node.remove_children()
+        entries: list[_Entry] = []
         for path in content:
             is_dir = self._is_dir_cache.pop(path, None)
             if is_dir is None:
                 is_dir = self._safe_is_dir(path)
-            if is_dir and self.compact_folders:
-                label, deepest = self._resolve_compact_chain(path)
-                node.add(
-                    label,
-                    data=DirEntry(deepest),
-                    allow_expand=True,
-                )
-            else:
-                node.add(
-                    path.name,
-                    data=DirEntry(path),
-                    allow_expand=is_dir,
-                )
+            entries.append((path, is_dir, self._compact_chains.pop(path, None)))
+        self._add_entries(node, entries[: self._PAGE_SIZE])
+        self._set_more(node, entries[self._PAGE_SIZE :])
         node.expand()
+        self._schedule_prefetch(node)
+
+    def _add_entries(self, node: TreeNode[DirEntry], entries: list[_Entry]) -> None:
+        """Append a node for each of *entries* to *node* and index it."""
+        for path, is_dir, chain in entries:
+            label, target, allow_expand = self._entry_spec(path, is_dir, chain)
+            self._node_index[target] = node.add(
+                label, data=DirEntry(target), allow_expand=allow_expand
+            )
+
+    def _entry_spec(
+        self, path: Path, is_dir: bool, chain: tuple[str, Path] | None
+    ) -> _NodeSpec:
+        """Return how to show a listed entry as a node."""
+        if is_dir and self.compact_folders and chain is not None:
+            label, deepest = chain
+            _log.debug("compact chain: %s → %s", path.name, label)
+            return _NodeSpec(label, deepest, True)
+        return _NodeSpec(path.name, path, is_dir)
@@ -11,7 +11,7 @@ from textual.containers import Horizontal
 from textual.css.query import NoMatches
 from textual.message import Message
 from textual.reactive import reactive
-from textual.widgets import Button, Checkbox, Input
+from textual.widgets import Button, Checkbox, Input, Label
 
 # Full and compact (icon-only) label variants for each button.
 # Mirrors the _BTN_LABELS pattern in workspace_search.py.
@@ -57,6 +57,15 @@ class FindReplaceBar(Horizontal):
     replace_mode: reactive[bool] = reactive(False, init=False)
     _compact: bool | None = None
 
+    class QueryChanged(Message):
+        """Emitted when the query or its options change (starts a find session)."""
+
+        def __init__(self, query: str, use_regex: bool, case_sensitive: bool) -> None:
+            super().__init__()
+            self.query = query
+            self.use_regex = use_regex
+            self.case_sensitive = case_sensitive
+
     class FindNext(Message):
         """Emitted when the user requests the next match."""
 
@@ -116,6 +125,7 @@ class FindReplaceBar(Horizontal):
             yield Input(placeholder="Find...", id="find_input")
             yield Checkbox(".*", id="use_regex", value=False)
             yield Checkbox("Aa", id="case_sensitive", value=True)
+            yield Label("", id="match_count")
             yield Button(_BTN_LABELS["prev_match"][0], id="prev_match")
             yield Button(_BTN_LABELS["next_match"][0], id="next_match")
             yield Button(
@@ -176,6 +186,7 @@ class FindReplaceBar(Horizontal):
         self.display = True
         self.query_one("#find_input", Input).focus()
         self.call_after_refresh(self._refresh_labels)
+        self._on_query_changed()
 
     def show_replace(self) -> None:
         """Show the bar in replace mode (replace row visible) and focus find input."""
@@ -183,6 +194,20 @@ class FindReplaceBar(Horizontal):
         self.display = True
         self.query_one("#find_input", Input).focus()
         self.call_after_refresh(self._refresh_labels)
+        self._on_query_changed()
+
+    def set_match_count(self, current: int | None, total: int | None) -> None:
+        """Show "current of total" matches; hidden while *total* is None."""
+        label = self.query_one("#match_count", Label)
+        if total is None:
+            label.display = False
+            return
+        if total == 0:
+            label.update("No results")
+        else:
+            position = "?" if current is None else f"{current:,}"
+            label.update(f"{position} of {total:,}")
+        label.display = True
 
     def _get_query(self) -> str:
         return self.query_one("#find_input", Input).value
@@ -211,6 +236,15 @@ class FindReplaceBar(Horizontal):
             _REPLACE_PLACEHOLDER_REGEX if event.value else _REPLACE_PLACEHOLDER
         )
 
+    @on(Input.Changed, "#find_input")
+    @on(Checkbox.Changed)
+    def _on_query_changed(self) -> None:
+        self.post_message(
+            FindReplaceBar.QueryChanged(
+                self._get_query(), self._get_use_regex(), self._get_case_sensitive()
+            )
+        )
+
     @on(Button.Pressed, "#next_match")
     def _on_find_next(self) -> None:
         self.post_message(
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import contextlib
+import dataclasses
 import logging
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal, cast
@@ -8,6 +10,7 @@ from uuid import uuid4
 
 from textual import events, on, work
 from textual.app import ComposeResult
+from textual.cache import LRUCache
 from textual.css.query import NoMatches
 from textual.message import Message
 from textual.timer import Timer
@@ -16,11 +19,18 @@ from textual.widgets import Button, Static, TabbedContent, TabPane
 
 from textual_code.cancellable_worker import run_cancellable
 from textual_code.command_registry import bindings_for_context as _bindings_for_context
+from textual_code.file_preloader import get_file_preloader
+from textual_code.file_service import get_file_service
 from textual_code.modals import LargeFileConfirmModalScreen
-from textual_code.utils import is_binary_file
-from textual_code.widgets.code_editor import CodeEditor, CodeEditorFooter, EditorState
+from textual_code.widgets.code_editor import (
+    CodeEditor,
+    CodeEditorFooter,
+    EditorCaches,
+    EditorState,
+)
 from textual_code.widgets.code_editor_helpers import (
     FileLoadResult,
+    _snapshot_editorconfig_mtimes,
     load_file_for_editor,
 )
 from textual_code.widgets.draggable_tabs_content import DraggableTabbedContent
@@ -56,11 +66,16 @@ from textual_code.widgets.split_tree import (
 
 if TYPE_CHECKING:
     from textual_code.app import TextualCode
+    from textual_code.file_watcher import FileChanges
 
 log = logging.getLogger(__name__)
 
 PREVIEW_DEBOUNCE_DELAY = 0.3
 
+# Unmounted editors whose syntax tree, highlights and git gutter are kept
+# for a cheap remount (each holds a full parsed copy of its file).
+REMOUNT_CACHE_SIZE = 8
+
 _DIRECTION_TO_SPLIT: dict[Direction, tuple[str, str]] = {
     "left": ("horizontal", "before"),
     "right": ("horizontal", "after"),
@@ -101,6 +116,9 @@ class MainView(Static):
         self._preview_update_timers: dict[Path, Timer] = {}
         # Lazy tab mounting: pane_id → saved EditorState for unmounted editors
         self._editor_states: dict[str, EditorState] = {}
+        # Lazy tab mounting: pane_id → parse tree, highlights and git gutter of
+        # the most recently unmounted editors (see CodeEditor.capture_caches)
+        self._remount_caches: LRUCache[str, EditorCaches] = LRUCache(REMOUNT_CACHE_SIZE)
         # Lazy tab mounting: leaf_id → previously active pane_id (for unmounting)
         self._prev_active_pane_ids: dict[str, str | None] = {}
         # MRU history per leaf: leaf_id → list of pane_ids (most recent first)
@@ -133,9 +151,11 @@ class MainView(Static):
         yield CodeEditorFooter()
 
     def on_mount(self) -> None:
-        # Central polling timer: only the active editor is polled (Fix 2)
+        # Central polling timer: only the active editor is polled (Fix 2).
+        # When the inotify watcher is running the tick only refreshes the
+        # watched directory set; polling is the fallback.
         if not self.app.is_headless:
-            self.set_interval(2.0, self._poll_active_editor)
+            self.set_interval(2.0, self._on_poll_tick)
 
     def _poll_active_editor(self) -> None:
         """Poll only the active editor for file and editorconfig changes."""
@@ -144,6 +164,79 @@ class MainView(Static):
             editor._poll_file_change()
             editor._poll_editorconfig_change()
 
+    def _on_poll_tick(self) -> None:
+        """Timer callback: sync watches, or poll the active editor off-loop."""
+        if getattr(self.app, "file_watcher", None) is not None:
+            self._sync_file_watches()
+            return
+        editor = self.get_active_code_editor()
+        if editor is not None and editor.path is not None:
+            self._poll_editor_in_background(editor)
+
+    @work(exclusive=True, group="editor_poll", exit_on_error=False)
+    async def _poll_editor_in_background(self, editor: CodeEditor) -> None:
+        """Stat the editor's file and EditorConfig chain on the file service."""
+        path = editor.path
+        ec_dirs = list(editor._ec_search_dirs)
+        if path is None:
+            return
+        service = get_file_service()
+        try:
+            mtime = await service.mtime(path)
+            ec_mtimes = (
+                await service.run(_snapshot_editorconfig_mtimes, ec_dirs)
+                if ec_dirs
+                else None
+            )
+        except TimeoutError:
+            return
+        self._apply_polled_editor_state(editor, path, mtime, ec_mtimes)
+
+    def _apply_polled_editor_state(
+        self,
+        editor: CodeEditor,
+        path: Path,
+        mtime: float | None,
+        ec_mtimes: dict[Path, float | None] | None,
+    ) -> None:
+        """Apply background poll results if the editor still shows *path*."""
+        if not editor.is_mounted or editor.path != path:
+            return
+        editor._handle_file_mtime(mtime)
+        if ec_mtimes is not None and editor._ec_search_dirs:
+            editor._handle_editorconfig_mtimes(ec_mtimes)
+
+    # ── File watcher integration ─────────────────────────────────────────────
+
+    def _sync_file_watches(self) -> None:
+        """Watch the parent directory of every open file plus EditorConfig dirs."""
+        dirs: set[Path] = set()
+        for leaf in all_leaves(self._split_root):
+            dirs.update(p.parent for p in leaf.opened_files)
+        for editor in self.query(CodeEditor):
+            dirs.update(editor._ec_search_dirs)
+        set_watched_dirs = getattr(self.app, "set_watched_dirs", None)
+        if set_watched_dirs is not None:
+            set_watched_dirs("editors", dirs)
+
+    def apply_file_changes(self, changes: FileChanges) -> None:
+        """Route a file watcher batch to the affected mounted editors.
+
+        Editors whose file appears in the batch re-check their mtime (which
+        auto-reloads or shows the "changed externally" toast); editors whose
+        EditorConfig chain contains a changed ``.editorconfig`` re-apply it.
+        A queue overflow falls back to checking every mounted editor.
+        """
+        ec_dirs = {p.parent for p in changes.paths if p.name == ".editorconfig"}
+        for editor in self.query(CodeEditor):
+            if editor.path is None:
+                continue
+            if changes.overflow or editor.path in changes.paths:
+                editor._poll_file_change()
+            if changes.overflow or ec_dirs.intersection(editor._ec_search_dirs):
+                editor._poll_editorconfig_change()
+        self._sync_file_watches()
+
     # ── Compatibility properties ─────────────────────────────────────────────
     # These provide backward-compatible access for tests and app.py
 
@@ -416,6 +509,34 @@ class MainView(Static):
         """
         return find_leaves_for_path(self._split_root, path)
 
+    def _peer_state(self, path: Path, exclude: str | None = None) -> EditorState | None:
+        """The state of another open view of *path*, to open a view like it.
+
+        A mounted view is captured (its state carries the shared document);
+        otherwise an unmounted view's saved state is returned, preferring one
+        that still holds a document (its own or one in the remount cache).
+        """
+        fallback: EditorState | None = None
+        for pane_id, _leaf in self.find_editors(path):
+            if pane_id == exclude:
+                continue
+            state = self._editor_states.get(pane_id)
+            if state is not None:
+                state.drop_stale_document()
+                if state.document is not None:
+                    return state
+                caches = self._remount_caches.get(pane_id)
+                if caches is not None and caches.fits(state):
+                    return dataclasses.replace(state, document=caches.document)
+                fallback = fallback or state
+                continue
+            try:
+                editor = self.query_one(f"#{pane_id}", TabPane).query_one(CodeEditor)
+            except NoMatches:
+                continue
+            return editor.capture_state()
+        return fallback
+
     async def open_new_pane(
         self, pane_id: str, pane: TabPane, *, leaf_id: str | None = None
     ) -> bool:
@@ -517,11 +638,13 @@ class MainView(Static):
             self.focus_pane(pane_id)
             return pane_id
 
+        service = get_file_service()
         if path is not None and path.suffix.lower() in IMAGE_EXTENSIONS:
             try:
-                file_size = path.stat().st_size
-            except OSError:
-                file_size = -1
+                st = await service.stat(path)
+            except TimeoutError:
+                st = None
+            file_size = st.st_size if st is not None else -1
             if file_size < 0:
                 pane = TabPane(
                     path.name,
@@ -547,7 +670,7 @@ class MainView(Static):
             await self.open_new_pane(pane_id, pane, leaf_id=target_leaf_id)
             return pane_id
 
-        if path is not None and is_binary_file(path):
+        if path is not None and await self._is_binary(path):
             pane = TabPane(
                 path.name,
                 Static("⚠  Binary file — not supported", classes="binary-notice"),
@@ -557,6 +680,18 @@ class MainView(Static):
             await self.open_new_pane(pane_id, pane, leaf_id=target_leaf_id)
             return pane_id
 
+        peer = self._peer_state(path) if path is not None else None
+        if peer is not None:
+            # Another view of the file is open: share its document, undo
+            # history and syntax tree (and its unsaved text and settings).
+            editor = CodeEditor.from_state(dataclasses.replace(peer, pane_id=pane_id))
+            assert path is not None
+            target_leaf.opened_files[path] = pane_id
+            await self.open_new_pane(
+                pane_id, TabPane(path.name, editor, id=pane_id), leaf_id=target_leaf_id
+            )
+            return pane_id
+
         pane = TabPane(
             path.name if path else "<Untitled>",
             CodeEditor(
@@ -587,8 +722,26 @@ class MainView(Static):
         if path is not None:
             target_leaf.opened_files[path] = pane_id
         await self.open_new_pane(pane_id, pane, leaf_id=target_leaf_id)
+        if path is not None:
+            self._sync_file_watches()
         return pane_id
 
+    @staticmethod
+    async def _is_binary(path: Path) -> bool:
+        """``is_binary_file`` on the file service; a timeout counts as text."""
+        try:
+            return await get_file_service().is_binary(path)
+        except TimeoutError:
+            return False
+
+    @staticmethod
+    async def _preloaded(path: Path) -> FileLoadResult | None:
+        """The preloader's still-current result for *path*, if any."""
+        try:
+            return await get_file_service().run(get_file_preloader().lookup, path)
+        except TimeoutError:
+            return None
+
     def get_active_code_editor(self) -> CodeEditor | None:
         return self._get_active_code_editor_in_leaf(self._active_leaf)
 
@@ -625,12 +778,15 @@ class MainView(Static):
             file_already_open = self.find_editor_by_path(path) is not None
             if not file_already_open:
                 # Gate 1: file-size check
+                service = get_file_service()
                 threshold = getattr(self.app, "default_large_file_threshold", 5_242_880)
                 if threshold > 0:
                     try:
-                        file_size = path.stat().st_size
-                    except OSError:
-                        file_size = 0
+                        st = await service.stat(path)
+                    except TimeoutError:
+                        self._handle_file_open_timeout(path, focus, line)
+                        return
+                    file_size = st.st_size if st is not None else 0
                     if file_size > threshold:
                         log.info(
                             "Large file detected: %s (%d bytes)",
@@ -645,15 +801,26 @@ class MainView(Static):
                 # Gate 2: timeout check (skip binary/image — they have
                 # separate handling in open_code_editor_pane)
                 timeout: float = getattr(self.app, "default_file_open_timeout", 5.0)
-                if (
-                    timeout > 0
-                    and not is_binary_file(path)
-                    and path.suffix.lower() not in IMAGE_EXTENSIONS
+                if path.suffix.lower() not in IMAGE_EXTENSIONS:
+                    loaded = await self._preloaded(path)
+                    if loaded is not None:
+                        await self._finish_open_code_editor(
+                            path, focus=focus, line=line, loaded=loaded
+                        )
+                        return
+                if path.suffix.lower() not in IMAGE_EXTENSIONS and not (
+                    await self._is_binary(path)
                 ):
                     try:
-                        loaded = await run_cancellable(
-                            load_file_for_editor, path, timeout=timeout
-                        )
+                        if timeout > 0:
+                            loaded = await run_cancellable(
+                                load_file_for_editor, path, timeout=timeout
+                            )
+                        else:
+                            # No timeout configured: still read off the loop.
+                            loaded = await service.run(
+                                load_file_for_editor, path, timeout=None
+                            )
                     except TimeoutError:
                         self._handle_file_open_timeout(path, focus, line)
                         return
@@ -674,9 +841,10 @@ class MainView(Static):
         """Show timeout modal and optionally retry loading."""
         log.info("File open timeout: %s", path.name)
         try:
-            file_size = path.stat().st_size
-        except OSError:
-            file_size = 0
+            st = await get_file_service().stat(path)
+        except TimeoutError:
+            st = None
+        file_size = st.st_size if st is not None else 0
         result = await self.app.push_screen_wait(
             LargeFileConfirmModalScreen(path.name, file_size, reason="timeout")
         )
@@ -754,6 +922,7 @@ class MainView(Static):
         self, pane_id: str, *, auto_close_split: bool = True
     ) -> None:
         self._editor_states.pop(pane_id, None)
+        self._remount_caches.discard(pane_id)
         leaf = self._leaf_of_pane(pane_id)
         await self.close_pane(pane_id)
         if leaf:
@@ -791,12 +960,13 @@ class MainView(Static):
 
     def action_save_all(self) -> None:
         editors = []
+        states = []
         for pane_id in list(self.opened_pane_ids):
             # Save unmounted editors directly from state (lazy mounting)
             if pane_id in self._editor_states:
                 state = self._editor_states[pane_id]
                 if state.text != state.initial_text and state.path is not None:
-                    CodeEditor.save_from_state(state)
+                    states.append(state)
                 continue
             tc = self._tc_for_pane(pane_id)
             if tc is None:
@@ -809,14 +979,38 @@ class MainView(Static):
             if code_editor.text != code_editor.initial_text:
                 editors.append(code_editor)
         editors.sort(key=lambda e: e.path is None)
+        if states:
+            self._save_states_in_background(states)
         self._save_next(editors)
 
+    @work(group="save_states", exit_on_error=False)
+    async def _save_states_in_background(self, states: list[EditorState]) -> None:
+        """Write unmounted editors' states on the file service, in parallel."""
+        service = get_file_service()
+        # Split views of the same file may update state.text meanwhile, so
+        # the threads write snapshots and the states are updated here.
+        texts = [state.text for state in states]
+        results = await asyncio.gather(
+            *(
+                service.run(CodeEditor.save_from_state, state, text, timeout=None)
+                for state, text in zip(states, texts, strict=True)
+            ),
+            return_exceptions=True,
+        )
+        for state, text, result in zip(states, texts, results, strict=True):
+            if isinstance(result, BaseException):
+                log.error("save_from_state: error saving %s: %s", state.path, result)
+                self.notify(f"Error saving file: {result}", severity="error")
+            else:
+                state.mark_saved(text, result)
+
     def _save_next(self, editors: list[CodeEditor]) -> None:
         if not editors:
             return
         editor = editors[0]
         remaining = editors[1:]
         if editor.path is not None:
+            # action_save starts its own worker, so these saves run in parallel.
             editor.action_save()
             self._save_next(remaining)
         else:
@@ -1343,11 +1537,12 @@ class MainView(Static):
         if not new_pane_id:
             return source_pane_id
 
-        # Restore unsaved content
+        # Restore unsaved content (already there if the document was shared)
         if has_unsaved:
             tc_dest = self.query_one(f"#{dest_leaf.leaf_id}", TabbedContent)
             new_editor = tc_dest.get_pane(new_pane_id).query_one(CodeEditor)
-            new_editor.replace_editor_text(text)
+            if new_editor.text != text:
+                new_editor.replace_editor_text(text)
 
         # Close the source pane (defer auto-close to preserve tree structure)
         await self.action_close_code_editor(source_pane_id, auto_close_split=False)
@@ -1639,6 +1834,13 @@ class MainView(Static):
                     if query:
                         old_editor = query.first(CodeEditor)
                         state = old_editor.capture_state()
+                        if state.path is None or len(self.find_editors(state.path)) < 2:
+                            # No other view shares the document: keep the text,
+                            # and the parse tree only while it is recently used.
+                            state.document = None
+                        caches = old_editor.capture_caches()
+                        if caches is not None:
+                            self._remount_caches.set(old_pane_id, caches)
                         self._editor_states[old_pane_id] = state
                         log.debug(
                             "lazy unmount: pane=%s path=%s", old_pane_id, state.path
@@ -1653,7 +1855,20 @@ class MainView(Static):
                     new_pane = tc.get_pane(new_pane_id)
                     if not new_pane.query(CodeEditor):
                         new_state = self._editor_states.pop(new_pane_id)
-                        new_editor = CodeEditor.from_state(new_state)
+                        new_state.drop_stale_document()
+                        caches = self._remount_caches.get(new_pane_id)
+                        self._remount_caches.discard(new_pane_id)
+                        if caches is not None and not caches.fits(new_state):
+                            caches = None
+                        if (
+                            new_state.document is None
+                            and caches is None
+                            and new_state.path is not None
+                        ):
+                            peer = self._peer_state(new_state.path, new_pane_id)
+                            if peer is not None:
+                                new_state.document = peer.document
+                        new_editor = CodeEditor.from_state(new_state, caches)
                         log.debug(
                             "lazy mount: pane=%s path=%s",
                             new_pane_id,
@@ -1805,7 +2020,8 @@ class MainView(Static):
     def on_code_editor_text_changed(self, event: CodeEditor.TextChanged) -> None:
         editor = event.code_editor
         path = editor.path
-        # Live sync: propagate edits to other editors with the same file open
+        # Live sync: propagate edits to other editors with the same file open.
+        # Views sharing the document already follow the edit themselves.
         if path is not None:
             new_text = editor.text
             for other_pane_id, _leaf in self.find_editors(path):
@@ -1819,7 +2035,8 @@ class MainView(Static):
                     other_editor = self.query_one(
                         f"#{other_pane_id}", TabPane
                     ).query_one(CodeEditor)
-                    other_editor.sync_text(new_text)
+                    if other_editor.editor.document is not editor.editor.document:
+                        other_editor.sync_text(new_text)
                 except Exception:
                     pass
         if path is None or path not in self._preview_pane_ids:
@@ -2,29 +2,52 @@
 
 from __future__ import annotations
 
+import logging
 import re
 from bisect import bisect_left, bisect_right
 from collections import defaultdict
-from collections.abc import Callable
-from typing import TYPE_CHECKING, ClassVar, Literal
+from collections.abc import Callable, Iterable, Sequence
+from typing import TYPE_CHECKING, ClassVar, Literal, NamedTuple
 
 from rich.cells import cell_len
 from rich.color import Color
 from rich.segment import Segment
 from rich.style import Style
 from rich.text import Text
-from textual import events
+from textual import events, work
+from textual._tree_sitter import TREE_SITTER, get_language
+from textual.cache import LRUCache
 from textual.message import Message
 from textual.strip import Strip
 from textual.widgets import TextArea
-
+from textual.widgets.text_area import (
+    Document,
+    DocumentBase,
+    DocumentNavigator,
+    Edit,
+    EditHistory,
+    EditResult,
+    Selection,
+    WrappedDocument,
+)
+from textual.worker import get_current_worker
+
+from textual_code.background_parse import parse_document
 from textual_code.command_registry import bindings_for_context as _bindings_for_context
+from textual_code.line_index import LineIndex
+from textual_code.match_index import MatchIndex
+from textual_code.shared_document import SharedDocument
+from textual_code.viewport_highlights import ViewportHighlights
 
 if TYPE_CHECKING:
+    from tree_sitter import Language, Query
+
     from textual_code.widgets.code_editor import LineChangeType
 
 # ── Module-level helpers ───────────────────────────────────────────────────────
 
+log = logging.getLogger(__name__)
+
 _WORD_PATTERN = re.compile(r"(?<=\W)(?=\w)|(?<=\w)(?=\W)")
 
 
@@ -55,6 +78,161 @@ def _range_has_element(sorted_list: list[int], start: int, end: int) -> bool:
     return idx < len(sorted_list) and sorted_list[idx] < end
 
 
+class _CursorRows(NamedTuple):
+    """Extra cursors indexed for de-duplication and per-line rendering."""
+
+    positions: set[tuple[int, int]]
+    # Row -> sorted columns of the extra cursors on that row.
+    cols_by_row: dict[int, list[int]]
+
+
+class _PendingParse(NamedTuple):
+    """A syntax tree being built on a worker thread for a plain-text document."""
+
+    # The plain-text document shown until the parse finishes.
+    placeholder: DocumentBase
+    language: Language
+    highlight_query: str
+
+
+def _index_cursors(cursors: list[tuple[int, int]]) -> _CursorRows:
+    cols_by_row: dict[int, list[int]] = defaultdict(list)
+    for row, col in cursors:
+        cols_by_row[row].append(col)
+    for cols in cols_by_row.values():
+        cols.sort()
+    return _CursorRows(set(cursors), dict(cols_by_row))
+
+
+class _EditBatch:
+    """Non-overlapping ranged edits applied bottom-up as one undoable edit.
+
+    Stands in for a single :class:`Edit` in the TextArea's history, so undo
+    and redo replay the whole batch.  Edits are applied from the end of the
+    document towards its start, so every edit's locations are still valid
+    when it is applied and no offsets need adjusting in between.
+    """
+
+    def __init__(self, edits: list[Edit]) -> None:
+        # Sorted by position; applied in reverse.
+        self.edits = edits
+        self.text = "".join(edit.text for edit in edits)
+        self.top: tuple[int, int] = edits[0].top
+        self.bottom: tuple[int, int] = edits[-1].bottom
+        # (start, end) of each edit in the edited document.
+        self.locations: list[tuple[tuple[int, int], tuple[int, int]]] = []
+        self._original_selection: Selection | None = None
+        self._updated_selection: Selection | None = None
+        self._edit_result: EditResult | None = None
+
+    @property
+    def changes_line_count(self) -> bool:
+        """Whether any edit inserted or removed a line break."""
+        return any(
+            edit._edit_result is not None
+            and edit._edit_result.end_location[0] - edit.top[0]
+            != edit.bottom[0] - edit.top[0]
+            for edit in self.edits
+        )
+
+    def do(self, text_area: TextArea, record_selection: bool = True) -> EditResult:
+        if record_selection:
+            self._original_selection = text_area.selection
+        for edit in reversed(self.edits):
+            edit.do(text_area, record_selection=False)
+        self.locations = self._final_locations()
+        end = self.locations[-1][1]
+        self._updated_selection = Selection.cursor(self.locations[0][1])
+        self._edit_result = EditResult(
+            end_location=end,
+            replaced_text="".join(
+                edit._edit_result.replaced_text
+                for edit in self.edits
+                if edit._edit_result is not None
+            ),
+        )
+        return self._edit_result
+
+    def undo(self, text_area: TextArea) -> EditResult:
+        # The reverse of do(): the top edit was applied last, so undo it first.
+        for edit in self.edits:
+            edit.undo(text_area)
+        self._updated_selection = self._original_selection
+        return EditResult(end_location=self.bottom, replaced_text=self.text)
+
+    def after(self, text_area: TextArea) -> None:
+        if self._updated_selection is not None:
+            text_area.selection = self._updated_selection
+        text_area.record_cursor_width()
+
+    def _final_locations(self) -> list[tuple[tuple[int, int], tuple[int, int]]]:
+        """Map each edit's start and end into the fully edited document.
+
+        Each edit's result is relative to the document with only the edits
+        below it applied; the edits above shift it by the rows they added
+        and, on the row where the previous edit ended, by the columns.
+        """
+        result: list[tuple[tuple[int, int], tuple[int, int]]] = []
+        row_shift = 0
+        last_row = -1
+        col_shift = 0
+        for edit in self.edits:
+            (top_row, top_col), (bottom_row, bottom_col) = edit.top, edit.bottom
+            assert edit._edit_result is not None
+            end_row, end_col = edit._edit_result.end_location
+            same_row = top_row == last_row
+            start = (top_row + row_shift, top_col + col_shift if same_row else top_col)
+            end = (
+                end_row + row_shift,
+                end_col + col_shift if same_row and end_row == top_row else end_col,
+            )
+            result.append((start, end))
+            row_shift = end[0] - bottom_row
+            last_row = bottom_row
+            col_shift = end[1] - bottom_col
+        return result
+
+
+def _row_splices(
+    edit: Edit | _EditBatch, undone: bool = False
+) -> list[tuple[int, int, int]]:
+    """The ``(top, old_bottom, new_bottom)`` rows each part of *edit* replaced.
+
+    Listed in the order the parts were applied (or undone when *undone*), so
+    each splice is relative to the document left by the ones before it.
+    """
+    if isinstance(edit, _EditBatch):
+        parts = edit.edits if undone else edit.edits[::-1]
+    else:
+        parts = [edit]
+    splices: list[tuple[int, int, int]] = []
+    for part in parts:
+        if part._edit_result is None:
+            continue
+        top, bottom = part.top[0], part.bottom[0]
+        end = part._edit_result.end_location[0]
+        splices.append((top, end, bottom) if undone else (top, bottom, end))
+    return splices
+
+
+def _merge_splices(splices: Sequence[tuple[int, int, int]]) -> tuple[int, int, int]:
+    """Cover a sequence of row splices (as from :func:`_row_splices`) with one.
+
+    The result's *old_bottom* is a row of the document before the first
+    splice and its *new_bottom* a row of the document after the last.
+    """
+    top, old_bottom, new_bottom = splices[0]
+    for s_top, s_old, s_new in splices[1:]:
+        if s_old > new_bottom:
+            # Ends below the rows covered so far: map back past their shift.
+            old_bottom = max(old_bottom, s_old - (new_bottom - old_bottom))
+            new_bottom = s_new
+        else:
+            new_bottom += s_new - s_old
+        top = min(top, s_top)
+    return top, old_bottom, new_bottom
+
+
 # ── Key classification helpers ─────────────────────────────────────────────────
 
 
@@ -200,8 +378,11 @@ class MultiCursorTextArea(TextArea):
 
     Extra cursors are stored in ``_extra_cursors`` as a plain list so that
     Textual's reactive system does not interfere (list mutation would not
-    trigger a watch).  The widget posts a ``CursorsChanged`` message whenever
-    the extra-cursor set changes.
+    trigger a watch).  The list is always replaced, never mutated: assigning
+    it drops the row index (``_cursor_rows()``) that rendering and
+    de-duplication use, which is rebuilt lazily on the next lookup.  The
+    widget posts a ``CursorsChanged`` message whenever the extra-cursor set
+    changes.
 
     Each extra cursor has a parallel anchor in ``_extra_anchors``.  When
     anchor == cursor the cursor is collapsed (no selection); otherwise the
@@ -216,11 +397,20 @@ class MultiCursorTextArea(TextArea):
 
     BINDINGS = _bindings_for_context("text_area")
 
+    # Documents with at least this many lines are highlighted a viewport at a
+    # time (see ViewportHighlights) instead of in full after every edit.
+    VIEWPORT_HIGHLIGHT_LINES: ClassVar[int] = 10_000
+
+    # Documents of at least this many characters are parsed on a worker thread
+    # when their language is set, showing plain text until the parse finishes.
+    BACKGROUND_PARSE_CHARS: ClassVar[int] = 128 * 1024
+
     COMPONENT_CLASSES: ClassVar[set[str]] = TextArea.COMPONENT_CLASSES | {
         "text-area--indentation-guide",
         "text-area--indentation-guide-active",
         "text-area--whitespace",
         "text-area--whitespace-active",
+        "text-area--find-match",
     }
 
     DEFAULT_CSS = """\
@@ -229,6 +419,7 @@ MultiCursorTextArea {
     & .text-area--indentation-guide-active { color: $text 30%; }
     & .text-area--whitespace { color: $text 15%; }
     & .text-area--whitespace-active { color: $text 30%; }
+    & .text-area--find-match { background: $warning 30%; }
 }
 """
 
@@ -273,7 +464,8 @@ MultiCursorTextArea {
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
-        self._extra_cursors: list[tuple[int, int]] = []
+        self._extra_cursor_list: list[tuple[int, int]] = []
+        self._cursor_rows_cache: _CursorRows | None = None
         self._extra_anchors: list[tuple[int, int]] = []
         self._extra_last_x_offsets: list[int] = []
         self._cached_selection_ranges: dict[int, list[tuple[int, int | None]]] = {}
@@ -281,11 +473,436 @@ MultiCursorTextArea {
         self._show_indentation_guides: bool = True
         self._render_whitespace: str = "none"
         self._overlay_fg_cache: dict[tuple[str, bool], Color | None] = {}
+        # Composited line strips (see _render_line) and leading-whitespace
+        # widths, both keyed on line content so they survive edits elsewhere.
+        self._strip_cache: LRUCache[tuple, Strip] = LRUCache(1024)
+        self._leading_width_cache: LRUCache[tuple[str, int], int] = LRUCache(4096)
+        self._line_index: LineIndex | None = None
+        self._line_index_document: object | None = None
+        self._match_index: MatchIndex | None = None
+        self._edit_generation = 0
 
     def notify_style_update(self) -> None:
         self._overlay_fg_cache.clear()
+        self._strip_cache.clear()
         super().notify_style_update()
 
+    @property
+    def _extra_cursors(self) -> list[tuple[int, int]]:
+        return self._extra_cursor_list
+
+    @_extra_cursors.setter
+    def _extra_cursors(self, cursors: list[tuple[int, int]]) -> None:
+        self._extra_cursor_list = cursors
+        self._cursor_rows_cache = None
+
+    def _cursor_rows(self) -> _CursorRows:
+        """The row index of the current extra cursors."""
+        if self._cursor_rows_cache is None:
+            self._cursor_rows_cache = _index_cursors(self._extra_cursor_list)
+        return self._cursor_rows_cache
+
+    # ── line-start index ─────────────────────────────────────────────────────
+
+    @property
+    def line_index(self) -> LineIndex:
+        """Offset ↔ location index of the current document, kept up to date."""
+        document = self.document
+        if self._line_index is None or self._line_index_document is not document:
+            self._line_index = LineIndex(document.lines)
+            self._line_index_document = document
+        return self._line_index
+
+    @property
+    def match_index(self) -> MatchIndex | None:
+        """Matches of the open find session, highlighted in the viewport."""
+        index = self._match_index
+        if index is not None and index.lines is not self.document.lines:
+            return None
+        return index
+
+    def set_match_index(self, index: MatchIndex | None) -> None:
+        """Show (or with None, stop showing) the matches of *index*."""
+        self._match_index = index
+        self.refresh_matches()
+
+    def refresh_matches(self) -> None:
+        """Redraw after the match index changed outside of an edit."""
+        self._line_cache.clear()
+        self.refresh()
+
+    @property
+    def edit_generation(self) -> int:
+        """Counter bumped by every edit, undo and redo of the document."""
+        return self._edit_generation
+
+    def _note_edited_rows(self, top: int, old_bottom: int, new_bottom: int) -> None:
+        """Tell the line and match indexes which rows an edit replaced."""
+        self._edit_generation += 1
+        if self._shared_document is not None:
+            self._shared_document.invalidate_text()
+        index = self._line_index
+        if index is not None and self._line_index_document is self.document:
+            if old_bottom == new_bottom:
+                index.update_rows(top, new_bottom)
+            else:
+                index.invalidate()
+        match_index = self.match_index
+        if match_index is not None:
+            match_index.splice(top, old_bottom, new_bottom)
+        highlights = self._highlights
+        if isinstance(highlights, ViewportHighlights):
+            highlights.splice(top, old_bottom, new_bottom)
+
+    def edit(self, edit: Edit) -> EditResult:
+        tree = getattr(self.document, "_syntax_tree", None)
+        result = super().edit(edit)
+        splice = (edit.top[0], edit.bottom[0], result.end_location[0])
+        self._note_edited_rows(*splice)
+        self._rehighlight_changed(tree)
+        self._share_edit([splice])
+        return result
+
+    def _undo_batch(self, edits: Sequence[Edit]) -> None:
+        super()._undo_batch(edits)
+        splices = [
+            splice
+            for edit in reversed(edits)
+            for splice in _row_splices(edit, undone=True)
+        ]
+        for splice in splices:
+            self._note_edited_rows(*splice)
+        self._rehighlight_changed(None)
+        self._share_edit(splices)
+
+    def _redo_batch(self, edits: Sequence[Edit]) -> None:
+        super()._redo_batch(edits)
+        splices = [splice for edit in edits for splice in _row_splices(edit)]
+        for splice in splices:
+            self._note_edited_rows(*splice)
+        self._rehighlight_changed(None)
+        self._share_edit(splices)
+
+    # ── shared document ──────────────────────────────────────────────────────
+
+    # Class-level default: TextArea.__init__ calls _set_document before
+    # __init__ below runs.
+    _shared_document: SharedDocument | None = None
+
+    @property
+    def shared_document(self) -> SharedDocument:
+        """This view's document, history and syntax tree, for other views.
+
+        Pass it to :meth:`share_document` of another view of the same file.
+        """
+        shared = self._shared_document
+        if shared is None or shared.document is not self.document:
+            shared = SharedDocument(
+                self.document, self.history, self.language, self._highlight_query
+            )
+            shared.attach(self)
+            self._shared_document = shared
+        return shared
+
+    def share_document(
+        self,
+        shared: SharedDocument,
+        highlights: dict[int, list[tuple[int, int | None, str]]] | None = None,
+    ) -> None:
+        """Show *shared*'s document, undo history and syntax tree in this view.
+
+        The view keeps its own cursors, scroll position and wrapping.  Edits
+        made in any view of *shared* are applied to the document once and
+        followed by the others.  *highlights*, a highlight map built for the
+        document's current text, is adopted instead of querying the tree.
+        """
+        if self._shared_document is not None:
+            self._shared_document.detach(self)
+        self._shared_document = shared
+        shared.attach(self)
+        self.set_reactive(TextArea.language, shared.language)
+        self.document = shared.document
+        self.history = shared.history
+        self._highlight_query = shared.highlight_query  # type: ignore[assignment]
+        self.wrapped_document = WrappedDocument(
+            self.document, tab_width=self.indent_width
+        )
+        self.navigator = DocumentNavigator(self.wrapped_document)
+        if highlights is None:
+            self._build_highlight_map()
+        else:
+            if isinstance(highlights, ViewportHighlights):
+                highlights.window = self._visible_rows
+            self._highlights = highlights
+            self._line_cache.clear()
+        self.selection = self._validate_selection(self.selection)
+        self._rewrap_and_refresh_virtual_size()
+        self.post_message(self.Changed(self))
+
+    def leave_shared_document(self) -> None:
+        """Give this view a document and undo history of its own.
+
+        Used when the view starts showing another file (Save As): its edits
+        must no longer reach the other views of the old file, nor the
+        lazily unmounted ones still holding on to the shared document.  The
+        cursors and scroll position are kept.
+        """
+        if self._shared_document is None:
+            return
+        selection = self.selection
+        scroll_x, scroll_y = self.scroll_offset
+        self._set_document(self.text, self.language)
+        self.selection = self._validate_selection(selection)
+        self.scroll_to(scroll_x, scroll_y, animate=False, immediate=True)
+
+    def _set_document(self, text: str, language: str | None) -> None:
+        shared = self._shared_document
+        if shared is not None:
+            # A new document (e.g. another language) leaves the shared one.
+            shared.detach(self)
+            self._shared_document = None
+            history = self.history
+            self.history = EditHistory(
+                max_checkpoints=history.max_checkpoints,
+                checkpoint_timer=history.checkpoint_timer,
+                checkpoint_max_characters=history.checkpoint_max_characters,
+            )
+        self._cancel_parse()
+        if language and len(text) >= self.BACKGROUND_PARSE_CHARS and self.is_attached:
+            resolved = self._tree_sitter_language(language)
+            if resolved is not None:
+                document = self.document
+                if (
+                    shared is not None
+                    or type(document) is not Document
+                    or document.text != text
+                ):
+                    super()._set_document(text, None)
+                else:
+                    # Already showing this text plain (e.g. on open): keep
+                    # the document and its wrapping, which are costly to
+                    # rebuild for a large file.
+                    self.move_cursor((0, 0))
+                pending = _PendingParse(self.document, *resolved)
+                self._pending_parse = pending
+                self._parse_in_background(pending, text, self._edit_generation)
+                return
+        super()._set_document(text, language)
+
+    @property
+    def text(self) -> str:
+        """The entire text content of the document."""
+        shared = self._shared_document
+        if shared is not None and shared.document is self.document:
+            return shared.text
+        return self.document.text
+
+    @text.setter
+    def text(self, value: str) -> None:
+        self.load_text(value)
+
+    def on_unmount(self) -> None:
+        pending = self._pending_parse
+        self._cancel_parse()
+        shared = self._shared_document
+        if shared is not None:
+            shared.detach(self)
+            if pending is not None and shared.document is pending.placeholder:
+                self._hand_over_parse(shared, pending)
+
+    @staticmethod
+    def _hand_over_parse(shared: SharedDocument, pending: _PendingParse) -> None:
+        """Restart a cancelled parse on another view still showing its text."""
+        for view in shared.views():
+            if view.is_attached and not view.parse_pending:
+                view._pending_parse = pending
+                view._parse_in_background(pending, view.text, view._edit_generation)
+                return
+
+    def _share_edit(self, splices: list[tuple[int, int, int]]) -> None:
+        """Let the other views of the shared document follow an edit."""
+        shared = self._shared_document
+        if shared is None or not splices:
+            return
+        for view in shared.views():
+            if view is not self:
+                view._follow_shared_edit(splices)
+
+    def _follow_shared_edit(self, splices: list[tuple[int, int, int]]) -> None:
+        """Update this view after another view edited the shared document."""
+        for splice in splices:
+            self._note_edited_rows(*splice)
+        top, old_bottom, new_bottom = _merge_splices(splices)
+        wrapped = self.wrapped_document
+        if wrapped._width != self.wrap_width:
+            # The gutter grew or shrank with the line count.
+            wrapped.wrap(self.wrap_width, self.indent_width)
+        else:
+            wrapped.wrap_range((top, 0), (old_bottom, 0), (new_bottom, 0))
+
+        shift = new_bottom - old_bottom
+        clamp = self.clamp_visitable
+
+        def follow(location: tuple[int, int]) -> tuple[int, int]:
+            row, col = location
+            if row > old_bottom:
+                return (row + shift, col)
+            if row >= top:
+                return clamp((min(row, new_bottom), col))
+            return location
+
+        start, end = self.selection
+        selection = Selection(follow(start), follow(end))
+        if selection != self.selection:
+            self.selection = selection
+        if self._extra_cursors:
+            self._extra_cursors = [follow(loc) for loc in self._extra_cursors]
+            self._extra_anchors = [follow(loc) for loc in self._extra_anchors]
+            self._recompute_selection_ranges()
+        self._rehighlight_changed(None)
+        self._build_highlight_map()
+        self._refresh_size()
+        self.post_message(self.Changed(self))
+
+    # ── background parse ─────────────────────────────────────────────────────
+
+    # Class-level default: TextArea.__init__ calls _set_document first.
+    _pending_parse: _PendingParse | None = None
+
+    @property
+    def parse_pending(self) -> bool:
+        """Whether the document is shown as plain text until its parse ends."""
+        return self._pending_parse is not None
+
+    def _tree_sitter_language(self, language: str) -> tuple[Language, str] | None:
+        """The tree-sitter language and highlight query TextArea would use.
+
+        None if there is none; the TextArea's own error handling applies then.
+        """
+        if not TREE_SITTER:
+            return None
+        registered = self._languages.get(language)
+        if registered is not None:
+            document_language = registered.language or get_language(language)
+            highlight_query = registered.highlight_query
+        else:
+            document_language = get_language(language)
+            if document_language is None:
+                return None
+            highlight_query = self._get_builtin_highlight_query(language)
+        if document_language is None:
+            return None
+        return document_language, highlight_query
+
+    def _cancel_parse(self) -> None:
+        if self._pending_parse is None:
+            return
+        self._pending_parse = None
+        if self.is_attached:
+            self.workers.cancel_group(self, "parse")
+
+    @work(thread=True, exclusive=True, group="parse", exit_on_error=False)
+    def _parse_in_background(
+        self, pending: _PendingParse, text: str, generation: int
+    ) -> None:
+        """Parse *text* on a worker thread and hand the document to the loop."""
+        worker = get_current_worker()
+        document = parse_document(text, pending.language)
+        if worker.is_cancelled:
+            return
+        query = document.prepare_query(pending.highlight_query)
+        if worker.is_cancelled:
+            return
+        try:
+            self.app.call_from_thread(
+                self._adopt_parsed_document, pending, generation, document, query
+            )
+        except RuntimeError as exc:
+            if "loop" not in str(exc).lower() and "closed" not in str(exc).lower():
+                raise
+            log.debug("call_from_thread suppressed (app exiting): %s", exc)
+
+    def _adopt_parsed_document(
+        self,
+        pending: _PendingParse,
+        generation: int,
+        document: DocumentBase,
+        query: Query | None,
+    ) -> None:
+        """Swap the parsed document in for the plain text it was parsed from."""
+        placeholder = pending.placeholder
+        if self._pending_parse is not pending or self.document is not placeholder:
+            return
+        if self._edit_generation != generation:
+            # Edited while parsing: parse the current text again.
+            self._parse_in_background(pending, self.text, self._edit_generation)
+            return
+        shared = self._shared_document
+        views = [self]
+        if shared is not None and shared.document is placeholder:
+            views = shared.views()
+            shared.document = document
+            shared.highlight_query = query
+        for view in views:
+            view._pending_parse = None
+            view.document = document
+            view._highlight_query = query
+            view.wrapped_document.document = document
+            view.navigator = DocumentNavigator(view.wrapped_document)
+            view._build_highlight_map()
+            view.refresh()
+
+    # ── viewport highlighting ────────────────────────────────────────────────
+
+    def _visible_rows(self) -> tuple[int, int]:
+        """The document rows in view, as ``(first, stop)``."""
+        info = self.wrapped_document._offset_to_line_info
+        if not info:
+            return (0, 0)
+        top, bottom = self._visible_line_indices
+        last = len(info) - 1
+        return info[min(top, last)][0], info[min(bottom, last)][0] + 1
+
+    def _build_highlight_map(self) -> None:
+        """Rebuild the highlight map, or for a large document, scope it.
+
+        Documents of :attr:`VIEWPORT_HIGHLIGHT_LINES` lines or more get a
+        :class:`ViewportHighlights` map, which queries only the rows in view
+        and is kept current by the edit hooks instead of being rebuilt.
+        """
+        query = self._highlight_query
+        if not query or self.document.line_count < self.VIEWPORT_HIGHLIGHT_LINES:
+            if isinstance(self._highlights, ViewportHighlights):
+                self._highlights = defaultdict(list)
+            super()._build_highlight_map()
+            return
+        self._line_cache.clear()
+        highlights = self._highlights
+        if not (
+            isinstance(highlights, ViewportHighlights)
+            and highlights.document is self.document
+            and highlights.query is query
+        ):
+            self._highlights = ViewportHighlights(
+                self.document, query, self._visible_rows
+            )
+
+    def _rehighlight_changed(self, old_tree: object | None) -> None:
+        """Drop viewport highlights whose syntax an edit changed.
+
+        *old_tree* is the syntax tree from before a single ranged edit; pass
+        None when it is unknown (batches, edits made in another view) to drop
+        them all.
+        """
+        highlights = self._highlights
+        if not isinstance(highlights, ViewportHighlights):
+            return
+        new_tree = getattr(self.document, "_syntax_tree", None)
+        if old_tree is None or new_tree is None or new_tree is old_tree:
+            highlights.clear()
+        else:
+            highlights.discard_changed(old_tree, new_tree)  # type: ignore[arg-type]
+
     # ── git gutter API ───────────────────────────────────────────────────────
 
     def set_line_changes(self, changes: dict[int, LineChangeType]) -> None:
@@ -307,15 +924,12 @@ MultiCursorTextArea {
         (e.g. beyond end-of-file or an invalid offset).
         """
         _, scroll_y = self.scroll_offset
-        y_offset = y + scroll_y
-        wrapped_document = self.wrapped_document
-        if y_offset >= wrapped_document.height:
-            return None
+        # _offset_to_line_info has one entry per visual line, so an IndexError
+        # is the end-of-document check (WrappedDocument.height is O(lines)).
         try:
-            line_info = wrapped_document._offset_to_line_info[y_offset]
+            return self.wrapped_document._offset_to_line_info[y + scroll_y]
         except IndexError:
             return None
-        return line_info
 
     # ── theme / cursor-line helpers ───────────────────────────────────────────
 
@@ -355,7 +969,103 @@ MultiCursorTextArea {
         """Override TextArea._render_line to layer visual enhancements.
 
         Pipeline: base render → git gutter → whitespace → guides → extra cursors.
+
+        The composited strip is cached under :meth:`_strip_key`, which holds
+        the line's text and everything else the pipeline reads for that line.
+        Unlike the TextArea's own line cache (cleared by every edit, and by
+        every cursor move when soft wrap is on), it lets scrolling, cursor
+        movement and edits on other lines reuse the strips of unchanged lines.
         """
+        line_info = self._resolve_line_index(y)
+        if line_info is None:
+            return self._compose_line(y)
+        key = self._strip_key(*line_info)
+        strip = self._strip_cache.get(key)
+        if strip is None:
+            strip = self._compose_line(y)
+            self._strip_cache[key] = strip
+        return strip
+
+    def _strip_key(self, line_index: int, section_offset: int) -> tuple:
+        """Everything the render pipeline reads to draw this line section."""
+        selection = self.selection
+        start, end = selection
+        top, bottom = sorted(selection)
+        cursor_row, cursor_col = end
+        has_cursor = self._has_cursor
+        bracket = self._matching_bracket_location
+        draw_brackets = (
+            has_cursor
+            and self.match_cursor_bracket
+            and bracket is not None
+            and start == end
+        )
+        cursor = (
+            (
+                cursor_col,
+                self._draw_cursor,
+                draw_brackets,
+                self.suggestion,
+                self.has_focus,
+            )
+            if cursor_row == line_index
+            else None
+        )
+        selected = (
+            (
+                top[1] if top[0] == line_index else -1,
+                bottom[1] if bottom[0] == line_index else -1,
+            )
+            if start != end and top[0] <= line_index <= bottom[0]
+            else None
+        )
+        partner = (
+            bracket[1]
+            if draw_brackets and bracket is not None and bracket[0] == line_index
+            else None
+        )
+        # Indexing fills a viewport-scoped map; an empty map has no highlights.
+        highlights = self._highlights[line_index] if self._highlights else None
+        extra = (
+            (
+                tuple(self._cursor_rows().cols_by_row.get(line_index, ())),
+                tuple(self._cached_selection_ranges.get(line_index, ())),
+            )
+            if self._extra_cursors
+            else None
+        )
+        match_index = self.match_index
+        return (
+            line_index,
+            section_offset,
+            self.document[line_index],
+            tuple(highlights) if highlights else None,
+            cursor,
+            selected,
+            partner,
+            extra,
+            tuple(match_index.spans_on_row(line_index)) if match_index else None,
+            self._line_changes.get(line_index),
+            self.size,
+            self.scrollable_content_region.size.width,
+            self.virtual_size.width,
+            self.scroll_offset.x,
+            self.theme,
+            self.show_line_numbers,
+            self.gutter_width,
+            self.line_number_start,
+            self.soft_wrap,
+            self.indent_width,
+            self.read_only,
+            self.show_cursor,
+            self.highlight_cursor_line,
+            has_cursor,
+            self._render_whitespace,
+            self._show_indentation_guides,
+        )
+
+    def _compose_line(self, y: int) -> Strip:
+        """Run the render pipeline for visual line *y* (uncached)."""
         strip = self._render_line_with_gutter(y)
         if self._render_whitespace != "none":
             strip = self._inject_whitespace_rendering(strip, y)
@@ -435,6 +1145,18 @@ MultiCursorTextArea {
         indicator = Strip([Segment(char, indicator_style)], cell_length=1)
         return Strip.join([before, indicator, after])
 
+    def _leading_width(self, line: str) -> int:
+        """Columns of *line*'s leading whitespace with tabs expanded (cached)."""
+        if not line or line[0] not in " \t":
+            return 0
+        key = (line, self.indent_width)
+        width = self._leading_width_cache.get(key)
+        if width is None:
+            expanded = line.expandtabs(self.indent_width)
+            width = len(expanded) - len(expanded.lstrip())
+            self._leading_width_cache[key] = width
+        return width
+
     def _inject_whitespace_rendering(self, strip: Strip, y: int) -> Strip:
         """Replace whitespace characters with visible markers.
 
@@ -570,9 +1292,7 @@ MultiCursorTextArea {
         if section_offset != 0:
             return strip
 
-        doc_line = self.document.get_line(line_index)
-        expanded = doc_line.expandtabs(indent_width)
-        leading_spaces = len(expanded) - len(expanded.lstrip())
+        leading_spaces = self._leading_width(self.document[line_index])
         if leading_spaces < indent_width:
             return strip
 
@@ -643,7 +1363,7 @@ MultiCursorTextArea {
             return strip
 
         cursor_cols = (
-            {col for row, col in self._extra_cursors if row == line_index}
+            set(self._cursor_rows().cols_by_row.get(line_index, ()))
             if cursor_style
             else set()
         )
@@ -733,7 +1453,15 @@ MultiCursorTextArea {
 
     def _cell_width_at(self, location: tuple[int, int]) -> int:
         """Get the visual (cell) x offset at a document location."""
-        x_offset, _ = self.wrapped_document.location_to_offset(location)
+        row, col = location
+        wrapped = self.wrapped_document
+        if 0 <= row < self.document.line_count and not wrapped.get_offsets(row):
+            # A line that fits on one row, without tabs: the offset is the
+            # prefix's width, far cheaper than building the line's sections.
+            prefix = self.document[row][:col]
+            if len(prefix) == col and "\t" not in prefix:
+                return col if prefix.isascii() else cell_len(prefix)
+        x_offset, _ = wrapped.location_to_offset(location)
         return x_offset
 
     def add_cursor(
@@ -745,17 +1473,41 @@ MultiCursorTextArea {
         No-op if *location* equals the primary cursor position or is already
         present in the extra-cursor list.
         """
-        anchor = anchor if anchor is not None else location
-        if location != self.cursor_location and location not in self._extra_cursors:
-            self._extra_cursors = self._extra_cursors + [location]
-            self._extra_anchors = self._extra_anchors + [anchor]
-            self._extra_last_x_offsets = self._extra_last_x_offsets + [
-                self._cell_width_at(location)
-            ]
-            self._recompute_selection_ranges()
-            self._line_cache.clear()
-            self.refresh()
-            self.post_message(self.CursorsChanged(self))
+        self.add_cursors([(location, anchor)])
+
+    def add_cursors(
+        self,
+        cursors: Iterable[tuple[tuple[int, int], tuple[int, int] | None]],
+    ) -> int:
+        """Add many extra cursors at once; return how many were added.
+
+        Each item is a ``(location, anchor)`` pair as for :meth:`add_cursor`.
+        Locations equal to the primary cursor or to an existing (or earlier)
+        extra cursor are skipped.  Selection ranges are recomputed and
+        ``CursorsChanged`` is posted once for the whole batch.
+        """
+        seen = set(self._cursor_rows().positions)
+        seen.add(self.cursor_location)
+        locations: list[tuple[int, int]] = []
+        anchors: list[tuple[int, int]] = []
+        offsets: list[int] = []
+        for location, anchor in cursors:
+            if location in seen:
+                continue
+            seen.add(location)
+            locations.append(location)
+            anchors.append(anchor if anchor is not None else location)
+            offsets.append(self._cell_width_at(location))
+        if not locations:
+            return 0
+        self._extra_cursors = self._extra_cursors + locations
+        self._extra_anchors = self._extra_anchors + anchors
+        self._extra_last_x_offsets = self._extra_last_x_offsets + offsets
+        self._recompute_selection_ranges()
+        self._line_cache.clear()
+        self.refresh()
+        self.post_message(self.CursorsChanged(self))
+        return len(locations)
 
     def action_undo(self) -> None:
         """Block undo in read-only mode to match VSCode behavior."""
@@ -814,8 +1566,6 @@ MultiCursorTextArea {
 
     def action_indent_line(self) -> None:
         """VS Code style: add indent at start of selected lines, or at cursor."""
-        from textual.widgets.text_area import Selection
-
         use_tabs = self._use_tabs
         indent = "\t" if use_tabs else " " * self.indent_width
         indent_col_width = 1 if use_tabs else self.indent_width
@@ -826,11 +1576,10 @@ MultiCursorTextArea {
         if end_row > start_row:
             # Multi-line selection: indent each selected line
             actual_end_row = end_row - 1 if end_col == 0 else end_row
-            lines = self.text.split("\n")
-            for row in range(start_row, actual_end_row + 1):
-                if row < len(lines):
-                    lines[row] = indent + lines[row]
-            self.replace("\n".join(lines), self.document.start, self.document.end)
+            last_row = min(actual_end_row, self.document.line_count - 1)
+            self.apply_edits(
+                ((row, 0), (row, 0), indent) for row in range(start_row, last_row + 1)
+            )
             new_start = (start_row, start_col + indent_col_width)
             new_end = (end_row, end_col + indent_col_width if end_col > 0 else 0)
             self.selection = Selection(start=new_start, end=new_end)
@@ -840,8 +1589,6 @@ MultiCursorTextArea {
 
     def action_outdent_line(self) -> None:
         """Remove up to one indent level of leading whitespace from each line."""
-        from textual.widgets.text_area import Selection
-
         n = self.indent_width
         sel = self.selection
         start_row, start_col = sel.start
@@ -850,23 +1597,22 @@ MultiCursorTextArea {
             end_row - 1 if (end_row > start_row and end_col == 0) else end_row
         )
 
-        lines = self.text.split("\n")
+        lines = self.document.lines
         removed: dict[int, int] = {}
         for row in range(start_row, actual_end_row + 1):
             if row < len(lines):
                 if lines[row].startswith("\t"):
-                    lines[row] = lines[row][1:]
                     removed[row] = 1
                 else:
                     spaces = len(lines[row]) - len(lines[row].lstrip(" "))
-                    remove = min(spaces, n)
-                    lines[row] = lines[row][remove:]
-                    removed[row] = remove
+                    removed[row] = min(spaces, n)
 
         if not any(removed.values()):
             return  # nothing to dedent
 
-        self.replace("\n".join(lines), self.document.start, self.document.end)
+        self.apply_edits(
+            ((row, 0), (row, count), "") for row, count in removed.items() if count
+        )
 
         def adjust(row: int, col: int) -> int:
             return max(0, col - removed.get(row, 0))
@@ -892,9 +1638,7 @@ MultiCursorTextArea {
 
     def _move_lines(self, direction: int) -> None:
         """Move line(s) at all cursors up (direction=-1) or down (+1)."""
-        from textual.widgets.text_area import Selection
-
-        lines = self.text.split("\n")
+        lines = self.document.lines
         num_lines = len(lines)
 
         # Collect row ranges from primary + extra cursors
@@ -922,17 +1666,17 @@ MultiCursorTextArea {
             if any(s <= 0 for s, _ in merged):
                 return
 
-        # Relocate adjacent lines
-        if direction == 1:
-            for s, e in reversed(merged):
-                line_below = lines.pop(e + 1)
-                lines.insert(s, line_below)
-        else:
-            for s, e in merged:
-                line_above = lines.pop(s - 1)
-                lines.insert(e, line_above)
-
-        self.replace("\n".join(lines), self.document.start, self.document.end)
+        # Relocate adjacent lines: each block swaps with the line beside it
+        edits = []
+        for s, e in merged:
+            if direction == 1:
+                top, bottom = s, e + 1
+                moved = [lines[e + 1], *lines[s : e + 1]]
+            else:
+                top, bottom = s - 1, e
+                moved = [*lines[s : e + 1], lines[s - 1]]
+            edits.append(((top, 0), (bottom, len(lines[bottom])), "\n".join(moved)))
+        self.apply_edits(edits)
 
         # Shift primary selection
         self.selection = Selection(
@@ -974,11 +1718,7 @@ MultiCursorTextArea {
 
     def _delete_word_multi(self, direction: Literal["left", "right"]) -> None:
         """Delete word at all cursor positions."""
-        from textual.widgets.text_area import Selection
-
-        text = self.text
-        lines = text.split("\n")
-        offsets = _build_offsets(lines)
+        lines = self.document.lines
 
         primary = self.cursor_location
         primary_anchor = self.selection.start
@@ -989,78 +1729,49 @@ MultiCursorTextArea {
             zip(extra_anchors, extra, strict=True)
         )
 
-        def to_off(row: int, col: int) -> int:
-            return offsets[row] + col
-
-        ops: list[list[int]] = []
-        p_start = to_off(*primary)  # default for right direction
+        ranges: list[list[tuple[int, int]]] = []
+        p_start = primary  # default for right direction
         for anchor, cursor in all_pairs:
             if anchor != cursor:
                 # Has selection — delete the selection content
-                a_off = to_off(*anchor)
-                c_off = to_off(*cursor)
-                ops.append([min(a_off, c_off), max(a_off, c_off)])
+                ranges.append([min(anchor, cursor), max(anchor, cursor)])
                 if cursor == primary:
-                    p_start = min(a_off, c_off)
+                    p_start = min(anchor, cursor)
             elif direction == "left":
                 row, col = cursor
                 target = self._move_location(lines, row, col, "ctrl+left")
-                t_off = to_off(*target)
-                c_off = to_off(row, col)
-                if t_off < c_off:
-                    ops.append([t_off, c_off])
+                if target < cursor:
+                    ranges.append([target, cursor])
                 if cursor == primary:
-                    p_start = t_off
+                    p_start = target
             else:
                 row, col = cursor
-                c_off = to_off(row, col)
                 line = lines[row] if row < len(lines) else ""
                 remaining = line[col:]
                 matches = list(_WORD_PATTERN.finditer(remaining))
                 if matches:
-                    end_off = to_off(row, col + matches[0].end())
+                    end = (row, col + matches[0].end())
                 elif row < len(lines) - 1 and col == len(line):
-                    end_off = to_off(row + 1, 0)
+                    end = (row + 1, 0)
                 else:
-                    end_off = to_off(row, len(line))
-                if end_off > c_off:
-                    ops.append([c_off, end_off])
+                    end = (row, len(line))
+                if end > cursor:
+                    ranges.append([cursor, end])
 
-        if not ops:
+        if not ranges:
             return
 
         # Sort and merge overlapping ranges
-        ops.sort()
-        deduped: list[list[int]] = []
-        for op in ops:
-            if deduped and op[0] <= deduped[-1][1]:
-                deduped[-1][1] = max(deduped[-1][1], op[1])
+        ranges.sort()
+        deduped: list[list[tuple[int, int]]] = []
+        for r in ranges:
+            if deduped and r[0] <= deduped[-1][1]:
+                deduped[-1][1] = max(deduped[-1][1], r[1])
             else:
-                deduped.append(list(op))
-
-        # Build new text and track cursor offsets
-        parts: list[str] = []
-        prev = 0
-        new_cursor_offsets: list[int] = []
-        accumulated = 0
-        for s, e in deduped:
-            parts.append(text[prev:s])
-            new_cursor_offsets.append(accumulated + (s - prev))
-            accumulated += s - prev
-            prev = e
-        parts.append(text[prev:])
-        new_text = "".join(parts)
-
-        self.replace(new_text, self.document.start, self.document.end)
-
-        new_lines = new_text.split("\n")
-        new_offsets = _build_offsets(new_lines)
-        new_locs = [
-            _offset_to_loc(off, new_lines, new_offsets) for off in new_cursor_offsets
-        ]
+                deduped.append(list(r))
 
-        if not new_locs:
-            return
+        locations = self.apply_edits((s, e, "") for s, e in deduped)
+        new_locs = [start for start, _end in locations]
 
         # Match primary cursor to its deduped range
         primary_idx = 0
@@ -1069,9 +1780,7 @@ MultiCursorTextArea {
                 primary_idx = i
                 break
 
-        new_primary = (
-            new_locs[primary_idx] if primary_idx < len(new_locs) else new_locs[0]
-        )
+        new_primary = new_locs[primary_idx]
         self.selection = Selection(new_primary, new_primary)
         self._extra_cursors = [
             loc for i, loc in enumerate(new_locs) if i != primary_idx
@@ -1086,9 +1795,7 @@ MultiCursorTextArea {
 
     def _sort_lines(self, reverse: bool) -> None:
         """Sort selected line(s) at all cursors alphabetically."""
-        from textual.widgets.text_area import Selection
-
-        lines = self.text.split("\n")
+        lines = self.document.lines
 
         # Collect row ranges from primary + extra cursors
         sel = self.selection
@@ -1115,13 +1822,13 @@ MultiCursorTextArea {
         old_range_lines = {(s, e): lines[s : e + 1] for s, e in merged}
 
         # Sort lines in each range
-        for s, e in merged:
-            lines[s : e + 1] = sorted(lines[s : e + 1], reverse=reverse)
-
-        # Snapshot new lines per range
-        new_range_lines = {(s, e): lines[s : e + 1] for s, e in merged}
-
-        self.replace("\n".join(lines), self.document.start, self.document.end)
+        new_range_lines = {
+            (s, e): sorted(old_range_lines[(s, e)], reverse=reverse) for s, e in merged
+        }
+        self.apply_edits(
+            ((s, 0), (e, len(lines[e])), "\n".join(new_range_lines[(s, e)]))
+            for s, e in merged
+        )
 
         # Adjust positions via character offset tracking (VSCode behavior):
         # convert (row, col) → char offset in old text → same offset in new text
@@ -1181,8 +1888,6 @@ MultiCursorTextArea {
         When the cursor is collapsed (no selection), auto-selects the word
         under the cursor before transforming, matching VS Code behavior.
         """
-        from textual.widgets.text_area import Selection
-
         if self.read_only:
             return
 
@@ -1190,7 +1895,7 @@ MultiCursorTextArea {
         if not text:
             # Auto-select word under cursor (VS Code behavior)
             row, col = self.cursor_location
-            bounds = self._word_bounds_at(self.text, row, col)
+            bounds = self._word_bounds_at(self.document.get_line(row), 0, col)
             if bounds is None:
                 return
             start = (row, bounds[0])
@@ -1316,8 +2021,18 @@ MultiCursorTextArea {
     # ── rendering ─────────────────────────────────────────────────────────────
 
     def get_line(self, line_index: int) -> Text:
-        """Render extra cursors and their selections."""
+        """Render find matches, extra cursors and their selections."""
         line = super().get_line(line_index)
+        match_index = self.match_index
+        if match_index is not None:
+            spans = match_index.spans_on_row(line_index)
+            if spans:
+                match_style = self.get_component_rich_style("text-area--find-match")
+                line_len = len(line.plain)
+                for start_col, end_col in spans:
+                    end = line_len if end_col is None else end_col
+                    if start_col < end:
+                        line.stylize(match_style, start_col, end)
         if self._extra_cursors and self._theme:
             cursor_style = self._theme.cursor_style
             selection_style = self._theme.selection_style
@@ -1331,10 +2046,11 @@ MultiCursorTextArea {
                     if start_col < end:
                         line.stylize(selection_style, start_col, end)
 
-            # Render cursor positions
+            # Render cursor positions (only the cursors on this row)
             if cursor_style:
-                for row, col in self._extra_cursors:
-                    if row == line_index and 0 <= col <= len(line.plain):
+                line_len = len(line.plain)
+                for col in self._cursor_rows().cols_by_row.get(line_index, ()):
+                    if 0 <= col <= line_len:
                         line.stylize(cursor_style, col, col + 1)
 
         return line
@@ -1361,8 +2077,6 @@ MultiCursorTextArea {
 
     def on_click(self, event: events.Click) -> None:
         """Handle click for cursor clear and word/line selection."""
-        from textual.widgets.text_area import Selection
-
         if self._extra_cursors:
             self.clear_extra_cursors()
 
@@ -1373,14 +2087,14 @@ MultiCursorTextArea {
 
         if event.chain == 2:
             # Double-click: select word at cursor
-            bounds = self._word_bounds_at(self.text, row, col)
+            bounds = self._word_bounds_at(self.document.get_line(row), 0, col)
             if bounds is not None:
                 start, end = bounds
                 self.selection = Selection((row, start), (row, end))
 
         elif event.chain == 3:
             # Triple-click: select entire line
-            lines = self.text.split("\n")
+            lines = self.document.lines
             line = lines[row] if row < len(lines) else ""
             self.selection = Selection((row, 0), (row, len(line)))
 
@@ -1600,8 +2314,6 @@ MultiCursorTextArea {
         For up/down, delegates to DocumentNavigator (handles sticky column
         and boundary conditions). For all other keys, uses _move_location().
         """
-        from textual.widgets.text_area import Selection
-
         is_shift = "shift+" in key
         base_key = key.replace("shift+", "") if is_shift else key
         is_vertical = base_key in ("up", "down")
@@ -1720,6 +2432,75 @@ MultiCursorTextArea {
 
         # tab/shift+tab fall through to action_indent_line / action_outdent_line
 
+    # ── edit batches ──────────────────────────────────────────────────────────
+
+    def apply_edits(
+        self,
+        edits: Iterable[tuple[tuple[int, int], tuple[int, int], str]],
+    ) -> list[tuple[tuple[int, int], tuple[int, int]]]:
+        """Replace several ranges of the document as a single undo step.
+
+        Each edit is ``(start, end, text)`` in the current document; the
+        ranges must not overlap (they may touch).  The edits go through the
+        document's own ranged replace from the bottom up, so the cost
+        depends on the number and size of the edits, not the file length.
+
+        Returns the ``(start, end)`` of each inserted text in the edited
+        document, in the order the edits were given.
+
+        Raises:
+            ValueError: If two edits overlap.
+        """
+        indexed = sorted(
+            enumerate(
+                Edit(text, start, end, maintain_selection_offset=False)
+                for start, end, text in edits
+            ),
+            key=lambda item: (item[1].top, item[1].bottom),
+        )
+        if not indexed:
+            return []
+        ordered = [edit for _, edit in indexed]
+        for above, below in zip(ordered, ordered[1:], strict=False):
+            if below.top < above.bottom:
+                raise ValueError(f"overlapping edits at {below.top}")
+
+        batch = _EditBatch(ordered)
+        old_gutter_width = self.gutter_width
+        batch.do(self)
+        self.history.checkpoint()
+        self.history.record(batch)  # type: ignore[arg-type]
+        self.history.checkpoint()
+
+        wrapped = self.wrapped_document
+        if self.gutter_width != old_gutter_width:
+            wrapped.wrap(self.wrap_width, self.indent_width)
+        elif batch.changes_line_count:
+            # Rows below each edit moved: rewrap the span once.
+            wrapped.wrap_range(batch.top, batch.bottom, batch.locations[-1][1])
+        else:
+            for edit, (start, end) in zip(ordered, batch.locations, strict=True):
+                wrapped.wrap_range(start, (edit.bottom[0], 0), end)
+
+        splices = _row_splices(batch)
+        for splice in splices:
+            self._note_edited_rows(*splice)
+        self._rehighlight_changed(None)
+
+        batch.after(self)
+        self.suggestion = ""
+        self._build_highlight_map()
+        self.post_message(self.Changed(self))
+        self._refresh_size()
+        self._share_edit(splices)
+
+        result: list[tuple[tuple[int, int], tuple[int, int]]] = [
+            ((0, 0), (0, 0))
+        ] * len(ordered)
+        for (index, _edit), location in zip(indexed, batch.locations, strict=True):
+            result[index] = location
+        return result
+
     # ── multi-cursor editing ──────────────────────────────────────────────────
 
     def _apply_to_all_cursors(self, event: events.Key) -> None:
@@ -1728,7 +2509,7 @@ MultiCursorTextArea {
         Delegates to ``_apply_with_selections`` when any cursor has an active
         selection; otherwise uses the existing per-operation helpers.
         """
-        lines = self.text.split("\n")
+        lines = self.document.lines
         primary = self.cursor_location
         primary_anchor = self.selection.start
         extra = list(self._extra_cursors)
@@ -1751,7 +2532,7 @@ MultiCursorTextArea {
             self._do_enter(all_cursors, primary, extra)
 
         elif char is not None and char.isprintable():
-            self._do_insert(lines, all_cursors, primary, extra, char)
+            self._do_insert(all_cursors, primary, extra, char)
 
         elif key == "backspace":
             if all(c == 0 for _, c in all_cursors):
@@ -1760,7 +2541,7 @@ MultiCursorTextArea {
                 # Mixed: some at col 0, some not — clear and delegate.
                 self.clear_extra_cursors()
             else:
-                self._do_backspace(lines, all_cursors, primary, extra)
+                self._do_backspace(all_cursors, primary, extra)
 
         elif key == "delete":
             all_at_eol = all(
@@ -1775,7 +2556,7 @@ MultiCursorTextArea {
                 # Mixed: some at EOL, some not — clear and delegate.
                 self.clear_extra_cursors()
             else:
-                self._do_delete(lines, all_cursors, primary, extra)
+                self._do_delete(all_cursors, primary, extra)
 
     def _apply_with_selections(
         self,
@@ -1786,8 +2567,6 @@ MultiCursorTextArea {
         extra_anchors: list[tuple[int, int]],
     ) -> None:
         """Replace each selection (or collapsed cursor) with the typed character."""
-        from textual.widgets.text_area import Selection
-
         key = event.key
         char = event.character
 
@@ -1801,69 +2580,38 @@ MultiCursorTextArea {
             self.clear_extra_cursors()
             return
 
-        text = self.text
-        lines = text.split("\n")
-        offsets = _build_offsets(lines)
-
-        def to_off(row: int, col: int) -> int:
-            return offsets[row] + col
-
+        lines = self.document.lines
         all_cursors_and_anchors = [(primary_anchor, primary)] + list(
             zip(extra_anchors, extra, strict=True)
         )
 
-        ops: list[list[int]] = []
+        ranges: list[list[tuple[int, int]]] = []
         for anchor, cursor in all_cursors_and_anchors:
-            a_off = to_off(*anchor)
-            c_off = to_off(*cursor)
-            start_off = min(a_off, c_off)
-            end_off = max(a_off, c_off)
+            start = min(anchor, cursor)
+            end = max(anchor, cursor)
             # For collapsed cursors, adjust for backspace/delete
-            if start_off == end_off:
-                if key == "backspace" and start_off > 0:
-                    start_off -= 1
-                elif key == "delete" and end_off < len(text):
-                    end_off += 1
-            ops.append([start_off, end_off])
-
-        # Track primary's start offset before sorting
-        p_a_off = to_off(*primary_anchor)
-        p_c_off = to_off(*primary)
-        primary_start = min(p_a_off, p_c_off)
-        if primary_anchor == primary and key == "backspace" and primary_start > 0:
-            primary_start -= 1
+            if start == end:
+                if key == "backspace":
+                    row, col = start
+                    start = self._move_location(lines, row, col, "left")
+                elif key == "delete":
+                    row, col = end
+                    end = self._move_location(lines, row, col, "right")
+            ranges.append([start, end])
+        # Track primary's start before sorting
+        primary_start = ranges[0][0]
 
         # Sort and deduplicate overlapping ranges
-        ops.sort()
-        deduped: list[list[int]] = []
-        for op in ops:
-            if deduped and op[0] < deduped[-1][1]:
-                deduped[-1][1] = max(deduped[-1][1], op[1])
+        ranges.sort()
+        deduped: list[list[tuple[int, int]]] = []
+        for r in ranges:
+            if deduped and r[0] < deduped[-1][1]:
+                deduped[-1][1] = max(deduped[-1][1], r[1])
             else:
-                deduped.append(list(op))
-
-        # Build new text + track new cursor offsets
-        parts: list[str] = []
-        prev = 0
-        new_cursor_offsets: list[int] = []
-        accumulated = 0
-        repl_len = len(replacement)
-        for s, e in deduped:
-            parts.append(text[prev:s])
-            new_cursor_offsets.append(accumulated + (s - prev) + repl_len)
-            accumulated += (s - prev) + repl_len
-            parts.append(replacement)
-            prev = e
-        parts.append(text[prev:])
-        new_text = "".join(parts)
-
-        self.replace(new_text, self.document.start, self.document.end)
-
-        new_lines = new_text.split("\n")
-        new_offsets = _build_offsets(new_lines)
-        new_locs = [
-            _offset_to_loc(off, new_lines, new_offsets) for off in new_cursor_offsets
-        ]
+                deduped.append(list(r))
+
+        locations = self.apply_edits((s, e, replacement) for s, e in deduped)
+        new_locs = [end for _start, end in locations]
 
         if not new_locs:
             return
@@ -1875,9 +2623,7 @@ MultiCursorTextArea {
                 primary_idx = i
                 break
 
-        new_primary = (
-            new_locs[primary_idx] if primary_idx < len(new_locs) else new_locs[0]
-        )
+        new_primary = new_locs[primary_idx]
         self.selection = Selection(new_primary, new_primary)
         self._extra_cursors = [
             loc for i, loc in enumerate(new_locs) if i != primary_idx
@@ -1897,30 +2643,12 @@ MultiCursorTextArea {
         extra: list[tuple[int, int]],
     ) -> None:
         """Insert a newline at every cursor position."""
-        sorted_cursors = sorted(all_cursors)
-        new_positions: dict[tuple[int, int], tuple[int, int]] = {}
-        last_orig_row = -1
-        accumulated_col_shift = 0
-
-        for row_offset, (orig_row, orig_col) in enumerate(sorted_cursors):
-            if orig_row != last_orig_row:
-                last_orig_row = orig_row
-                accumulated_col_shift = 0
-
-            actual_row = orig_row + row_offset
-            actual_col = orig_col - accumulated_col_shift
-
-            self.replace("\n", (actual_row, actual_col), (actual_row, actual_col))
-
-            accumulated_col_shift = orig_col
-            new_positions[(orig_row, orig_col)] = (actual_row + 1, 0)
-
-        self.cursor_location = new_positions[primary]
-        self._extra_cursors = [new_positions[ec] for ec in extra]
-        self._extra_anchors = list(self._extra_cursors)
-        self._extra_last_x_offsets = [0] * len(self._extra_cursors)
-        self._recompute_selection_ranges()
-        self.refresh()
+        locations = self.apply_edits((c, c, "\n") for c in all_cursors)
+        new_positions = {
+            cursor: end
+            for cursor, (_start, end) in zip(all_cursors, locations, strict=True)
+        }
+        self._place_cursors(new_positions, primary, extra)
 
     def _do_backspace_line_merge(
         self,
@@ -1929,26 +2657,23 @@ MultiCursorTextArea {
         extra: list[tuple[int, int]],
     ) -> None:
         """Merge each cursor's line with the line above (backspace at col 0)."""
-        sorted_cursors = sorted(all_cursors)
-        new_positions: dict[tuple[int, int], tuple[int, int]] = {}
-
-        for i, (row, col) in enumerate(sorted_cursors):
-            actual_row = row - i
-            if actual_row == 0:
-                new_positions[(row, col)] = (0, 0)
-                continue
-
-            current_lines = self.text.split("\n")
-            prev_len = len(current_lines[actual_row - 1])
-            self.replace("", (actual_row - 1, prev_len), (actual_row, 0))
-            new_positions[(row, col)] = (actual_row - 1, prev_len)
-
-        self.cursor_location = new_positions[primary]
-        self._extra_cursors = [new_positions[ec] for ec in extra]
-        self._extra_anchors = list(self._extra_cursors)
-        self._extra_last_x_offsets = [0] * len(self._extra_cursors)
-        self._recompute_selection_ranges()
-        self.refresh()
+        lines = self.document.lines
+        # A cursor on the first row has nothing to merge with; an empty edit
+        # still reports where it ends up.
+        edits = [
+            ((row - 1, len(lines[row - 1])), (row, 0), "")
+            if row > 0
+            else ((row, col), (row, col), "")
+            for row, col in dict.fromkeys(all_cursors)
+        ]
+        locations = self.apply_edits(edits)
+        new_positions = {
+            cursor: start
+            for cursor, (start, _end) in zip(
+                dict.fromkeys(all_cursors), locations, strict=True
+            )
+        }
+        self._place_cursors(new_positions, primary, extra)
 
     def _do_delete_line_merge(
         self,
@@ -1957,113 +2682,81 @@ MultiCursorTextArea {
         extra: list[tuple[int, int]],
     ) -> None:
         """Merge each cursor's line with the line below (delete at EOL)."""
-        sorted_cursors = sorted(all_cursors)
-        new_positions: dict[tuple[int, int], tuple[int, int]] = {}
-
-        for i, (row, col) in enumerate(sorted_cursors):
-            actual_row = row - i
-            current_lines = self.text.split("\n")
-            eol_col = (
-                len(current_lines[actual_row]) if actual_row < len(current_lines) else 0
-            )
-
-            if actual_row >= len(current_lines) - 1:
-                new_positions[(row, col)] = (actual_row, eol_col)
-                continue
-
-            self.replace("", (actual_row, eol_col), (actual_row + 1, 0))
-            new_positions[(row, col)] = (actual_row, eol_col)
-
-        self.cursor_location = new_positions[primary]
-        self._extra_cursors = [new_positions[ec] for ec in extra]
-        self._extra_anchors = list(self._extra_cursors)
-        self._extra_last_x_offsets = [0] * len(self._extra_cursors)
-        self._recompute_selection_ranges()
-        self.refresh()
+        lines = self.document.lines
+        last_row = len(lines) - 1
+        rows = list(dict.fromkeys(row for row, _col in all_cursors))
+        edits = []
+        for row in rows:
+            eol = (row, len(lines[row]) if row < len(lines) else 0)
+            # The last line has nothing below it; keep the cursor at its end.
+            edits.append((eol, eol if row >= last_row else (row + 1, 0), ""))
+        locations = self.apply_edits(edits)
+        row_ends = {
+            row: start for row, (start, _end) in zip(rows, locations, strict=True)
+        }
+        new_positions = {cursor: row_ends[cursor[0]] for cursor in all_cursors}
+        self._place_cursors(new_positions, primary, extra)
 
     def _do_insert(
         self,
-        lines: list[str],
         all_cursors: list[tuple[int, int]],
         primary: tuple[int, int],
         extra: list[tuple[int, int]],
         char: str,
     ) -> None:
-        row_cols: dict[int, list[int]] = defaultdict(list)
-        for row, col in all_cursors:
-            row_cols[row].append(col)
-
-        for row, cols in row_cols.items():
-            if 0 <= row < len(lines):
-                for col in sorted(cols, reverse=True):
-                    line = lines[row]
-                    lines[row] = line[:col] + char + line[col:]
-            else:
-                self.clear_extra_cursors()
-                return
+        line_count = self.document.line_count
+        if any(not 0 <= row < line_count for row, _col in all_cursors):
+            self.clear_extra_cursors()
+            return
 
-        new_text = "\n".join(lines)
-        self.replace(new_text, self.document.start, self.document.end)
-
-        new_pos = self._new_positions(all_cursors, "insert")
-        self.cursor_location = new_pos[primary]
-        self._extra_cursors = [new_pos[ec] for ec in extra]
-        self._extra_anchors = list(self._extra_cursors)
-        self._extra_last_x_offsets = [0] * len(self._extra_cursors)
-        self._recompute_selection_ranges()
-        self.refresh()
+        locations = self.apply_edits((c, c, char) for c in all_cursors)
+        new_pos = {
+            cursor: end
+            for cursor, (_start, end) in zip(all_cursors, locations, strict=True)
+        }
+        self._place_cursors(new_pos, primary, extra)
 
     def _do_backspace(
         self,
-        lines: list[str],
         all_cursors: list[tuple[int, int]],
         primary: tuple[int, int],
         extra: list[tuple[int, int]],
     ) -> None:
-        row_cols: dict[int, list[int]] = defaultdict(list)
-        for row, col in all_cursors:
-            row_cols[row].append(col)
-
-        for row, cols in row_cols.items():
-            if 0 <= row < len(lines):
-                for col in sorted(cols, reverse=True):
-                    line = lines[row]
-                    lines[row] = line[: col - 1] + line[col:]
-
-        new_text = "\n".join(lines)
-        self.replace(new_text, self.document.start, self.document.end)
-
-        new_pos = self._new_positions(all_cursors, "backspace")
-        self.cursor_location = new_pos[primary]
-        self._extra_cursors = [new_pos[ec] for ec in extra]
-        self._extra_anchors = list(self._extra_cursors)
-        self._extra_last_x_offsets = [0] * len(self._extra_cursors)
-        self._recompute_selection_ranges()
-        self.refresh()
+        cursors = list(dict.fromkeys(all_cursors))
+        locations = self.apply_edits(
+            ((row, col - 1), (row, col), "") for row, col in cursors
+        )
+        new_pos = {
+            cursor: start
+            for cursor, (start, _end) in zip(cursors, locations, strict=True)
+        }
+        self._place_cursors(new_pos, primary, extra)
 
     def _do_delete(
         self,
-        lines: list[str],
         all_cursors: list[tuple[int, int]],
         primary: tuple[int, int],
         extra: list[tuple[int, int]],
     ) -> None:
-        row_cols: dict[int, list[int]] = defaultdict(list)
-        for row, col in all_cursors:
-            row_cols[row].append(col)
-
-        for row, cols in row_cols.items():
-            if 0 <= row < len(lines):
-                for col in sorted(cols, reverse=True):
-                    line = lines[row]
-                    lines[row] = line[:col] + line[col + 1 :]
-
-        new_text = "\n".join(lines)
-        self.replace(new_text, self.document.start, self.document.end)
+        cursors = list(dict.fromkeys(all_cursors))
+        locations = self.apply_edits(
+            ((row, col), (row, col + 1), "") for row, col in cursors
+        )
+        new_pos = {
+            cursor: start
+            for cursor, (start, _end) in zip(cursors, locations, strict=True)
+        }
+        self._place_cursors(new_pos, primary, extra)
 
-        new_pos = self._new_positions(all_cursors, "delete")
-        self.cursor_location = new_pos[primary]
-        self._extra_cursors = [new_pos[ec] for ec in extra]
+    def _place_cursors(
+        self,
+        new_positions: dict[tuple[int, int], tuple[int, int]],
+        primary: tuple[int, int],
+        extra: list[tuple[int, int]],
+    ) -> None:
+        """Move the primary and extra cursors to their post-edit positions."""
+        self.cursor_location = new_positions[primary]
+        self._extra_cursors = [new_positions[ec] for ec in extra]
         self._extra_anchors = list(self._extra_cursors)
         self._extra_last_x_offsets = [0] * len(self._extra_cursors)
         self._recompute_selection_ranges()
@@ -110,6 +110,29 @@ class ProgressToast(Widget, inherit_css=False):
             "progress_toast [%s] %r: mounted", self._group, self._label_text
         )
 
+    def set_label(self, text: str) -> None:
+        """Replace the label (e.g. with progress) while the worker runs."""
+        if self._terminal:
+            return
+        self._label_text = text
+        if self.is_mounted:
+            self.query_one(Label).update(text)
+
+    def close(self) -> None:
+        """Remove the toast although its worker is still running.
+
+        For workers whose tracked step ends early (e.g. a measurement
+        followed by a confirmation modal).
+        """
+        if self._terminal:
+            return
+        self._terminal = True
+        if self._poll_timer is not None:
+            self._poll_timer.stop()
+            self._poll_timer = None
+        self._dismiss_modal()
+        self._dismiss()
+
     def _poll_worker(self) -> None:
         if not self.is_attached or self._terminal:
             return
@@ -201,8 +224,8 @@ class ProgressToastHolder(Container, inherit_css=False):
     def _show_toast(self) -> None:
         if not self.is_attached:
             return
-        if self._toast._worker.is_finished:
-            # Worker finished during delay — skip mounting, clean up
+        if self._toast._worker.is_finished or self._toast._terminal:
+            # Worker finished (or toast closed) during delay — skip mounting
             self.remove()
             return
         self.mount(self._toast)
@@ -14,6 +14,7 @@ from textual.widgets import Button, Checkbox, Input, Label, Static
 from textual.worker import Worker, WorkerState
 
 from textual_code.cancellable_worker import run_cancellable
+from textual_code.file_preloader import get_file_preloader
 from textual_code.modals import (
     ReplacePreviewResult,
     ReplacePreviewScreen,
@@ -47,6 +48,9 @@ _BTN_MIN_WIDTHS = {
 class WorkspaceSearchPane(Static):
     """Sidebar panel for searching text across all workspace files."""
 
+    # Result files preloaded for the editor when a search completes.
+    _PRELOAD_RESULTS = 8
+
     @dataclass
     class OpenFileAtLineRequested(Message):
         """Posted when the user selects a search result."""
@@ -184,6 +188,8 @@ class WorkspaceSearchPane(Static):
         checkbox_tree.populate(response.results, workspace_path)
 
         results = response.results
+        files = dict.fromkeys(r.file_path for r in results)
+        get_file_preloader().prefetch(list(files)[: self._PRELOAD_RESULTS])
         if results:
             file_count = len({r.file_path for r in results})
             match_count = len(results)
@@ -375,6 +381,9 @@ class WorkspaceSearchPane(Static):
     def _on_replace_submitted(self) -> None:
         self._run_replace_all()
 
+    def on_checkbox_tree_cursor_moved(self, event: CheckboxTree.CursorMoved) -> None:
+        get_file_preloader().prefetch([event.file_path])
+
     def on_checkbox_tree_node_selected(self, event: CheckboxTree.NodeSelected) -> None:
         self.post_message(
             self.OpenFileAtLineRequested(
@@ -6,12 +6,16 @@ Group B — _reload_file() behavior
 Group C — _poll_file_change() auto-reload
 Group D — action_revert_file() manual reload with modal
 Group E — action_save() with external change modal
+Group F — cursor position preservation on reload
+Group G — external-change toast lifecycle
+Group H — inotify FilesChanged dispatch and off-loop polling
 """
 
 import time
 from pathlib import Path
 
-from tests.conftest import make_app
+from tests.conftest import await_workers, make_app
+from textual_code.file_watcher import FileChanges
 from textual_code.modals import (
     DiscardAndReloadModalScreen,
     OverwriteConfirmModalScreen,
@@ -42,6 +46,7 @@ async def test_file_mtime_updated_after_save(workspace: Path, sample_py_file: Pa
         # Modify and save
         editor.text = "modified content\n"
         await pilot.press("ctrl+s")
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
         assert editor._file_mtime is not None
@@ -74,6 +79,7 @@ async def test_reload_file_updates_editor_text(workspace: Path, sample_py_file:
         sample_py_file.write_text("externally changed\n", encoding="utf-8")
 
         editor._reload_file()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
         assert editor.text == "externally changed\n"
@@ -91,6 +97,7 @@ async def test_reload_file_clears_unsaved_state(workspace: Path, sample_py_file:
         sample_py_file.write_text("disk content\n", encoding="utf-8")
 
         editor._reload_file()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
         assert editor.text == editor.initial_text
@@ -111,6 +118,7 @@ async def test_reload_file_updates_mtime(workspace: Path, sample_py_file: Path):
         new_mtime = sample_py_file.stat().st_mtime
 
         editor._reload_file()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
         assert editor._file_mtime == new_mtime
@@ -136,6 +144,7 @@ async def test_auto_reload_when_no_unsaved_changes(
         editor._file_mtime -= 1.0
 
         editor._poll_file_change()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
         assert editor.text == "auto reloaded content\n"
@@ -162,6 +171,7 @@ async def test_no_auto_reload_when_unsaved_changes_exist(
         editor._file_mtime -= 1.0
 
         editor._poll_file_change()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
         # Should NOT have reloaded — editor text still has the unsaved change
@@ -181,6 +191,7 @@ async def test_poll_does_nothing_without_mtime_change(
         original_text = editor.text
         # Do NOT change file or mtime
         editor._poll_file_change()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
         assert editor.text == original_text
@@ -267,6 +278,7 @@ async def test_save_no_external_change_saves_directly(
 
         editor.text = "no external change\n"
         await pilot.press("ctrl+s")
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
         # No overwrite modal
@@ -292,6 +304,7 @@ async def test_save_external_change_shows_overwrite_modal(
         editor._file_mtime -= 1.0
 
         editor.action_save()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
         assert isinstance(app.screen, OverwriteConfirmModalScreen)
@@ -314,6 +327,7 @@ async def test_save_overwrite_confirmed_writes_file(
         editor._file_mtime -= 1.0
 
         editor.action_save()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
         await pilot.click("#overwrite")
@@ -340,6 +354,7 @@ async def test_save_overwrite_cancelled_does_not_write(
         editor._file_mtime -= 1.0
 
         editor.action_save()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
         await pilot.click("#cancel")
@@ -365,6 +380,7 @@ async def test_reload_preserves_cursor_position(workspace: Path, multiline_file:
 
         # Reload with same content
         editor._reload_file()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
         assert editor.editor.cursor_location == (4, 3)
@@ -387,6 +403,7 @@ async def test_reload_clamps_cursor_row_when_file_shrinks(
         # Replace file with only 3 lines
         multiline_file.write_text("line1\nline2\nline3\n", encoding="utf-8")
         editor._reload_file()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
         row, _col = editor.editor.cursor_location
@@ -412,6 +429,7 @@ async def test_reload_clamps_cursor_col_when_line_shrinks(
         # Replace with shorter content
         sample_py_file.write_text("hi\n", encoding="utf-8")
         editor._reload_file()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
         _row, col = editor.editor.cursor_location
@@ -440,6 +458,7 @@ async def test_auto_reload_preserves_cursor_position(
         editor._file_mtime -= 1.0
 
         editor._poll_file_change()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
         assert editor.editor.cursor_location == (3, 2)
@@ -465,6 +484,7 @@ async def test_toast_shown_once_on_first_poll(workspace: Path, sample_py_file: P
 
         assert editor._external_change_notification is None
         editor._poll_file_change()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
         assert editor._external_change_notification is not None
@@ -487,14 +507,17 @@ async def test_toast_not_repeated_on_subsequent_polls(
         editor._file_mtime -= 1.0
 
         editor._poll_file_change()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
         first_notification = editor._external_change_notification
         assert first_notification is not None
 
         # Poll two more times — same notification object, no new one created
         editor._poll_file_change()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
         editor._poll_file_change()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
         assert editor._external_change_notification is first_notification
@@ -515,12 +538,14 @@ async def test_notification_cleared_after_reload(workspace: Path, sample_py_file
         editor._file_mtime -= 1.0
 
         editor._poll_file_change()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
         notification = editor._external_change_notification
         assert notification is not None
 
         # Reload dismisses the notification
         editor._reload_file()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
         assert editor._external_change_notification is None
         assert notification not in app._notifications
@@ -531,6 +556,7 @@ async def test_notification_cleared_after_reload(workspace: Path, sample_py_file
         editor.text = "unsaved2\n"
         await pilot.wait_for_scheduled_animations()
         editor._poll_file_change()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
         assert editor._external_change_notification is not None
 
@@ -550,12 +576,14 @@ async def test_notification_cleared_after_save(workspace: Path, sample_py_file:
         editor._file_mtime -= 1.0
 
         editor._poll_file_change()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
         notification = editor._external_change_notification
         assert notification is not None
 
         # Save dismisses the notification
         editor._write_to_disk()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
         assert editor._external_change_notification is None
         assert notification not in app._notifications
@@ -578,12 +606,14 @@ async def test_new_notification_after_reload_then_change(
         assert editor._file_mtime is not None
         editor._file_mtime -= 1.0
         editor._poll_file_change()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
         first_notification = editor._external_change_notification
         assert first_notification is not None
 
         # Reload clears it
         editor._reload_file()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
         assert editor._external_change_notification is None
 
@@ -593,6 +623,7 @@ async def test_new_notification_after_reload_then_change(
         editor.text = "unsaved2\n"
         await pilot.wait_for_scheduled_animations()
         editor._poll_file_change()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
         second_notification = editor._external_change_notification
         assert second_notification is not None
@@ -616,12 +647,14 @@ async def test_new_notification_after_save_then_change(
         assert editor._file_mtime is not None
         editor._file_mtime -= 1.0
         editor._poll_file_change()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
         first_notification = editor._external_change_notification
         assert first_notification is not None
 
         # Save clears it
         editor._write_to_disk()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
         assert editor._external_change_notification is None
 
@@ -631,7 +664,93 @@ async def test_new_notification_after_save_then_change(
         editor.text = "unsaved2\n"
         await pilot.wait_for_scheduled_animations()
         editor._poll_file_change()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
         second_notification = editor._external_change_notification
         assert second_notification is not None
         assert second_notification is not first_notification
+
+
+# ── Group H: inotify FilesChanged dispatch and off-loop polling ──────────────
+
+
+async def test_files_changed_reloads_open_editor(workspace: Path, sample_py_file: Path):
+    """H-01: A watcher event for an open file triggers its auto-reload."""
+    app = make_app(workspace, open_file=sample_py_file, light=True)
+    async with app.run_test() as pilot:
+        await pilot.wait_for_scheduled_animations()
+        editor = app.main_view.get_active_code_editor()
+        assert editor is not None
+        sample_py_file.write_text("watched content\n", encoding="utf-8")
+        assert editor._file_mtime is not None
+        editor._file_mtime -= 1.0
+
+        app.post_message(
+            app.FilesChanged(FileChanges(frozenset({sample_py_file}), frozenset()))
+        )
+        await pilot.wait_for_scheduled_animations()
+
+        assert editor.text == "watched content\n"
+
+
+async def test_files_changed_ignores_unrelated_paths(
+    workspace: Path, sample_py_file: Path
+):
+    """H-02: Events for other files do not touch the editor."""
+    app = make_app(workspace, open_file=sample_py_file, light=True)
+    async with app.run_test() as pilot:
+        await pilot.wait_for_scheduled_animations()
+        editor = app.main_view.get_active_code_editor()
+        assert editor is not None
+        original = editor.text
+        sample_py_file.write_text("not reloaded\n", encoding="utf-8")
+        assert editor._file_mtime is not None
+        editor._file_mtime -= 1.0
+
+        other = workspace / "other.py"
+        app.post_message(app.FilesChanged(FileChanges(frozenset({other}), frozenset())))
+        await pilot.wait_for_scheduled_animations()
+
+        assert editor.text == original
+
+
+async def test_files_changed_reapplies_editorconfig(
+    workspace: Path, sample_py_file: Path, monkeypatch
+):
+    """H-03: A changed .editorconfig in the search chain is re-checked."""
+    app = make_app(workspace, open_file=sample_py_file, light=True)
+    async with app.run_test() as pilot:
+        await pilot.wait_for_scheduled_animations()
+        editor = app.main_view.get_active_code_editor()
+        assert editor is not None
+        assert sample_py_file.parent in editor._ec_search_dirs
+        calls = []
+        monkeypatch.setattr(
+            editor, "_poll_editorconfig_change", lambda: calls.append(True)
+        )
+
+        ec = sample_py_file.parent / ".editorconfig"
+        app.post_message(app.FilesChanged(FileChanges(frozenset({ec}), frozenset())))
+        await pilot.wait_for_scheduled_animations()
+
+        assert calls == [True]
+
+
+async def test_background_poll_reloads_active_editor(
+    workspace: Path, sample_py_file: Path
+):
+    """H-04: Fallback polling stats off the event loop and applies the result."""
+    app = make_app(workspace, open_file=sample_py_file, light=True)
+    async with app.run_test() as pilot:
+        await pilot.wait_for_scheduled_animations()
+        editor = app.main_view.get_active_code_editor()
+        assert editor is not None
+        sample_py_file.write_text("polled content\n", encoding="utf-8")
+        assert editor._file_mtime is not None
+        editor._file_mtime -= 1.0
+
+        app.main_view._poll_editor_in_background(editor)
+        await await_workers(pilot)
+        await pilot.wait_for_scheduled_animations()
+
+        assert editor.text == "polled content\n"
@@ -2,7 +2,7 @@
 
 from pathlib import Path
 
-from tests.conftest import make_app
+from tests.conftest import await_workers, make_app
 
 
 async def test_light_app_mounts_without_sidebar(workspace: Path, sample_py_file: Path):
@@ -46,6 +46,7 @@ async def test_light_app_save(workspace: Path, sample_py_file: Path):
         await pilot.press("a")
         await pilot.wait_for_scheduled_animations()
         await pilot.press("ctrl+s")
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
         # File should be saved without crash
         assert sample_py_file.read_text(encoding="utf-8").startswith("a")
@@ -143,13 +143,14 @@ class TestGitignoreMatching:
         (ws / ".gitignore").write_text("*.log\n")
         tree = self._make_tree(ws)
         # Prime the cache
+        tree._load_directory_sync(ws)
         tree._is_gitignored(ws / "test.log")
-        assert tree._gitignore_specs is not None
+        assert len(tree._gitignore_mtimes) > 0
         assert len(tree._gitignore_cache) > 0
         # reload() should invalidate
-        tree._gitignore_specs = None
+        tree._gitignore_mtimes.clear()
         tree._gitignore_cache.clear()
-        assert tree._gitignore_specs is None
+        assert len(tree._gitignore_mtimes) == 0
         assert len(tree._gitignore_cache) == 0
 
     def test_b10_dim_disabled_returns_false(self, tmp_path: Path):
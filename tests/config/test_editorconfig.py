@@ -8,17 +8,27 @@ Group D — Property value mapping (T-23 to T-28)
 Group E — Integration: CodeEditor file open (T-29 to T-32)
 Group F — Save-time transformations (T-33 to T-46)
 Group G — EditorConfig reload on modification (G-01 to G-12)
+Group H — Shared EditorConfig cache (H-01 to H-05)
 """
 
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 from textual.app import App, ComposeResult
 
+from tests.conftest import await_workers
+from textual_code.widgets import code_editor_helpers as helpers
 from textual_code.widgets.code_editor import (
     CodeEditor,
     _editorconfig_glob_to_pattern,
     _read_editorconfig,
 )
+from textual_code.widgets.code_editor_helpers import (
+    EditorConfigCache,
+    get_editorconfig_cache,
+    load_file_for_editor,
+)
 
 # ── Group A: _read_editorconfig() basic behaviour ────────────────────────────
 
@@ -475,6 +485,7 @@ async def test_T33_insert_final_newline_true_adds_newline(tmp_path: Path):
     async with app.run_test() as pilot:
         await pilot.wait_for_scheduled_animations()
         app.code_editor.action_save()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
     assert f.read_bytes() == b"x = 1\n"
@@ -491,6 +502,7 @@ async def test_T34_insert_final_newline_true_already_has_newline(tmp_path: Path)
     async with app.run_test() as pilot:
         await pilot.wait_for_scheduled_animations()
         app.code_editor.action_save()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
     assert f.read_bytes() == b"x = 1\n"
@@ -507,6 +519,7 @@ async def test_T35_insert_final_newline_false_removes_newline(tmp_path: Path):
     async with app.run_test() as pilot:
         await pilot.wait_for_scheduled_animations()
         app.code_editor.action_save()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
     assert f.read_bytes() == b"x = 1"
@@ -523,6 +536,7 @@ async def test_T36_insert_final_newline_true_empty_file(tmp_path: Path):
     async with app.run_test() as pilot:
         await pilot.wait_for_scheduled_animations()
         app.code_editor.action_save()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
     assert f.read_bytes() == b""
@@ -539,6 +553,7 @@ async def test_T37_trim_trailing_whitespace_true(tmp_path: Path):
     async with app.run_test() as pilot:
         await pilot.wait_for_scheduled_animations()
         app.code_editor.action_save()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
     assert f.read_bytes() == b"  x = 1\n  y = 2\n"
@@ -555,6 +570,7 @@ async def test_T38_trim_trailing_whitespace_false_no_change(tmp_path: Path):
     async with app.run_test() as pilot:
         await pilot.wait_for_scheduled_animations()
         app.code_editor.action_save()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
     assert f.read_bytes() == b"x = 1   \n"
@@ -573,6 +589,7 @@ async def test_T39_trim_and_insert_final_newline_combined(tmp_path: Path):
     async with app.run_test() as pilot:
         await pilot.wait_for_scheduled_animations()
         app.code_editor.action_save()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
     assert f.read_bytes() == b"x = 1\ny = 2\n"
@@ -589,6 +606,7 @@ async def test_T40_insert_final_newline_unset_no_change(tmp_path: Path):
     async with app.run_test() as pilot:
         await pilot.wait_for_scheduled_animations()
         app.code_editor.action_save()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
     assert f.read_bytes() == b"x = 1"
@@ -605,6 +623,7 @@ async def test_T41_editor_text_updated_after_trim_on_save(tmp_path: Path):
     async with app.run_test() as pilot:
         await pilot.wait_for_scheduled_animations()
         app.code_editor.action_save()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
         saved_text = app.code_editor.text
 
@@ -622,6 +641,7 @@ async def test_T42_initial_text_matches_text_after_save(tmp_path: Path):
     async with app.run_test() as pilot:
         await pilot.wait_for_scheduled_animations()
         app.code_editor.action_save()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
         text = app.code_editor.text
         initial_text = app.code_editor.initial_text
@@ -640,6 +660,7 @@ async def test_T43_insert_final_newline_with_crlf(tmp_path: Path):
     async with app.run_test() as pilot:
         await pilot.wait_for_scheduled_animations()
         app.code_editor.action_save()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
     assert f.read_bytes() == b"x = 1\r\n"
@@ -656,6 +677,7 @@ async def test_T44_insert_final_newline_false_empty_file(tmp_path: Path):
     async with app.run_test() as pilot:
         await pilot.wait_for_scheduled_animations()
         app.code_editor.action_save()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
     assert f.read_bytes() == b""
@@ -674,6 +696,7 @@ async def test_T45_trim_and_insert_final_newline_false_combined(tmp_path: Path):
     async with app.run_test() as pilot:
         await pilot.wait_for_scheduled_animations()
         app.code_editor.action_save()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
     assert f.read_bytes() == b"x = 1\ny = 2"
@@ -710,6 +733,7 @@ async def test_T46_textarea_updated_when_user_adds_trailing_ws(tmp_path: Path):
 
         # Save — trim should revert to "x = 1\n"
         editor.action_save()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
         # The actual TextArea widget must reflect the trimmed content
@@ -1018,3 +1042,98 @@ async def test_G12_property_removed_indent_stays(tmp_path: Path):
         assert editor.indent_size == 8
         # But trim_trailing_whitespace IS applied
         assert editor._trim_trailing_whitespace is True
+
+
+# ── Group H: Shared EditorConfig cache ───────────────────────────────────────
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    """Backdate *path* so the cache treats it as settled (outside the racy window)."""
+    st = path.stat()
+    old = st.st_mtime_ns - seconds * 10**9
+    os.utime(path, ns=(old, old))
+
+
+def test_H01_many_opens_parse_each_file_once(tmp_path: Path):
+    """H-01: Opening 200 files parses each .editorconfig exactly once."""
+    (tmp_path / ".editorconfig").write_text("root = true\n[*]\nindent_size = 2\n")
+    sub = tmp_path / "src"
+    sub.mkdir()
+    (sub / ".editorconfig").write_text("[*.py]\nindent_style = tab\n")
+    _age(tmp_path / ".editorconfig")
+    _age(sub / ".editorconfig")
+    files = []
+    for i in range(200):
+        f = sub / f"m{i}.py"
+        f.write_text("")
+        files.append(f)
+
+    with (
+        patch.object(helpers, "_shared_editorconfig_cache", EditorConfigCache()),
+        patch.object(
+            helpers,
+            "_parse_editorconfig_text",
+            wraps=helpers._parse_editorconfig_text,
+        ) as parse,
+    ):
+        results = [load_file_for_editor(f) for f in files]
+
+    assert parse.call_count == 2
+    assert all(
+        r.editorconfig == {"indent_size": "2", "indent_style": "tab"} for r in results
+    )
+    assert results[0].ec_search_dirs == [sub, tmp_path]
+
+
+def test_H02_edited_file_is_reparsed(tmp_path: Path):
+    """H-02: A changed mtime invalidates the parsed file."""
+    ec = tmp_path / ".editorconfig"
+    ec.write_text("root = true\n[*]\nindent_size = 2\n")
+    _age(ec, 120)
+    f = tmp_path / "a.py"
+    f.write_text("")
+    cache = EditorConfigCache()
+    assert cache.resolve(f)[0] == {"indent_size": "2"}
+
+    ec.write_text("root = true\n[*]\nindent_size = 8\n")
+    _age(ec, 60)
+    assert cache.resolve(f)[0] == {"indent_size": "8"}
+
+
+def test_H03_new_and_deleted_files_are_seen(tmp_path: Path):
+    """H-03: The chain is revalidated, so created and removed files apply."""
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    f = sub / "a.py"
+    f.write_text("")
+    (tmp_path / ".editorconfig").write_text("root = true\n")
+    cache = EditorConfigCache()
+    assert cache.resolve(f)[0] == {}
+
+    ec = sub / ".editorconfig"
+    ec.write_text("[*.py]\nindent_style = tab\n")
+    assert cache.resolve(f)[0] == {"indent_style": "tab"}
+
+    ec.unlink()
+    assert cache.resolve(f)[0] == {}
+
+
+def test_H04_sibling_files_share_chain_and_match_separately(tmp_path: Path):
+    """H-04: One cached chain serves files with different section matches."""
+    ec = tmp_path / ".editorconfig"
+    ec.write_text("root = true\n[*.py]\nindent_size = 4\n[*.js]\nindent_size = 2\n")
+    _age(ec)
+    (tmp_path / "a.py").write_text("")
+    (tmp_path / "b.js").write_text("")
+    cache = EditorConfigCache()
+    assert cache.resolve(tmp_path / "a.py")[0] == {"indent_size": "4"}
+    assert cache.resolve(tmp_path / "b.js")[0] == {"indent_size": "2"}
+    assert cache._chain(tmp_path) is cache._chain(tmp_path)
+
+
+def test_H05_glob_patterns_are_memoized():
+    """H-05: The same section glob compiles once."""
+    assert _editorconfig_glob_to_pattern("*.{py,pyi}") is (
+        _editorconfig_glob_to_pattern("*.{py,pyi}")
+    )
+    assert get_editorconfig_cache() is get_editorconfig_cache()
@@ -10,6 +10,7 @@ from pathlib import Path
 import pytest
 from textual.app import App, ComposeResult
 
+from tests.conftest import await_workers
 from textual_code.widgets.code_editor import (
     CodeEditor,
     CodeEditorFooter,
@@ -288,6 +289,7 @@ async def test_save_writes_utf8_bom_bytes(tmp_path: Path):
 
         editor = app.screen_stack[0].query_one(CodeEditor)
         editor.action_save()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
     saved = f.read_bytes()
@@ -319,6 +321,7 @@ async def test_save_writes_latin1_bytes(tmp_path: Path):
 
         editor = app.screen_stack[0].query_one(CodeEditor)
         editor.action_save()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
     saved = f.read_bytes()
@@ -338,6 +341,7 @@ async def test_save_utf16_roundtrip(tmp_path: Path):
         )  # Windows: extra pause for lazy widget mount
         editor = app.code_editor
         editor.action_save()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
     saved = f.read_bytes()
@@ -367,6 +371,7 @@ async def test_save_as_preserves_encoding(tmp_path: Path):
 
         app.screen.query_one(Input).value = str(new_path)
         await pilot.click("#save")
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
     saved = new_path.read_bytes()
@@ -18,6 +18,7 @@ from textual_code.widgets.explorer import (
     FilteredDirectoryTree,
     _parse_git_status_output,
 )
+from textual_code.widgets.filtered_tree import _merge_git_status
 
 # ── Config tests ─────────────────────────────────────────────────────────────
 
@@ -56,69 +57,78 @@ class TestConfig:
 # ── Parser unit tests (pure function, no git needed) ─────────────────────────
 
 
+_HASH = "0" * 40
+
+
+def _v2(xy: str, path: str) -> str:
+    """Build an ordinary-change record of ``git status --porcelain=v2 -z``."""
+    return f"1 {xy} N... 100644 100644 100644 {_HASH} {_HASH} {path}\0"
+
+
 class TestParseGitStatusOutput:
     def test_b01_modified_file(self, tmp_path: Path):
         """Modified file is parsed as 'modified'."""
         ws = tmp_path / "ws"
         ws.mkdir()
-        # git status --porcelain -z output: " M file.py\0"
-        stdout = " M file.py\0"
+        stdout = _v2(".M", "file.py")
         result = _parse_git_status_output(stdout, ws)
-        assert result.status_map[ws / "file.py"] == "modified"
+        assert result.status_of(ws / "file.py") == "modified"
 
     def test_b02_untracked_file(self, tmp_path: Path):
         """Untracked file is parsed as 'untracked'."""
         ws = tmp_path / "ws"
         ws.mkdir()
-        stdout = "?? newfile.py\0"
+        stdout = "? newfile.py\0"
         result = _parse_git_status_output(stdout, ws)
-        assert result.status_map[ws / "newfile.py"] == "untracked"
+        assert result.status_of(ws / "newfile.py") == "untracked"
 
     def test_b03_staged_file(self, tmp_path: Path):
         """Staged file (added) is parsed as 'modified'."""
         ws = tmp_path / "ws"
         ws.mkdir()
-        stdout = "A  staged.py\0"
+        stdout = _v2("A.", "staged.py")
         result = _parse_git_status_output(stdout, ws)
-        assert result.status_map[ws / "staged.py"] == "modified"
+        assert result.status_of(ws / "staged.py") == "modified"
 
     def test_b04_renamed_file(self, tmp_path: Path):
         """Renamed file is parsed correctly from NUL-separated -z output."""
         ws = tmp_path / "ws"
         ws.mkdir()
-        # With -z, renames are: "R  old.py\0new.py\0"
-        stdout = "R  old.py\0new.py\0"
+        # With -z, renames are: "2 R. ... R100 new.py\0old.py\0"
+        stdout = f"2 R. N... 100644 100644 100644 {_HASH} {_HASH} R100 new.py\0old.py\0"
         result = _parse_git_status_output(stdout, ws)
-        assert result.status_map[ws / "new.py"] == "modified"
+        assert result.status_of(ws / "new.py") == "modified"
+        assert result.status_of(ws / "old.py") is None
 
     def test_b05_folder_propagation(self, tmp_path: Path):
         """Parent folders inherit status from children."""
         ws = tmp_path / "ws"
         ws.mkdir()
-        stdout = " M src/utils/helper.py\0"
+        stdout = _v2(".M", "src/utils/helper.py")
         result = _parse_git_status_output(stdout, ws)
-        assert result.status_map[ws / "src" / "utils" / "helper.py"] == "modified"
-        assert result.status_map[ws / "src" / "utils"] == "modified"
-        assert result.status_map[ws / "src"] == "modified"
+        assert result.status_of(ws / "src" / "utils" / "helper.py") == "modified"
+        assert result.status_of(ws / "src" / "utils") == "modified"
+        assert result.status_of(ws / "src") == "modified"
 
     def test_b06_folder_propagation_highest_priority(self, tmp_path: Path):
         """Folder gets the highest-priority status among children."""
         ws = tmp_path / "ws"
         ws.mkdir()
         # One untracked, one modified in same dir
-        stdout = "?? src/new.py\0 M src/old.py\0"
+        stdout = "? src/new.py\0" + _v2(".M", "src/old.py")
         result = _parse_git_status_output(stdout, ws)
         # modified > untracked
-        assert result.status_map[ws / "src"] == "modified"
+        assert result.status_of(ws / "src") == "modified"
 
     def test_b07_untracked_directory(self, tmp_path: Path):
         """Untracked directory entry (from -unormal) stores dir in untracked_dirs."""
         ws = tmp_path / "ws"
         ws.mkdir()
         # -unormal shows untracked dirs with trailing /
-        stdout = "?? newdir/\0"
+        stdout = "? newdir/\0"
         result = _parse_git_status_output(stdout, ws)
         assert (ws / "newdir") in result.untracked_dirs
+        assert result.status_of(ws / "newdir" / "deep" / "x.py") == "untracked"
 
     def test_b08_empty_output(self, tmp_path: Path):
         """Empty output produces empty result."""
@@ -132,29 +142,68 @@ class TestParseGitStatusOutput:
         """Entries too short to parse are skipped gracefully."""
         ws = tmp_path / "ws"
         ws.mkdir()
-        # "X" is too short (< 4 chars), should be skipped
-        stdout = "X\0 M valid.py\0"
+        # "1 X" is missing its fields, should be skipped
+        stdout = "1 X\0" + _v2(".M", "valid.py")
         result = _parse_git_status_output(stdout, ws)
-        assert ws / "valid.py" in result.status_map
+        assert str(ws / "valid.py") in result.status_map
         assert len(result.status_map) == 1  # only valid.py, no garbage
 
     def test_b10_multiple_statuses(self, tmp_path: Path):
         """Multiple files with different statuses parsed correctly."""
         ws = tmp_path / "ws"
         ws.mkdir()
-        stdout = " M modified.py\0?? untracked.py\0A  added.py\0"
+        stdout = _v2(".M", "modified.py") + "? untracked.py\0" + _v2("A.", "added.py")
         result = _parse_git_status_output(stdout, ws)
-        assert result.status_map[ws / "modified.py"] == "modified"
-        assert result.status_map[ws / "untracked.py"] == "untracked"
-        assert result.status_map[ws / "added.py"] == "modified"
+        assert result.status_of(ws / "modified.py") == "modified"
+        assert result.status_of(ws / "untracked.py") == "untracked"
+        assert result.status_of(ws / "added.py") == "modified"
 
     def test_b11_deleted_file(self, tmp_path: Path):
         """Deleted file is parsed as 'modified' (tracked change)."""
         ws = tmp_path / "ws"
         ws.mkdir()
-        stdout = " D deleted.py\0"
+        stdout = _v2(".D", "deleted.py")
+        result = _parse_git_status_output(stdout, ws)
+        assert result.status_of(ws / "deleted.py") == "modified"
+
+    def test_b12_unmerged_file_and_headers(self, tmp_path: Path):
+        """Unmerged records count as modified; headers and ignored are skipped."""
+        ws = tmp_path / "ws"
+        ws.mkdir()
+        stdout = (
+            "# branch.oid (initial)\0"
+            f"u UU N... 100644 100644 100644 100644 {_HASH} {_HASH} {_HASH} "
+            "both.py\0"
+            "! ignored.log\0"
+        )
+        result = _parse_git_status_output(stdout, ws)
+        assert result.status_of(ws / "both.py") == "modified"
+        assert result.status_of(ws / "ignored.log") is None
+        assert len(result.status_map) == 1
+
+    def test_b13_path_with_spaces(self, tmp_path: Path):
+        """The path is the last field, so spaces inside it are preserved."""
+        ws = tmp_path / "ws"
+        ws.mkdir()
+        stdout = _v2(".M", "my dir/a file.py")
         result = _parse_git_status_output(stdout, ws)
-        assert result.status_map[ws / "deleted.py"] == "modified"
+        assert result.status_of(ws / "my dir" / "a file.py") == "modified"
+        assert result.status_of(ws / "my dir") == "modified"
+
+    def test_b14_scoped_merge_replaces_only_its_subtree(self, tmp_path: Path):
+        """A scoped refresh replaces entries under its dirs and re-derives parents."""
+        ws = tmp_path / "ws"
+        ws.mkdir()
+        stdout = _v2(".M", "src/a.py") + _v2(".M", "docs/b.md") + "? srcx.py\0"
+        previous = _parse_git_status_output(stdout, ws)
+        # src/ is clean again; a new untracked file appeared in it instead.
+        merged = _merge_git_status(previous, ["src/"], {"src/c.py": "untracked"}, ws)
+        assert merged.status_of(ws / "src" / "a.py") is None
+        assert merged.status_of(ws / "src" / "c.py") == "untracked"
+        assert merged.status_of(ws / "src") == "untracked"
+        assert merged.status_of(ws / "docs" / "b.md") == "modified"
+        # "src/" must not swallow the sibling "srcx.py".
+        assert merged.status_of(ws / "srcx.py") == "untracked"
 
 
 # ── Integration tests (real git repo) ────────────────────────────────────────
@@ -253,6 +302,28 @@ class TestGitStatusIntegration:
         tree = self._make_tree(ws)
         assert tree._get_git_status(newdir / "file.py") == "untracked"
 
+    def test_c10_scoped_reload_only_requeries_scope(self, tmp_path: Path):
+        """A scoped _load_git_status updates its dirs and keeps the rest."""
+        ws = tmp_path / "ws"
+        ws.mkdir()
+        init_git_repo(ws)
+        sub = ws / "sub"
+        sub.mkdir()
+        tree = self._make_tree(ws)
+        tree._git_result = tree._load_git_status()
+        assert tree._get_git_status(sub / "new.py") is None
+
+        (sub / "new.py").write_text("# new\n")
+        (ws / "committed.py").write_text("# changed\n")
+        tree._git_result = tree._load_git_status([sub])
+
+        assert tree._get_git_status(sub / "new.py") == "untracked"
+        assert tree._get_git_status(sub) == "untracked"
+        # Outside the scope the previous (clean) result is kept.
+        assert tree._get_git_status(ws / "committed.py") is None
+        tree._git_result = tree._load_git_status()
+        assert tree._get_git_status(ws / "committed.py") == "modified"
+
     def test_c09_subprocess_uses_utf8_encoding(self, tmp_path: Path):
         """_load_git_status subprocess.run calls must pass encoding='utf-8'."""
         ws = tmp_path / "ws"
@@ -10,6 +10,7 @@ from pathlib import Path
 import pytest
 from textual.app import App, ComposeResult
 
+from tests.conftest import await_workers
 from textual_code.widgets.code_editor import (
     CodeEditor,
     CodeEditorFooter,
@@ -307,6 +308,7 @@ async def test_save_writes_crlf_to_disk(tmp_path: Path):
         # save the file
         editor = app.screen_stack[0].query_one(CodeEditor)
         editor.action_save()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
     saved = f.read_bytes()
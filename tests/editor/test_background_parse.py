@@ -0,0 +1,120 @@
+"""Tests for parsing large documents on a worker thread when they are opened."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+from textual.document._syntax_aware_document import SyntaxAwareDocument
+
+from tests.conftest import make_app, wait_for_condition
+from textual_code.widgets import multi_cursor_text_area
+from textual_code.widgets.multi_cursor_text_area import MultiCursorTextArea
+from textual_code.widgets.split_tree import all_leaves
+
+_SOURCE = "".join(f"def f{i}(x):\n    return x + {i}\n" for i in range(200))
+
+
+def _held_parse(monkeypatch) -> threading.Event:
+    """Make background parses wait until the returned event is set."""
+    release = threading.Event()
+    parse = multi_cursor_text_area.parse_document
+
+    def held(text, language):
+        release.wait(10)
+        return parse(text, language)
+
+    monkeypatch.setattr(multi_cursor_text_area, "parse_document", held)
+    monkeypatch.setattr(MultiCursorTextArea, "BACKGROUND_PARSE_CHARS", 1000)
+    return release
+
+
+async def test_large_file_shows_plain_text_then_highlights(
+    tmp_path: Path, monkeypatch
+) -> None:
+    release = _held_parse(monkeypatch)
+    f = tmp_path / "big.py"
+    f.write_text(_SOURCE, encoding="utf-8")
+    app = make_app(tmp_path, light=True, open_file=f)
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        editor = app.main_view.get_active_code_editor()
+        assert editor is not None
+        ta = editor.editor
+        assert editor.language == "python"
+        assert ta.parse_pending
+        assert ta.text == _SOURCE
+        assert not isinstance(ta.document, SyntaxAwareDocument)
+
+        # Typing while the parse runs is kept; the text is parsed again.
+        ta.insert("# top\n", (0, 0))
+        release.set()
+        await wait_for_condition(
+            pilot, lambda: not ta.parse_pending, msg="parse did not finish"
+        )
+        assert isinstance(ta.document, SyntaxAwareDocument)
+        assert ta.text == "# top\n" + _SOURCE
+        assert any(name == "comment" for _, _, name in ta._highlights[0])
+        assert ta._highlights[1]
+        ta.undo()
+        assert ta.text == _SOURCE
+
+
+async def test_switching_tab_cancels_the_parse(tmp_path: Path, monkeypatch) -> None:
+    release = _held_parse(monkeypatch)
+    big = tmp_path / "big.py"
+    big.write_text(_SOURCE, encoding="utf-8")
+    other = tmp_path / "other.txt"
+    other.write_text("x\n", encoding="utf-8")
+    app = make_app(tmp_path, light=True, open_file=big)
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        main = app.main_view
+        editor = main.get_active_code_editor()
+        assert editor is not None
+        ta = editor.editor
+        assert ta.parse_pending
+        workers = [w for w in app.workers if w.group == "parse"]
+        assert workers
+
+        await main.action_open_code_editor(path=other)
+        await pilot.pause()
+        assert all(w.is_cancelled for w in workers)
+        pane_id = main._active_leaf.opened_files[big]
+        assert pane_id not in main._remount_caches
+        release.set()
+
+
+async def test_split_view_finishes_the_parse_of_an_unmounted_view(
+    tmp_path: Path, monkeypatch
+) -> None:
+    """A view sharing the plain placeholder takes over the cancelled parse."""
+    release = _held_parse(monkeypatch)
+    big = tmp_path / "big.py"
+    big.write_text(_SOURCE, encoding="utf-8")
+    other = tmp_path / "other.txt"
+    other.write_text("x\n", encoding="utf-8")
+    app = make_app(tmp_path, light=True, open_file=big)
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        main = app.main_view
+        await main.action_split_right()
+        await pilot.pause()
+        leaves = all_leaves(main._split_root)
+        left = main._get_active_code_editor_in_leaf(leaves[0])
+        right = main._get_active_code_editor_in_leaf(leaves[1])
+        assert left is not None and right is not None
+        assert left.editor.parse_pending
+        assert right.editor.document is left.editor.document
+
+        main.focus_pane(leaves[0].opened_files[big])
+        await pilot.pause()
+        await main.action_open_code_editor(path=other)
+        await pilot.pause()
+        assert right.editor.parse_pending
+        release.set()
+        await wait_for_condition(
+            pilot, lambda: not right.editor.parse_pending, msg="parse abandoned"
+        )
+        assert isinstance(right.editor.document, SyntaxAwareDocument)
+        assert right.text == _SOURCE
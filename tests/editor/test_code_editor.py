@@ -142,6 +142,7 @@ async def test_title_asterisk_removed_after_save(workspace: Path, sample_py_file
         assert "*" in editor.title
 
         await pilot.press("ctrl+s")
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
         assert "*" not in editor.title
 
@@ -182,6 +183,7 @@ async def test_save_writes_to_disk(workspace: Path, sample_py_file: Path):
         assert editor is not None
         editor.text = "print('modified')\n"
         await pilot.press("ctrl+s")
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
     assert sample_py_file.read_text(encoding="utf-8") == "print('modified')\n"
@@ -195,6 +197,7 @@ async def test_save_updates_initial_text(workspace: Path, sample_py_file: Path):
         assert editor is not None
         editor.text = "updated\n"
         await pilot.press("ctrl+s")
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
         assert editor.initial_text == "updated\n"
         assert editor.text == editor.initial_text
@@ -206,6 +209,7 @@ async def test_save_without_path_triggers_save_as_modal(workspace: Path):
         await pilot.press("ctrl+n")
         await pilot.wait_for_scheduled_animations()
         await pilot.press("ctrl+s")
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
         assert isinstance(app.screen, SaveAsModalScreen)
 
@@ -228,6 +232,7 @@ async def test_save_as_creates_new_file(workspace: Path, sample_py_file: Path):
         input_widget.value = str(new_path)
         await pilot.wait_for_scheduled_animations()
         await pilot.click("#save")
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
     assert new_path.exists()
@@ -0,0 +1,59 @@
+"""Tests for the composited line strip cache of MultiCursorTextArea."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+from tests.conftest import make_app
+from textual_code.widgets.multi_cursor_text_area import MultiCursorTextArea
+
+
+def _text(strip) -> str:
+    return "".join(segment.text for segment in strip)
+
+
+async def test_unchanged_lines_reuse_their_strips(tmp_path: Path) -> None:
+    """Cursor moves and edits elsewhere do not recompose untouched lines."""
+    f = tmp_path / "a.txt"
+    f.write_text("alpha\nbeta\ngamma\ndelta\n", encoding="utf-8")
+    app = make_app(tmp_path, light=True, open_file=f)
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        _ce = app.main_view.get_active_code_editor()
+        assert _ce is not None
+        ta = _ce.editor
+        ta.soft_wrap = True
+        await pilot.pause()
+        for y in range(4):
+            ta._render_line(y)
+
+        composed: list[int] = []
+        original = MultiCursorTextArea._compose_line
+
+        def spy(self, y):
+            composed.append(y)
+            return original(self, y)
+
+        with patch.object(MultiCursorTextArea, "_compose_line", spy):
+            ta.cursor_location = (1, 2)
+            for y in range(4):
+                ta._render_line(y)
+            # Only the rows the cursor left and entered are recomposed.
+            assert sorted(composed) == [0, 1]
+
+            composed.clear()
+            ta.insert("!", (3, 0))
+            strips = [ta._render_line(y) for y in range(4)]
+            assert composed == [3]
+            assert "!delta" in _text(strips[3])
+
+
+async def test_leading_width_expands_tabs(tmp_path: Path) -> None:
+    app = make_app(tmp_path, light=True)
+    async with app.run_test():
+        ta = MultiCursorTextArea()
+        ta.indent_width = 4
+        assert ta._leading_width("code") == 0
+        assert ta._leading_width("  \tx") == 4
+        assert ta._leading_width("\t\t") == 8
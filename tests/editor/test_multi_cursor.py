@@ -5,14 +5,20 @@ Unit-level tests exercise MultiCursorTextArea directly (API + editing logic).
 Integration-level tests run the full app via pilot (CodeEditor + key bindings).
 """
 
+import random
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from textual.widgets.text_area import Selection
 
 from tests.conftest import get_style_color_at, make_app
 from textual_code.widgets.code_editor import CodeEditorFooter
-from textual_code.widgets.multi_cursor_text_area import MultiCursorTextArea
+from textual_code.widgets.multi_cursor_text_area import (
+    MultiCursorTextArea,
+    _EditBatch,
+    _merge_splices,
+)
 
 # ── Fixtures ──────────────────────────────────────────────────────────────────
 
@@ -99,6 +105,123 @@ async def test_clear_cursors_removes_all(workspace: Path, two_line_file: Path):
         assert ta.extra_cursors == []
 
 
+async def test_add_cursors_bulk_dedupes_and_posts_once(
+    workspace: Path, two_line_file: Path
+):
+    """add_cursors skips the primary and duplicates and posts one event."""
+    app = make_app(workspace, light=True, open_file=two_line_file)
+    async with app.run_test() as pilot:
+        await pilot.wait_for_scheduled_animations()
+        _ce = app.main_view.get_active_code_editor()
+        assert _ce is not None
+        ta = _ce.editor
+        ta.add_cursor((1, 0))
+        posted: list[MultiCursorTextArea.CursorsChanged] = []
+        original = ta.post_message
+
+        def record(message):
+            if isinstance(message, MultiCursorTextArea.CursorsChanged):
+                posted.append(message)
+            return original(message)
+
+        with patch.object(ta, "post_message", record):
+            added = ta.add_cursors(
+                [
+                    (ta.cursor_location, None),  # primary
+                    ((1, 0), None),  # already present
+                    ((0, 5), (0, 2)),
+                    ((1, 3), None),
+                    ((0, 5), None),  # duplicate within the batch
+                ]
+            )
+        assert added == 2
+        assert ta.extra_cursors == [(1, 0), (0, 5), (1, 3)]
+        assert ta.extra_anchors == [(1, 0), (0, 2), (1, 3)]
+        assert len(posted) == 1
+        assert ta._cursor_rows().cols_by_row == {0: [5], 1: [0, 3]}
+        assert ta._cached_selection_ranges == {0: [(2, 5)]}
+
+
+async def test_cursor_row_index_follows_reassignment(
+    workspace: Path, two_line_file: Path
+):
+    """Replacing the cursor list invalidates the row index."""
+    app = make_app(workspace, light=True, open_file=two_line_file)
+    async with app.run_test() as pilot:
+        await pilot.wait_for_scheduled_animations()
+        _ce = app.main_view.get_active_code_editor()
+        assert _ce is not None
+        ta = _ce.editor
+        ta.add_cursors([((1, 4), None), ((1, 1), None)])
+        assert ta._cursor_rows().cols_by_row == {1: [1, 4]}
+        ta.clear_extra_cursors()
+        assert ta._cursor_rows().cols_by_row == {}
+
+
+# ── Unit: apply_edits (edit batches) ──────────────────────────────────────────
+
+
+async def test_apply_edits_is_one_undo_step(workspace: Path, three_line_file: Path):
+    """Ranged edits apply bottom-up, report final locations and undo together."""
+    app = make_app(workspace, light=True, open_file=three_line_file)
+    async with app.run_test() as pilot:
+        await pilot.wait_for_scheduled_animations()
+        _ce = app.main_view.get_active_code_editor()
+        assert _ce is not None
+        ta = _ce.editor
+        undo_depth = len(ta.history.undo_stack)
+        locations = ta.apply_edits(
+            [
+                ((2, 0), (2, 4), "L"),
+                ((0, 0), (0, 0), "a\nb"),
+                ((0, 5), (1, 0), ""),
+            ]
+        )
+        assert ta.text == "a\nbline1line2\nL3\n"
+        assert locations == [((2, 0), (2, 1)), ((0, 0), (1, 1)), ((1, 6), (1, 6))]
+        assert len(ta.history.undo_stack) == undo_depth + 1
+        ta.action_undo()
+        assert ta.text == "line1\nline2\nline3\n"
+        ta.action_redo()
+        assert ta.text == "a\nbline1line2\nL3\n"
+
+
+async def test_apply_edits_rejects_overlap(workspace: Path, three_line_file: Path):
+    app = make_app(workspace, light=True, open_file=three_line_file)
+    async with app.run_test() as pilot:
+        await pilot.wait_for_scheduled_animations()
+        _ce = app.main_view.get_active_code_editor()
+        assert _ce is not None
+        ta = _ce.editor
+        with pytest.raises(ValueError, match="overlapping"):
+            ta.apply_edits([((0, 0), (0, 3), "x"), ((0, 2), (0, 4), "y")])
+        assert ta.text == "line1\nline2\nline3\n"
+
+
+async def test_multi_cursor_typing_is_ranged(workspace: Path, three_line_file: Path):
+    """Typing with extra cursors edits only the cursor ranges, as one undo step."""
+    app = make_app(workspace, light=True, open_file=three_line_file)
+    async with app.run_test() as pilot:
+        await pilot.wait_for_scheduled_animations()
+        _ce = app.main_view.get_active_code_editor()
+        assert _ce is not None
+        ta = _ce.editor
+        ta.add_cursors([((1, 5), None), ((2, 5), None)])
+        ta.cursor_location = (0, 5)
+        await pilot.press("!")
+        assert ta.text == "line1!\nline2!\nline3!\n"
+        batch = ta.history.undo_stack[-1]
+        assert len(batch) == 1
+        assert isinstance(batch[0], _EditBatch)
+        assert [edit.bottom for edit in batch[0].edits] == [(0, 5), (1, 5), (2, 5)]
+        await pilot.press("enter")
+        assert ta.text == "line1!\n\nline2!\n\nline3!\n\n"
+        assert ta.cursor_location == (1, 0)
+        assert ta.extra_cursors == [(3, 0), (5, 0)]
+        ta.action_undo()
+        assert ta.text == "line1!\nline2!\nline3!\n"
+
+
 # ── Unit: _new_positions (position maths) ─────────────────────────────────────
 
 
@@ -1943,3 +2066,21 @@ class TestExtraCursorVisibility:
                 f"Extra-cursor selection bg at col 2 should differ from plain "
                 f"bg at col 8 on non-cursor line (sel={bg_sel}, plain={bg_plain})"
             )
+
+
+def test_merge_splices_covers_every_edited_row():
+    """One merged splice rebuilds the final rows from the original ones."""
+    rng = random.Random(3)
+    for _ in range(300):
+        original = [f"r{i}" for i in range(12)]
+        rows = list(original)
+        splices = []
+        for n in range(rng.randint(1, 4)):
+            top = rng.randrange(len(rows))
+            old_bottom = rng.randint(top, min(top + 3, len(rows) - 1))
+            new = [f"e{n}.{i}" for i in range(rng.randint(1, 4))]
+            rows[top : old_bottom + 1] = new
+            splices.append((top, old_bottom, top + len(new) - 1))
+        top, old_bottom, new_bottom = _merge_splices(splices)
+        rebuilt = original[:top] + rows[top : new_bottom + 1]
+        assert rebuilt + original[old_bottom + 1 :] == rows
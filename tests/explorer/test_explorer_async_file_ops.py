@@ -1,11 +1,12 @@
 """
 Tests for async file operations and the Cancel File Operation command.
 
-Verifies that directory copy/delete/move run in background workers,
-single file operations stay synchronous, and the cancel command works.
+Verifies that directory and single-file copy/delete/move run in background
+workers and that the cancel command works.
 """
 
-import asyncio
+import threading
+import time
 from pathlib import Path
 from unittest.mock import patch
 
@@ -14,6 +15,7 @@ import pytest
 from tests.conftest import await_workers, make_app, wait_for_condition
 from textual_code.app import TextualCode
 from textual_code.command_registry import COMMAND_REGISTRY
+from textual_code.file_operations import FileOperation, FileOperationCancelled
 from textual_code.modals import DeleteFileModalScreen
 from textual_code.widgets.explorer import Explorer
 
@@ -107,6 +109,28 @@ async def test_single_file_delete_stays_sync(workspace: Path, sample_py_file: Pa
     assert not sample_py_file.exists()
 
 
+async def test_back_to_back_deletes_both_run(workspace: Path):
+    """A second delete queues behind the first instead of cancelling it."""
+    first = workspace / "first.txt"
+    second = workspace / "second.txt"
+    first.write_text("first", encoding="utf-8")
+    second.write_text("second", encoding="utf-8")
+
+    app = make_app(workspace)
+    async with app.run_test() as pilot:
+        await pilot.wait_for_scheduled_animations()
+        with patch.object(app, "notify") as notify:
+            app._execute_delete(first)
+            app._execute_delete(second)
+            await await_workers(pilot)
+
+    assert not first.exists()
+    assert not second.exists()
+    messages = [call.args[0] for call in notify.call_args_list]
+    assert "Deleted: first.txt" in messages
+    assert "Deleted: second.txt" in messages
+
+
 # ── Directory move via worker ─────────────────────────────────────────
 
 
@@ -164,11 +188,11 @@ async def test_paste_copytree_runs_in_worker(workspace: Path):
     assert src.exists()
 
 
-# ── Single file copy stays sync ───────────────────────────────────────
+# ── Single file copy runs in the worker too ───────────────────────────
 
 
-async def test_single_file_copy_stays_sync(workspace: Path, sample_py_file: Path):
-    """Single file copy-paste does not use the file_ops worker group."""
+async def test_single_file_copy_runs_in_worker(workspace: Path, sample_py_file: Path):
+    """Single file copy-paste also runs in the file_ops worker (off the loop)."""
     target_dir = workspace / "target"
     target_dir.mkdir()
 
@@ -177,36 +201,41 @@ async def test_single_file_copy_stays_sync(workspace: Path, sample_py_file: Path
         await pilot.wait_for_scheduled_animations()
         assert app.sidebar is not None
         explorer = app.sidebar.explorer
-
-        # Copy
         explorer.post_message(
             Explorer.FileCopyRequested(explorer=explorer, path=sample_py_file)
         )
         await pilot.wait_for_scheduled_animations()
 
-        # Paste
-        explorer.post_message(
-            Explorer.FilePasteRequested(explorer=explorer, target_dir=target_dir)
-        )
-        await pilot.wait_for_scheduled_animations()
-        await await_workers(pilot)
+        with patch.object(
+            TextualCode, "_do_file_op", wraps=app._do_file_op
+        ) as do_file_op:
+            explorer.post_message(
+                Explorer.FilePasteRequested(explorer=explorer, target_dir=target_dir)
+            )
+            await wait_for_condition(pilot, lambda: (target_dir / "hello.py").exists())
+            await await_workers(pilot)
+        do_file_op.assert_called_once()
 
-    # File should be copied immediately (synchronously)
-    assert (target_dir / "hello.py").exists()
+    assert (target_dir / "hello.py").read_bytes() == sample_py_file.read_bytes()
 
 
 # ── Cancel file operation ─────────────────────────────────────────────
 
 
 async def test_cancel_stops_worker(workspace: Path):
-    """Cancelling a file operation stops the subprocess-based worker."""
+    """Cancelling a file operation stops the engine and rolls back the copy."""
     src = _make_large_dir(workspace, "original")
     target_dir = workspace / "target"
     target_dir.mkdir()
+    started = threading.Event()
+    real_copy_file = FileOperation._copy_file
 
-    async def slow_run_cancellable(*_args: object, **_kwargs: object) -> None:
-        """Simulate a long-running subprocess that can be cancelled."""
-        await asyncio.sleep(60)
+    def blocking_copy_file(self, src_file, dst_file, stopped, created):
+        real_copy_file(self, src_file, dst_file, stopped, created)
+        started.set()
+        while not stopped():
+            time.sleep(0.01)
+        raise FileOperationCancelled
 
     app = make_app(workspace)
     async with app.run_test() as pilot:
@@ -218,23 +247,34 @@ async def test_cancel_stops_worker(workspace: Path):
         explorer.post_message(Explorer.FileCopyRequested(explorer=explorer, path=src))
         await pilot.wait_for_scheduled_animations()
 
-        # Paste with mocked run_cancellable that blocks forever
-        mock_target = "textual_code.app.run_cancellable"
-        with patch(mock_target, side_effect=slow_run_cancellable):
+        # Paste with a copy engine that blocks until cancelled
+        with patch.object(FileOperation, "_copy_file", blocking_copy_file):
             explorer.post_message(
                 Explorer.FilePasteRequested(explorer=explorer, target_dir=target_dir)
             )
-            await pilot.wait_for_scheduled_animations()
-            await pilot.wait_for_scheduled_animations()
-            await await_workers(pilot)
+            await wait_for_condition(pilot, started.is_set)
+            assert (target_dir / "original").exists()
 
             # Cancel the operation
             app.action_cancel_file_operation()
-            await pilot.wait_for_scheduled_animations()
+            await wait_for_condition(pilot, lambda: app._current_file_op_label == "")
+            await await_workers(pilot)
 
-    # Verify cancel was invoked: the label should have been cleared after
-    # the worker finished (whether cancelled or completed).
+    # The worker finished and the partial copy was rolled back.
     assert app._current_file_op_label == ""
-    # The worker group should have no running workers after cleanup.
     running = [w for w in app.workers if w.group == "file_ops" and w.is_running]
     assert len(running) == 0
+    assert not (target_dir / "original").exists()
+    assert (src / "file0.txt").exists()
+
+
+def test_file_op_progress_shown_in_toast(workspace: Path):
+    """The file_ops toast label reports files done while copying."""
+    from textual_code.app import _file_op_status
+
+    op = FileOperation("copy", _make_large_dir(workspace), workspace / "copy")
+    assert _file_op_status("Copying 'bigdir'", op.progress) == "Copying 'bigdir'"
+    op.run()
+    assert _file_op_status("Copying 'bigdir'", op.progress) == (
+        "Copying 'bigdir' — 6/6 files, 51 B of 51 B"
+    )
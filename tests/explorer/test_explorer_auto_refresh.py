@@ -6,6 +6,8 @@ Group B — _get_git_ref_mtimes()
 Group C — _poll_workspace_change() directory changes
 Group D — _poll_workspace_change() git changes
 Group E — Integration (full app)
+Group F — File watcher events (apply_file_changes) and off-loop polling
+Group G — Subtree refresh (refresh_dirs)
 """
 
 from __future__ import annotations
@@ -17,9 +19,28 @@ from unittest.mock import patch
 
 import pytest
 
-from tests.conftest import init_git_repo, make_app, requires_git, wait_for_condition
+from tests.conftest import (
+    await_workers,
+    init_git_repo,
+    make_app,
+    requires_git,
+    wait_for_condition,
+)
+from textual_code.file_watcher import FileChanges
 from textual_code.widgets.explorer import FilteredDirectoryTree
 
+
+async def _settled(pilot, tree: FilteredDirectoryTree) -> None:
+    """Wait for the tree's startup loads, which pause change handling."""
+    await wait_for_condition(
+        pilot,
+        lambda: not tree._ws_polling_paused,
+        max_retries=100,
+        msg="explorer did not finish loading",
+    )
+    await await_workers(pilot)
+
+
 # ── Group A: _collect_expanded_dir_mtimes() ──────────────────────────────────
 
 
@@ -121,8 +142,8 @@ class TestGetGitRefMtimes:
 
 
 class TestPollWorkspaceChangeDir:
-    async def test_c01_new_file_triggers_reload(self, tmp_path: Path):
-        """T-06: Creating a new file changes dir mtime → reload triggered."""
+    async def test_c01_new_file_triggers_subtree_refresh(self, tmp_path: Path):
+        """T-06: Creating a new file changes dir mtime → that dir is re-listed."""
         ws = tmp_path / "ws"
         ws.mkdir()
         (ws / "existing.py").write_text("x\n")
@@ -131,6 +152,7 @@ class TestPollWorkspaceChangeDir:
             await pilot.wait_for_scheduled_animations()
             assert app.sidebar is not None
             tree = app.sidebar.explorer.directory_tree
+            await _settled(pilot, tree)
             # Initialize polling state
             tree._dir_mtimes = tree._collect_expanded_dir_mtimes()
             tree._git_ref_mtimes = tree._get_git_ref_mtimes()
@@ -138,14 +160,22 @@ class TestPollWorkspaceChangeDir:
             # Create a new file (changes workspace root mtime)
             (ws / "new_file.py").write_text("y\n")
 
-            with patch.object(
-                FilteredDirectoryTree, "reload", wraps=tree.reload
-            ) as mock_reload:
+            with (
+                patch.object(
+                    FilteredDirectoryTree, "reload", wraps=tree.reload
+                ) as mock_reload,
+                patch.object(
+                    FilteredDirectoryTree, "refresh_dirs", wraps=tree.refresh_dirs
+                ) as mock_refresh_dirs,
+            ):
                 tree._poll_workspace_change()
-                mock_reload.assert_called_once()
+                mock_refresh_dirs.assert_called_once_with({ws})
+                mock_reload.assert_not_called()
+            # Let the refresh (and its git status worker) finish in the app.
+            await _settled(pilot, tree)
 
-    async def test_c02_deleted_file_triggers_reload(self, tmp_path: Path):
-        """T-07: Deleting a file changes dir mtime → reload triggered."""
+    async def test_c02_deleted_file_triggers_subtree_refresh(self, tmp_path: Path):
+        """T-07: Deleting a file changes dir mtime → that dir is re-listed."""
         ws = tmp_path / "ws"
         ws.mkdir()
         target = ws / "to_delete.py"
@@ -155,6 +185,7 @@ class TestPollWorkspaceChangeDir:
             await pilot.wait_for_scheduled_animations()
             assert app.sidebar is not None
             tree = app.sidebar.explorer.directory_tree
+            await _settled(pilot, tree)
             tree._dir_mtimes = tree._collect_expanded_dir_mtimes()
             tree._git_ref_mtimes = tree._get_git_ref_mtimes()
 
@@ -162,10 +193,11 @@ class TestPollWorkspaceChangeDir:
             target.unlink()
 
             with patch.object(
-                FilteredDirectoryTree, "reload", wraps=tree.reload
-            ) as mock_reload:
+                FilteredDirectoryTree, "refresh_dirs", wraps=tree.refresh_dirs
+            ) as mock_refresh_dirs:
                 tree._poll_workspace_change()
-                mock_reload.assert_called_once()
+                mock_refresh_dirs.assert_called_once_with({ws})
+            await _settled(pilot, tree)
 
     async def test_c03_no_changes_no_reload(self, tmp_path: Path):
         """T-08: No filesystem changes → no reload or refresh."""
@@ -177,6 +209,7 @@ class TestPollWorkspaceChangeDir:
             await pilot.wait_for_scheduled_animations()
             assert app.sidebar is not None
             tree = app.sidebar.explorer.directory_tree
+            await _settled(pilot, tree)
             tree._dir_mtimes = tree._collect_expanded_dir_mtimes()
             tree._git_ref_mtimes = tree._get_git_ref_mtimes()
 
@@ -200,6 +233,7 @@ class TestPollWorkspaceChangeDir:
             await pilot.wait_for_scheduled_animations()
             assert app.sidebar is not None
             tree = app.sidebar.explorer.directory_tree
+            await _settled(pilot, tree)
             tree._dir_mtimes = tree._collect_expanded_dir_mtimes()
             tree._git_ref_mtimes = tree._get_git_ref_mtimes()
             tree._ws_polling_paused = True
@@ -223,6 +257,7 @@ class TestPollWorkspaceChangeDir:
             await pilot.wait_for_scheduled_animations()
             assert app.sidebar is not None
             tree = app.sidebar.explorer.directory_tree
+            await _settled(pilot, tree)
             tree._dir_mtimes = tree._collect_expanded_dir_mtimes()
             tree._git_ref_mtimes = tree._get_git_ref_mtimes()
 
@@ -255,6 +290,7 @@ class TestPollWorkspaceChangeGit:
             await pilot.wait_for_scheduled_animations()
             assert app.sidebar is not None
             tree = app.sidebar.explorer.directory_tree
+            await _settled(pilot, tree)
             tree._dir_mtimes = tree._collect_expanded_dir_mtimes()
             tree._git_ref_mtimes = tree._get_git_ref_mtimes()
             # Pre-load git status cache
@@ -286,8 +322,8 @@ class TestPollWorkspaceChangeGit:
                 assert tree._git_result is not None
 
     @requires_git
-    async def test_d02_both_dir_and_git_change_reloads(self, tmp_path: Path):
-        """T-12: Both dir + git change → full reload (not just refresh)."""
+    async def test_d02_both_dir_and_git_change_refreshes_dir(self, tmp_path: Path):
+        """T-12: Both dir + git change → the changed dir is re-listed."""
         ws = tmp_path / "ws"
         ws.mkdir()
         init_git_repo(ws)
@@ -296,6 +332,7 @@ class TestPollWorkspaceChangeGit:
             await pilot.wait_for_scheduled_animations()
             assert app.sidebar is not None
             tree = app.sidebar.explorer.directory_tree
+            await _settled(pilot, tree)
             tree._dir_mtimes = tree._collect_expanded_dir_mtimes()
             tree._git_ref_mtimes = tree._get_git_ref_mtimes()
 
@@ -311,11 +348,12 @@ class TestPollWorkspaceChangeGit:
             )
 
             with patch.object(
-                FilteredDirectoryTree, "reload", wraps=tree.reload
-            ) as mock_reload:
+                FilteredDirectoryTree, "refresh_dirs", wraps=tree.refresh_dirs
+            ) as mock_refresh_dirs:
                 tree._poll_workspace_change()
-                # Dir change takes priority → full reload
-                mock_reload.assert_called_once()
+                # Dir change takes priority; the refresh also reloads git status
+                mock_refresh_dirs.assert_called_once_with({ws})
+            await _settled(pilot, tree)
 
     @requires_git
     async def test_d03_git_only_preserves_expanded_state(self, tmp_path: Path):
@@ -331,6 +369,7 @@ class TestPollWorkspaceChangeGit:
             await pilot.wait_for_scheduled_animations()
             assert app.sidebar is not None
             tree = app.sidebar.explorer.directory_tree
+            await _settled(pilot, tree)
 
             # Expand the subdir
             for child in tree.root.children:
@@ -379,6 +418,7 @@ class TestPollWorkspaceChangeGit:
             await pilot.wait_for_scheduled_animations()
             assert app.sidebar is not None
             tree = app.sidebar.explorer.directory_tree
+            await _settled(pilot, tree)
             # Windows: wait for background git loading to complete
             await wait_for_condition(
                 pilot,
@@ -424,6 +464,7 @@ class TestPollWorkspaceChangeGit:
             await pilot.wait_for_scheduled_animations()
             assert app.sidebar is not None
             tree = app.sidebar.explorer.directory_tree
+            await _settled(pilot, tree)
             # Pre-load git status synchronously (bypass bg_loading for test)
             tree._git_result = tree._load_git_status()
             assert tree._git_result is not None
@@ -454,6 +495,7 @@ class TestIntegration:
             await pilot.wait_for_scheduled_animations()
             assert app.sidebar is not None
             tree = app.sidebar.explorer.directory_tree
+            await _settled(pilot, tree)
             tree._dir_mtimes = tree._collect_expanded_dir_mtimes()
             tree._git_ref_mtimes = tree._get_git_ref_mtimes()
 
@@ -490,6 +532,7 @@ class TestIntegration:
             await pilot.wait_for_scheduled_animations()
             assert app.sidebar is not None
             tree = app.sidebar.explorer.directory_tree
+            await _settled(pilot, tree)
 
             # Expand the subdir
             for child in tree.root.children:
@@ -520,3 +563,380 @@ class TestIntegration:
                     found = True
                     break
             assert found, "mydir node not found in tree after reload"
+
+
+# ── Group F: File watcher events and off-loop polling ───────────────────────
+
+
+class TestFileWatcherEvents:
+    async def test_f01_listing_change_in_expanded_dir_refreshes(self, tmp_path: Path):
+        """A watcher batch that changes the root listing re-lists the root."""
+        ws = tmp_path / "ws"
+        ws.mkdir()
+        (ws / "file.py").write_text("x\n", encoding="utf-8")
+        app = make_app(ws)
+        async with app.run_test() as pilot:
+            await pilot.wait_for_scheduled_animations()
+            assert app.sidebar is not None
+            tree = app.sidebar.explorer.directory_tree
+            await _settled(pilot, tree)
+            (ws / "new.py").write_text("y\n", encoding="utf-8")
+            changes = FileChanges(frozenset({ws / "new.py"}), frozenset({ws}))
+            with patch.object(
+                FilteredDirectoryTree, "refresh_dirs", wraps=tree.refresh_dirs
+            ) as mock_refresh_dirs:
+                tree.apply_file_changes(changes)
+                mock_refresh_dirs.assert_called_once_with({ws})
+            await _settled(pilot, tree)
+
+    async def test_f02_collapsed_dir_change_ignored(self, tmp_path: Path):
+        """Listing changes in directories that are not expanded are ignored."""
+        ws = tmp_path / "ws"
+        ws.mkdir()
+        sub = ws / "sub"
+        sub.mkdir()
+        app = make_app(ws)
+        async with app.run_test() as pilot:
+            await pilot.wait_for_scheduled_animations()
+            assert app.sidebar is not None
+            tree = app.sidebar.explorer.directory_tree
+            await _settled(pilot, tree)
+            changes = FileChanges(frozenset({sub / "x.py"}), frozenset({sub}))
+            with (
+                patch.object(
+                    FilteredDirectoryTree, "reload", wraps=tree.reload
+                ) as mock_reload,
+                patch.object(tree, "_start_bg_loading") as mock_bg,
+            ):
+                tree.apply_file_changes(changes)
+                mock_reload.assert_not_called()
+                # A file edit still refreshes git decorations.
+                mock_bg.assert_called_once()
+
+    async def test_f03_git_index_event_refreshes_status_only(self, tmp_path: Path):
+        """An index update inside .git refreshes git status without reload."""
+        ws = tmp_path / "ws"
+        ws.mkdir()
+        (ws / ".git").mkdir()
+        app = make_app(ws)
+        async with app.run_test() as pilot:
+            await pilot.wait_for_scheduled_animations()
+            assert app.sidebar is not None
+            tree = app.sidebar.explorer.directory_tree
+            await _settled(pilot, tree)
+            changes = FileChanges(frozenset({ws / ".git" / "index"}), frozenset())
+            with (
+                patch.object(
+                    FilteredDirectoryTree, "reload", wraps=tree.reload
+                ) as mock_reload,
+                patch.object(tree, "_start_bg_loading") as mock_bg,
+            ):
+                tree.apply_file_changes(changes)
+                mock_reload.assert_not_called()
+                mock_bg.assert_called_once()
+
+    async def test_f04_overflow_reloads(self, tmp_path: Path):
+        """A kernel queue overflow falls back to a full reload."""
+        ws = tmp_path / "ws"
+        ws.mkdir()
+        app = make_app(ws)
+        async with app.run_test() as pilot:
+            await pilot.wait_for_scheduled_animations()
+            assert app.sidebar is not None
+            tree = app.sidebar.explorer.directory_tree
+            await _settled(pilot, tree)
+            changes = FileChanges(frozenset(), frozenset(), overflow=True)
+            with patch.object(
+                FilteredDirectoryTree, "reload", wraps=tree.reload
+            ) as mock_reload:
+                tree.apply_file_changes(changes)
+                mock_reload.assert_called_once()
+            await _settled(pilot, tree)
+
+    async def test_f05_background_poll_detects_new_file(self, tmp_path: Path):
+        """Fallback polling stats in a worker thread and applies on the loop."""
+        ws = tmp_path / "ws"
+        ws.mkdir()
+        (ws / "existing.py").write_text("x\n", encoding="utf-8")
+        app = make_app(ws)
+        async with app.run_test() as pilot:
+            await pilot.wait_for_scheduled_animations()
+            assert app.sidebar is not None
+            tree = app.sidebar.explorer.directory_tree
+            await _settled(pilot, tree)
+            tree._dir_mtimes = tree._collect_expanded_dir_mtimes()
+            tree._git_ref_mtimes = tree._get_git_ref_mtimes()
+            (ws / "new_file.txt").write_text("hello\n", encoding="utf-8")
+            os.utime(ws, (0, 0))  # make the root mtime change unambiguous
+
+            tree._poll_workspace_in_background(tree._expanded_dir_paths())
+            await await_workers(pilot)
+            await wait_for_condition(
+                pilot,
+                lambda: any(
+                    c.data is not None and c.data.path.name == "new_file.txt"
+                    for c in tree.root.children
+                ),
+            )
+
+    async def test_f06_files_changed_message_invalidates_path_cache(
+        self, tmp_path: Path
+    ):
+        """The app fans FilesChanged out to the path-search cache."""
+        ws = tmp_path / "ws"
+        ws.mkdir()
+        app = make_app(ws)
+        async with app.run_test() as pilot:
+            await pilot.wait_for_scheduled_animations()
+            with patch(
+                "textual_code.modals.PathSearchModal.invalidate_cache"
+            ) as mock_invalidate:
+                app.post_message(
+                    app.FilesChanged(
+                        FileChanges(frozenset({ws / "a.py"}), frozenset({ws}))
+                    )
+                )
+                await pilot.wait_for_scheduled_animations()
+                mock_invalidate.assert_called_with(ws)
+
+    async def test_f07_file_edit_scopes_git_status(self, tmp_path: Path):
+        """A file edit re-queries git status for its directory only."""
+        ws = tmp_path / "ws"
+        ws.mkdir()
+        sub = ws / "sub"
+        sub.mkdir()
+        app = make_app(ws)
+        async with app.run_test() as pilot:
+            await pilot.wait_for_scheduled_animations()
+            assert app.sidebar is not None
+            tree = app.sidebar.explorer.directory_tree
+            await _settled(pilot, tree)
+            changes = FileChanges(frozenset({sub / "x.py"}), frozenset())
+            with patch.object(tree, "_start_bg_loading") as mock_bg:
+                tree.apply_file_changes(changes)
+                mock_bg.assert_called_once_with({sub})
+
+    async def test_f08_pending_git_scopes_are_merged(self, tmp_path: Path):
+        """Scopes requested while a refresh runs are folded together."""
+        ws = tmp_path / "ws"
+        ws.mkdir()
+        app = make_app(ws)
+        async with app.run_test() as pilot:
+            await pilot.wait_for_scheduled_animations()
+            assert app.sidebar is not None
+            tree = app.sidebar.explorer.directory_tree
+            await _settled(pilot, tree)
+            await await_workers(pilot)
+            tree._git_result = tree._ensure_git_status_loaded()
+            tree._git_pending = frozenset()
+            tree._queue_git_scope([ws / "a"])
+            tree._queue_git_scope([ws / "b"])
+            assert tree._git_pending == {ws / "a", ws / "b"}
+            # A full refresh absorbs every scope.
+            tree._queue_git_scope(None)
+            assert tree._git_pending == {ws}
+
+
+# ── Group G: Subtree refresh (refresh_dirs) ─────────────────────────────────
+
+
+def _child(node, name: str):
+    return next(
+        c for c in node.children if c.data is not None and c.data.path.name == name
+    )
+
+
+def _child_names(node) -> list[str]:
+    return [c.data.path.name for c in node.children if c.data is not None]
+
+
+class TestSubtreeRefresh:
+    async def test_g01_merge_keeps_untouched_nodes(self, tmp_path: Path):
+        """New entries are inserted in sort order; existing nodes are reused."""
+        ws = tmp_path / "ws"
+        ws.mkdir()
+        sub = ws / "sub"
+        sub.mkdir()
+        (sub / "inner.py").write_text("x\n", encoding="utf-8")
+        (sub / "other.py").write_text("x\n", encoding="utf-8")
+        (ws / "b.py").write_text("x\n", encoding="utf-8")
+        (ws / "d.py").write_text("x\n", encoding="utf-8")
+        app = make_app(ws)
+        async with app.run_test() as pilot:
+            await pilot.wait_for_scheduled_animations()
+            assert app.sidebar is not None
+            tree = app.sidebar.explorer.directory_tree
+            sub_node = _child(tree.root, "sub")
+            sub_node.expand()
+            await wait_for_condition(pilot, lambda: len(sub_node.children) == 2)
+            b_node = _child(tree.root, "b.py")
+
+            (ws / "c.py").write_text("x\n", encoding="utf-8")
+            (ws / "d.py").unlink()
+            await tree.refresh_dirs({ws})
+
+            assert _child_names(tree.root) == ["sub", "b.py", "c.py"]
+            assert _child(tree.root, "sub") is sub_node
+            assert _child(tree.root, "b.py") is b_node
+            assert sub_node.is_expanded
+            assert _child_names(sub_node) == ["inner.py", "other.py"]
+            assert tree._ws_polling_paused is False
+
+    async def test_g02_cursor_stays_on_node(self, tmp_path: Path):
+        """Entries added above the cursor do not move it to another node."""
+        ws = tmp_path / "ws"
+        ws.mkdir()
+        (ws / "m.py").write_text("x\n", encoding="utf-8")
+        (ws / "z.py").write_text("x\n", encoding="utf-8")
+        app = make_app(ws)
+        async with app.run_test() as pilot:
+            await pilot.wait_for_scheduled_animations()
+            assert app.sidebar is not None
+            tree = app.sidebar.explorer.directory_tree
+            tree.move_cursor(_child(tree.root, "z.py"))
+            await pilot.wait_for_scheduled_animations()
+
+            (ws / "a.py").write_text("x\n", encoding="utf-8")
+            (ws / "b_dir").mkdir()
+            await tree.refresh_dirs({ws})
+            await pilot.wait_for_scheduled_animations()
+
+            assert tree.cursor_node is not None
+            assert tree.cursor_node.data is not None
+            assert tree.cursor_node.data.path.name == "z.py"
+
+    async def test_g03_deleted_cursor_falls_back_to_neighbour(self, tmp_path: Path):
+        """When the highlighted entry vanishes, the cursor takes its slot."""
+        ws = tmp_path / "ws"
+        ws.mkdir()
+        for name in ("a.py", "b.py", "c.py"):
+            (ws / name).write_text("x\n", encoding="utf-8")
+        app = make_app(ws)
+        async with app.run_test() as pilot:
+            await pilot.wait_for_scheduled_animations()
+            assert app.sidebar is not None
+            tree = app.sidebar.explorer.directory_tree
+            tree.move_cursor(_child(tree.root, "b.py"))
+            await pilot.wait_for_scheduled_animations()
+
+            (ws / "b.py").unlink()
+            await tree.refresh_dirs({ws})
+            await pilot.wait_for_scheduled_animations()
+
+            assert tree.cursor_node is not None
+            assert tree.cursor_node.data is not None
+            assert tree.cursor_node.data.path.name == "c.py"
+
+    async def test_g04_only_changed_gitignore_is_invalidated(self, tmp_path: Path):
+        """A refreshed dir drops its own stale verdicts; others survive."""
+        ws = tmp_path / "ws"
+        ws.mkdir()
+        (ws / ".gitignore").write_text("*.log\n", encoding="utf-8")
+        sub = ws / "sub"
+        sub.mkdir()
+        (sub / ".gitignore").write_text("*.tmp\n", encoding="utf-8")
+        (sub / "a.tmp").write_text("x\n", encoding="utf-8")
+        (ws / "a.log").write_text("x\n", encoding="utf-8")
+        app = make_app(ws)
+        async with app.run_test() as pilot:
+            await pilot.wait_for_scheduled_animations()
+            assert app.sidebar is not None
+            tree = app.sidebar.explorer.directory_tree
+            sub_node = _child(tree.root, "sub")
+            sub_node.expand()
+            await wait_for_condition(pilot, lambda: len(sub_node.children) >= 1)
+            assert tree._is_gitignored(ws / "a.log", is_dir=False)
+            assert tree._is_gitignored(sub / "a.tmp", is_dir=False)
+            sentinel = ws / "untouched.log"
+            tree._gitignore_cache[sentinel] = True
+
+            # Atomic rewrite of sub/.gitignore: the listing changes too.
+            new_ignore = sub / ".gitignore.new"
+            new_ignore.write_text("nothing\n", encoding="utf-8")
+            os.replace(new_ignore, sub / ".gitignore")
+            st = (sub / ".gitignore").stat()
+            os.utime(sub / ".gitignore", ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+            await tree.refresh_dirs({sub})
+
+            assert not tree._is_gitignored(sub / "a.tmp", is_dir=False)
+            assert tree._is_gitignored(ws / "a.log", is_dir=False)
+            assert tree._gitignore_cache[sentinel] is True
+
+    async def test_g07_root_gitignore_change_reflags_loaded_subdirs(
+        self, tmp_path: Path
+    ):
+        """Refreshing a dir whose .gitignore changed re-flags loaded subdirs."""
+        ws = tmp_path / "ws"
+        ws.mkdir()
+        (ws / ".gitignore").write_text("*.tmp\n", encoding="utf-8")
+        sub = ws / "sub"
+        sub.mkdir()
+        (sub / "a.tmp").write_text("x\n", encoding="utf-8")
+        (sub / "b.py").write_text("x\n", encoding="utf-8")
+        app = make_app(ws)
+        async with app.run_test() as pilot:
+            await pilot.wait_for_scheduled_animations()
+            assert app.sidebar is not None
+            tree = app.sidebar.explorer.directory_tree
+            sub_node = _child(tree.root, "sub")
+            sub_node.expand()
+            await wait_for_condition(pilot, lambda: len(sub_node.children) >= 2)
+            # Verdicts arrived with the listing, before any render lookup.
+            assert tree._gitignore_cache[sub / "a.tmp"] is True
+            assert tree._gitignore_cache[sub / "b.py"] is False
+            a_tmp = _child(sub_node, "a.tmp")
+
+            (ws / ".gitignore").write_text("*.py\n", encoding="utf-8")
+            st = (ws / ".gitignore").stat()
+            os.utime(ws / ".gitignore", ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+            await tree.refresh_dirs({ws})
+
+            assert tree._gitignore_cache[sub / "a.tmp"] is False
+            assert tree._gitignore_cache[sub / "b.py"] is True
+            # The subtree was merged, not rebuilt.
+            assert _child(sub_node, "a.tmp") is a_tmp
+
+    async def test_g05_collapsed_dir_is_relisted_on_expand(self, tmp_path: Path):
+        """Changes made while a loaded folder was collapsed show on re-expand."""
+        ws = tmp_path / "ws"
+        ws.mkdir()
+        sub = ws / "sub"
+        sub.mkdir()
+        (sub / "old.py").write_text("x\n", encoding="utf-8")
+        app = make_app(ws)
+        async with app.run_test() as pilot:
+            await pilot.wait_for_scheduled_animations()
+            assert app.sidebar is not None
+            tree = app.sidebar.explorer.directory_tree
+            sub_node = _child(tree.root, "sub")
+            sub_node.expand()
+            await wait_for_condition(pilot, lambda: len(sub_node.children) == 1)
+            sub_node.collapse()
+            await pilot.wait_for_scheduled_animations()
+
+            (sub / "new.py").write_text("x\n", encoding="utf-8")
+            sub_node.expand()
+            await wait_for_condition(
+                pilot, lambda: _child_names(sub_node) == ["new.py", "old.py"]
+            )
+
+    async def test_g06_compact_chain_update(self, tmp_path: Path):
+        """A compact chain that gains a sibling entry is split on refresh."""
+        ws = tmp_path / "ws"
+        (ws / "src" / "main").mkdir(parents=True)
+        (ws / "src" / "main" / "app.py").write_text("x\n", encoding="utf-8")
+        app = make_app(ws)
+        async with app.run_test() as pilot:
+            await pilot.wait_for_scheduled_animations()
+            assert app.sidebar is not None
+            tree = app.sidebar.explorer.directory_tree
+            (node,) = tree.root.children
+            assert str(node.label) == "src/main"
+
+            (ws / "src" / "README.md").write_text("x\n", encoding="utf-8")
+            await tree.refresh_dirs({ws})
+
+            (node,) = tree.root.children
+            assert str(node.label) == "src"
+            assert node.data is not None
+            assert node.data.path == ws / "src"
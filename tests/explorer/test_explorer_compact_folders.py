@@ -288,6 +288,7 @@ class _FakeNode:
     """Minimal stand-in for a TreeNode, capturing add() calls."""
 
     def __init__(self):
+        self.id = 0
         self.children: list[_FakeChildNode] = []
 
     def remove_children(self):
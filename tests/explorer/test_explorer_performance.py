@@ -4,6 +4,8 @@ These tests verify:
 1. Lazy per-directory gitignore loading (no workspace-wide traversal)
 2. Background loading of git status (non-blocking render)
 3. os.scandir optimization with is_dir caching in _load_directory
+4. Paged population of directories with very many entries
+5. Idle-time prefetch of child directory listings
 """
 
 from __future__ import annotations
@@ -14,7 +16,8 @@ from unittest.mock import patch
 
 import pytest
 
-from tests.conftest import make_app
+from tests.conftest import make_app, wait_for_condition
+from textual_code.directory_scanner import get_directory_scanner
 from textual_code.widgets.explorer import FilteredDirectoryTree
 
 # ── os.scandir optimization tests ────────────────────────────────────────────
@@ -140,30 +143,23 @@ class TestLazyGitignoreLoading:
         (sub / ".gitignore").write_text("*.tmp\n")
 
         tree = FilteredDirectoryTree(ws)
-        # _gitignore_checked_dirs should exist and be empty
-        assert hasattr(tree, "_gitignore_checked_dirs")
-        assert len(tree._gitignore_checked_dirs) == 0
-        # No specs loaded yet
-        specs = tree._get_gitignore_specs()
-        assert len(specs) == 0
+        # Nothing is matched or recorded until a directory is listed
+        assert tree._gitignore_mtimes == {}
+        assert tree._gitignore_cache == {}
 
     def test_c02_lazy_loads_on_is_gitignored_call(self, tmp_path: Path):
-        """_is_gitignored lazily loads ancestor gitignore files."""
+        """_is_gitignored falls back to the shared matcher for unlisted paths."""
         ws = tmp_path / "ws"
         ws.mkdir()
         (ws / ".gitignore").write_text("*.log\n")
         (ws / "debug.log").touch()
 
         tree = FilteredDirectoryTree(ws)
-        # Before: no specs
-        assert len(tree._get_gitignore_specs()) == 0
-        # Calling _is_gitignored triggers lazy load for ancestor dirs
+        assert (ws / "debug.log") not in tree._gitignore_cache
         result = tree._is_gitignored(ws / "debug.log")
         assert result is True
-        # After: root .gitignore loaded
-        assert len(tree._get_gitignore_specs()) == 1
-        # Root dir should be in checked set
-        assert ws in tree._gitignore_checked_dirs
+        # The verdict is cached for the next render
+        assert tree._gitignore_cache[ws / "debug.log"] is True
 
     def test_c03_skips_hidden_ancestor_dirs(self, tmp_path: Path):
         """Lazy loading skips .gitignore in hidden directory ancestors."""
@@ -194,7 +190,7 @@ class TestLazyGitignoreLoading:
         assert result is True
 
     def test_c05_only_loads_ancestors_not_siblings(self, tmp_path: Path):
-        """Lazy load only checks ancestor dirs, not sibling dirs."""
+        """Only ancestor .gitignore files apply, not sibling ones."""
         ws = tmp_path / "ws"
         ws.mkdir()
         (ws / ".gitignore").write_text("*.log\n")
@@ -206,25 +202,178 @@ class TestLazyGitignoreLoading:
         (docs / ".gitignore").write_text("*.bak\n")
 
         tree = FilteredDirectoryTree(ws)
-        # Check a file in src/ — should load root and src gitignores
-        tree._is_gitignored(src / "app.tmp")
-        checked = tree._gitignore_checked_dirs
-        assert ws in checked
-        assert src in checked
-        # docs/ should NOT be checked (it's a sibling, not an ancestor)
-        assert docs not in checked
+        assert tree._is_gitignored(src / "app.tmp", is_dir=False) is True
+        assert tree._is_gitignored(src / "app.log", is_dir=False) is True
+        # docs/.gitignore is a sibling: its rules do not reach src/
+        assert tree._is_gitignored(src / "app.bak", is_dir=False) is False
 
     def test_c06_reload_clears_checked_dirs(self, tmp_path: Path):
-        """reload() clears _gitignore_checked_dirs for re-discovery."""
+        """reload() clears the recorded verdicts for re-discovery."""
         ws = tmp_path / "ws"
         ws.mkdir()
         (ws / ".gitignore").write_text("*.log\n")
 
         tree = FilteredDirectoryTree(ws)
+        tree._load_directory_sync(ws)
         tree._is_gitignored(ws / "test.log")
-        assert len(tree._gitignore_checked_dirs) > 0
+        assert len(tree._gitignore_mtimes) > 0
         # Simulate reload cache clearing
-        tree._gitignore_specs = None
-        tree._gitignore_checked_dirs.clear()
+        tree._gitignore_mtimes.clear()
         tree._gitignore_cache.clear()
-        assert len(tree._gitignore_checked_dirs) == 0
+        assert len(tree._gitignore_mtimes) == 0
+
+    def test_c07_listing_records_verdicts(self, tmp_path: Path):
+        """A directory listing carries the ignored flags of its entries."""
+        ws = tmp_path / "ws"
+        ws.mkdir()
+        (ws / ".gitignore").write_text("*.log\n")
+        (ws / "test.log").touch()
+        (ws / "app.py").touch()
+
+        tree = FilteredDirectoryTree(ws)
+        tree._load_directory_sync(ws)
+        assert tree._gitignore_cache[ws / "test.log"] is True
+        assert tree._gitignore_cache[ws / "app.py"] is False
+        assert tree._gitignore_mtimes[ws] is not None
+
+
+# ── Paged directories ────────────────────────────────────────────────────────
+
+
+def _make_big_dir(ws: Path, count: int) -> Path:
+    big = ws / "big"
+    big.mkdir(parents=True)
+    for i in range(count):
+        (big / f"f{i:03d}.txt").touch()
+    return big
+
+
+def _entry_names(node) -> list[str]:
+    return [c.data.path.name for c in node.children if c.data is not None]
+
+
+@patch.object(FilteredDirectoryTree, "_PAGE_SIZE", 10)
+class TestPagedDirectories:
+    async def _expand(self, pilot, tree, path: Path):
+        node = await tree.reveal_path(path / "f000.txt")
+        assert node is not None and node.parent is not None
+        await pilot.wait_for_scheduled_animations()
+        return node.parent
+
+    async def test_d01_large_dir_shows_first_page(self, tmp_path: Path):
+        """Only one page of a big listing gets nodes; the rest waits."""
+        big = _make_big_dir(tmp_path / "ws", 25)
+        app = make_app(tmp_path / "ws")
+        async with app.run_test() as pilot:
+            await pilot.wait_for_scheduled_animations()
+            assert app.sidebar is not None
+            tree = app.sidebar.explorer.directory_tree
+            node = await self._expand(pilot, tree, big)
+            assert _entry_names(node) == [f"f{i:03d}.txt" for i in range(10)]
+            more = node.children[-1]
+            assert more.data is None
+            assert "15 more" in str(more.label)
+            assert tree.find_node(big / "f020.txt") is None
+
+    async def test_d02_highlighting_load_more_shows_next_page(self, tmp_path: Path):
+        """Moving the cursor onto "load more" pages in and keeps the row."""
+        big = _make_big_dir(tmp_path / "ws", 25)
+        app = make_app(tmp_path / "ws")
+        async with app.run_test() as pilot:
+            await pilot.wait_for_scheduled_animations()
+            assert app.sidebar is not None
+            tree = app.sidebar.explorer.directory_tree
+            node = await self._expand(pilot, tree, big)
+            tree.move_cursor(node.children[-1])
+            await pilot.wait_for_scheduled_animations()
+            assert len(_entry_names(node)) == 20
+            assert tree.cursor_node is not None
+            assert tree.cursor_node.data is not None
+            assert tree.cursor_node.data.path == big / "f010.txt"
+            tree.show_more(node)
+            assert len(_entry_names(node)) == 25
+            assert node.children[-1].data is not None  # no more row left
+
+    async def test_d03_reveal_pages_in_target(self, tmp_path: Path):
+        """reveal_path shows pages until the requested entry has a node."""
+        big = _make_big_dir(tmp_path / "ws", 25)
+        app = make_app(tmp_path / "ws")
+        async with app.run_test() as pilot:
+            await pilot.wait_for_scheduled_animations()
+            assert app.sidebar is not None
+            tree = app.sidebar.explorer.directory_tree
+            node = await tree.reveal_path(big / "f022.txt")
+            assert node is not None
+            assert tree.cursor_node is node
+            assert len(_entry_names(node.parent)) == 25
+
+    async def test_d04_refresh_keeps_shown_entries(self, tmp_path: Path):
+        """A subtree refresh keeps the shown window and updates the tail."""
+        big = _make_big_dir(tmp_path / "ws", 25)
+        app = make_app(tmp_path / "ws")
+        async with app.run_test() as pilot:
+            await pilot.wait_for_scheduled_animations()
+            assert app.sidebar is not None
+            tree = app.sidebar.explorer.directory_tree
+            node = await self._expand(pilot, tree, big)
+            tree.show_more(node)
+            first = node.children[0]
+            (big / "f999.txt").touch()
+            await tree.refresh_dirs({big})
+            assert len(_entry_names(node)) == 20
+            assert node.children[0] is first
+            assert "6 more" in str(node.children[-1].label)
+
+
+# ── Listing prefetch ─────────────────────────────────────────────────────────
+
+
+def _backdate(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - 60 * 10**9))
+
+
+@patch.object(FilteredDirectoryTree, "_PREFETCH_DELAY", 0.01)
+class TestListingPrefetch:
+    async def test_e01_expanding_prefetched_dir_skips_scan(self, tmp_path: Path):
+        """Subdirectories of a populated folder are listed while idle."""
+        ws = tmp_path / "ws"
+        deep = ws / "deep"
+        (deep / "a").mkdir(parents=True)
+        (deep / "b").mkdir()
+        # The listing depends on the subdirectories' mtimes too.
+        for path in (deep / "a", deep / "b", deep):
+            _backdate(path)
+        app = make_app(ws)
+        async with app.run_test() as pilot:
+            await pilot.wait_for_scheduled_animations()
+            assert app.sidebar is not None
+            tree = app.sidebar.explorer.directory_tree
+            key = (deep, tree.show_hidden_files, tree.compact_folders, ws)
+            cache = get_directory_scanner().cache
+            await wait_for_condition(
+                pilot,
+                lambda: cache.get(key, deep.stat().st_mtime_ns) is not None,
+                msg="deep/ was not prefetched",
+            )
+            with patch(
+                "textual_code.directory_scanner.scan_directory_listing",
+                side_effect=AssertionError("should come from the cache"),
+            ):
+                node = await tree.reveal_path(deep / "a")
+            assert node is not None
+            assert tree.find_node(deep / "b") is not None
+
+    def test_e02_prefetch_targets(self, tmp_path: Path):
+        """An unlisted folder prefetches itself; files prefetch nothing."""
+        ws = tmp_path / "ws"
+        (ws / "sub").mkdir(parents=True)
+        (ws / "f.txt").touch()
+        tree = FilteredDirectoryTree(ws)
+        assert tree.root.data is not None
+        tree.root.data.loaded = True
+        tree._populate_node(tree.root, tree._load_directory_sync(ws))
+        sub, file = tree.root.children
+        assert tree._prefetch_targets(sub) == [ws / "sub"]
+        assert tree._prefetch_targets(file) == []
+        assert tree._prefetch_targets(tree.root) == [ws / "sub"]
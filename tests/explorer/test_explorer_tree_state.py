@@ -376,7 +376,7 @@ async def test_select_file_expands_collapsed_parent(
         assert not alpha_node.is_expanded
 
         # Select inner.py inside dir_alpha — should trigger auto-expansion
-        # (triggers _load_directory worker for dir_alpha via run_cancellable)
+        # (triggers _load_directory worker for dir_alpha via the shared scanner)
         explorer.select_file(state_tree["inner"])
         await wait_for_condition(
             pilot,
@@ -417,7 +417,7 @@ async def test_select_file_expands_deeply_nested_path(
         tree = explorer.directory_tree
 
         # Select deep.py (two levels deep — each level triggers a
-        # _load_directory worker via run_cancellable).
+        # _load_directory worker via the shared scanner).
         explorer.select_file(state_tree["deep"])
         await wait_for_condition(
             pilot,
@@ -447,6 +447,50 @@ async def test_select_file_expands_deeply_nested_path(
         assert cursor.data.path == state_tree["deep"]
 
 
+async def test_reveal_path_loads_folders_in_one_pass(
+    workspace: Path, state_tree: dict[str, Path]
+):
+    """reveal_path() awaits each folder load and returns the revealed node."""
+    app = make_app(workspace)
+    async with app.run_test(size=(120, 40)) as pilot:
+        await pilot.wait_for_scheduled_animations()
+
+        assert app.sidebar is not None
+        tree = app.sidebar.explorer.directory_tree
+
+        node = await tree.reveal_path(state_tree["deep"])
+
+        assert node is not None
+        assert node is tree.find_node(state_tree["deep"])
+        assert tree.cursor_node is node
+        assert tree.find_node(state_tree["sub_beta"]) is node.parent
+        assert node.parent is not None and node.parent.is_expanded
+        assert await tree.reveal_path(state_tree["dir_beta"] / "missing.py") is None
+
+
+async def test_node_index_tracks_reload_and_refresh(
+    workspace: Path, state_tree: dict[str, Path]
+):
+    """The path index follows populate, subtree refresh and full reload."""
+    app = make_app(workspace)
+    async with app.run_test(size=(120, 40)) as pilot:
+        await pilot.wait_for_scheduled_animations()
+
+        assert app.sidebar is not None
+        tree = app.sidebar.explorer.directory_tree
+        await tree.reveal_path(state_tree["inner"])
+        assert tree.find_node(state_tree["inner"]) is not None
+
+        state_tree["inner"].unlink()
+        await tree.refresh_dirs({state_tree["dir_alpha"]})
+        assert tree.find_node(state_tree["inner"]) is None
+
+        await tree.reload()
+        mmm = tree.find_node(state_tree["mmm"])
+        assert mmm is not None
+        assert mmm in tree.root.children
+
+
 # ── Cursor Position After Operations ─────────────────────────────────────────
 
 
@@ -5,9 +5,12 @@ Verifies that a confirmation modal is shown before copying, deleting,
 or moving directories that exceed the configured size threshold.
 """
 
+import os
 import stat
 import sys
+import threading
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -15,7 +18,9 @@ from tests.conftest import await_workers, make_app, wait_for_condition
 from textual_code.app import TextualCode
 from textual_code.modals import DeleteFileModalScreen
 from textual_code.modals.file_ops import LargeDirWarningModalScreen
+from textual_code.subprocess_tasks import DirSizeCache, calc_dir_size
 from textual_code.widgets.explorer import Explorer
+from textual_code.widgets.progress_toast import ProgressToast
 
 # ── Helpers ────────────────────────────────────────────────────────────
 
@@ -113,6 +118,58 @@ def test_calc_dir_size_threshold_zero_scans_all(tmp_path: Path):
     assert count == 10
 
 
+def _count_measured(path: Path, cache: DirSizeCache) -> tuple[int, int, int]:
+    """Run calc_dir_size and also return how many directories were listed."""
+    import textual_code.subprocess_tasks as tasks
+
+    listed: list[str] = []
+    real = tasks._measure_dir
+
+    def counting(directory: str):
+        listed.append(directory)
+        return real(directory)
+
+    with patch.object(tasks, "_measure_dir", counting):
+        total, count = calc_dir_size(path, cache=cache)
+    return total, count, len(listed)
+
+
+def test_calc_dir_size_cache_skips_unchanged_dirs(tmp_path: Path):
+    """A second measurement of an unchanged tree lists no directory."""
+    d = tmp_path / "root"
+    (d / "a" / "b").mkdir(parents=True)
+    (d / "x.txt").write_bytes(b"x" * 10)
+    (d / "a" / "b" / "y.txt").write_bytes(b"x" * 20)
+    cache = DirSizeCache()
+    assert _count_measured(d, cache) == (30, 2, 3)
+    assert _count_measured(d, cache) == (30, 2, 0)
+
+    # A new file bumps only its directory's mtime.
+    (d / "a" / "z.txt").write_bytes(b"x" * 5)
+    st = (d / "a").stat()
+    os.utime(d / "a", ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert _count_measured(d, cache) == (35, 3, 1)
+
+
+def test_calc_dir_size_reports_progress(tmp_path: Path):
+    """The progress callback receives running totals."""
+    d = _make_dir_with_size(tmp_path, "data", file_size=10, count=3)
+    reports: list[tuple[int, int]] = []
+    total, count = calc_dir_size(
+        d, progress=lambda t, c: reports.append((t, c)), progress_interval=0
+    )
+    assert (total, count) == (30, 3)
+    assert reports == [(30, 3)]
+
+
+def test_calc_dir_size_cancel_returns_partial(tmp_path: Path):
+    """A set cancel event stops the scan before any directory is listed."""
+    d = _make_dir_with_size(tmp_path, "data", file_size=10, count=3)
+    cancel = threading.Event()
+    cancel.set()
+    assert calc_dir_size(d, cancel=cancel) == (0, 0)
+
+
 # ── Integration tests: delete ─────────────────────────────────────────
 
 
@@ -376,3 +433,27 @@ async def test_dir_removed_during_size_calc(workspace: Path):
 
     # Should not crash — directory was already gone
     assert not ghost.exists()
+
+
+async def test_size_check_error_closes_toast(workspace: Path):
+    """The measuring toast is closed when the size check raises."""
+    bigdir = _make_dir_with_size(workspace, "bigdir", file_size=10, count=2)
+    proceed = threading.Event()
+
+    def _fail(*args, **kwargs):
+        raise PermissionError("denied")
+
+    app = make_app(workspace)
+    app.default_large_dir_threshold = 100
+    async with app.run_test() as pilot:
+        await pilot.wait_for_scheduled_animations()
+        with (
+            patch("textual_code.app.calc_dir_size", _fail),
+            patch.object(ProgressToast, "close", autospec=True) as close,
+        ):
+            app._check_dir_size_and_proceed(bigdir, "Delete", proceed.set)
+            await await_workers(pilot)
+
+    close.assert_called_once()
+    assert not proceed.is_set()
+    assert bigdir.exists()
@@ -12,12 +12,16 @@ Behaviour spec:
 - Case-sensitive matching
 """
 
+import re
+import threading
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from textual.widgets import Input
 
-from tests.conftest import make_app
+from tests.conftest import make_app, wait_for_condition
+from textual_code.widgets.code_editor_helpers import _replace_all_matches
 from textual_code.widgets.find_replace_bar import FindReplaceBar
 
 # ── fixtures ──────────────────────────────────────────────────────────────────
@@ -686,3 +690,52 @@ async def test_replace_single_no_match_anywhere_shows_warning(
         await pilot.wait_for_scheduled_animations()
 
         assert editor.text == original_text
+
+
+# ── Replace All: large buffers ───────────────────────────────────────────────
+
+
+def test_replace_all_job_builds_text_beyond_max_edits():
+    """Many replacements come back as one new text instead of ranged edits."""
+    pattern = re.compile("a")
+    ranged = _replace_all_matches(pattern, "bb", "a-a-a", max_edits=3)
+    assert ranged is not None and ranged.new_text is None
+    assert ranged.edits == [(0, 1, "bb"), (2, 3, "bb"), (4, 5, "bb")]
+    swap = _replace_all_matches(pattern, "bb", "a-a-a", max_edits=2)
+    assert swap is not None and swap.count == 3 and swap.new_text == "bb-bb-bb"
+
+
+def test_replace_all_job_stops_when_cancelled():
+    cancel = threading.Event()
+    cancel.set()
+    assert _replace_all_matches(re.compile("x"), "y", "x" * 10_000, cancel) is None
+
+
+@pytest.mark.parametrize("max_edits", [1000, 10])
+async def test_background_replace_all_is_one_undo_step(workspace: Path, max_edits: int):
+    """A large Replace All runs in the background, as ranged edits or one swap."""
+    f = workspace / "big.txt"
+    original = "".join(f"row {i} foo\n" for i in range(300))
+    f.write_text(original)
+    app = make_app(workspace, light=True, open_file=f)
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        editor = app.main_view.get_active_code_editor()
+        assert editor is not None
+        with (
+            patch("textual_code.widgets.code_editor._BACKGROUND_REPLACE_CHARS", 100),
+            patch(
+                "textual_code.widgets.code_editor_helpers._REPLACE_ALL_MAX_EDITS",
+                max_edits,
+            ),
+        ):
+            editor.on_find_replace_bar_replace_all(
+                FindReplaceBar.ReplaceAll("foo", "bar", False, True)
+            )
+            await app.workers.wait_for_complete()
+        await wait_for_condition(
+            pilot, lambda: "foo" not in editor.editor.text, msg="not replaced"
+        )
+        assert editor.editor.text.count("bar") == 300
+        editor.editor.action_undo()
+        assert editor.editor.text == original
@@ -19,7 +19,12 @@ from pathlib import Path
 import pytest
 from textual.message import Message
 
-from tests.conftest import assert_focus_on_leaf, make_app, wait_for_condition
+from tests.conftest import (
+    assert_focus_on_leaf,
+    await_workers,
+    make_app,
+    wait_for_condition,
+)
 from textual_code.widgets.draggable_tabs_content import DraggableTabbedContent
 from textual_code.widgets.split_tree import BranchNode, all_leaves
 
@@ -824,12 +829,196 @@ async def test_split_editors_sync_on_save(workspace: Path, py_file: Path):
         left_editor.replace_editor_text(new_text)
         await pilot.wait_for_scheduled_animations()
         left_editor.action_save()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
         assert right_editor.initial_text == new_text
         assert right_editor._file_mtime == left_editor._file_mtime
 
 
+async def test_split_editors_share_one_document(workspace: Path, py_file: Path):
+    """Both views edit one document and history; each keeps its own cursor."""
+    py_file.write_text("a\nb\nc\n", encoding="utf-8")
+    app = make_app(workspace, open_file=py_file, light=True)
+    async with app.run_test() as pilot:
+        await pilot.wait_for_scheduled_animations()
+        await app.main_view.action_split_right()
+        await pilot.wait_for_scheduled_animations()
+
+        leaves = all_leaves(app.main_view._split_root)
+        left = app.main_view._get_active_code_editor_in_leaf(leaves[0])
+        right = app.main_view._get_active_code_editor_in_leaf(leaves[1])
+        assert left is not None and right is not None
+        assert left.editor.document is right.editor.document
+        assert left.editor.history is right.editor.history
+
+        right.editor.cursor_location = (2, 1)
+        left.editor.cursor_location = (0, 0)
+        left.editor.insert("new\n")
+        await pilot.wait_for_scheduled_animations()
+        assert right.text == "new\na\nb\nc\n"
+        assert right.title == "main.py*"
+        # The right cursor stays on "c", which moved down a row.
+        assert right.editor.cursor_location == (3, 1)
+        assert right.editor.wrapped_document.height == 5
+
+        right.editor.undo()
+        await pilot.wait_for_scheduled_animations()
+        assert left.text == "a\nb\nc\n"
+        assert left.title == "main.py"
+
+
+async def test_split_of_unsaved_file_shows_unsaved_text(workspace: Path, py_file: Path):
+    """A new view of a modified file opens with the unsaved text."""
+    app = make_app(workspace, open_file=py_file, light=True)
+    async with app.run_test() as pilot:
+        await pilot.wait_for_scheduled_animations()
+        editor = app.main_view.get_active_code_editor()
+        assert editor is not None
+        editor.editor.insert("# draft\n", (0, 0))
+        await pilot.wait_for_scheduled_animations()
+        await app.main_view.action_split_right()
+        await pilot.wait_for_scheduled_animations()
+
+        right = app.main_view.get_active_code_editor()
+        assert right is not None and right is not editor
+        assert right.text == "# draft\nprint('hello')\n"
+        assert right.initial_text == "print('hello')\n"
+
+
+async def test_lazy_remount_rejoins_shared_document(
+    workspace: Path, py_file: Path, py_file2: Path
+):
+    """A view unmounted by a tab switch shares the document again on remount."""
+    app = make_app(workspace, open_file=py_file, light=True)
+    async with app.run_test() as pilot:
+        await pilot.wait_for_scheduled_animations()
+        await app.main_view.action_split_right()
+        await pilot.wait_for_scheduled_animations()
+        leaves = all_leaves(app.main_view._split_root)
+        left = app.main_view._get_active_code_editor_in_leaf(leaves[0])
+        assert left is not None
+        right_pane_id = leaves[1].opened_files[py_file]
+
+        await app.main_view.action_open_code_editor(path=py_file2)
+        await pilot.wait_for_scheduled_animations()
+        assert right_pane_id in app.main_view._editor_states
+        left.editor.insert("# edited\n", (0, 0))
+        await pilot.wait_for_scheduled_animations()
+        assert app.main_view._editor_states[right_pane_id].text.startswith("# edited")
+
+        app.main_view.focus_pane(right_pane_id)
+        await wait_for_condition(
+            pilot,
+            lambda: right_pane_id not in app.main_view._editor_states,
+            msg="right view not remounted",
+        )
+        right = app.main_view._get_active_code_editor_in_leaf(leaves[1])
+        assert right is not None
+        assert right.editor.document is left.editor.document
+        assert right.text.startswith("# edited")
+
+
+async def test_save_as_from_split_view_leaves_shared_document(
+    workspace: Path, py_file: Path
+):
+    """A view saved as another file stops editing the old file's document."""
+    new_path = workspace / "copy.py"
+    app = make_app(workspace, open_file=py_file, light=True)
+    async with app.run_test() as pilot:
+        await pilot.wait_for_scheduled_animations()
+        await app.main_view.action_split_right()
+        await pilot.wait_for_scheduled_animations()
+        leaves = all_leaves(app.main_view._split_root)
+        left = app.main_view._get_active_code_editor_in_leaf(leaves[0])
+        right = app.main_view._get_active_code_editor_in_leaf(leaves[1])
+        assert left is not None and right is not None
+        right.editor.cursor_location = (0, 5)
+
+        right._save_as_in_background(new_path, None)
+        await app.workers.wait_for_complete()
+        await pilot.wait_for_scheduled_animations()
+        assert right.path == new_path
+        assert right.editor.document is not left.editor.document
+        assert right.editor.history is not left.editor.history
+        assert right.editor.cursor_location == (0, 5)
+
+        right.editor.insert("# copy\n", (0, 0))
+        await pilot.wait_for_scheduled_animations()
+        assert right.text == "# copy\nprint('hello')\n"
+        assert left.text == "print('hello')\n"
+        assert left.title == "main.py"
+        assert not left.editor.history.undo_stack
+
+
+async def test_lazy_remount_after_save_as_keeps_old_file_text(
+    workspace: Path, py_file: Path, py_file2: Path
+):
+    """An unmounted view of the old file does not pick up the renamed view's edits."""
+    app = make_app(workspace, open_file=py_file, light=True)
+    async with app.run_test() as pilot:
+        await pilot.wait_for_scheduled_animations()
+        await app.main_view.action_split_right()
+        await pilot.wait_for_scheduled_animations()
+        leaves = all_leaves(app.main_view._split_root)
+        right_pane_id = leaves[1].opened_files[py_file]
+        await app.main_view.action_open_code_editor(path=py_file2)
+        await pilot.wait_for_scheduled_animations()
+        assert app.main_view._editor_states[right_pane_id].document is not None
+
+        left = app.main_view._get_active_code_editor_in_leaf(leaves[0])
+        assert left is not None
+        left._save_as_in_background(workspace / "copy.py", None)
+        await app.workers.wait_for_complete()
+        left.editor.insert("# copy\n", (0, 0))
+        await pilot.wait_for_scheduled_animations()
+
+        app.main_view.focus_pane(right_pane_id)
+        await wait_for_condition(
+            pilot,
+            lambda: right_pane_id not in app.main_view._editor_states,
+            msg="right view not remounted",
+        )
+        right = app.main_view._get_active_code_editor_in_leaf(leaves[1])
+        assert right is not None
+        assert right.text == "print('hello')\n"
+        assert right.editor.document is not left.editor.document
+
+
+async def test_lazy_remount_drops_document_left_by_every_view(
+    workspace: Path, py_file: Path, py_file2: Path
+):
+    """A remounted view does not adopt a shared document that fell behind."""
+    app = make_app(workspace, open_file=py_file, light=True)
+    async with app.run_test() as pilot:
+        await pilot.wait_for_scheduled_animations()
+        await app.main_view.action_split_right()
+        await pilot.wait_for_scheduled_animations()
+        leaves = all_leaves(app.main_view._split_root)
+        right_pane_id = leaves[1].opened_files[py_file]
+        await app.main_view.action_open_code_editor(path=py_file2)
+        await pilot.wait_for_scheduled_animations()
+        stale = app.main_view._editor_states[right_pane_id].document
+        assert stale is not None
+
+        left = app.main_view._get_active_code_editor_in_leaf(leaves[0])
+        assert left is not None
+        left.editor.leave_shared_document()
+        left.editor.insert("# edited\n", (0, 0))
+        await pilot.wait_for_scheduled_animations()
+
+        app.main_view.focus_pane(right_pane_id)
+        await wait_for_condition(
+            pilot,
+            lambda: right_pane_id not in app.main_view._editor_states,
+            msg="right view not remounted",
+        )
+        right = app.main_view._get_active_code_editor_in_leaf(leaves[1])
+        assert right is not None
+        assert right.text == "# edited\nprint('hello')\n"
+        assert right.editor.document is not stale.document
+
+
 async def test_find_replace_bar_focus_keeps_active_split(
     workspace: Path, py_file: Path
 ):
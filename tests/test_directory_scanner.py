@@ -0,0 +1,349 @@
+"""Tests for the shared, thread-based directory scanner."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from textual_code.directory_scanner import (
+    DirectoryListing,
+    DirectoryScanner,
+    ListingCache,
+    get_directory_scanner,
+    scan_directory_listing,
+)
+from textual_code.subprocess_tasks import resolve_compact_chains, scan_directory_sync
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    """Backdate *path* so its listing is outside the racy-mtime window."""
+    st = path.stat()
+    mtime = st.st_mtime_ns - seconds * 10**9
+    os.utime(path, ns=(st.st_atime_ns, mtime))
+
+
+def _make_tree(root: Path) -> None:
+    (root / "b_dir").mkdir()
+    (root / "a_dir").mkdir()
+    (root / "z.txt").write_text("z", encoding="utf-8")
+    (root / ".hidden").write_text("h", encoding="utf-8")
+
+
+@pytest.mark.asyncio
+async def test_scan_matches_scan_directory_sync(tmp_path: Path) -> None:
+    """Threaded scan returns the same listing as the synchronous scan."""
+    _make_tree(tmp_path)
+    scanner = DirectoryScanner(max_workers=2)
+    result = await scanner.scan(tmp_path, False)
+    paths, is_dir = scan_directory_sync(tmp_path, False)
+    assert result == DirectoryListing(paths, is_dir, {})
+
+
+@pytest.mark.asyncio
+async def test_scan_many_batches_directories(tmp_path: Path) -> None:
+    """scan_many returns one listing per requested directory."""
+    _make_tree(tmp_path)
+    scanner = DirectoryScanner(max_workers=2)
+    results = await scanner.scan_many(
+        [tmp_path, tmp_path / "a_dir", tmp_path / "b_dir"], True
+    )
+    assert set(results) == {tmp_path, tmp_path / "a_dir", tmp_path / "b_dir"}
+    assert results[tmp_path / "a_dir"].paths == []
+    assert tmp_path / ".hidden" in results[tmp_path].paths
+
+
+@pytest.mark.asyncio
+async def test_scan_many_skips_failed_directories(tmp_path: Path) -> None:
+    """A directory whose scan raises is omitted instead of failing the batch."""
+    _make_tree(tmp_path)
+    scanner = DirectoryScanner(max_workers=2)
+    real_scan = scan_directory_listing
+
+    def flaky(path: Path, show_hidden: bool, compact: bool, root: Path | None):
+        if path.name == "b_dir":
+            raise OSError("boom")
+        return real_scan(path, show_hidden, compact, root)
+
+    with patch("textual_code.directory_scanner.scan_directory_listing", flaky):
+        results = await scanner.scan_many([tmp_path, tmp_path / "b_dir"], False)
+    assert set(results) == {tmp_path}
+
+
+@pytest.mark.asyncio
+async def test_in_flight_requests_are_deduplicated(tmp_path: Path) -> None:
+    """Concurrent scans of the same directory share a single scandir pass."""
+    release = threading.Event()
+    calls: list[Path] = []
+
+    def slow_scan(path: Path, show_hidden: bool, compact: bool, root: Path | None):
+        calls.append(path)
+        release.wait(5)
+        return DirectoryListing([], {}, {})
+
+    scanner = DirectoryScanner(max_workers=4)
+    with patch("textual_code.directory_scanner.scan_directory_listing", slow_scan):
+        tasks = [asyncio.create_task(scanner.scan(tmp_path, False)) for _ in range(5)]
+        await asyncio.sleep(0.05)
+        release.set()
+        results = await asyncio.gather(*tasks)
+    assert calls == [tmp_path]
+    assert all(r.paths == [] for r in results)
+
+
+@pytest.mark.asyncio
+async def test_stuck_scan_is_abandoned_on_timeout(tmp_path: Path) -> None:
+    """A hung scan times out and its worker slot is replaced."""
+    release = threading.Event()
+
+    def maybe_stuck(path: Path, show_hidden: bool, compact: bool, root: Path | None):
+        if path.name == "stuck":
+            release.wait(5)
+        return DirectoryListing([], {}, {})
+
+    (tmp_path / "stuck").mkdir()
+    (tmp_path / "ok").mkdir()
+    scanner = DirectoryScanner(max_workers=1)
+    try:
+        with patch(
+            "textual_code.directory_scanner.scan_directory_listing", maybe_stuck
+        ):
+            with pytest.raises(TimeoutError, match="timed out"):
+                await scanner.scan(tmp_path / "stuck", False, timeout=0.1)
+            # The single slot went to a fresh thread, so other scans proceed.
+            result = await scanner.scan(tmp_path / "ok", False, timeout=2.0)
+        assert result.paths == []
+    finally:
+        release.set()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_shared_scan(tmp_path: Path) -> None:
+    """Cancelling one waiter leaves the scan running for the others."""
+    release = threading.Event()
+
+    def slow_scan(path: Path, show_hidden: bool, compact: bool, root: Path | None):
+        release.wait(5)
+        return DirectoryListing([path], {path: False}, {})
+
+    scanner = DirectoryScanner(max_workers=1)
+    with patch("textual_code.directory_scanner.scan_directory_listing", slow_scan):
+        first = asyncio.create_task(scanner.scan(tmp_path, False))
+        second = asyncio.create_task(scanner.scan(tmp_path, False))
+        await asyncio.sleep(0.05)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        release.set()
+        assert await second == DirectoryListing([tmp_path], {tmp_path: False}, {})
+
+
+@pytest.mark.asyncio
+async def test_scan_resolves_compact_chains(tmp_path: Path) -> None:
+    """compact_folders=True returns collapsed chains with the listing."""
+    (tmp_path / "src" / "main" / "java").mkdir(parents=True)
+    (tmp_path / "src" / "main" / "java" / "App.java").touch()
+    (tmp_path / "lib").mkdir()
+    (tmp_path / "lib" / "a.py").touch()
+    (tmp_path / "lib" / "b.py").touch()
+    scanner = DirectoryScanner(max_workers=1)
+    listing = await scanner.scan(tmp_path, False, compact_folders=True)
+    root = tmp_path.resolve()
+    assert listing.compact_chains == {
+        root / "src": ("src/main/java", root / "src" / "main" / "java")
+    }
+
+
+def test_compact_chain_through_symlink_is_matched_as_shown(tmp_path: Path) -> None:
+    """A chain through a symlink is gitignored by its path, not its target."""
+    (tmp_path / "vendor" / "x" / "out").mkdir(parents=True)
+    (tmp_path / "vendor" / "x" / "out" / "a.o").touch()
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "lnk").symlink_to(tmp_path / "vendor" / "x")
+    (tmp_path / ".gitignore").write_text("/pkg/lnk/\n", encoding="utf-8")
+    listing = scan_directory_listing(tmp_path, False, True, tmp_path)
+    label, deepest = listing.compact_chains[tmp_path / "pkg"]
+    assert label == "pkg/lnk/out"
+    assert deepest in listing.ignored
+    assert tmp_path / "vendor" not in listing.ignored
+
+
+@pytest.mark.asyncio
+async def test_cached_listing_is_reused_until_mtime_changes(tmp_path: Path) -> None:
+    """use_cache=True skips the scan while the directory mtime is unchanged."""
+    _make_tree(tmp_path)
+    _age(tmp_path)
+    calls: list[Path] = []
+    real_scan = scan_directory_listing
+
+    def counting(path: Path, show_hidden: bool, compact: bool, root: Path | None):
+        calls.append(path)
+        return real_scan(path, show_hidden, compact, root)
+
+    scanner = DirectoryScanner(max_workers=1)
+    with patch("textual_code.directory_scanner.scan_directory_listing", counting):
+        first = await scanner.scan(tmp_path, False, use_cache=True)
+        assert await scanner.scan(tmp_path, False, use_cache=True) is first
+        assert len(calls) == 1
+        # A fresh scan bypasses the cache.
+        await scanner.scan(tmp_path, False)
+        assert len(calls) == 2
+        (tmp_path / "new.txt").touch()
+        _age(tmp_path, 30)
+        listing = await scanner.scan(tmp_path, False, use_cache=True)
+    assert len(calls) == 3
+    assert tmp_path / "new.txt" in listing.paths
+
+
+@pytest.mark.asyncio
+async def test_cached_compact_chain_follows_subdirectory_changes(
+    tmp_path: Path,
+) -> None:
+    """A chain that stops collapsing is re-scanned though the parent is unchanged."""
+    (tmp_path / "src" / "main").mkdir(parents=True)
+    (tmp_path / "src" / "main" / "App.java").touch()
+    for path in (tmp_path / "src" / "main", tmp_path / "src", tmp_path):
+        _age(path)
+    scanner = DirectoryScanner(max_workers=1)
+    first = await scanner.scan(tmp_path, False, compact_folders=True, use_cache=True)
+    assert tmp_path / "src" in first.compact_chains
+    assert len(scanner.cache) == 1
+    (tmp_path / "src" / "README").touch()
+    _age(tmp_path / "src", 30)
+    listing = await scanner.scan(tmp_path, False, compact_folders=True, use_cache=True)
+    assert listing.compact_chains == {}
+
+
+@pytest.mark.asyncio
+async def test_cached_ignore_flags_follow_ancestor_gitignore(tmp_path: Path) -> None:
+    """Editing a parent's .gitignore invalidates a cached subdirectory listing."""
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    (sub / "out.log").touch()
+    gitignore = tmp_path / ".gitignore"
+    gitignore.write_text("*.tmp\n", encoding="utf-8")
+    for path in (gitignore, sub, tmp_path):
+        _age(path)
+    scanner = DirectoryScanner(max_workers=1)
+    first = await scanner.scan(sub, False, gitignore_root=tmp_path, use_cache=True)
+    assert first.ignored == frozenset()
+    assert len(scanner.cache) == 1
+    gitignore.write_text("*.log\n", encoding="utf-8")
+    _age(gitignore, 30)
+    listing = await scanner.scan(sub, False, gitignore_root=tmp_path, use_cache=True)
+    assert listing.ignored == {sub / "out.log"}
+
+
+@pytest.mark.asyncio
+async def test_recently_modified_directory_is_not_cached(tmp_path: Path) -> None:
+    """A listing whose mtime is within the racy window is never cached."""
+    _make_tree(tmp_path)
+    scanner = DirectoryScanner(max_workers=1)
+    await scanner.scan(tmp_path, False, use_cache=True)
+    assert len(scanner.cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_prefetch_fills_cache_for_later_scan(tmp_path: Path) -> None:
+    """prefetch() scans in the background; a later cached scan reuses it."""
+    _make_tree(tmp_path)
+    for sub in ("a_dir", "b_dir"):
+        _age(tmp_path / sub)
+    scanner = DirectoryScanner(max_workers=1)
+    scanner.prefetch([tmp_path / "a_dir", tmp_path / "b_dir"], False)
+    for _ in range(100):
+        if len(scanner.cache) == 2:
+            break
+        await asyncio.sleep(0.01)
+    assert len(scanner.cache) == 2
+    with patch(
+        "textual_code.directory_scanner.scan_directory_listing",
+        side_effect=AssertionError("should not rescan"),
+    ):
+        listing = await scanner.scan(tmp_path / "a_dir", False, use_cache=True)
+    assert listing.paths == []
+
+
+@pytest.mark.asyncio
+async def test_new_prefetch_batch_drops_queued_one(tmp_path: Path) -> None:
+    """Unstarted prefetches are cancelled when a new batch supersedes them."""
+    release = threading.Event()
+    calls: list[Path] = []
+
+    def slow_scan(path: Path, show_hidden: bool, compact: bool, root: Path | None):
+        calls.append(path)
+        release.wait(5)
+        return DirectoryListing([], {}, {})
+
+    for name in ("busy", "old", "new"):
+        (tmp_path / name).mkdir()
+        _age(tmp_path / name)
+    scanner = DirectoryScanner(max_workers=1)
+    with patch("textual_code.directory_scanner.scan_directory_listing", slow_scan):
+        busy = asyncio.create_task(scanner.scan(tmp_path / "busy", False))
+        await asyncio.sleep(0.05)
+        scanner.prefetch([tmp_path / "old"], False)
+        scanner.prefetch([tmp_path / "new"], False)
+        release.set()
+        await busy
+        await scanner.scan(tmp_path / "new", False, use_cache=True)
+    assert calls == [tmp_path / "busy", tmp_path / "new"]
+
+
+@pytest.mark.asyncio
+async def test_foreground_scan_overtakes_prefetch(tmp_path: Path) -> None:
+    """A scan someone awaits runs before queued prefetches."""
+    release = threading.Event()
+    calls: list[Path] = []
+
+    def slow_scan(path: Path, show_hidden: bool, compact: bool, root: Path | None):
+        calls.append(path)
+        release.wait(5)
+        return DirectoryListing([], {}, {})
+
+    for name in ("busy", "p1", "p2", "wanted"):
+        (tmp_path / name).mkdir()
+    scanner = DirectoryScanner(max_workers=1)
+    with patch("textual_code.directory_scanner.scan_directory_listing", slow_scan):
+        busy = asyncio.create_task(scanner.scan(tmp_path / "busy", False))
+        await asyncio.sleep(0.05)
+        scanner.prefetch([tmp_path / "p1", tmp_path / "p2"], False)
+        wanted = asyncio.create_task(scanner.scan(tmp_path / "wanted", False))
+        await asyncio.sleep(0.05)
+        release.set()
+        await asyncio.gather(busy, wanted)
+    assert calls[:2] == [tmp_path / "busy", tmp_path / "wanted"]
+
+
+def test_listing_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    """The LRU keeps max_size listings and validates them by mtime."""
+    cache = ListingCache(max_size=2)
+    empty = DirectoryListing([], {}, {})
+    keys = [(tmp_path / name, False, False, None) for name in "abc"]
+    cache.put(keys[0], 1, empty)
+    cache.put(keys[1], 1, empty)
+    assert cache.get(keys[0], 1) is empty  # a becomes most recent
+    cache.put(keys[2], 1, empty)
+    assert cache.get(keys[1], 1) is None
+    assert cache.get(keys[0], 1) is empty
+    assert cache.get(keys[0], 2) is None  # stale mtime drops the entry
+    assert len(cache) == 1
+
+
+def test_resolve_compact_chains_stops_at_symlink_cycle(tmp_path: Path) -> None:
+    """A directory symlinked back to its ancestor does not loop forever."""
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "a" / "b" / "loop").symlink_to(tmp_path / "a")
+    chains = resolve_compact_chains([tmp_path / "a"], False)
+    label, deepest = chains[tmp_path / "a"]
+    assert label.startswith("a/b/loop")
+    assert deepest.is_dir()
+
+
+def test_get_directory_scanner_is_shared() -> None:
+    """The process-wide scanner is created once and reused."""
+    assert get_directory_scanner() is get_directory_scanner()
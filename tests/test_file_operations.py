@@ -0,0 +1,253 @@
+"""Tests for the cancellable copy/move/delete engine."""
+
+from __future__ import annotations
+
+import errno
+import os
+import shutil
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from textual_code import file_operations
+from textual_code.file_operations import (
+    FileOperation,
+    FileOperationCancelled,
+    FileOpProgress,
+)
+
+
+def _make_tree(root: Path) -> Path:
+    src = root / "src"
+    (src / "sub" / "deep").mkdir(parents=True)
+    (src / "a.txt").write_bytes(b"a" * 100)
+    (src / "sub" / "b.txt").write_bytes(b"b" * 2000)
+    (src / "sub" / "deep" / "c.txt").write_bytes(b"")
+    (src / "link").symlink_to("a.txt")
+    return src
+
+
+def _snapshot(root: Path) -> dict[str, bytes | str | None]:
+    out: dict[str, bytes | str | None] = {}
+    for path in sorted(root.rglob("*")):
+        rel = path.relative_to(root).as_posix()
+        if path.is_symlink():
+            out[rel] = "-> " + os.readlink(path)
+        elif path.is_dir():
+            out[rel] = None
+        else:
+            out[rel] = path.read_bytes()
+    return out
+
+
+def _cancel_after_first_chunk(cancel: threading.Event):
+    real = FileOpProgress.add_bytes
+
+    def add_bytes(self: FileOpProgress, count: int) -> None:
+        real(self, count)
+        cancel.set()
+
+    return patch.object(FileOpProgress, "add_bytes", add_bytes)
+
+
+def test_copy_tree_reproduces_source(tmp_path: Path) -> None:
+    """A copy recreates files, directories and symlinks, with progress totals."""
+    src = _make_tree(tmp_path)
+    op = FileOperation("copy", src, tmp_path / "dst")
+    op.run()
+    assert _snapshot(tmp_path / "dst") == _snapshot(src)
+    assert op.progress.snapshot() == (4, 4, 2100, 2100)
+
+
+def test_copy_single_file(tmp_path: Path) -> None:
+    """A single file is copied with its metadata."""
+    src = tmp_path / "big.bin"
+    src.write_bytes(os.urandom(50_000))
+    os.utime(src, (1_000_000, 1_000_000))
+    op = FileOperation("copy", src, tmp_path / "copy.bin", chunk_size=4096)
+    op.run()
+    assert (tmp_path / "copy.bin").read_bytes() == src.read_bytes()
+    assert (tmp_path / "copy.bin").stat().st_mtime == 1_000_000
+    assert op.progress.bytes_done == 50_000
+
+
+@pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="Linux only")
+def test_copy_falls_back_when_copy_file_range_refuses(tmp_path: Path) -> None:
+    """EXDEV from copy_file_range switches to the next copy method."""
+    src = _make_tree(tmp_path)
+
+    def refuse(*_args: object) -> int:
+        raise OSError(errno.EXDEV, "cross-device")
+
+    with patch("os.copy_file_range", refuse):
+        FileOperation("copy", src, tmp_path / "dst").run()
+    assert _snapshot(tmp_path / "dst") == _snapshot(src)
+
+
+def test_cancelled_copy_rolls_back(tmp_path: Path) -> None:
+    """Cancelling mid-copy removes everything the copy created."""
+    src = _make_tree(tmp_path)
+    expected = _snapshot(src)
+    cancel = threading.Event()
+    op = FileOperation("copy", src, tmp_path / "dst", chunk_size=10, max_workers=1)
+    with _cancel_after_first_chunk(cancel), pytest.raises(FileOperationCancelled):
+        op.run(cancel)
+    assert not (tmp_path / "dst").exists()
+    assert _snapshot(src) == expected
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="chmod not reliable on Windows")
+def test_failed_copy_rolls_back(tmp_path: Path) -> None:
+    """An unreadable file aborts the copy and removes the partial tree."""
+    src = _make_tree(tmp_path)
+    secret = src / "sub" / "b.txt"
+    secret.chmod(0)
+    try:
+        if os.access(secret, os.R_OK):
+            pytest.skip("running with permissions that ignore chmod")
+        with pytest.raises(PermissionError):
+            FileOperation("copy", src, tmp_path / "dst").run()
+    finally:
+        secret.chmod(0o644)
+    assert not (tmp_path / "dst").exists()
+
+
+def test_worker_error_is_not_reported_as_cancel(tmp_path: Path) -> None:
+    """An I/O error in one parallel copy reaches the caller, not a cancel."""
+    src = tmp_path / "src"
+    src.mkdir()
+    for name in ("a.bin", "b.bin", "z.bin"):
+        (src / name).write_bytes(b"x" * 100)
+    real_enumerate = file_operations._enumerate
+    copying = threading.Event()
+
+    def enumerate_sorted(source: Path):
+        plan = real_enumerate(source)
+        plan.files.sort()
+        return plan
+
+    def copy_file(self, src: Path, dst: Path, stopped, created) -> None:
+        if src.name == "z.bin":
+            # Fail while the files submitted before this one are copying.
+            copying.wait(5)
+            raise OSError(errno.ENOSPC, "No space left on device")
+        copying.set()
+        while not stopped():
+            time.sleep(0.001)
+        raise FileOperationCancelled
+
+    op = FileOperation("copy", src, tmp_path / "dst", max_workers=3)
+    with (
+        patch.object(file_operations, "_enumerate", enumerate_sorted),
+        patch.object(FileOperation, "_copy_file", copy_file),
+        pytest.raises(OSError) as excinfo,
+    ):
+        op.run()
+    assert excinfo.value.errno == errno.ENOSPC
+    assert not (tmp_path / "dst").exists()
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs named pipes")
+def test_named_pipe_fails_copy_and_is_deleted(tmp_path: Path) -> None:
+    """A FIFO is refused up front (opening it would block); delete removes it."""
+    src = _make_tree(tmp_path)
+    os.mkfifo(src / "sub" / "pipe")
+    for kind in ("copy", "move"):
+        with (
+            patch("os.rename", side_effect=OSError(errno.EXDEV, "cross-device")),
+            pytest.raises(shutil.SpecialFileError, match="pipe"),
+        ):
+            FileOperation(kind, src, tmp_path / "dst").run()
+        assert not (tmp_path / "dst").exists()
+    op = FileOperation("delete", src)
+    op.run()
+    assert not src.exists()
+    assert op.progress.files_done == op.progress.files_total == 5
+
+
+def test_existing_destination_is_refused(tmp_path: Path) -> None:
+    """Copy and move never overwrite an existing destination."""
+    src = _make_tree(tmp_path)
+    (tmp_path / "dst").mkdir()
+    for kind in ("copy", "move"):
+        with pytest.raises(FileExistsError):
+            FileOperation(kind, src, tmp_path / "dst").run()
+    assert src.exists()
+
+
+def test_move_renames_on_same_filesystem(tmp_path: Path) -> None:
+    """A same-filesystem move is a single rename."""
+    src = _make_tree(tmp_path)
+    expected = _snapshot(src)
+    with patch("shutil.copystat") as copystat:
+        FileOperation("move", src, tmp_path / "moved").run()
+    copystat.assert_not_called()
+    assert not src.exists()
+    assert _snapshot(tmp_path / "moved") == expected
+
+
+def test_cross_device_move_copies_then_deletes(tmp_path: Path) -> None:
+    """EXDEV from rename falls back to copy + delete of the source."""
+    src = _make_tree(tmp_path)
+    expected = _snapshot(src)
+
+    def cross_device(*_args: object) -> None:
+        raise OSError(errno.EXDEV, "cross-device")
+
+    with patch("os.rename", cross_device):
+        FileOperation("move", src, tmp_path / "moved").run()
+    assert not src.exists()
+    assert _snapshot(tmp_path / "moved") == expected
+
+
+def test_cancelled_cross_device_move_keeps_source(tmp_path: Path) -> None:
+    """A move cancelled during its copy phase leaves only the source."""
+    src = _make_tree(tmp_path)
+    expected = _snapshot(src)
+    cancel = threading.Event()
+
+    def cross_device(*_args: object) -> None:
+        raise OSError(errno.EXDEV, "cross-device")
+
+    op = FileOperation("move", src, tmp_path / "moved", chunk_size=10, max_workers=1)
+    with (
+        patch("os.rename", cross_device),
+        _cancel_after_first_chunk(cancel),
+        pytest.raises(FileOperationCancelled),
+    ):
+        op.run(cancel)
+    assert _snapshot(src) == expected
+    assert not (tmp_path / "moved").exists()
+
+
+def test_delete_tree_reports_progress(tmp_path: Path) -> None:
+    """Delete removes files, symlinks and directories and counts them."""
+    src = _make_tree(tmp_path)
+    op = FileOperation("delete", src)
+    op.run()
+    assert not src.exists()
+    assert op.progress.snapshot() == (4, 4, 2100, 2100)
+
+
+def test_delete_symlink_to_directory_keeps_target(tmp_path: Path) -> None:
+    """Deleting a symlinked directory removes the link, not the target."""
+    src = _make_tree(tmp_path)
+    link = tmp_path / "link_dir"
+    link.symlink_to(src)
+    FileOperation("delete", link).run()
+    assert not link.exists()
+    assert (src / "a.txt").exists()
+
+
+def test_cancelled_delete_stops(tmp_path: Path) -> None:
+    """A delete that is already cancelled removes nothing."""
+    src = _make_tree(tmp_path)
+    cancel = threading.Event()
+    cancel.set()
+    with pytest.raises(FileOperationCancelled):
+        FileOperation("delete", src).run(cancel)
+    assert (src / "a.txt").exists()
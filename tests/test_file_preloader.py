@@ -0,0 +1,127 @@
+"""Tests for the speculative editor-load cache."""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from tests.conftest import make_app, wait_for_condition
+from textual_code.file_preloader import FilePreloader, get_file_preloader
+from textual_code.widgets.code_editor import CodeEditor
+
+
+def _write_old(path: Path, content: str) -> Path:
+    """Write *content* with an mtime outside the racy window."""
+    path.write_text(content, encoding="utf-8")
+    old = time.time_ns() - 60 * 10**9
+    os.utime(path, ns=(old, old))
+    return path
+
+
+def test_load_then_lookup_hits(tmp_path: Path) -> None:
+    """A loaded file is returned from the cache while unchanged."""
+    f = _write_old(tmp_path / "a.py", "x = 1\n")
+    preloader = FilePreloader()
+    loaded = preloader.load(f)
+    assert loaded is not None and loaded.text == "x = 1\n"
+    assert preloader.lookup(f) is loaded
+
+
+def test_symlinked_and_relative_paths_share_an_entry(
+    tmp_path: Path, monkeypatch
+) -> None:
+    """A file loaded under one spelling is a hit under another."""
+    f = _write_old(tmp_path / "a.py", "x = 1\n")
+    link = tmp_path / "link.py"
+    link.symlink_to(f)
+    preloader = FilePreloader()
+    loaded = preloader.load(link)
+    assert loaded is not None
+    assert preloader.lookup(f) is loaded
+    monkeypatch.chdir(tmp_path)
+    assert preloader.lookup(Path("a.py")) is loaded
+
+
+def test_changed_file_is_a_miss(tmp_path: Path) -> None:
+    """A different mtime or size drops the cached entry."""
+    f = _write_old(tmp_path / "a.py", "x = 1\n")
+    preloader = FilePreloader()
+    preloader.load(f)
+    _write_old(f, "x = 22\n")
+    assert preloader.lookup(f) is None
+    reloaded = preloader.load(f)
+    assert reloaded is not None
+    assert reloaded.text == "x = 22\n"
+
+
+def test_editorconfig_change_is_a_miss(tmp_path: Path) -> None:
+    """Editing the .editorconfig the result was built from invalidates it."""
+    _write_old(tmp_path / ".editorconfig", "root = true\n[*]\nindent_size = 2\n")
+    f = _write_old(tmp_path / "a.py", "x = 1\n")
+    preloader = FilePreloader()
+    loaded = preloader.load(f)
+    assert loaded is not None
+    assert loaded.editorconfig["indent_size"] == "2"
+    ec = tmp_path / ".editorconfig"
+    ec.write_text("root = true\n[*]\nindent_size = 8\n", encoding="utf-8")
+    os.utime(ec, ns=(time.time_ns(), time.time_ns() + 10**9))
+    assert preloader.lookup(f) is None
+
+
+def test_recent_large_and_binary_files_are_not_cached(tmp_path: Path) -> None:
+    """Racy, oversized and binary files are never preloaded."""
+    preloader = FilePreloader(max_file_size=100)
+    recent = tmp_path / "recent.py"
+    recent.write_text("x = 1\n", encoding="utf-8")
+    big = _write_old(tmp_path / "big.py", "x" * 200)
+    binary = tmp_path / "data.bin"
+    binary.write_bytes(b"\x00\x01" * 10)
+    os.utime(binary, ns=(0, 0))
+    for path in (recent, big, binary):
+        assert preloader.load(path) is None
+        assert preloader.lookup(path) is None
+
+
+def test_lru_is_bounded_by_text_size(tmp_path: Path) -> None:
+    """Least recently used entries are evicted beyond max_bytes."""
+    files = [_write_old(tmp_path / f"f{i}.txt", "y" * 1000) for i in range(3)]
+    preloader = FilePreloader(max_bytes=4500)
+    preloader.load(files[0])
+    preloader.load(files[1])
+    preloader.lookup(files[0])  # now most recently used
+    preloader.load(files[2])
+    assert preloader.lookup(files[0]) is not None
+    assert preloader.lookup(files[1]) is None
+    assert preloader.lookup(files[2]) is not None
+
+
+def test_prefetch_loads_in_background(tmp_path: Path) -> None:
+    """prefetch() fills the cache from its own thread."""
+    f = _write_old(tmp_path / "a.py", "x = 1\n")
+    preloader = FilePreloader()
+    preloader.prefetch([f])
+    deadline = time.monotonic() + 5
+    while preloader.lookup(f) is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert preloader.lookup(f) is not None
+
+
+async def test_open_uses_preloaded_result(tmp_path: Path) -> None:
+    """Opening a preloaded file skips loading it again."""
+    f = _write_old(tmp_path / "a.py", "x = 1\n")
+    get_file_preloader().load(f)
+    app = make_app(tmp_path)
+    async with app.run_test() as pilot:
+        with patch(
+            "textual_code.widgets.main_view.run_cancellable",
+            side_effect=AssertionError("file was loaded again"),
+        ):
+            await app.main_view.action_open_code_editor(path=f)
+        await wait_for_condition(
+            pilot, lambda: bool(app.main_view.query(CodeEditor)), msg="no editor"
+        )
+        editor = app.main_view.get_active_code_editor()
+        assert editor is not None
+        assert editor.text == "x = 1\n"
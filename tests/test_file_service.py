@@ -0,0 +1,61 @@
+"""Tests for the bounded thread-pool file service."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from textual_code.file_service import FileService, get_file_service
+
+
+async def test_run_returns_result_off_the_loop() -> None:
+    """run() executes the call on a pool thread and returns its value."""
+    service = FileService(max_workers=1)
+    name = await service.run(lambda: threading.current_thread().name)
+    assert name.startswith("FileService")
+    assert name != threading.current_thread().name
+
+
+async def test_run_propagates_exceptions(tmp_path: Path) -> None:
+    """Errors raised by the call reach the awaiting coroutine."""
+    service = FileService()
+    with pytest.raises(FileNotFoundError):
+        await service.read_bytes(tmp_path / "missing.txt")
+
+
+async def test_run_times_out_without_blocking() -> None:
+    """A call that exceeds its timeout raises TimeoutError."""
+    service = FileService(max_workers=1, timeout=0.05)
+    release = threading.Event()
+    try:
+        with pytest.raises(TimeoutError, match="timed out"):
+            await service.run(release.wait)
+    finally:
+        release.set()
+
+
+async def test_stat_and_mtime_of_missing_file_are_none(tmp_path: Path) -> None:
+    """stat()/mtime() return None instead of raising for missing paths."""
+    service = FileService()
+    assert await service.stat(tmp_path / "missing") is None
+    assert await service.mtime(tmp_path / "missing") is None
+    assert not await service.exists(tmp_path / "missing")
+
+
+async def test_write_read_and_unlink_round_trip(tmp_path: Path) -> None:
+    """The byte wrappers write, read back and remove a file."""
+    service = FileService()
+    path = tmp_path / "f.bin"
+    await service.write_bytes(path, b"\x00data")
+    assert await service.read_bytes(path) == b"\x00data"
+    assert await service.is_binary(path)
+    assert await service.mtime(path) == path.stat().st_mtime
+    await service.unlink(path)
+    assert not path.exists()
+
+
+def test_get_file_service_is_shared() -> None:
+    """The process-wide service is created once and reused."""
+    assert get_file_service() is get_file_service()
@@ -0,0 +1,125 @@
+"""Tests for the merged, per-directory gitignore matcher."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from textual_code.gitignore import (
+    GitignoreCache,
+    GitignoreMatcher,
+    get_gitignore_cache,
+)
+
+
+def _bump_mtime(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+def test_root_rules_match_entries(tmp_path: Path) -> None:
+    """Plain patterns of the root .gitignore flag matching entries."""
+    (tmp_path / ".gitignore").write_text("*.log\nbuild/\n", encoding="utf-8")
+    matcher = GitignoreCache().matcher(tmp_path, tmp_path)
+    assert matcher.is_ignored("debug.log", is_dir=False)
+    assert matcher.is_ignored("build", is_dir=True)
+    assert not matcher.is_ignored("build", is_dir=False)
+    assert not matcher.is_ignored("app.py", is_dir=False)
+
+
+def test_nested_negation_overrides_parent(tmp_path: Path) -> None:
+    """A deeper .gitignore can re-include what the root ignores."""
+    (tmp_path / ".gitignore").write_text("*.log\n", encoding="utf-8")
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    (sub / ".gitignore").write_text("!keep.log\n", encoding="utf-8")
+    cache = GitignoreCache()
+    matcher = cache.matcher(sub, tmp_path)
+    assert matcher.rule_count == 2
+    assert not matcher.is_ignored("keep.log", is_dir=False)
+    assert matcher.is_ignored("other.log", is_dir=False)
+    # The negation is scoped to sub/.
+    assert cache.matcher(tmp_path, tmp_path).is_ignored("keep.log", is_dir=False)
+
+
+def test_last_matching_rule_wins(tmp_path: Path) -> None:
+    """Within one file the last matching pattern decides."""
+    (tmp_path / ".gitignore").write_text(
+        "*.log\n!important.log\nimportant.log\n", encoding="utf-8"
+    )
+    matcher = GitignoreCache().matcher(tmp_path, tmp_path)
+    assert matcher.is_ignored("important.log", is_dir=False)
+
+
+def test_anchored_pattern_is_relative_to_its_file(tmp_path: Path) -> None:
+    """An anchored pattern in sub/.gitignore only matches below sub/."""
+    sub = tmp_path / "sub"
+    (sub / "out").mkdir(parents=True)
+    (sub / ".gitignore").write_text("/out\n", encoding="utf-8")
+    cache = GitignoreCache()
+    assert cache.matcher(sub, tmp_path).is_ignored("out", is_dir=True)
+    assert not cache.matcher(tmp_path, tmp_path).is_ignored("out", is_dir=True)
+
+
+def test_ignored_batch_skips_dotfiles(tmp_path: Path) -> None:
+    """ignored() returns the ignored subset and never flags dotfiles."""
+    (tmp_path / ".gitignore").write_text("*\n", encoding="utf-8")
+    paths = [tmp_path / "a.txt", tmp_path / ".env", tmp_path / "dir"]
+    is_dir = {tmp_path / "dir": True}
+    matcher = GitignoreCache().matcher(tmp_path, tmp_path)
+    assert matcher.ignored(paths, is_dir) == {tmp_path / "a.txt", tmp_path / "dir"}
+
+
+def test_hidden_directory_gitignore_is_not_read(tmp_path: Path) -> None:
+    """Ignore files inside hidden directories do not apply."""
+    hidden = tmp_path / ".venv"
+    hidden.mkdir()
+    (hidden / ".gitignore").write_text("*\n", encoding="utf-8")
+    matcher = GitignoreCache().matcher(hidden, tmp_path)
+    assert not matcher.is_ignored("lib", is_dir=True)
+
+
+def test_directory_outside_root_ignores_nothing(tmp_path: Path) -> None:
+    """Directories outside the workspace get an empty matcher."""
+    ws = tmp_path / "ws"
+    ws.mkdir()
+    (ws / ".gitignore").write_text("*\n", encoding="utf-8")
+    matcher = GitignoreCache().matcher(tmp_path, ws)
+    assert matcher.rule_count == 0
+    assert not matcher.is_ignored("ws", is_dir=True)
+
+
+def test_matcher_is_cached_and_revalidated_by_mtime(tmp_path: Path) -> None:
+    """The same matcher is reused until an ignore file on the chain changes."""
+    (tmp_path / ".gitignore").write_text("*.log\n", encoding="utf-8")
+    cache = GitignoreCache()
+    first = cache.matcher(tmp_path, tmp_path)
+    assert cache.matcher(tmp_path, tmp_path) is first
+
+    (tmp_path / ".gitignore").write_text("*.tmp\n", encoding="utf-8")
+    _bump_mtime(tmp_path / ".gitignore")
+    second = cache.matcher(tmp_path, tmp_path)
+    assert second is not first
+    assert second.is_ignored("a.tmp", is_dir=False)
+    assert not second.is_ignored("a.log", is_dir=False)
+
+
+def test_new_nested_gitignore_is_picked_up(tmp_path: Path) -> None:
+    """Creating a .gitignore deeper in the chain changes the matcher."""
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    cache = GitignoreCache()
+    assert cache.matcher(sub, tmp_path).rule_count == 0
+    (sub / ".gitignore").write_text("*.o\n", encoding="utf-8")
+    assert cache.matcher(sub, tmp_path).is_ignored("main.o", is_dir=False)
+
+
+def test_matcher_without_rules_ignores_nothing() -> None:
+    """An empty rule list never matches."""
+    matcher = GitignoreMatcher("", [])
+    assert not matcher.is_ignored("anything", is_dir=False)
+
+
+def test_get_gitignore_cache_is_shared() -> None:
+    """The process-wide cache is created once and reused."""
+    assert get_gitignore_cache() is get_gitignore_cache()
@@ -0,0 +1,163 @@
+"""Tests for the ctypes-based inotify file watcher."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from textual_code.file_watcher import (
+    FileChanges,
+    InotifyWatcher,
+    create_file_watcher,
+    inotify_supported,
+)
+
+pytestmark = pytest.mark.skipif(
+    not inotify_supported(), reason="inotify is only available on Linux"
+)
+
+
+class _Collector:
+    """Thread-safe sink for watcher batches."""
+
+    def __init__(self) -> None:
+        self.batches: list[FileChanges] = []
+        self._event = threading.Event()
+
+    def __call__(self, changes: FileChanges) -> None:
+        self.batches.append(changes)
+        self._event.set()
+
+    def wait(self, timeout: float = 3.0) -> FileChanges:
+        assert self._event.wait(timeout), "no file watcher batch delivered"
+        self._event.clear()
+        return self.batches[-1]
+
+
+@pytest.fixture
+def collector():
+    return _Collector()
+
+
+@pytest.fixture
+def watcher(collector: _Collector):
+    w = InotifyWatcher(collector, debounce=0.05, max_delay=0.5)
+    w.start()
+    yield w
+    w.stop()
+
+
+def test_file_modification_reported(
+    tmp_path: Path, watcher: InotifyWatcher, collector: _Collector
+) -> None:
+    """Writing to a file in a watched directory reports its path."""
+    target = tmp_path / "a.txt"
+    target.write_text("1", encoding="utf-8")
+    watcher.set_watches("test", [tmp_path])
+    target.write_text("2", encoding="utf-8")
+    batch = collector.wait()
+    assert target in batch.paths
+    assert tmp_path not in batch.dirs  # content change, not a listing change
+
+
+def test_create_and_delete_mark_directory(
+    tmp_path: Path, watcher: InotifyWatcher, collector: _Collector
+) -> None:
+    """Creating or removing an entry reports the directory as changed."""
+    watcher.set_watches("test", [tmp_path])
+    (tmp_path / "new.txt").touch()
+    batch = collector.wait()
+    assert tmp_path in batch.dirs
+    assert tmp_path / "new.txt" in batch.paths
+
+
+def test_burst_is_debounced_into_one_batch(
+    tmp_path: Path, watcher: InotifyWatcher, collector: _Collector
+) -> None:
+    """Many quick events are coalesced into a single batch."""
+    watcher.set_watches("test", [tmp_path])
+    for i in range(50):
+        (tmp_path / f"f{i}.txt").touch()
+    batch = collector.wait()
+    assert len(batch.paths) == 50
+    assert len(collector.batches) == 1
+
+
+def test_steady_stream_is_delivered_after_max_delay(
+    tmp_path: Path, collector: _Collector
+) -> None:
+    """A stream of events that never goes quiet still delivers batches."""
+    watcher = InotifyWatcher(collector, debounce=1.0, max_delay=0.2)
+    watcher.start()
+    watcher.set_watches("test", [tmp_path])
+    # A separate process, so the stream does not wait on this one's GIL.
+    writer = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "import sys, time\n"
+            "end = time.monotonic() + 10\n"
+            "while time.monotonic() < end:\n"
+            "    open(sys.argv[1], 'w').close()\n",
+            str(tmp_path / "build.log"),
+        ]
+    )
+    try:
+        batch = collector.wait(timeout=5.0)
+        assert writer.poll() is None, "batch held back until the stream stopped"
+        assert tmp_path / "build.log" in batch.paths
+    finally:
+        writer.kill()
+        writer.wait()
+        watcher.stop()
+
+
+def test_watches_are_shared_between_owners(
+    tmp_path: Path, watcher: InotifyWatcher
+) -> None:
+    """A directory stays watched until no owner lists it."""
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    watcher.set_watches("a", [tmp_path, sub])
+    watcher.set_watches("b", [sub])
+    assert watcher.watched_dirs == {tmp_path, sub}
+    watcher.set_watches("a", [])
+    assert watcher.watched_dirs == {sub}
+    watcher.set_watches("b", [])
+    assert watcher.watched_dirs == frozenset()
+
+
+def test_missing_directory_is_ignored(tmp_path: Path, watcher: InotifyWatcher) -> None:
+    """Registering a directory that does not exist is a silent no-op."""
+    watcher.set_watches("test", [tmp_path / "missing"])
+    assert watcher.watched_dirs == frozenset()
+
+
+def test_deleted_directory_reports_parent(
+    tmp_path: Path, watcher: InotifyWatcher, collector: _Collector
+) -> None:
+    """Removing a watched directory marks it and its parent as changed."""
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    watcher.set_watches("test", [sub])
+    sub.rmdir()
+    batch = collector.wait()
+    assert sub in batch.dirs
+    assert tmp_path in batch.dirs
+
+
+def test_create_file_watcher_starts_thread(tmp_path: Path) -> None:
+    """create_file_watcher returns a running watcher on Linux."""
+    collector = _Collector()
+    w = create_file_watcher(collector, debounce=0.05)
+    assert w is not None
+    try:
+        w.set_watches("test", [tmp_path])
+        (tmp_path / "x").touch()
+        assert tmp_path / "x" in collector.wait().paths
+    finally:
+        w.stop()
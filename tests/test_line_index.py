@@ -0,0 +1,94 @@
+"""Tests for the Fenwick line-start index."""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Sequence
+from pathlib import Path
+
+from tests.conftest import make_app
+from textual_code.line_index import LineIndex
+from textual_code.widgets.code_editor_helpers import (
+    _location_to_text_offset,
+    _text_offset_to_location,
+)
+
+
+def _assert_matches_text(index: LineIndex, lines: Sequence[str]) -> None:
+    text = "\n".join(lines)
+    for offset in range(len(text) + 1):
+        assert index.location_of(offset) == _text_offset_to_location(text, offset)
+    for row, line in enumerate(lines):
+        for col in range(len(line) + 1):
+            assert index.offset_of((row, col)) == _location_to_text_offset(
+                text, (row, col)
+            )
+
+
+def test_conversions_match_full_text() -> None:
+    """Both directions agree with the prefix-sum helpers."""
+    lines = ["first", "", "third line", "x"]
+    _assert_matches_text(LineIndex(lines), lines)
+
+
+def test_single_empty_line() -> None:
+    index = LineIndex([""])
+    assert index.location_of(0) == (0, 0)
+    assert index.offset_of((0, 0)) == 0
+    assert len(index) == 1
+
+
+def test_offset_past_end_lands_on_last_line() -> None:
+    index = LineIndex(["ab", "cd"])
+    assert index.location_of(100) == (1, 97)
+    assert index.line_start(10) == 3
+
+
+def test_row_updates_and_invalidation_track_edits() -> None:
+    """In-place row updates and rebuilds after line-count changes stay exact."""
+    rng = random.Random(42)
+    lines = ["x" * rng.randint(0, 6) for _ in range(30)]
+    index = LineIndex(lines)
+    _assert_matches_text(index, lines)
+    for _ in range(200):
+        row = rng.randrange(len(lines))
+        if rng.random() < 0.8:
+            lines[row] = "y" * rng.randint(0, 9)
+            index.update_rows(row, row)
+        else:
+            lines.insert(row, "new")
+            index.invalidate()
+    _assert_matches_text(index, lines)
+
+
+def test_update_rows_notices_line_count_change() -> None:
+    """A missed invalidate() is caught when the line count differs."""
+    lines = ["a", "b"]
+    index = LineIndex(lines)
+    assert index.offset_of((1, 0)) == 2
+    lines.insert(0, "zzz")
+    index.update_rows(0, 0)
+    assert index.offset_of((1, 0)) == 4
+
+
+async def test_editor_index_follows_edits_and_undo(tmp_path: Path) -> None:
+    """The text area's index stays in step with typing, Enter and undo."""
+    f = tmp_path / "a.txt"
+    f.write_text("alpha\nbeta\ngamma\n", encoding="utf-8")
+    app = make_app(tmp_path, light=True, open_file=f)
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        editor = app.main_view.get_active_code_editor()
+        assert editor is not None
+        ta = editor.editor
+        index = ta.line_index
+        assert index.offset_of((2, 0)) == 11
+        ta.cursor_location = (0, 5)
+        await pilot.press("!", "!")
+        assert index.offset_of((2, 0)) == 13
+        await pilot.press("enter")
+        assert index.location_of(14) == (3, 0)
+        ta.action_undo()
+        ta.action_undo()
+        assert ta.line_index.offset_of((2, 0)) == 11
+        assert ta.line_index.location_of(ta.text.index("gamma")) == (2, 0)
@@ -0,0 +1,151 @@
+"""Tests for the per-find-session match index."""
+
+from __future__ import annotations
+
+import random
+import re
+from pathlib import Path
+
+from textual.widgets import Input, Label
+
+from tests.conftest import make_app, wait_for_condition
+from textual_code.match_index import MatchIndex, is_line_local, scan_matches
+
+
+def _expected(pattern: re.Pattern[str], lines: list[str]) -> list:
+    """All matches as (start, end) locations, computed from the full text."""
+    text = "\n".join(lines)
+    starts = [0]
+    for line in lines:
+        starts.append(starts[-1] + len(line) + 1)
+
+    def loc(offset: int) -> tuple[int, int]:
+        row = max(i for i, start in enumerate(starts[:-1]) if start <= offset)
+        return (row, offset - starts[row])
+
+    return [(loc(m.start()), loc(m.end())) for m in pattern.finditer(text)]
+
+
+def _index(pattern: re.Pattern[str], lines: list[str], line_local: bool):
+    index = MatchIndex(lines, pattern, line_local)
+    rows = scan_matches(pattern, lines)
+    assert rows is not None
+    assert index.install(rows, index.generation)
+    return index
+
+
+def _all_matches(index: MatchIndex) -> list:
+    """Walk the index with next_match from the top, collecting every match."""
+    found = []
+    location = (0, 0)
+    for _ in range(index.count or 0):
+        match = index.next_match(location)
+        assert match is not None
+        found.append(match)
+        location = match[1] if match[1] > match[0] else (match[0][0], match[0][1] + 1)
+    return found
+
+
+def test_is_line_local() -> None:
+    assert is_line_local("foo", use_regex=False)
+    assert is_line_local(r"fo+\b\d", use_regex=True)
+    assert not is_line_local(r"a\sb", use_regex=True)
+    assert not is_line_local("a[^b]", use_regex=True)
+    assert not is_line_local("(?s)a.b", use_regex=True)
+    assert not is_line_local(r"a[\12]b", use_regex=True)
+    assert not is_line_local(r"[]\015]", use_regex=True)
+    assert is_line_local(r"(a)\1[b\]]", use_regex=True)
+    assert not is_line_local(r"[\t- ]", use_regex=True)
+    assert is_line_local(r"[a-z_]+\[0]", use_regex=True)
+    assert not is_line_local("a\nb", use_regex=False)
+
+
+def test_scan_groups_matches_by_row() -> None:
+    """Matches, including ones spanning rows, come back in document order."""
+    lines = ["ab ab", "", "xab", "a", "b"]
+    for query in ("ab", r"a\s*b"):
+        pattern = re.compile(query, re.MULTILINE)
+        index = _index(pattern, lines, is_line_local(query, use_regex=True))
+        assert index.count == len(_expected(pattern, lines))
+        assert _all_matches(index) == _expected(pattern, lines)
+
+
+def test_next_and_previous_wrap() -> None:
+    lines = ["one foo", "foo two", "three"]
+    index = _index(re.compile("foo"), lines, line_local=True)
+    assert index.next_match((0, 5)) == ((1, 0), (1, 3))
+    assert index.next_match((2, 0)) == ((0, 4), (0, 7))
+    assert index.previous_match((1, 2)) == ((0, 4), (0, 7))
+    assert index.previous_match((0, 1)) == ((1, 0), (1, 3))
+    assert index.ordinal_of((1, 0), (1, 3)) == 2
+    assert index.ordinal_of((1, 0), (1, 2)) is None
+
+
+def test_spans_on_row_cover_multiline_matches() -> None:
+    lines = ["xa", "", "b y"]
+    index = _index(re.compile(r"a\s*b", re.MULTILINE), lines, line_local=False)
+    assert index.spans_on_row(0) == [(1, None)]
+    assert index.spans_on_row(1) == [(0, None)]
+    assert index.spans_on_row(2) == [(0, 1)]
+
+
+def test_splices_keep_line_local_index_exact() -> None:
+    """Random edits reported as splices give the same matches as a rescan."""
+    rng = random.Random(7)
+    words = ["foo", "bar", "xfoo", ""]
+    lines = [" ".join(rng.choices(words, k=3)) for _ in range(40)]
+    pattern = re.compile("foo")
+    index = _index(pattern, lines, line_local=True)
+    for _ in range(300):
+        top = rng.randrange(len(lines))
+        old_bottom = min(top + rng.randint(0, 2), len(lines) - 1)
+        new_rows = [" ".join(rng.choices(words, k=2)) for _ in range(rng.randint(1, 3))]
+        lines[top : old_bottom + 1] = new_rows
+        index.splice(top, old_bottom, top + len(new_rows) - 1)
+        if rng.random() < 0.3:
+            assert index.count == len(_expected(pattern, lines))
+    assert _all_matches(index) == _expected(pattern, lines)
+
+
+def test_stale_scan_is_rejected() -> None:
+    """A scan of a snapshot taken before an edit is not installed."""
+    lines = ["foo"]
+    index = MatchIndex(lines, re.compile("foo"), line_local=True)
+    generation = index.generation
+    rows = scan_matches(index.pattern, list(lines))
+    assert rows is not None
+    lines[0] = "bar"
+    index.splice(0, 0, 0)
+    assert not index.install(rows, generation)
+    assert index.count is None
+
+
+async def test_find_bar_counts_and_follows_edits(tmp_path: Path) -> None:
+    """The find bar shows "n of N" and the count follows typing."""
+    f = tmp_path / "a.txt"
+    f.write_text("foo\nbar foo\nfoo\n", encoding="utf-8")
+    app = make_app(tmp_path, light=True, open_file=f)
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        editor = app.main_view.get_active_code_editor()
+        assert editor is not None
+        editor.action_find()
+        await pilot.pause()
+        editor.query_one("#find_input", Input).value = "foo"
+        label = editor.query_one("#match_count", Label)
+        await wait_for_condition(
+            pilot, lambda: str(label.render()) == "? of 3", msg="no count"
+        )
+        await pilot.press("enter")
+        await wait_for_condition(
+            pilot, lambda: str(label.render()) == "1 of 3", msg="not on match 1"
+        )
+        await pilot.press("enter")
+        assert editor.editor.selection.start == (1, 4)
+        editor.editor.insert("foo", (3, 0))
+        await wait_for_condition(
+            pilot, lambda: str(label.render()).endswith("of 4"), msg="count stale"
+        )
+        match_index = editor.editor.match_index
+        assert match_index is not None
+        assert match_index.spans_on_row(3) == [(0, 3)]
@@ -0,0 +1,132 @@
+"""Tests for the streaming, atomic save pipeline."""
+
+from __future__ import annotations
+
+import itertools
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from textual_code.save_pipeline import save_text
+from textual_code.widgets.code_editor_helpers import (
+    _convert_line_ending,
+    _insert_final_newline,
+    _remove_final_newline,
+    _trim_trailing_whitespace,
+)
+
+
+def _reference(text: str, trim: bool | None, final: bool | None) -> str:
+    """The whole-string transforms the pipeline must reproduce."""
+    if trim is True:
+        text = _trim_trailing_whitespace(text)
+    if final is True:
+        text = _insert_final_newline(text)
+    elif final is False:
+        text = _remove_final_newline(text)
+    return text
+
+
+_SAMPLES = [
+    "",
+    "\n",
+    "   ",
+    "a",
+    "a  \n",
+    "a\nb\t\n  \n\n",
+    "x = 1   \ny = 2\n\n\n",
+    "  lead\n\ttab\t \nend  ",
+]
+
+
+@pytest.mark.parametrize(
+    ("trim", "final", "chunk_size"),
+    list(itertools.product([None, True, False], [None, True, False], [1, 3, 4096])),
+)
+def test_streamed_output_matches_whole_string_transforms(
+    tmp_path: Path, trim: bool | None, final: bool | None, chunk_size: int
+) -> None:
+    """Chunked writing gives the same bytes as transforming the whole text."""
+    path = tmp_path / "f.txt"
+    for text in _SAMPLES:
+        expected = _reference(text, trim, final)
+        result = save_text(
+            path,
+            text,
+            line_ending="crlf",
+            trim_trailing_whitespace=trim,
+            insert_final_newline=final,
+            chunk_size=chunk_size,
+        )
+        assert path.read_bytes() == _convert_line_ending(expected, "crlf").encode()
+        assert result.saved_text == (None if expected == text else expected)
+
+
+def test_bom_is_written_once(tmp_path: Path) -> None:
+    """An incremental encoder writes the UTF-8 BOM only at the start."""
+    path = tmp_path / "bom.txt"
+    save_text(path, "line\n" * 50, encoding="utf-8-sig", chunk_size=8)
+    data = path.read_bytes()
+    assert data.startswith(b"\xef\xbb\xbf")
+    assert data.count(b"\xef\xbb\xbf") == 1
+
+
+def test_encoding_error_keeps_original(tmp_path: Path) -> None:
+    """A failed save leaves the original file and no temp file behind."""
+    path = tmp_path / "f.txt"
+    path.write_bytes(b"original")
+    with pytest.raises(UnicodeEncodeError):
+        save_text(path, "café ☃", encoding="latin-1", chunk_size=2)
+    assert path.read_bytes() == b"original"
+    assert os.listdir(tmp_path) == ["f.txt"]
+
+
+def test_crash_before_rename_keeps_original(tmp_path: Path) -> None:
+    """The target is only replaced once the new content is fully written."""
+    path = tmp_path / "f.txt"
+    path.write_bytes(b"original")
+    with (
+        patch("os.replace", side_effect=OSError("disk gone")),
+        pytest.raises(OSError, match="disk gone"),
+    ):
+        save_text(path, "new content")
+    assert path.read_bytes() == b"original"
+    assert os.listdir(tmp_path) == ["f.txt"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+def test_permissions_are_preserved(tmp_path: Path) -> None:
+    """The replaced file keeps the original's permission bits."""
+    path = tmp_path / "run.sh"
+    path.write_bytes(b"#!/bin/sh\n")
+    path.chmod(0o750)
+    save_text(path, "#!/bin/sh\necho hi\n")
+    assert path.stat().st_mode & 0o777 == 0o750
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="symlinks need privileges")
+def test_symlink_is_saved_through(tmp_path: Path) -> None:
+    """Saving through a symlink writes the target and keeps the link."""
+    real = tmp_path / "real.txt"
+    real.write_bytes(b"old")
+    link = tmp_path / "link.txt"
+    link.symlink_to(real)
+    save_text(link, "new")
+    assert link.is_symlink()
+    assert real.read_bytes() == b"new"
+
+
+def test_unwritable_directory_falls_back_to_in_place_write(tmp_path: Path) -> None:
+    """Without room for a temp file, the file is overwritten directly."""
+    path = tmp_path / "f.txt"
+    path.write_bytes(b"old")
+    with patch(
+        "textual_code.save_pipeline._create_temp",
+        side_effect=PermissionError("read-only directory"),
+    ):
+        result = save_text(path, "new")
+    assert path.read_bytes() == b"new"
+    assert result.mtime == path.stat().st_mtime
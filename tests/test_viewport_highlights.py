@@ -0,0 +1,87 @@
+"""Tests for viewport-scoped syntax highlighting of large documents."""
+
+from __future__ import annotations
+
+import random
+from collections import defaultdict
+from unittest.mock import patch
+
+import pytest
+from textual.app import App, ComposeResult
+
+from textual_code.viewport_highlights import ViewportHighlights
+from textual_code.widgets.multi_cursor_text_area import MultiCursorTextArea
+
+
+def _rows(highlights, rows: range) -> dict[int, list]:
+    # Captures of different names may come in another order; compare as sets.
+    return {row: sorted(highlights[row], key=repr) for row in rows}
+
+
+def _full_map(ta: MultiCursorTextArea, rows: range) -> dict[int, list]:
+    """The rows of a full highlight map of the current document."""
+    viewport = ta._highlights
+    ta._highlights = defaultdict(list)
+    try:
+        with patch.object(MultiCursorTextArea, "VIEWPORT_HIGHLIGHT_LINES", 10**9):
+            ta._build_highlight_map()
+        return _rows(ta._highlights, rows)
+    finally:
+        ta._highlights = viewport
+
+
+class _Editor(App):
+    def __init__(self, text: str) -> None:
+        super().__init__()
+        self._text = text
+
+    def compose(self) -> ComposeResult:
+        yield MultiCursorTextArea.code_editor(text=self._text, language="python")
+
+
+def test_splice_shifts_rows_below_the_edit() -> None:
+    highlights = ViewportHighlights(None, None, lambda: (0, 0))  # type: ignore[arg-type]
+    highlights.update({row: [(0, 1, f"r{row}")] for row in range(6)})
+    highlights.splice(1, 2, 3)
+    assert sorted(highlights) == [0, 4, 5, 6]
+    assert highlights[4] == [(0, 1, "r3")]
+    highlights.splice(4, 4, 4)
+    assert sorted(highlights) == [0, 5, 6]
+    assert highlights
+
+
+async def test_large_document_highlights_only_the_viewport(monkeypatch) -> None:
+    monkeypatch.setattr(MultiCursorTextArea, "VIEWPORT_HIGHLIGHT_LINES", 500)
+    text = "".join(f"def f{i}(x):\n    return x + {i}  # c\n" for i in range(400))
+    async with _Editor(text).run_test(size=(80, 24)) as pilot:
+        ta = pilot.app.query_one(MultiCursorTextArea)
+        await pilot.pause()
+        assert isinstance(ta._highlights, ViewportHighlights)
+        assert 0 < len(ta._highlights) < 200
+
+        ta.scroll_to(0, 600, animate=False)
+        await pilot.pause()
+        assert 600 in ta._highlights
+        rows = range(590, 640)
+        assert _rows(ta._highlights, rows) == _full_map(ta, rows)
+
+
+@pytest.mark.parametrize("seed", [3, 11])
+async def test_edits_keep_viewport_highlights_exact(monkeypatch, seed: int) -> None:
+    """Random edits, including opening strings, match a full rebuild."""
+    monkeypatch.setattr(MultiCursorTextArea, "VIEWPORT_HIGHLIGHT_LINES", 100)
+    text = "".join(f"x{i} = {i}  # note\ny = 'a'\n" for i in range(100))
+    rng = random.Random(seed)
+    snippets = ['"""', "\n", "def g():\n    ", "'", "# ", "", "1 +"]
+    async with _Editor(text).run_test(size=(80, 24)) as pilot:
+        ta = pilot.app.query_one(MultiCursorTextArea)
+        await pilot.pause()
+        rows = range(0, 30)
+        for step in range(40):
+            row = rng.randrange(25)
+            col = rng.randrange(len(ta.document[row]) + 1)
+            end = (row + rng.randint(0, 1), 0) if rng.random() < 0.3 else (row, col)
+            ta.replace(rng.choice(snippets), (row, col), max(end, (row, col)))
+            if step % 7 == 0:
+                ta.undo()
+            assert _rows(ta._highlights, rows) == _full_map(ta, rows), step
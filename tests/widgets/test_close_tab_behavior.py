@@ -26,7 +26,7 @@ Supports both:
 
 from pathlib import Path
 
-from tests.conftest import make_app
+from tests.conftest import await_workers, make_app
 from textual_code.modals import UnsavedChangeModalScreen
 from textual_code.widgets.code_editor import CodeEditor
 from textual_code.widgets.draggable_tabs_content import DraggableTabbedContent
@@ -423,6 +423,7 @@ async def test_close_dirty_editor_save_closes_and_persists(workspace: Path):
         assert isinstance(app.screen, UnsavedChangeModalScreen)
 
         await pilot.click("#save")
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
         # Editor should be closed and file content updated on disk
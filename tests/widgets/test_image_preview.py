@@ -142,6 +142,11 @@ async def test_corrupt_image_shows_fallback(workspace: Path):
     bad.write_bytes(b"this is not a PNG file at all")
     app = make_app(workspace, open_file=bad, light=True)
     async with app.run_test(size=(80, 24)) as pilot:
+        await wait_for_condition(
+            pilot,
+            lambda: bool(app.query(ImagePreviewPane)),
+            msg="Image preview pane not mounted",
+        )
         preview = app.query_one(ImagePreviewPane)
         # Windows: wait for worker to load and fail
         await wait_for_condition(
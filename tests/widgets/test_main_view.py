@@ -15,7 +15,7 @@ from pathlib import Path
 from textual.widgets._tabbed_content import ContentTabs
 from textual.widgets._tabs import Underline
 
-from tests.conftest import make_app, set_editor_text
+from tests.conftest import await_workers, make_app, set_editor_text
 from textual_code.modals import (
     SaveAsModalResult,
     SaveAsModalScreen,
@@ -115,6 +115,7 @@ async def test_has_unsaved_pane_false_after_save(workspace: Path, sample_py_file
         assert app.main_view.has_unsaved_pane() is True
 
         await pilot.press("ctrl+s")
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
         assert app.main_view.has_unsaved_pane() is False
 
@@ -157,6 +158,7 @@ async def test_save_all_noop_when_no_files_open(workspace: Path):
         await pilot.wait_for_scheduled_animations()
         # Should not raise any error
         app.main_view.action_save_all()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
 
@@ -166,6 +168,7 @@ async def test_save_all_noop_when_all_clean(workspace: Path, sample_py_file: Pat
         await pilot.wait_for_scheduled_animations()
         assert app.main_view.has_unsaved_pane() is False
         app.main_view.action_save_all()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
         assert app.main_view.has_unsaved_pane() is False
 
@@ -183,6 +186,7 @@ async def test_save_all_saves_single_modified_file(
         assert app.main_view.has_unsaved_pane() is True
 
         app.main_view.action_save_all()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
         assert app.main_view.has_unsaved_pane() is False
         assert sample_py_file.read_text(encoding="utf-8") == "modified\n"
@@ -203,6 +207,7 @@ async def test_save_all_saves_all_of_two_modified(
 
         assert app.main_view.has_unsaved_pane() is True
         app.main_view.action_save_all()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
         assert app.main_view.has_unsaved_pane() is False
         assert sample_py_file.read_text(encoding="utf-8") == "modified\n"
@@ -234,6 +239,7 @@ async def test_save_all_saves_only_modified_among_three(workspace: Path):
         await pilot.wait_for_scheduled_animations()
 
         app.main_view.action_save_all()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
         assert file_a.read_text() == "modified_a\n"
         assert file_b.read_text() == "modified_b\n"
@@ -262,6 +268,7 @@ async def test_save_all_saves_all_of_three_modified(workspace: Path):
 
         assert app.main_view.has_unsaved_pane() is True
         app.main_view.action_save_all()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
         assert app.main_view.has_unsaved_pane() is False
         assert file_a.read_text() == "modified\n"
@@ -282,6 +289,7 @@ async def test_save_all_shows_save_as_for_single_untitled(workspace: Path):
 
         main_view = app.main_view
         main_view.action_save_all()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
         assert isinstance(app.screen, SaveAsModalScreen)
@@ -311,6 +319,7 @@ async def test_save_all_mixed_saves_file_then_shows_save_as(
 
         main_view = app.main_view
         main_view.action_save_all()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
         # File with path should be saved before showing modal for untitled
@@ -347,6 +356,7 @@ async def test_save_all_three_mixed_saves_two_files_shows_save_as(workspace: Pat
 
         main_view = app.main_view
         main_view.action_save_all()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
         assert file_a.read_text() == "modified_a\n"
@@ -377,6 +387,7 @@ async def test_save_all_sequential_multiple_untitled(workspace: Path):
 
         main_view = app.main_view
         main_view.action_save_all()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
         # First modal should be shown
@@ -447,6 +458,7 @@ async def test_save_all_clean_untitled_no_modal(workspace: Path):
         # Untitled file is clean (text == initial_text == "")
 
         app.main_view.action_save_all()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
         # No modal should appear for a clean untitled file
@@ -468,11 +480,13 @@ async def test_save_all_idempotent_on_already_saved(
         await pilot.wait_for_scheduled_animations()
 
         app.main_view.action_save_all()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
         assert sample_py_file.read_text(encoding="utf-8") == "first_write\n"
 
         # Second call — nothing modified, nothing to save
         app.main_view.action_save_all()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
         assert sample_py_file.read_text(encoding="utf-8") == "first_write\n"
         assert app.main_view.has_unsaved_pane() is False
@@ -140,6 +140,41 @@ async def test_toast_skipped_when_worker_fast():
         assert _no_toast(app)
 
 
+@pytest.mark.asyncio
+async def test_set_label_updates_running_toast():
+    """set_label() replaces the text while the worker runs."""
+    app = _ProgressApp()
+    async with app.run_test(size=(80, 24)) as pilot:
+        gate = asyncio.Event()
+        worker = app._make_controlled_worker(gate)
+        toast = app.show_progress("Measuring", worker)
+        await wait_for_condition(pilot, lambda: _has_toast(app))
+        toast.set_label("Measuring — 10 files")
+        assert toast.query_one(Label).content == "Measuring — 10 files"
+        gate.set()
+
+
+@pytest.mark.asyncio
+async def test_close_removes_toast_before_worker_finishes():
+    """close() removes the toast, mounted or still waiting for its delay."""
+    app = _ProgressApp()
+    async with app.run_test(size=(80, 24)) as pilot:
+        gate = asyncio.Event()
+        worker = app._make_controlled_worker(gate)
+        toast = app.show_progress("Measuring", worker)
+        await wait_for_condition(pilot, lambda: _has_toast(app))
+        toast.close()
+        await wait_for_condition(pilot, lambda: _no_toast(app))
+
+        pending = app.show_progress("Measuring", worker, delay=0.1)
+        pending.close()
+        await asyncio.sleep(0.2)
+        await pilot.wait_for_scheduled_animations()
+        assert _no_toast(app)
+        assert worker.is_running
+        gate.set()
+
+
 # ── Terminal states ──────────────────────────────────────────────────────────
 
 
@@ -8,10 +8,12 @@ Tests verify the three performance fixes:
 """
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from tests.conftest import make_app
+from tests.conftest import await_workers, make_app
+from textual_code.widgets import code_editor
 from textual_code.widgets.code_editor import CodeEditor, CodeEditorFooter
 
 # ── Fix 1: Footer batch update ────────────────────────────────────────────────
@@ -299,12 +301,74 @@ async def test_save_all_saves_unmounted_editors(
 
         # Save all
         main.action_save_all()
+        await await_workers(pilot)
         await pilot.wait_for_scheduled_animations()
 
         # py file should have been saved (its unsaved state is gone)
         assert main.has_unsaved_pane() is False
 
 
+async def test_save_all_reports_unmounted_save_failure(
+    workspace: Path, sample_py_file: Path, sample_json_file: Path
+):
+    """A failed save of an unmounted editor is shown as an error toast."""
+    app = make_app(workspace, light=True, open_file=sample_py_file)
+    async with app.run_test() as pilot:
+        await pilot.wait_for_scheduled_animations()
+        main = app.main_view
+        await pilot.press("x")
+        await main.action_open_code_editor(path=sample_json_file)
+        await pilot.wait_for_scheduled_animations()
+
+        with patch(
+            "textual_code.widgets.code_editor.save_text",
+            side_effect=OSError(28, "No space left on device"),
+        ):
+            main.action_save_all()
+            await await_workers(pilot)
+        await pilot.wait_for_scheduled_animations()
+
+        errors = [n for n in app._notifications if n.severity == "error"]
+        assert [n.message for n in errors] == [
+            "Error saving file: [Errno 28] No space left on device"
+        ]
+        assert main.has_unsaved_pane() is True
+
+
+async def test_save_all_keeps_unmounted_text_edited_during_the_write(
+    workspace: Path, sample_py_file: Path, sample_json_file: Path
+):
+    """Text a split view adds while an unmounted tab is written stays unsaved."""
+    app = make_app(workspace, light=True, open_file=sample_py_file)
+    async with app.run_test() as pilot:
+        await pilot.wait_for_scheduled_animations()
+        main = app.main_view
+        await pilot.press("x")
+        py_pane_id = main._active_leaf.opened_files[sample_py_file]
+        await main.action_open_code_editor(path=sample_json_file)
+        await pilot.wait_for_scheduled_animations()
+        state = main._editor_states[py_pane_id]
+        written = state.text
+        edited = written + "# more\n"
+
+        def save_text(*args, **kwargs):
+            result = real_save_text(*args, **kwargs)
+            # Live sync from a split view updates the state on the loop.
+            app.call_from_thread(setattr, state, "text", edited)
+            return result
+
+        real_save_text = code_editor.save_text
+        with patch.object(code_editor, "save_text", save_text):
+            main.action_save_all()
+            await await_workers(pilot)
+        await pilot.wait_for_scheduled_animations()
+
+        assert sample_py_file.read_text(encoding="utf-8") == written
+        assert state.initial_text == written
+        assert state.text == edited
+        assert main.has_unsaved_pane() is True
+
+
 # ── Issue #15: Custom language tab switch crash ──────────────────────────────
 
 
@@ -357,3 +421,70 @@ async def test_custom_language_tab_survives_lazy_remount(
         assert restored.language == language
         assert language in restored.editor.available_languages
         assert restored.text == content
+
+
+# ── Remount cache: parse tree, highlights and git gutter ─────────────────────
+
+
+async def test_lazy_remount_reuses_parse_tree_and_highlights(
+    workspace: Path, sample_py_file: Path, sample_json_file: Path
+):
+    """Switching back to a tab adopts its document and highlights, unparsed."""
+    app = make_app(workspace, light=True, open_file=sample_py_file)
+    async with app.run_test() as pilot:
+        await pilot.wait_for_scheduled_animations()
+        main = app.main_view
+        tc = main.tabbed_content
+        py_pane_id = main._active_leaf.opened_files[sample_py_file]
+        editor = main.get_active_code_editor()
+        assert editor is not None
+        ta = editor.editor
+        ta.insert("x = 1\n", (0, 0))
+        document, highlights = ta.document, ta._highlights
+        assert highlights
+
+        await main.action_open_code_editor(path=sample_json_file)
+        await pilot.wait_for_scheduled_animations()
+        assert py_pane_id in main._remount_caches
+
+        tc.active = py_pane_id
+        await pilot.wait_for_scheduled_animations()
+        await pilot.wait_for_scheduled_animations()
+        restored = main.get_active_code_editor()
+        assert restored is not None
+        assert restored.path == sample_py_file
+        assert restored.editor.document is document
+        assert restored.editor._highlights is highlights
+        assert restored.text.startswith("x = 1\n")
+        assert py_pane_id not in main._remount_caches
+
+        # The undo history came along with the document.
+        restored.editor.undo()
+        assert not restored.editor.text.startswith("x = 1\n")
+
+
+async def test_lazy_remount_rebuilds_when_text_changed_while_unmounted(
+    workspace: Path, sample_py_file: Path, sample_json_file: Path
+):
+    app = make_app(workspace, light=True, open_file=sample_py_file)
+    async with app.run_test() as pilot:
+        await pilot.wait_for_scheduled_animations()
+        main = app.main_view
+        tc = main.tabbed_content
+        py_pane_id = main._active_leaf.opened_files[sample_py_file]
+        editor = main.get_active_code_editor()
+        assert editor is not None
+        document = editor.editor.document
+
+        await main.action_open_code_editor(path=sample_json_file)
+        await pilot.wait_for_scheduled_animations()
+        main._editor_states[py_pane_id].text = "y = 2\n"
+
+        tc.active = py_pane_id
+        await pilot.wait_for_scheduled_animations()
+        await pilot.wait_for_scheduled_animations()
+        restored = main.get_active_code_editor()
+        assert restored is not None
+        assert restored.editor.document is not document
+        assert restored.editor.text == "y = 2\n"
+        assert restored.editor._highlights